@@ -3,14 +3,25 @@
 import traceback
 from datetime import date, timedelta
 
+import anyio
+
 from ..domain.models import CreatePageStatus, DateRange, WeeklyPageConfig
 from ..domain.services import (
     calculate_last_week_range,
     calculate_this_week_range,
     format_confluence_page_title,
 )
-from .ports import ConfluencePort, NotificationPort, PageTransformerPort
+from .ports import (
+    AsyncConfluencePort,
+    BackfillCheckpointPort,
+    ConfluencePort,
+    NotificationPort,
+    PageTransformerPort,
+)
+
 
+# 여러 주 생성 시 CQL `title in (...)` 1회에 넣는 제목 수 (청크끼리는 동시에 조회)
+_TITLE_LOOKUP_CHUNK = 10
 
 # 모듈 레벨 — application 레이어 (presentation mapping은 use case가 책임)
 STATUS_LABELS: dict[CreatePageStatus, str] = {
@@ -20,8 +31,136 @@ STATUS_LABELS: dict[CreatePageStatus, str] = {
 }
 
 
+def _plan(target_date: date | None) -> tuple[DateRange, DateRange, str, str]:
+    """1. 날짜 계산 → (이전 주, 이번 주, 이전 주 제목, 새 주 제목)"""
+    today = target_date or date.today()
+    last_week = calculate_last_week_range(today)
+    this_week = calculate_this_week_range(today)
+    old_title = format_confluence_page_title(last_week)
+    new_title = format_confluence_page_title(this_week)
+
+    print(f"Source page: {old_title}")
+    print(f"Target page: {new_title}")
+    return last_week, this_week, old_title, new_title
+
+
+def _generate_date_strings(monday: date, friday: date) -> list[str]:
+    """월~금 날짜를 MM.DD 형식 리스트로 생성"""
+    dates = []
+    current = monday
+    while current <= friday:
+        dates.append(current.strftime("%m.%d"))
+        current += timedelta(days=1)
+    return dates
+
+
+def _transform(
+    transformer: PageTransformerPort, html: str, last_week: DateRange, this_week: DateRange
+) -> str:
+    """이전 주 HTML의 날짜를 새 주 날짜로 변환"""
+    old_dates = _generate_date_strings(last_week.start, last_week.end)
+    new_dates = _generate_date_strings(this_week.start, this_week.end)
+    return transformer.transform(html, old_dates, new_dates)
+
+
+class _PageCreationNotifier:
+    """create_page 결과 Slack 알림 — 동기/비동기 use case가 하나씩 갖는다.
+
+    already_notified: 실행 1회 안에서 알림을 보냈는지 (예외 경로의 중복 알림 방지 래치).
+    """
+
+    def __init__(self, notifier: NotificationPort | None):
+        self._notifier = notifier
+        self.already_notified: bool = False
+
+    def reset(self) -> None:
+        """실행 시작 — 래치 초기화"""
+        self.already_notified = False
+
+    def check_pages(
+        self,
+        pages: dict[str, dict],
+        old_title: str,
+        new_title: str,
+        this_week: DateRange,
+        notification_prefix: str,
+    ) -> bool | None:
+        """이전 주 없음(False) / 새 주 이미 존재(True, 스킵)면 알림 후 결과 반환. 생성 진행이면 None."""
+        if old_title not in pages:
+            err = f"이전 주 페이지를 찾을 수 없습니다: {old_title}"
+            print(f"ERROR: {err}")
+            self.notify(CreatePageStatus.FAILED, notification_prefix, this_week, err)
+            return False
+
+        # 3. 새 주 페이지 중복 확인
+        existing_page = pages.get(new_title)
+        if existing_page is not None:
+            print(f"Page already exists: {new_title} — skipping.")
+            self.notify(
+                CreatePageStatus.ALREADY_EXISTS,
+                notification_prefix,
+                this_week,
+                existing_page["url"],
+            )
+            return True
+        return None
+
+    def fail_unexpected(
+        self, e: Exception, this_week: DateRange | None, notification_prefix: str
+    ) -> bool:
+        # task group이 감싼 단일 예외는 원래 예외로 보고
+        while isinstance(e, BaseExceptionGroup) and len(e.exceptions) == 1:
+            e = e.exceptions[0]
+        body = f"Unexpected error: {type(e).__name__}: {e}"
+        print(f"ERROR: create_page unexpected exception: {body}")
+        # 래치: 이미 알림 보냈으면 추가 알림 안 보냄
+        # 가드: pre-try에서 this_week가 None일 수 있음
+        if not self.already_notified and this_week is not None:
+            self.notify(
+                CreatePageStatus.FAILED, notification_prefix, this_week, body
+            )
+        return False
+
+    def build_title(
+        self,
+        prefix: str,
+        this_week: DateRange,
+        status: CreatePageStatus,
+    ) -> str:
+        """Slack 알림 제목 생성"""
+        start = this_week.start.strftime('%y.%m.%d')
+        end = this_week.end.strftime('%m.%d')
+        bracket = f"[{prefix}]" if prefix else ""
+        label = STATUS_LABELS[status]
+        return f"{bracket}[{start} ~ {end}_WeeklyPage] {label}"
+
+    def notify(
+        self,
+        status: CreatePageStatus,
+        prefix: str,
+        this_week: DateRange,
+        body: str,
+    ) -> None:
+        """알림 전송 (격리됨, notifier=None이면 스킵, 예외 swallow)"""
+        if self._notifier is None:
+            return
+        title = self.build_title(prefix, this_week, status)
+        try:
+            self._notifier.send(title, body)
+            self.already_notified = True
+        except Exception as e:
+            print(
+                f"WARNING: Slack notification failed (status={status.value}): {e}\n"
+                f"{traceback.format_exc()}"
+            )
+
+
 class CreateWeeklyPageUseCase:
-    """이전 주 Confluence 페이지를 복사하여 새 주간 페이지 생성"""
+    """이전 주 Confluence 페이지를 복사하여 새 주간 페이지 생성
+
+    동기 ConfluencePort 버전. CLI(main)는 AsyncCreateWeeklyPageUseCase를 쓰고, 이 클래스는
+    동기 호출자와 benchmark 기준선을 위해 같은 공개 API(생성자 + execute)로 유지한다.
+    """
 
     def __init__(
         self,
@@ -31,8 +170,7 @@ class CreateWeeklyPageUseCase:
     ):
         self.confluence = confluence
         self.transformer = transformer
-        self._notifier = notifier
-        self._already_notified: bool = False
+        self._notifications = _PageCreationNotifier(notifier)
 
     def execute(
         self,
@@ -45,48 +183,24 @@ class CreateWeeklyPageUseCase:
         Returns: True (성공/스킵), False (실패).
         알림은 부수효과 — boolean 결과를 오염시키지 않음.
         """
-        self._already_notified = False
+        self._notifications.reset()
         this_week: DateRange | None = None
 
         try:
-            today = target_date or date.today()
-
-            # 1. 날짜 계산
-            last_week = calculate_last_week_range(today)
-            this_week = calculate_this_week_range(today)
-            old_title = format_confluence_page_title(last_week)
-            new_title = format_confluence_page_title(this_week)
+            last_week, this_week, old_title, new_title = _plan(target_date)
 
-            print(f"Source page: {old_title}")
-            print(f"Target page: {new_title}")
-
-            # 2. 이전 주 페이지 조회
-            source_page = self.confluence.get_page_by_title(config.space_key, old_title)
-            if source_page is None:
-                err = f"이전 주 페이지를 찾을 수 없습니다: {old_title}"
-                print(f"ERROR: {err}")
-                self._notify(CreatePageStatus.FAILED, notification_prefix, this_week, err)
-                return False
+            # 2. 이전 주 / 새 주 페이지를 한 번에 조회 (이전 주 본문 포함)
+            pages = self.confluence.get_pages_by_titles(
+                config.space_key, [old_title, new_title], expand_body=True
+            )
+            skipped = self._notifications.check_pages(
+                pages, old_title, new_title, this_week, notification_prefix
+            )
+            if skipped is not None:
+                return skipped
 
-            # 3. 새 주 페이지 중복 확인
-            existing_page = self.confluence.get_page_by_title(config.space_key, new_title)
-            if existing_page is not None:
-                print(f"Page already exists: {new_title} — skipping.")
-                self._notify(
-                    CreatePageStatus.ALREADY_EXISTS,
-                    notification_prefix,
-                    this_week,
-                    existing_page["url"],
-                )
-                return True
-
-            # 4. 이전 페이지 HTML 가져오기
-            html = self.confluence.get_page_content(source_page["id"])
-
-            # 5. HTML 변환
-            old_dates = self._generate_date_strings(last_week.start, last_week.end)
-            new_dates = self._generate_date_strings(this_week.start, this_week.end)
-            new_html = self.transformer.transform(html, old_dates, new_dates)
+            # 4~5. 이전 페이지 HTML (조회 응답에 포함됨) 변환
+            new_html = _transform(self.transformer, pages[old_title]["content"], last_week, this_week)
 
             # 6. 새 페이지 생성
             url = self.confluence.create_page(
@@ -96,58 +210,232 @@ class CreateWeeklyPageUseCase:
                 parent_id=config.parent_page_id,
             )
             print(f"Created: {url}")
-            self._notify(CreatePageStatus.CREATED, notification_prefix, this_week, url)
+            self._notifications.notify(CreatePageStatus.CREATED, notification_prefix, this_week, url)
             return True
 
         except Exception as e:
-            body = f"Unexpected error: {type(e).__name__}: {e}"
-            print(f"ERROR: create_page unexpected exception: {body}")
-            # 래치: 이미 알림 보냈으면 추가 알림 안 보냄
-            # 가드: pre-try에서 this_week가 None일 수 있음
-            if not self._already_notified and this_week is not None:
-                self._notify(
-                    CreatePageStatus.FAILED, notification_prefix, this_week, body
-                )
-            return False
+            return self._notifications.fail_unexpected(e, this_week, notification_prefix)
+
 
-    def _build_title(
+class AsyncCreateWeeklyPageUseCase:
+    """AsyncConfluencePort로 독립 요청을 겹쳐 실행하는 주간 페이지 생성.
+
+    CreateWeeklyPageUseCase와 같은 결과/알림 — 날짜 계산/변환은 모듈 함수, 알림은
+    _PageCreationNotifier를 함께 쓴다. 페이지 조회(이전 주 본문 + 새 주 존재 확인)와
+    space id 조회를 동시에 보내고, execute_range로 여러 주를 이어서 만든다.
+    동시 요청 수 제한은 어댑터(AsyncConfluencePort 구현)가 맡는다.
+    """
+
+    def __init__(
         self,
-        prefix: str,
-        this_week: DateRange,
-        status: CreatePageStatus,
-    ) -> str:
-        """Slack 알림 제목 생성"""
-        start = this_week.start.strftime('%y.%m.%d')
-        end = this_week.end.strftime('%m.%d')
-        bracket = f"[{prefix}]" if prefix else ""
-        label = STATUS_LABELS[status]
-        return f"{bracket}[{start} ~ {end}_WeeklyPage] {label}"
+        confluence: AsyncConfluencePort,
+        transformer: PageTransformerPort,
+        notifier: NotificationPort | None = None,
+    ):
+        self.confluence = confluence
+        self.transformer = transformer
+        self._notifications = _PageCreationNotifier(notifier)
 
-    def _notify(
+    def execute(
         self,
-        status: CreatePageStatus,
-        prefix: str,
-        this_week: DateRange,
-        body: str,
-    ) -> None:
-        """알림 전송 (격리됨, notifier=None이면 스킵, 예외 swallow)"""
-        if self._notifier is None:
-            return
-        title = self._build_title(prefix, this_week, status)
+        config: WeeklyPageConfig,
+        target_date: date | None = None,
+        notification_prefix: str = "",
+    ) -> bool:
+        """동기 진입점 — execute_async를 새 이벤트 루프에서 실행"""
+        return anyio.run(self.execute_async, config, target_date, notification_prefix)
+
+    async def execute_async(
+        self,
+        config: WeeklyPageConfig,
+        target_date: date | None = None,
+        notification_prefix: str = "",
+    ) -> bool:
+        """CreateWeeklyPageUseCase.execute와 같은 결과/알림. 이미 실행 중인 이벤트 루프에서 호출."""
+        self._notifications.reset()
+        this_week: DateRange | None = None
+
         try:
-            self._notifier.send(title, body)
-            self._already_notified = True
+            last_week, this_week, old_title, new_title = _plan(target_date)
+
+            # 2. 페이지 조회와 space id 조회(create_page용, 어댑터가 캐시)를 동시에
+            pages: dict[str, dict] = {}
+
+            async def lookup_pages() -> None:
+                pages.update(await self.confluence.get_pages_by_titles(
+                    config.space_key, [old_title, new_title], expand_body=True
+                ))
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(lookup_pages)
+                tg.start_soon(self._warm_space_id, config.space_key)
+
+            skipped = self._notifications.check_pages(
+                pages, old_title, new_title, this_week, notification_prefix
+            )
+            if skipped is not None:
+                return skipped
+
+            new_html = _transform(self.transformer, pages[old_title]["content"], last_week, this_week)
+
+            url = await self.confluence.create_page(
+                space_key=config.space_key,
+                title=new_title,
+                content=new_html,
+                parent_id=config.parent_page_id,
+            )
+            print(f"Created: {url}")
+            self._notifications.notify(CreatePageStatus.CREATED, notification_prefix, this_week, url)
+            return True
+
         except Exception as e:
-            print(
-                f"WARNING: Slack notification failed (status={status.value}): {e}\n"
-                f"{traceback.format_exc()}"
+            return self._notifications.fail_unexpected(e, this_week, notification_prefix)
+
+    def execute_range(
+        self,
+        config: WeeklyPageConfig,
+        weeks: list[DateRange],
+        notification_prefix: str = "",
+        checkpoint: BackfillCheckpointPort | None = None,
+    ) -> bool:
+        """연속된 여러 주(오름차순) 페이지를 차례로 생성 (backfill / 미리 생성). 동기 진입점."""
+        if not weeks:
+            return True
+        return anyio.run(
+            self.execute_range_async, config, weeks, notification_prefix, checkpoint
+        )
+
+    async def execute_range_async(
+        self,
+        config: WeeklyPageConfig,
+        weeks: list[DateRange],
+        notification_prefix: str = "",
+        checkpoint: BackfillCheckpointPort | None = None,
+    ) -> bool:
+        """각 주의 원본은 바로 앞 주 페이지 — 앞 단계에서 만든 페이지면 메모리의 HTML을 그대로 쓴다.
+
+        범위 앞 주가 없어도 범위 첫 주들이 이미 있으면 그중 마지막 페이지부터 이어서 만든다.
+
+        - 독립 단계(전체 제목 확인을 청크별 동시 검색, space id 조회)를 먼저 한꺼번에
+        - 의존 단계는 순서대로 진행하되, 주 k 생성(POST)과 주 k+1 변환을 겹친다
+        - 주마다 checkpoint 기록 → 중단 후 재실행은 기록된 주를 건너뛰고 이어서 진행
+        알림은 범위 전체에 대해 1회 (마지막 주 기준 제목).
+        """
+        self._notifications.reset()
+        last_week = weeks[-1]
+        chain = [
+            DateRange(weeks[0].start - timedelta(weeks=1), weeks[0].end - timedelta(weeks=1)),
+            *weeks,
+        ]
+        titles = [format_confluence_page_title(w) for w in chain]
+        done = checkpoint.created_titles() if checkpoint is not None else set()
+        last_created = checkpoint.last_created() if checkpoint is not None else None
+        print(
+            f"Backfill: {titles[1]} .. {titles[-1]} ({len(weeks)} week(s), "
+            f"{len(done.intersection(titles[1:]))} already checkpointed)"
+        )
+        created_urls: list[str] = []
+
+        try:
+            # 1. 독립 단계 — 원본 + 대상 주 제목 전부 확인 (본문 포함), space id 미리 조회
+            pages: dict[str, dict] = {}
+
+            async def lookup(chunk: list[str]) -> None:
+                pages.update(await self.confluence.get_pages_by_titles(
+                    config.space_key, chunk, expand_body=True
+                ))
+
+            async with anyio.create_task_group() as tg:
+                for i in range(0, len(titles), _TITLE_LOOKUP_CHUNK):
+                    tg.start_soon(lookup, titles[i:i + _TITLE_LOOKUP_CHUNK])
+                tg.start_soon(self._warm_space_id, config.space_key)
+
+            def existing_html(title: str) -> str | None:
+                if title in pages:
+                    return pages[title]["content"]
+                # 직전 실행이 만든 페이지는 검색 색인에 아직 없을 수 있다 — checkpoint 본문 사용
+                if last_created is not None and last_created[0] == title:
+                    return last_created[1]
+                return None
+
+            # checkpoint에 기록됐지만 보이지 않는 주 — 한 번 더 조회하고, 그래도 없으면 다시 만든다
+            unseen = [t for t in titles[1:] if t in done and existing_html(t) is None]
+            if unseen:
+                pages.update(await self.confluence.get_pages_by_titles(
+                    config.space_key, unseen, expand_body=True
+                ))
+                for title in unseen:
+                    if existing_html(title) is None:
+                        print(f"WARNING: checkpointed page not found: {title} — creating it again.")
+                        done.discard(title)
+
+            # 원본 = 처음 만들어야 하는 주 바로 앞의 페이지 (범위 앞 주 또는 이미 있는 범위 안의 주)
+            first_missing = next(
+                (i for i, t in enumerate(titles) if i > 0 and existing_html(t) is None), None
             )
+            if first_missing is not None and existing_html(titles[first_missing - 1]) is None:
+                err = f"이전 주 페이지를 찾을 수 없습니다: {titles[first_missing - 1]}"
+                print(f"ERROR: {err}")
+                self._notifications.notify(CreatePageStatus.FAILED, notification_prefix, last_week, err)
+                return False
+
+            # 2. 의존 단계 — 변환(producer)과 생성(consumer)을 buffer 0 스트림으로 한 주씩 겹침
+            send, receive = anyio.create_memory_object_stream[tuple[str, str]](0)
+
+            async def transform_chain(html: str | None) -> None:
+                async with send:
+                    for prev, week, title in zip(chain, chain[1:], titles[1:]):
+                        existing = existing_html(title)
+                        if existing is not None:
+                            html = existing
+                            print(f"Page already exists: {title} — skipping.")
+                            continue
+                        html = await anyio.to_thread.run_sync(_transform, self.transformer, html, prev, week)
+                        await send.send((title, html))
 
-    def _generate_date_strings(self, monday: date, friday: date) -> list[str]:
-        """월~금 날짜를 MM.DD 형식 리스트로 생성"""
-        dates = []
-        current = monday
-        while current <= friday:
-            dates.append(current.strftime("%m.%d"))
-            current += timedelta(days=1)
-        return dates
+            async def create_pages() -> None:
+                async with receive:
+                    async for title, html in receive:
+                        # 변환 쪽이 실패해 취소돼도 보낸 POST는 끝까지 받아 checkpoint에 남긴다
+                        with anyio.CancelScope(shield=True):
+                            url = await self.confluence.create_page(
+                                space_key=config.space_key,
+                                title=title,
+                                content=html,
+                                parent_id=config.parent_page_id,
+                            )
+                            print(f"Created: {url}")
+                            created_urls.append(url)
+                            if checkpoint is not None:
+                                checkpoint.record(title, url, html)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(transform_chain, existing_html(titles[0]))
+                tg.start_soon(create_pages)
+
+        except Exception as e:
+            if created_urls:
+                print(f"Backfill stopped after {len(created_urls)} page(s); rerun resumes from the checkpoint.")
+            return self._notifications.fail_unexpected(e, last_week, notification_prefix)
+
+        if checkpoint is not None:
+            checkpoint.clear()
+        if created_urls:
+            self._notifications.notify(
+                CreatePageStatus.CREATED, notification_prefix, last_week, "\n".join(created_urls)
+            )
+        else:
+            self._notifications.notify(
+                CreatePageStatus.ALREADY_EXISTS,
+                notification_prefix,
+                last_week,
+                f"{len(weeks)}개 주 페이지가 모두 이미 존재합니다.",
+            )
+        return True
+
+    async def _warm_space_id(self, space_key: str) -> None:
+        """space id 미리 조회. 실패해도 create_page가 다시 조회하므로 경고만."""
+        try:
+            await self.confluence.get_space_id(space_key)
+        except Exception as e:
+            print(f"WARNING: space id prefetch failed for {space_key}: {type(e).__name__}: {e}")
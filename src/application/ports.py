@@ -1,5 +1,8 @@
+from collections.abc import AsyncIterator
 from datetime import date
-from typing import Protocol
+from typing import Protocol, runtime_checkable
+
+from ..domain.models import JiraIssue, RunMetrics, StreamRestart, TicketMention
 
 
 class CLIExecutorPort(Protocol):
@@ -9,6 +12,21 @@ class CLIExecutorPort(Protocol):
         """/daily_report 커맨드를 실행하고 결과 반환"""
         ...
 
+    async def execute_async(
+        self, space_key: str, mention_users: str = "", report_date: date | None = None
+    ) -> str | None:
+        """execute의 async 버전. 이미 실행 중인 이벤트 루프 안에서 호출 (batch fan-out용)"""
+        ...
+
+    def stream(
+        self, space_key: str, mention_users: str = "", report_date: date | None = None
+    ) -> AsyncIterator[str | StreamRestart]:
+        """출력 텍스트를 도착하는 대로 yield. 실패 시 예외 전파
+
+        fallback 시도가 시작되면 StreamRestart를 yield — 그 전까지 받은 텍스트는 버려야 한다.
+        """
+        ...
+
 
 class NotificationPort(Protocol):
     """알림 전송 추상 인터페이스"""
@@ -18,6 +36,35 @@ class NotificationPort(Protocol):
         ...
 
 
+class ReportStreamPort(Protocol):
+    """진행 중인 리포트 1건의 스트리밍 전송 핸들"""
+
+    def append(self, text: str) -> None:
+        """executor가 새로 내보낸 텍스트 조각 전달"""
+        ...
+
+    def restart(self) -> None:
+        """지금까지 받은 텍스트 폐기 (executor가 fallback 모델로 다시 생성 시작)"""
+        ...
+
+    def finish(self, thread_message: str) -> None:
+        """최종 리포트 본문으로 마무리"""
+        ...
+
+    def fail(self) -> None:
+        """생성 실패 표시"""
+        ...
+
+
+@runtime_checkable
+class StreamingNotificationPort(NotificationPort, Protocol):
+    """스트리밍 전송을 지원하는 알림 인터페이스"""
+
+    def open_stream(self, message: str) -> ReportStreamPort:
+        """제목 메시지를 먼저 보내고 본문 스트림 핸들 반환"""
+        ...
+
+
 class ConfluencePort(Protocol):
     """Confluence 페이지 접근 추상 인터페이스"""
 
@@ -33,14 +80,98 @@ class ConfluencePort(Protocol):
         """페이지의 storage format HTML 조회"""
         ...
 
+    def get_pages_by_titles(
+        self, space_key: str, titles: list[str], expand_body: bool = False
+    ) -> dict[str, dict]:
+        """여러 제목을 한 번에 조회. {제목: 페이지} — 없는 제목은 키가 없다.
+
+        페이지 dict는 get_page_by_title()과 같은 'id', 'title', 'url' 키를 갖고,
+        expand_body=True면 storage format HTML을 'content' 키로 함께 담는다.
+        """
+        ...
+
     def create_page(self, space_key: str, title: str, content: str, parent_id: str) -> str:
         """새 페이지 생성. 생성된 페이지 URL 반환."""
         ...
 
 
+class AsyncConfluencePort(Protocol):
+    """ConfluencePort의 async 버전 — 독립 요청을 한 이벤트 루프에서 겹쳐 실행하는 용도"""
+
+    async def get_pages_by_titles(
+        self, space_key: str, titles: list[str], expand_body: bool = False
+    ) -> dict[str, dict]:
+        """ConfluencePort.get_pages_by_titles와 동일"""
+        ...
+
+    async def get_page_content(self, page_id: str) -> str:
+        """페이지의 storage format HTML 조회"""
+        ...
+
+    async def get_space_id(self, space_key: str) -> str:
+        """space id 조회. 어댑터가 캐시하므로 create_page 전에 미리 불러 두면 왕복이 겹쳐진다."""
+        ...
+
+    async def create_page(self, space_key: str, title: str, content: str, parent_id: str) -> str:
+        """새 페이지 생성. 생성된 페이지 URL 반환."""
+        ...
+
+
+class BackfillCheckpointPort(Protocol):
+    """여러 주 페이지 생성(backfill) 진행 기록 — 중단 후 재실행이 이어서 진행하도록"""
+
+    def created_titles(self) -> set[str]:
+        """이전 실행까지 생성한 페이지 제목"""
+        ...
+
+    def last_created(self) -> tuple[str, str] | None:
+        """마지막으로 생성한 (제목, storage HTML). 다음 주의 원본으로 쓴다."""
+        ...
+
+    def record(self, title: str, url: str, content: str) -> None:
+        """페이지 1개 생성 완료 기록"""
+        ...
+
+    def clear(self) -> None:
+        """전체 범위 완료 후 기록 삭제"""
+        ...
+
+
 class PageTransformerPort(Protocol):
     """페이지 HTML 변환 추상 인터페이스"""
 
     def transform(self, html: str, old_dates: list[str], new_dates: list[str]) -> str:
         """이전 주 HTML을 새 주 형식으로 변환"""
         ...
+
+
+class MetricsStorePort(Protocol):
+    """실행 메트릭 저장소 (append-only)"""
+
+    def append(self, metrics: RunMetrics) -> None:
+        """메트릭 1건 추가"""
+        ...
+
+    def read_all(self) -> list[RunMetrics]:
+        """저장된 메트릭 전체 (기록 순)"""
+        ...
+
+
+class JiraPort(Protocol):
+    """JIRA 조회 추상 인터페이스"""
+
+    def get_issue(self, key: str) -> JiraIssue | None:
+        """티켓 조회. 없으면 None"""
+        ...
+
+    def get_issues(self, keys: list[str]) -> dict[str, JiraIssue]:
+        """여러 티켓 일괄 조회 (JQL key in). 없는 key는 결과에서 빠진다"""
+        ...
+
+
+class TicketScannerPort(Protocol):
+    """페이지 HTML에서 티켓 key 추출 추상 인터페이스"""
+
+    def scan(self, storage_html: str) -> list[TicketMention]:
+        """팀원/날짜별 티켓 등장 위치 (문서 순서)"""
+        ...
@@ -0,0 +1,99 @@
+"""리포트 입력 prefetch — agent 실행 전에 이번 주 페이지와 참조 티켓을 Python에서 조회.
+
+agent가 mcp-atlassian 도구로 페이지 검색 → 본문 조회 → 티켓별 조회를 순차 turn으로
+반복하는 대신, 결정적인 조회는 여기서 끝내고 프롬프트에 넣어 요약 1회로 끝내게 한다.
+페이지가 참조하는 티켓은 JQL key in (...) 일괄 조회 — 키가 많으면 묶음으로 나눠 동시에 요청한다.
+"""
+
+from datetime import date
+
+import anyio
+
+from ..domain.models import JiraIssue, ReportContext, TicketMention
+from ..domain.services import (
+    calculate_this_week_range,
+    extract_jira_keys,
+    format_confluence_page_title,
+    format_report_context,
+)
+from .ports import ConfluencePort, JiraPort, TicketScannerPort
+
+_DEFAULT_MAX_CONCURRENCY = 8
+# JQL 1회에 넣는 key 수 (검색 응답 상한 100 이내, URL 길이 여유)
+_ISSUE_BATCH_SIZE = 50
+
+
+class ReportContextPrefetcher:
+    """이번 주 Confluence 페이지 + 페이지가 참조하는 JIRA 티켓을 동시 조회"""
+
+    def __init__(
+        self,
+        confluence: ConfluencePort,
+        jira: JiraPort,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        scanner: TicketScannerPort | None = None,
+    ):
+        """scanner가 없으면 정규식으로 key만 추출한다 (팀원/날짜 위치 없음)"""
+        self._confluence = confluence
+        self._jira = jira
+        self._max_concurrency = max(1, max_concurrency)
+        self._scanner = scanner
+
+    async def fetch(self, space_key: str, report_date: date) -> ReportContext | None:
+        """페이지가 없으면 None. 티켓 조회 실패는 missing_issue_keys로 남기고 계속한다."""
+        title = format_confluence_page_title(calculate_this_week_range(report_date))
+        page = await anyio.to_thread.run_sync(self._confluence.get_page_by_title, space_key, title)
+        if page is None:
+            print(f"WARNING: prefetch could not find Confluence page '{title}' in {space_key}.")
+            return None
+        body = await anyio.to_thread.run_sync(self._confluence.get_page_content, page["id"])
+
+        if self._scanner is not None:
+            mentions = self._scanner.scan(body)
+        else:
+            mentions = [TicketMention(key) for key in extract_jira_keys(body)]
+        keys = list(dict.fromkeys(m.key for m in mentions))
+        issues = await self._fetch_issues(keys)
+
+        return ReportContext(
+            page_title=title,
+            page_url=page["url"],
+            page_body=body,
+            issues=tuple(issues[k] for k in keys if k in issues),
+            missing_issue_keys=tuple(k for k in keys if k not in issues),
+            mentions=tuple(m for m in mentions if m.member or m.day),
+        )
+
+    async def _fetch_issues(self, keys: list[str]) -> dict[str, JiraIssue]:
+        """_ISSUE_BATCH_SIZE개씩 묶어 동시 조회. 실패한 묶음의 key는 결과에서 빠진다."""
+        issues: dict[str, JiraIssue] = {}
+        limiter = anyio.CapacityLimiter(self._max_concurrency)
+
+        async def fetch_batch(batch: list[str]) -> None:
+            try:
+                found = await anyio.to_thread.run_sync(
+                    self._jira.get_issues, batch, limiter=limiter
+                )
+            except Exception as e:
+                print(
+                    f"WARNING: prefetch failed for {len(batch)} issue(s) ({batch[0]}..):"
+                    f" {type(e).__name__}: {e}"
+                )
+                return
+            issues.update((k, v) for k, v in found.items() if k in batch)
+
+        async with anyio.create_task_group() as tg:
+            for i in range(0, len(keys), _ISSUE_BATCH_SIZE):
+                tg.start_soon(fetch_batch, keys[i : i + _ISSUE_BATCH_SIZE])
+        return issues
+
+    async def fetch_prompt_block(self, space_key: str, report_date: date) -> str | None:
+        """fetch 결과를 프롬프트용 텍스트로. ClaudeCLIExecutor의 context_provider로 사용."""
+        context = await self.fetch(space_key, report_date)
+        if context is None:
+            return None
+        print(
+            f"Prefetched '{context.page_title}' with {len(context.issues)} issue(s)"
+            f" ({len(context.missing_issue_keys)} missing)."
+        )
+        return format_report_context(context)
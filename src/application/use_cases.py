@@ -1,8 +1,12 @@
 from datetime import date
 
-from ..domain.models import ReportConfig
-from ..domain.services import extract_report_content
-from .ports import CLIExecutorPort, NotificationPort
+import anyio
+
+from ..domain.models import ReportConfig, StreamRestart
+from ..domain.services import ReportMarkerExtractor, extract_report_content
+from .ports import CLIExecutorPort, NotificationPort, StreamingNotificationPort
+
+_DEFAULT_MAX_CONCURRENCY = 4
 
 
 class GenerateReportUseCase:
@@ -35,6 +39,109 @@ class GenerateReportUseCase:
         self._notifier.send(self._build_title(config), extract_report_content(output))
         return True
 
+    def execute_streaming(self, config: ReportConfig) -> bool:
+        """스트리밍 모드: executor 출력을 도착하는 대로 notifier 스트림에 흘린다.
+
+        제목은 생성 시작 시점에 먼저 전송되고, 본문은 마지막에 extract_report_content
+        결과로 확정된다. notifier가 StreamingNotificationPort가 아니면 execute로 실행한다.
+        """
+        if not isinstance(self._notifier, StreamingNotificationPort):
+            print("WARNING: notifier does not support streaming. Sending the report when it is complete.")
+            return self.execute(config)
+        return anyio.run(self._execute_streaming, config, self._notifier)
+
+    async def _execute_streaming(self, config: ReportConfig, notifier: StreamingNotificationPort) -> bool:
+        print(f"\n--------------------\nStreaming {self._title_suffix} report from: {config.space_key}\n--------------------")
+
+        # notifier 호출은 rate limiter 대기(429 Retry-After 등)로 블록될 수 있어 worker 스레드에서 실행
+        stream = await anyio.to_thread.run_sync(notifier.open_stream, self._build_title(config))
+        extractor = ReportMarkerExtractor()
+        try:
+            async for text in self._cli_executor.stream(
+                config.space_key, config.mention_users, config.report_date
+            ):
+                if isinstance(text, StreamRestart):
+                    # fallback 모델로 재생성 — 취소된 시도의 부분 출력은 본문에서 제외
+                    print(f"Restarting stream with fallback model {text.model}.")
+                    extractor = ReportMarkerExtractor()
+                    await anyio.to_thread.run_sync(stream.restart)
+                    continue
+                extractor.feed(text)
+                await anyio.to_thread.run_sync(stream.append, text)
+        except Exception as e:
+            print(f"ERROR: Failed to generate report: {type(e).__name__}: {e}")
+            await anyio.to_thread.run_sync(stream.fail)
+            return False
+
+        await anyio.to_thread.run_sync(stream.finish, extract_report_content(extractor.getvalue()))
+        return True
+
+    def execute_batch(
+        self,
+        configs: list[ReportConfig],
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> list[bool]:
+        """여러 팀 리포트를 하나의 이벤트 루프에서 동시에 생성 (multi-team fan-out).
+
+        - 동시 실행 수는 max_concurrency로 제한 (SDK 세션 = claude 프로세스 1개)
+        - job별 실패 격리: 한 팀의 생성/전송 실패가 다른 팀에 영향 없음
+        - 전송 순서는 configs 순서 보장: 앞 job이 끝날 때까지 뒤 job 결과는 대기
+        Returns: configs와 같은 순서의 job별 성공 여부.
+        """
+        if not configs:
+            return []
+        return anyio.run(self._execute_batch, configs, max(1, max_concurrency))
+
+    async def _execute_batch(
+        self, configs: list[ReportConfig], max_concurrency: int
+    ) -> list[bool]:
+        limiter = anyio.CapacityLimiter(max_concurrency)
+        outputs: list[str | None] = [None] * len(configs)
+        finished = [False] * len(configs)
+        results = [False] * len(configs)
+        next_index = 0
+        flush_lock = anyio.Lock()
+
+        async def flush_in_order() -> None:
+            # 완료된 연속 prefix만 전송. 전송은 rate limiter 대기로 블록될 수 있어 worker 스레드에서
+            # 실행하고, 그동안 끝난 job은 lock을 기다렸다가 이어서 전송한다 (순서 유지)
+            nonlocal next_index
+            async with flush_lock:
+                while next_index < len(configs) and finished[next_index]:
+                    results[next_index] = await anyio.to_thread.run_sync(
+                        self._deliver, configs[next_index], outputs[next_index]
+                    )
+                    next_index += 1
+
+        async def run_job(index: int, config: ReportConfig) -> None:
+            async with limiter:
+                print(f"Generating {self._title_suffix} report from: {config.space_key} (job {index + 1}/{len(configs)})")
+                try:
+                    outputs[index] = await self._cli_executor.execute_async(
+                        config.space_key, config.mention_users, config.report_date
+                    )
+                except Exception as e:
+                    print(f"ERROR: Report job failed ({config.space_key}): {type(e).__name__}: {e}")
+            finished[index] = True
+            await flush_in_order()
+
+        async with anyio.create_task_group() as tg:
+            for index, config in enumerate(configs):
+                tg.start_soon(run_job, index, config)
+        return results
+
+    def _deliver(self, config: ReportConfig, output: str | None) -> bool:
+        """batch job 1건 전송. 전송 예외는 해당 job 실패로만 기록 (격리)."""
+        if output is None:
+            print(f"ERROR: Failed to generate report ({config.space_key}). Skipping notification.")
+            return False
+        try:
+            self._notifier.send(self._build_title(config), extract_report_content(output))
+        except Exception as e:
+            print(f"ERROR: Failed to send report ({config.space_key}): {type(e).__name__}: {e}")
+            return False
+        return True
+
     def _build_title(self, config: ReportConfig) -> str:
         report_date = config.report_date or date.today()
         formatted_date = report_date.strftime("%y.%m.%d")
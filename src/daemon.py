@@ -0,0 +1,227 @@
+"""리포트 데몬 — 상주 SDK 세션으로 daily/weekly/create_page job을 로컬 소켓에서 실행.
+
+cron job마다 Python + claude CLI(node) + stdio MCP 서버(mcp-atlassian,
+sequential-thinking)를 cold start 하는 대신, 데몬이 WarmClaudeSession 하나를 띄워두고
+`--submit`으로 들어온 job을 순서대로 처리한다.
+
+프로토콜: unix socket, 요청/응답 각각 JSON 한 줄.
+  요청: {"mode": "daily", "report_date": "2026-04-06"|null, "model": "sonnet",
+         "dry_run": false, "use_cache": true, "prefetch": false,
+         "weeks": [["2026-04-06", "2026-04-10"], ...]|null}
+  응답: {"ok": true, "mode": "daily", "warm": true, "connect_s": 0.0, "latency_s": 93.1}
+"""
+
+import json
+import socket
+import time
+import traceback
+from dataclasses import dataclass, replace
+from datetime import date
+from pathlib import Path
+
+import anyio
+from anyio.streams.buffered import BufferedByteReceiveStream
+
+from .domain.models import DateRange
+from .infrastructure.adapters.cli_executors import WarmClaudeSession
+from .infrastructure.config import AppConfig
+
+_MAX_REQUEST_BYTES = 64 * 1024
+# 리포트 1건이 수 분 걸리므로 제출 측은 넉넉히 기다린다
+_SUBMIT_TIMEOUT_SECONDS = 3600.0
+
+
+@dataclass(frozen=True)
+class DaemonJob:
+    """데몬에 제출되는 job 1건"""
+    mode: str  # "daily" | "weekly" | "create_page"
+    report_date: date | None = None  # None이면 데몬이 실행 시점의 오늘 날짜 사용
+    model: str | None = None
+    dry_run: bool = False
+    use_cache: bool = True
+    prefetch: bool = False
+    weeks: tuple[DateRange, ...] | None = None  # create_page 범위 (--from/--to/--weeks-ahead)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "mode": self.mode,
+            "report_date": self.report_date.isoformat() if self.report_date else None,
+            "model": self.model,
+            "dry_run": self.dry_run,
+            "use_cache": self.use_cache,
+            "prefetch": self.prefetch,
+            "weeks": (
+                [[w.start.isoformat(), w.end.isoformat()] for w in self.weeks]
+                if self.weeks is not None else None
+            ),
+        })
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "DaemonJob":
+        data = json.loads(raw)
+        report_date = data.get("report_date")
+        weeks = data.get("weeks")
+        return cls(
+            mode=data["mode"],
+            report_date=date.fromisoformat(report_date) if report_date else None,
+            model=data.get("model"),
+            dry_run=bool(data.get("dry_run", False)),
+            use_cache=bool(data.get("use_cache", True)),
+            prefetch=bool(data.get("prefetch", False)),
+            weeks=(
+                tuple(DateRange(date.fromisoformat(s), date.fromisoformat(e)) for s, e in weeks)
+                if weeks is not None else None
+            ),
+        )
+
+
+class ReportDaemon:
+    """WarmClaudeSession을 소유하고 소켓으로 들어온 job을 한 번에 하나씩 실행"""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        socket_path: str | Path,
+        session: WarmClaudeSession | None = None,
+    ):
+        self._config = config
+        self._socket_path = Path(socket_path)
+        self._session = session or WarmClaudeSession(model=config.cli_model)
+        self._lock = anyio.Lock()
+
+    def serve(self) -> None:  # pragma: no cover
+        """블로킹 진입점 (`python -m src.main --serve`)."""
+        print(f"Report daemon listening on {self._socket_path}")
+        try:
+            anyio.run(self.serve_async)
+        except KeyboardInterrupt:
+            print("Report daemon stopped.")
+
+    async def serve_async(self, *, task_status=anyio.TASK_STATUS_IGNORED) -> None:
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # 이전 프로세스가 남긴 stale 소켓 파일 정리
+        self._socket_path.unlink(missing_ok=True)
+        listener = await anyio.create_unix_listener(self._socket_path)
+        task_status.started()
+        try:
+            await listener.serve(self._handle_connection)
+        finally:
+            await self._session.close()
+            self._socket_path.unlink(missing_ok=True)
+
+    async def _handle_connection(self, stream) -> None:
+        async with stream:
+            try:
+                line = await BufferedByteReceiveStream(stream).receive_until(
+                    b"\n", _MAX_REQUEST_BYTES
+                )
+                job = DaemonJob.from_json(line)
+            except Exception as e:
+                response = {"ok": False, "error": f"bad request: {type(e).__name__}: {e}"}
+            else:
+                response = await self.run_job(job)
+            await stream.send((json.dumps(response) + "\n").encode("utf-8"))
+
+    async def run_job(self, job: DaemonJob) -> dict:
+        """job 1건 실행 + cold/warm 지연 기록. job은 직렬 처리 (세션 1개)."""
+        async with self._lock:
+            warm = self._session.is_warm
+            started = time.perf_counter()
+            try:
+                ok = await anyio.to_thread.run_sync(self._execute_job, job)
+            except Exception as e:
+                print(f"ERROR: daemon job crashed: {type(e).__name__}: {e}\n{traceback.format_exc()}")
+                ok = False
+            latency = time.perf_counter() - started
+            # create_page는 SDK를 쓰지 않으므로 세션 상태와 무관
+            uses_session = job.mode != "create_page"
+            connect_s = self._session.last_connect_seconds if uses_session and not warm else 0.0
+
+        result = {
+            "ok": ok,
+            "mode": job.mode,
+            "warm": warm if uses_session else None,
+            "connect_s": round(connect_s, 3),
+            "latency_s": round(latency, 3),
+        }
+        temperature = "n/a" if not uses_session else ("warm" if warm else "cold")
+        print(
+            f"[daemon] mode={job.mode} {temperature} ok={ok} "
+            f"latency={latency:.1f}s connect={connect_s:.1f}s"
+        )
+        return result
+
+    def _execute_job(self, job: DaemonJob) -> bool:
+        """워커 스레드에서 실행 — main의 조립 함수를 그대로 재사용."""
+        from .main import build_report_use_case, run_create_page_mode
+
+        report = replace(self._config.report, report_date=job.report_date)
+        config = replace(
+            self._config, report_mode=job.mode, report=report,
+            prefetch=self._config.prefetch or job.prefetch,
+        )
+        report_date = job.report_date or date.today()
+
+        if job.mode == "create_page":
+            weeks = list(job.weeks) if job.weeks is not None else None
+            return run_create_page_mode(config, report_date, weeks)
+
+        model = job.model or config.cli_model or "sonnet"
+        use_case = build_report_use_case(
+            config, model, job.dry_run, session=self._session, use_cache=job.use_cache
+        )
+        # fan-out은 자체 이벤트 루프를 만들므로 데몬에서는 팀별로 순차 실행 (세션 1개 공유)
+        reports = [replace(r, report_date=job.report_date) for r in config.batch_reports]
+        results = [use_case.execute(r) for r in reports or [report]]
+        return all(results)
+
+
+def submit_job(
+    socket_path: str | Path,
+    job: DaemonJob,
+    timeout: float = _SUBMIT_TIMEOUT_SECONDS,
+) -> dict | None:
+    """데몬에 job 제출 후 결과 dict 반환. 데몬에 연결할 수 없으면 None.
+
+    제출한 뒤의 실패(응답 시간 초과, 깨진 응답)는 데몬이 job을 이미 실행했을 수 있으므로
+    in-process로 다시 돌리지 않고(Slack 중복 전송 방지) ok=False 결과로 반환한다.
+    """
+    submitted = False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall((job.to_json() + "\n").encode("utf-8"))
+            submitted = True
+            chunks: list[bytes] = []
+            while not chunks or not chunks[-1].endswith(b"\n"):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        print(f"WARNING: cannot reach report daemon at {socket_path}: {e}")
+        return None
+    except TimeoutError:
+        if not submitted:
+            print(f"WARNING: report daemon at {socket_path} did not accept the job within {timeout:.0f}s.")
+            return None
+        print(f"ERROR: report daemon did not return a result within {timeout:.0f}s.")
+        return {"ok": False, "error": "timeout"}
+
+    if not chunks:
+        print("ERROR: report daemon closed the connection without a result.")
+        return {"ok": False, "error": "empty response"}
+    try:
+        result = json.loads(b"".join(chunks))
+    except ValueError as e:  # JSONDecodeError / UnicodeDecodeError
+        print(f"ERROR: report daemon returned an invalid result: {e}")
+        return {"ok": False, "error": "invalid response"}
+    if not isinstance(result, dict) or "ok" not in result:
+        print(f"ERROR: report daemon returned an invalid result: {result!r}")
+        return {"ok": False, "error": "invalid response"}
+    print(
+        f"Daemon result: ok={result.get('ok')} warm={result.get('warm')} "
+        f"latency={result.get('latency_s')}s connect={result.get('connect_s')}s"
+    )
+    return result
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -23,6 +23,62 @@ class ReportConfig:
     report_date: date | None = None  # 리포트 대상 날짜 (None이면 오늘)
 
 
+@dataclass(frozen=True)
+class JiraIssue:
+    """리포트 작성에 필요한 JIRA 티켓 필드 (description은 인용 금지라 조회하지 않음)"""
+    key: str
+    summary: str
+    status: str
+    fix_versions: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TicketMention:
+    """주간 페이지에서 티켓 key가 등장한 위치 (팀원 블록 + Date 셀 텍스트)"""
+    key: str
+    member: str = ""  # 표 밖 또는 팀원 블록을 알 수 없으면 ""
+    day: str = ""  # 예: "01.26"
+
+
+@dataclass(frozen=True)
+class ReportContext:
+    """agent 실행 전에 미리 조회한 리포트 입력 (이번 주 Confluence 페이지 + 참조 티켓)"""
+    page_title: str
+    page_url: str
+    page_body: str  # storage format HTML
+    issues: tuple[JiraIssue, ...] = ()
+    missing_issue_keys: tuple[str, ...] = ()  # 조회 실패/미존재 티켓 — agent가 MCP로 보완
+    mentions: tuple[TicketMention, ...] = ()  # 팀원/날짜별 티켓 등장 위치
+
+
+@dataclass(frozen=True)
+class RunMetrics:
+    """claude 실행 1건의 비용/토큰/지연 기록 (SDK ResultMessage 기반)"""
+    recorded_at: datetime
+    mode: str  # "daily" | "weekly"
+    model: str  # 요청한 모델 alias (예: "sonnet")
+    space_key: str
+    duration_ms: int  # SDK가 보고한 전체 실행 시간
+    duration_api_ms: int  # 그중 API 호출 시간
+    num_turns: int
+    cost_usd: float | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    is_error: bool = False
+    timed_out: bool = False  # deadline으로 취소된 시도 (duration_ms = 취소까지의 wall-clock)
+    race_outcome: str | None = None  # 모델 경주 결과: "won" | "lost" | "invalid" | "failed" (경주 아니면 None)
+    race_delta_ms: int | None = None  # 완주한 참가자의 우승자 대비 완료 시각 차 (취소된 참가자는 None)
+
+
+@dataclass(frozen=True)
+class StreamRestart:
+    """executor 스트림의 시도 재시작 신호 — 이전 시도에서 흘린 텍스트는 폐기하고 처음부터 다시 받는다"""
+    attempt: int  # 새로 시작하는 시도 번호 (0부터, fallback 체인 순서)
+    model: str
+
+
 @dataclass(frozen=True)
 class WeeklyPageConfig:
     """주간 페이지 자동 생성 설정"""
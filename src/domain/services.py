@@ -1,7 +1,7 @@
 import re
 from datetime import date, timedelta
 
-from .models import DateRange
+from .models import DateRange, ReportContext
 
 
 def calculate_last_week_range(today: date) -> DateRange:
@@ -20,6 +20,20 @@ def calculate_this_week_range(today: date) -> DateRange:
     return DateRange(start=this_monday, end=this_friday)
 
 
+def plan_week_chain(first_day: date, last_day: date) -> list[DateRange]:
+    """first_day가 속한 주부터 last_day가 속한 주까지 월~금 범위 목록 (오름차순).
+
+    last_day가 first_day보다 앞선 주면 빈 목록.
+    """
+    week = calculate_this_week_range(first_day)
+    last_monday = calculate_this_week_range(last_day).start
+    weeks = []
+    while week.start <= last_monday:
+        weeks.append(week)
+        week = DateRange(start=week.start + timedelta(weeks=1), end=week.end + timedelta(weeks=1))
+    return weeks
+
+
 def format_confluence_page_title(date_range: DateRange) -> str:
     """
     날짜 범위를 Confluence 페이지 제목 형식으로 변환
@@ -38,6 +52,87 @@ _REPORT_MARKERS = (
 )
 
 
+def find_report_start(output: str) -> int:
+    """리포트 마커 시작 위치. 마커 우선순위는 _REPORT_MARKERS 순서. 없으면 -1."""
+    for marker in _REPORT_MARKERS:
+        idx = output.find(marker)
+        if idx != -1:
+            return idx
+    return -1
+
+
+# 단일 패스 multi-pattern 매칭용 — 긴 마커 우선 ("*📊 일정 요약*"이 "📊 일정 요약"보다 먼저)
+_REPORT_MARKER_PATTERN = re.compile(
+    "|".join(re.escape(m) for m in sorted(_REPORT_MARKERS, key=len, reverse=True))
+)
+# 모든 마커에 공통으로 들어있는 부분 문자열 — 없으면 정규식 탐색 자체를 생략 (C 수준 `in` 검사)
+_MARKER_ANCHOR = " 요약"
+# 블록 경계에 걸친 마커를 잡기 위해 이전 텍스트 끝에서 유지할 글자 수
+_MARKER_CARRY_LEN = max(len(m) for m in _REPORT_MARKERS) - 1
+
+
+def _find_last_marker(text: str, min_end: int = 0) -> re.Match | None:
+    """text의 마지막 마커 (min_end 이후에서 끝나는 것만)"""
+    if _MARKER_ANCHOR not in text:
+        return None
+    last = None
+    for match in _REPORT_MARKER_PATTERN.finditer(text):
+        if match.end() > min_end:
+            last = match
+    return last
+
+
+class ReportMarkerExtractor:
+    """스트리밍 리포트 추출기 — 텍스트 블록을 받으며 마지막 마커 이후만 보관.
+
+    마커가 나오면 그 이전의 중간 분석 텍스트는 즉시 버린다. 마커가 아직 없으면
+    (fallback으로 전체를 반환해야 하므로) 전부 보관한다. 블록 사이는 separator로
+    이어 붙이며, 블록 경계에 걸친 마커도 인식한다. 블록마다 새 텍스트만 한 번 훑는다.
+    """
+
+    def __init__(self, separator: str = "\n"):
+        self._separator = separator
+        self._parts: list[str] = []
+        self._carry = ""  # 지금까지 텍스트의 마지막 _MARKER_CARRY_LEN 글자
+        self._started = False
+        self.found = False
+
+    def feed(self, text: str) -> None:
+        head = self._carry + self._separator if self._started else self._carry
+        sep = head[len(self._carry):]
+        self._started = True
+
+        body = _find_last_marker(text)
+        # carry/separator에서 시작해 text 앞부분으로 이어지는 마커 (경계 구간만 탐색).
+        # carry 안에서 끝나는 마커는 이전 블록에서 이미 처리했다 — carry는 가장 긴 마커보다
+        # 1글자 짧아 그 마커의 뒷부분(예: "*" 없는 ":bar_chart: 일정 요약*")만 다시 잡힐 수 있다
+        edge = _find_last_marker(head + text[:_MARKER_CARRY_LEN], len(self._carry)) if head else None
+        if edge is not None and edge.start() >= len(head):
+            edge = None  # text 안에서 시작하는 마커는 body 탐색 결과를 따른다
+
+        if body is not None and (edge is None or body.start() >= edge.end() - len(head)):
+            self._parts = [text[body.start():]]
+            self.found = True
+        elif edge is not None:
+            self._parts = [head[edge.start():], text]
+            self.found = True
+        else:
+            if sep:
+                self._parts.append(sep)
+            self._parts.append(text)
+
+        if len(text) >= _MARKER_CARRY_LEN:
+            self._carry = text[-_MARKER_CARRY_LEN:]
+        else:
+            self._carry = (head + text)[-_MARKER_CARRY_LEN:]
+
+    def getvalue(self) -> str:
+        """보관 중인 텍스트 (마커가 있었으면 마지막 마커부터, 없으면 전체)."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+
 def extract_report_content(output: str) -> str:
     """CLI 출력에서 최종 리포트만 추출.
 
@@ -45,13 +140,84 @@ def extract_report_content(output: str) -> str:
     포함된 경우 마커 시작점부터만 추출하고, 마커가 없으면 전체 반환.
     """
     content = output.strip()
-    for marker in _REPORT_MARKERS:
-        idx = content.find(marker)
-        if idx != -1:
-            return content[idx:].strip()
+    idx = find_report_start(content)
+    if idx != -1:
+        return content[idx:].strip()
     return content
 
 
+# rubric D1/D2 — Slack 호환 형식 (마크다운 표/헤딩 금지) + 카테고리 헤더/구분선
+_TABLE_ROW_PATTERN = re.compile(r"^\s*\|[^|\n]+\|[^|\n]+\|", re.MULTILINE)
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_CATEGORY_HEADER_PATTERN = re.compile(r"\*\[.+?\]\*")
+_DIVIDER = "───"
+
+
+def find_report_violations(report: str) -> list[str]:
+    """daily 리포트 구조 검사 (rubric D1/D2). 위반 사유 목록 — 비어 있으면 유효."""
+    violations = []
+    if find_report_start(report) == -1:
+        violations.append("missing report marker")
+    if _TABLE_ROW_PATTERN.search(report):
+        violations.append("markdown table")
+    if _HEADING_PATTERN.search(report):
+        violations.append("markdown heading")
+    if not _CATEGORY_HEADER_PATTERN.search(report):
+        violations.append("missing *[category]* header")
+    if _DIVIDER not in report:
+        violations.append("missing divider")
+    return violations
+
+
+# storage format의 JIRA 매크로 key 파라미터 + /browse/KEY 링크
+_JIRA_KEY_PATTERN = re.compile(
+    r'<ac:parameter ac:name="key">\s*([A-Z][A-Z0-9_]+-\d+)\s*</ac:parameter>'
+    r'|/browse/([A-Z][A-Z0-9_]+-\d+)'
+)
+
+
+def extract_jira_keys(storage_html: str) -> list[str]:
+    """Confluence storage HTML에서 참조된 JIRA 티켓 key 추출 (등장 순서 유지, 중복 제거)"""
+    keys = (m.group(1) or m.group(2) for m in _JIRA_KEY_PATTERN.finditer(storage_html))
+    return list(dict.fromkeys(keys))
+
+
+def format_report_context(context: ReportContext) -> str:
+    """미리 조회한 페이지/티켓을 프롬프트에 붙일 텍스트 블록으로 변환"""
+    lines = [
+        "<prefetched_context>",
+        "아래 Confluence 페이지와 JIRA 티켓은 실행 직전에 조회한 최신 데이터다.",
+        "같은 데이터를 MCP 도구로 다시 조회하지 말고 이 내용으로 리포트를 작성하라.",
+    ]
+    if context.missing_issue_keys:
+        lines.append(
+            f"조회하지 못한 티켓만 MCP로 확인하라: {', '.join(context.missing_issue_keys)}"
+        )
+    lines += [
+        "",
+        f"## Confluence page: {context.page_title}",
+        f"URL: {context.page_url}",
+        context.page_body,
+        "",
+        "## JIRA issues",
+    ]
+    for issue in context.issues:
+        versions = ", ".join(issue.fix_versions) or "-"
+        lines.append(
+            f"- {issue.key} | status: {issue.status} | fixVersions: {versions} | summary: {issue.summary}"
+        )
+    if context.mentions:
+        # 팀원/날짜별로 어떤 티켓을 다뤘는지 — 표를 다시 해석하지 않아도 되도록
+        lines += ["", "## Ticket references (member | day: keys)"]
+        grouped: dict[tuple[str, str], list[str]] = {}
+        for mention in context.mentions:
+            grouped.setdefault((mention.member, mention.day), []).append(mention.key)
+        for (member, day), keys in grouped.items():
+            lines.append(f"- {member or '-'} | {day or '-'}: {', '.join(keys)}")
+    lines.append("</prefetched_context>")
+    return "\n".join(lines)
+
+
 def convert_markdown_links_to_slack(text: str) -> str:
     """
     마크다운 링크를 Slack 형식으로 변환
@@ -0,0 +1,52 @@
+"""ConfluenceAdapter의 async 버전 (AsyncConfluencePort 구현).
+
+blocking 호출을 anyio worker thread에서 실행하되, 어댑터 단위 CapacityLimiter로
+동시 요청 수를 제한한다. 여러 팀/여러 use case가 한 이벤트 루프에서 같은 어댑터를
+공유해도 요청마다 스레드를 늘리지 않고, 연결 풀(pool_size) 이상으로 동시에 보내지 않는다.
+"""
+
+import anyio
+from anyio.lowlevel import RunVar
+
+from .confluence_adapter import ConfluenceAdapter
+from .http_session import DEFAULT_POOL_SIZE, HttpPoolStats
+
+
+class AsyncConfluenceAdapter:
+    """ConfluenceAdapter를 감싼 async Confluence 접근 (세션/캐시는 감싼 어댑터와 공유)"""
+
+    def __init__(self, adapter: ConfluenceAdapter, max_concurrency: int = DEFAULT_POOL_SIZE):
+        self._adapter = adapter
+        self._max_concurrency = max(1, max_concurrency)
+        # CapacityLimiter는 이벤트 루프에 묶이므로 루프(anyio.run)마다 새로 만든다
+        self._limiter: RunVar[anyio.CapacityLimiter] = RunVar(f"confluence_limiter_{id(self)}")
+
+    def http_stats(self) -> HttpPoolStats:
+        return self._adapter.http_stats()
+
+    async def get_pages_by_titles(
+        self, space_key: str, titles: list[str], expand_body: bool = False
+    ) -> dict[str, dict]:
+        return await self._run(self._adapter.get_pages_by_titles, space_key, titles, expand_body)
+
+    async def get_page_content(self, page_id: str) -> str:
+        return await self._run(self._adapter.get_page_content, page_id)
+
+    async def get_space_id(self, space_key: str) -> str:
+        return await self._run(self._adapter.get_space_id, space_key)
+
+    async def create_page(
+        self, space_key: str, title: str, content: str, parent_id: str
+    ) -> str:
+        return await self._run(self._adapter.create_page, space_key, title, content, parent_id)
+
+    async def _run(self, func, *args):
+        return await anyio.to_thread.run_sync(func, *args, limiter=self._current_limiter())
+
+    def _current_limiter(self) -> anyio.CapacityLimiter:
+        try:
+            return self._limiter.get()
+        except LookupError:
+            limiter = anyio.CapacityLimiter(self._max_concurrency)
+            self._limiter.set(limiter)
+            return limiter
@@ -0,0 +1,54 @@
+"""여러 주 페이지 생성(backfill) 진행 기록 — JSON 파일 (BackfillCheckpointPort 구현).
+
+CQL 검색 색인은 페이지 생성 직후 몇 초간 새 페이지를 못 볼 수 있으므로, 중단 직후
+재실행이 같은 주를 다시 만들지 않도록 생성한 제목을 따로 남긴다. 마지막으로 만든
+페이지 본문도 함께 남겨 재실행이 그 페이지를 다시 받지 않고 다음 주 원본으로 쓴다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+class JsonBackfillCheckpoint:
+    """페이지 1개 생성마다 파일 전체를 원자적으로 다시 쓴다 (backfill은 많아야 수십 주)"""
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._data = self._read()
+
+    def created_titles(self) -> set[str]:
+        return set(self._data["created"])
+
+    def last_created(self) -> tuple[str, str] | None:
+        last = self._data.get("last")
+        if not last:
+            return None
+        return last["title"], last["content"]
+
+    def record(self, title: str, url: str, content: str) -> None:
+        self._data["created"][title] = url
+        self._data["last"] = {"title": title, "content": content}
+        self._write()
+
+    def clear(self) -> None:
+        self._data = {"created": {}, "last": None}
+        self._path.unlink(missing_ok=True)
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"created": {}, "last": None}
+        except ValueError:
+            print(f"WARNING: ignoring unreadable backfill checkpoint {self._path}.")
+            return {"created": {}, "last": None}
+        data.setdefault("created", {})
+        data.setdefault("last", None)
+        return data
+
+    def _write(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self._path)
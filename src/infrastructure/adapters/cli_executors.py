@@ -1,33 +1,169 @@
 """CLI 실행기.
 
-ClaudeCLIExecutor — claude-agent-sdk 기반.
+ClaudeCLIExecutor — claude-agent-sdk 기반 (job마다 claude 프로세스 cold start).
+WarmClaudeExecutor — 데몬용. WarmClaudeSession의 상주 프로세스/MCP 서버를 재사용.
 """
 
-from datetime import date
+import dataclasses
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from datetime import date, datetime
+from functools import partial
 from pathlib import Path
 
 import anyio
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeAgentOptions,
+    ClaudeSDKClient,
+    CLIConnectionError,
     CLIJSONDecodeError,
     CLINotFoundError,
     ProcessError,
+    ResultMessage,
     TextBlock,
     query,
 )
 
+from ...application.ports import MetricsStorePort
+from ...domain.models import RunMetrics, StreamRestart
+from ...domain.services import (
+    ReportMarkerExtractor,
+    extract_report_content,
+    find_report_violations,
+)
+
 # Task 0 스파이크 결과로 채택. 변경 시 docs/sdk_spike_findings.md 참조.
 _PERMISSION_MODE: str = "acceptEdits"
 _DEFAULT_MODEL: str = "sonnet"
+# 상주 세션에서 job 간 대화 컨텍스트를 초기화하는 슬래시 커맨드
+_CLEAR_COMMAND: str = "/clear"
+
+# deadline fallback 순서 (느림/고품질 → 빠름). 시작 모델 이후의 모델만 사용
+_FALLBACK_CHAIN: tuple[str, ...] = ("opus", "sonnet", "haiku")
+
+# split prompt 레이아웃에서 커맨드 본문의 `$ARGUMENTS` 자리에 들어갈 안내 (인자는 사용자 메시지로)
+_ARGUMENTS_PLACEHOLDER: str = "(사용자 메시지의 <arguments> 값)"
+
+# 실행 종료 시 SDK가 보내는 ResultMessage 콜백 (비용/토큰/지연 기록용)
+ResultCallback = Callable[[ResultMessage], None]
+
+# (space_key, report_date) → 프롬프트에 덧붙일 사전 조회 컨텍스트. None이면 agent가 직접 조회
+ContextProvider = Callable[[str, date], Awaitable[str | None]]
+
+
+@dataclasses.dataclass(frozen=True)
+class _RaceEntry:
+    """경주 참가자 1명의 완주 기록"""
+    elapsed: float  # 경주 시작부터 완료까지 (초)
+    output: str | None  # SDK 오류로 실패하면 None
+    valid: bool  # find_report_violations 통과 여부
+
+
+def _read_command_body(path: Path) -> str | None:
+    """슬래시 커맨드 파일 본문 (YAML frontmatter 제외). 파일이 없으면 None."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    if text.startswith("---\n"):
+        end = text.find("\n---\n", 4)
+        if end != -1:
+            text = text[end + len("\n---\n"):]
+    return text.strip()
+
+
+def _iter_text_blocks(msg) -> list[str]:
+    """AssistantMessage의 TextBlock 텍스트만 추출. 그 외 메시지/블록은 무시."""
+    if not isinstance(msg, AssistantMessage):
+        return []
+    return [block.text for block in msg.content if isinstance(block, TextBlock)]
+
+
+async def _iter_until(texts: AsyncIterator[str], deadline: float) -> AsyncIterator[str]:
+    """texts를 deadline(anyio.current_time 기준)까지만 소비. 초과 시 TimeoutError.
+
+    cancel scope는 `__anext__` 대기에만 걸어 yield를 가로지르지 않게 한다. 취소는 SDK
+    generator 안으로 전달되어 세션/서브프로세스 정리(finally)를 거친 뒤 빠져나온다.
+    """
+    async with aclosing(texts):
+        while True:
+            with anyio.CancelScope(deadline=deadline) as scope:
+                try:
+                    text = await texts.__anext__()
+                except StopAsyncIteration:
+                    return
+            if scope.cancelled_caught:
+                raise TimeoutError("no output within deadline")
+            yield text
+
+
+async def _collect_report(texts: AsyncIterator[str]) -> str:
+    """text block 스트림 소비 — 마지막 리포트 마커 이전의 중간 분석은 메모리에 남기지 않는다."""
+    extractor = ReportMarkerExtractor()
+    async for text in texts:
+        extractor.feed(text)
+    return extractor.getvalue().strip()
+
+
+def _build_run_metrics(msg: ResultMessage, mode: str, model: str, space_key: str) -> RunMetrics:
+    usage = msg.usage or {}
+    return RunMetrics(
+        recorded_at=datetime.now(),
+        mode=mode,
+        model=model,
+        space_key=space_key,
+        duration_ms=msg.duration_ms,
+        duration_api_ms=msg.duration_api_ms,
+        num_turns=msg.num_turns,
+        cost_usd=msg.total_cost_usd,
+        input_tokens=usage.get("input_tokens", 0),
+        output_tokens=usage.get("output_tokens", 0),
+        cache_creation_input_tokens=usage.get("cache_creation_input_tokens", 0),
+        cache_read_input_tokens=usage.get("cache_read_input_tokens", 0),
+        is_error=msg.is_error,
+    )
 
 
 class ClaudeCLIExecutor:
-    """Claude Agent SDK 기반 실행기 — `.claude/commands/<command>.md` 슬래시 커맨드 호출."""
+    """Claude Agent SDK 기반 실행기 — `.claude/commands/<command>.md` 슬래시 커맨드 호출.
+
+    metrics_store가 주어지면 실행마다 ResultMessage의 비용/토큰/지연을 기록한다.
+    deadline_seconds가 주어지면 실행 전체를 그 시간 안으로 제한한다. 남은 예산이
+    (남은 fallback 모델 수 × fallback_reserve_seconds)에 닿으면 현재 시도를 취소하고
+    (SDK 세션/서브프로세스 종료) _FALLBACK_CHAIN의 더 빠른 모델로 다시 시도한다.
+    fallback_reserve_seconds가 0이면 fallback 없이 deadline만 적용한다.
+    context_provider가 주어지면 실행 전에 리포트 입력을 조회해 프롬프트에 덧붙인다
+    (agent의 MCP 조회 turn 절약). 조회 실패 시 컨텍스트 없이 그대로 실행한다.
+    command_file이 주어지면 split prompt 레이아웃을 쓴다: 변하지 않는 커맨드 본문은
+    system prompt 뒤에 붙이고(dynamic section 제외), 매번 바뀌는 인자/날짜/페이지
+    데이터만 사용자 메시지로 보낸다. 실행 간 공통 prefix가 길어져 prompt cache가 맞는다.
+    파일이 없으면 기존 슬래시 커맨드 프롬프트로 실행한다.
+    race_models가 2개 이상이면 같은 프롬프트를 그 모델들로 동시에 실행하고, 구조 검사
+    (find_report_violations)를 먼저 통과한 출력을 채택한 뒤 나머지는 취소한다.
+    통과한 출력이 없으면 race_models 순서상 먼저인 모델의 출력을 쓴다.
+    """
 
-    def __init__(self, command: str = "daily_report", model: str | None = None):
+    def __init__(
+        self,
+        command: str = "daily_report",
+        model: str | None = None,
+        metrics_store: MetricsStorePort | None = None,
+        deadline_seconds: float | None = None,
+        fallback_reserve_seconds: float = 0.0,
+        context_provider: ContextProvider | None = None,
+        command_file: Path | None = None,
+        race_models: tuple[str, ...] = (),
+    ):
         self._command = command
         self._model = model
+        self._metrics_store = metrics_store
+        self._deadline_seconds = deadline_seconds
+        self._fallback_reserve_seconds = fallback_reserve_seconds
+        self._context_provider = context_provider
+        self._command_file = command_file
+        self._race_models = tuple(race_models) if len(race_models) > 1 else ()
 
     def execute(
         self,
@@ -35,36 +171,479 @@ class ClaudeCLIExecutor:
         mention_users: str = "",
         report_date: date | None = None,
     ) -> str | None:
-        prompt = self._build_prompt(space_key, mention_users, report_date)
+        return anyio.run(self.execute_async, space_key, mention_users, report_date)
+
+    async def execute_async(
+        self,
+        space_key: str,
+        mention_users: str = "",
+        report_date: date | None = None,
+    ) -> str | None:
+        """이벤트 루프 안에서 실행 — 여러 팀 리포트를 한 루프에서 동시에 돌릴 때 사용."""
+        prompt, system_append = await self._prepare_prompt(space_key, mention_users, report_date)
+        if self._race_models:
+            return await self._race(prompt, space_key, system_append)
+        extractor = ReportMarkerExtractor()
+        current_attempt = 0
         try:
-            return anyio.run(self._run_sdk, prompt)
+            async for attempt, text in self._stream_attempts(prompt, space_key, system_append):
+                if attempt != current_attempt:
+                    # fallback 시도는 처음부터 다시 생성 — 취소된 시도의 부분 출력은 버린다
+                    extractor, current_attempt = ReportMarkerExtractor(), attempt
+                extractor.feed(text)
         except (CLINotFoundError, ProcessError, CLIJSONDecodeError) as e:
             print(f"ERROR: claude SDK failed: {type(e).__name__}: {e}")
             return None
+        except TimeoutError as e:
+            print(f"ERROR: claude run exceeded its deadline: {e}")
+            return None
+        return extractor.getvalue().strip()
 
-    def _build_prompt(
+    async def stream(
+        self,
+        space_key: str,
+        mention_users: str = "",
+        report_date: date | None = None,
+    ) -> AsyncIterator[str | StreamRestart]:
+        """TextBlock 텍스트를 도착하는 대로 yield (스트리밍 전송용).
+
+        SDK 예외와 deadline 초과(TimeoutError)는 호출자에게 전파. fallback 시도가 시작되면
+        StreamRestart를 먼저 yield — 소비자는 취소된 시도의 부분 출력을 버리고 다시 받는다.
+        """
+        prompt, system_append = await self._prepare_prompt(space_key, mention_users, report_date)
+        if self._race_models:
+            # 경주는 우승자가 정해져야 출력이 확정되므로 한 조각으로 전달
+            output = await self._race(prompt, space_key, system_append)
+            if not output:
+                raise RuntimeError(f"no raced model produced a report ({', '.join(self._race_models)})")
+            yield output
+            return
+        models = self._fallback_models()
+        current_attempt = 0
+        async for attempt, text in self._stream_attempts(prompt, space_key, system_append):
+            if attempt != current_attempt:
+                current_attempt = attempt
+                yield StreamRestart(attempt=attempt, model=models[attempt])
+            yield text
+
+    def _build_arguments(
         self,
         space_key: str,
         mention_users: str,
         report_date: date | None,
     ) -> str:
-        parts = [f"/{self._command}", space_key]
+        parts = [space_key]
         if mention_users:
             parts.append(f'"{mention_users}"')
         if report_date:
             parts.append(f"--date {report_date.isoformat()}")
         return " ".join(parts)
 
-    async def _run_sdk(self, prompt: str) -> str:
-        parts: list[str] = []
+    def _build_prompt(
+        self,
+        space_key: str,
+        mention_users: str,
+        report_date: date | None,
+    ) -> str:
+        return f"/{self._command} {self._build_arguments(space_key, mention_users, report_date)}"
+
+    async def _prepare_prompt(
+        self,
+        space_key: str,
+        mention_users: str,
+        report_date: date | None,
+    ) -> tuple[str, str | None]:
+        """(사용자 메시지, system prompt append). split 레이아웃이 아니면 append는 None.
+
+        사용자 메시지 = 슬래시 커맨드 줄(또는 <arguments>) + 사전 조회 컨텍스트.
+        """
+        body = _read_command_body(self._command_file) if self._command_file is not None else None
+        if body is None:
+            prompt, system_append = self._build_prompt(space_key, mention_users, report_date), None
+        else:
+            system_append = (
+                f'<report_command name="{self._command}">\n'
+                f"{body.replace('$ARGUMENTS', _ARGUMENTS_PLACEHOLDER)}\n"
+                "</report_command>"
+            )
+            prompt = (
+                f"<report_command name=\"{self._command}\">를 실행하라.\n"
+                f"<arguments>{self._build_arguments(space_key, mention_users, report_date)}</arguments>"
+            )
+
+        if self._context_provider is None:
+            return prompt, system_append
+        try:
+            context = await self._context_provider(space_key, report_date or date.today())
+        except Exception as e:
+            # prefetch는 최적화일 뿐 — 실패하면 agent가 MCP로 직접 조회하는 기존 경로로
+            print(f"WARNING: context prefetch failed ({type(e).__name__}: {e}) — running without it.")
+            return prompt, system_append
+        if not context:
+            return prompt, system_append
+        return f"{prompt}\n\n{context}", system_append
+
+    def _fallback_models(self) -> list[str]:
+        """시도할 모델 순서. 체인에 없는 모델(전체 모델 ID 등)이나 deadline/reserve 미설정이면 fallback 없음."""
+        model = self._model or _DEFAULT_MODEL
+        if self._deadline_seconds is None or self._fallback_reserve_seconds <= 0 or model not in _FALLBACK_CHAIN:
+            return [model]
+        return list(_FALLBACK_CHAIN[_FALLBACK_CHAIN.index(model):])
+
+    async def _stream_attempts(
+        self, prompt: str, space_key: str, system_append: str | None = None
+    ) -> AsyncIterator[tuple[int, str]]:
+        """(시도 번호, 텍스트)를 yield. 시도마다 지연을 로그로 남긴다."""
+        models = self._fallback_models()
+        if self._deadline_seconds is None:
+            async for text in self._stream_sdk(
+                prompt, partial(self._record_result, space_key, models[0]), models[0], system_append
+            ):
+                yield 0, text
+            return
+
+        deadline = anyio.current_time() + self._deadline_seconds
+        for attempt, model in enumerate(models):
+            is_last = attempt == len(models) - 1
+            # 뒤에 남은 fallback 모델마다 reserve만큼 예산을 남겨둔다
+            remaining_fallbacks = len(models) - 1 - attempt
+            attempt_deadline = deadline - self._fallback_reserve_seconds * remaining_fallbacks
+            started = anyio.current_time()
+            budget = attempt_deadline - started
+            if budget <= 0:
+                print(f"Attempt {attempt + 1}/{len(models)} model={model}: skipped (remaining budget below reserve)")
+                continue
+
+            texts = self._stream_sdk(
+                prompt, partial(self._record_result, space_key, model), model, system_append
+            )
+            try:
+                async for text in _iter_until(texts, attempt_deadline):
+                    yield attempt, text
+            except TimeoutError:
+                elapsed = anyio.current_time() - started
+                print(f"Attempt {attempt + 1}/{len(models)} model={model}: timed out after {elapsed:.1f}s (budget {budget:.0f}s)")
+                self._record_timeout(space_key, model, elapsed)
+                if is_last:
+                    raise TimeoutError(
+                        f"{self._deadline_seconds:.0f}s deadline exhausted after {len(models)} attempt(s)"
+                    ) from None
+                continue
+            elapsed = anyio.current_time() - started
+            print(f"Attempt {attempt + 1}/{len(models)} model={model}: completed in {elapsed:.1f}s (budget {budget:.0f}s)")
+            return
+
+    async def _race(
+        self, prompt: str, space_key: str, system_append: str | None = None
+    ) -> str | None:
+        """race_models를 동시에 실행해 처음으로 구조 검사를 통과한 출력 반환.
+
+        deadline_seconds가 있으면 경주 전체에 적용된다. 참가자별 결과(won/lost/invalid/
+        failed)와 우승자 대비 지연 차는 경주가 끝난 뒤 메트릭으로 한꺼번에 기록한다.
+        """
+        started = anyio.current_time()
+        finished: dict[str, _RaceEntry] = {}
+        results: dict[str, ResultMessage] = {}
+        winner: str | None = None
+
+        async def run(model: str, scope: anyio.CancelScope) -> None:
+            nonlocal winner
+            extractor = ReportMarkerExtractor()
+            try:
+                async for text in self._stream_sdk(
+                    prompt, partial(results.__setitem__, model), model, system_append
+                ):
+                    extractor.feed(text)
+            except (CLINotFoundError, ProcessError, CLIJSONDecodeError) as e:
+                print(f"WARNING: race model={model} failed: {type(e).__name__}: {e}")
+                finished[model] = _RaceEntry(anyio.current_time() - started, None, False)
+                return
+            output = extractor.getvalue().strip()
+            violations = find_report_violations(extract_report_content(output))
+            finished[model] = _RaceEntry(anyio.current_time() - started, output, not violations)
+            if violations:
+                print(f"Race model={model}: invalid output ({', '.join(violations)})")
+            elif winner is None:
+                winner = model
+                scope.cancel()  # 나머지 참가자 취소 → SDK가 서브프로세스 정리
+
+        async with anyio.create_task_group() as tg:
+            if self._deadline_seconds is not None:
+                tg.cancel_scope.deadline = started + self._deadline_seconds
+            for model in self._race_models:
+                tg.start_soon(run, model, tg.cancel_scope)
+
+        elapsed = anyio.current_time() - started
+        chosen = winner or next(
+            (m for m in self._race_models if m in finished and finished[m].output), None
+        )
+        if winner is not None:
+            print(f"Race winner model={winner} in {finished[winner].elapsed:.1f}s")
+        elif chosen is not None:
+            print(f"WARNING: no raced output passed validation — using model={chosen}.")
+        else:
+            print(f"ERROR: every raced model failed or was cancelled after {elapsed:.1f}s.")
+        self._record_race(space_key, winner, finished, results, elapsed)
+        return finished[chosen].output if chosen is not None else None
+
+    def _record_race(
+        self,
+        space_key: str,
+        winner: str | None,
+        finished: dict[str, _RaceEntry],
+        results: dict[str, ResultMessage],
+        elapsed: float,
+    ) -> None:
+        mode = self._command.removesuffix("_report")
+        winner_elapsed = finished[winner].elapsed if winner is not None else None
+        for model in self._race_models:
+            entry = finished.get(model)
+            # 우승자 없이 끝나지 못한 참가자 = 경주 deadline으로 취소됨
+            timed_out = entry is None and winner is None
+            if model == winner:
+                outcome = "won"
+            elif winner is not None and (entry is None or entry.valid):
+                outcome = "lost"  # 우승자가 나와 취소됨
+            elif entry is None or entry.output is None:
+                outcome = "failed"
+            else:
+                outcome = "invalid"
+            msg = results.get(model)
+            if msg is not None:
+                metrics = _build_run_metrics(msg, mode=mode, model=model, space_key=space_key)
+            else:
+                # 취소된 참가자는 ResultMessage가 없으므로 취소까지의 wall-clock만 기록
+                metrics = RunMetrics(
+                    recorded_at=datetime.now(),
+                    mode=mode,
+                    model=model,
+                    space_key=space_key,
+                    duration_ms=int((entry.elapsed if entry else elapsed) * 1000),
+                    duration_api_ms=0,
+                    num_turns=0,
+                    is_error=outcome == "failed",
+                )
+            delta = (
+                int((entry.elapsed - winner_elapsed) * 1000)
+                if entry is not None and winner_elapsed is not None
+                else None
+            )
+            self._append_metrics(
+                dataclasses.replace(
+                    metrics,
+                    timed_out=metrics.timed_out or timed_out,
+                    race_outcome=outcome,
+                    race_delta_ms=delta,
+                )
+            )
+
+    def _record_result(self, space_key: str, model: str, msg: ResultMessage) -> None:
+        metrics = _build_run_metrics(
+            msg,
+            mode=self._command.removesuffix("_report"),
+            model=model,
+            space_key=space_key,
+        )
+        cost = f"${metrics.cost_usd:.4f}" if metrics.cost_usd is not None else "n/a"
+        print(
+            f"Run metrics: cost={cost} duration={metrics.duration_ms / 1000:.1f}s "
+            f"api={metrics.duration_api_ms / 1000:.1f}s turns={metrics.num_turns} "
+            f"tokens(in/out)={metrics.input_tokens}/{metrics.output_tokens} "
+            f"cache(read/write)={metrics.cache_read_input_tokens}/"
+            f"{metrics.cache_creation_input_tokens}"
+        )
+        self._append_metrics(metrics)
+
+    def _record_timeout(self, space_key: str, model: str, elapsed: float) -> None:
+        """취소된 시도는 ResultMessage가 없으므로 측정한 wall-clock만 기록 (예산 튜닝용)."""
+        self._append_metrics(RunMetrics(
+            recorded_at=datetime.now(),
+            mode=self._command.removesuffix("_report"),
+            model=model,
+            space_key=space_key,
+            duration_ms=int(elapsed * 1000),
+            duration_api_ms=0,
+            num_turns=0,
+            is_error=True,
+            timed_out=True,
+        ))
+
+    def _append_metrics(self, metrics: RunMetrics) -> None:
+        if self._metrics_store is None:
+            return
+        try:
+            self._metrics_store.append(metrics)
+        except Exception as e:
+            # 메트릭 기록 실패가 리포트 전송을 막지 않도록
+            print(f"WARNING: failed to record run metrics: {type(e).__name__}: {e}")
+
+    async def _stream_sdk(
+        self,
+        prompt: str,
+        on_result: ResultCallback | None = None,
+        model: str | None = None,
+        system_append: str | None = None,
+    ) -> AsyncIterator[str]:
         opts = ClaudeAgentOptions(
-            model=self._model or _DEFAULT_MODEL,
+            model=model or self._model or _DEFAULT_MODEL,
             permission_mode=_PERMISSION_MODE,
             cwd=Path.cwd(),
         )
-        async for msg in query(prompt=prompt, options=opts):
-            if isinstance(msg, AssistantMessage):
-                for block in msg.content:
-                    if isinstance(block, TextBlock):
-                        parts.append(block.text)
-        return "\n".join(parts).strip()
+        if system_append is not None:
+            # git status 등 실행마다 바뀌는 section은 빼서 system prompt 전체를 cache prefix로
+            opts.system_prompt = {
+                "type": "preset",
+                "preset": "claude_code",
+                "append": system_append,
+                "exclude_dynamic_sections": True,
+            }
+        # 취소 시 query generator를 즉시 닫아 SDK가 claude 서브프로세스를 정리하도록
+        async with aclosing(query(prompt=prompt, options=opts)) as messages:
+            async for msg in messages:
+                if on_result is not None and isinstance(msg, ResultMessage):
+                    on_result(msg)
+                for text in _iter_text_blocks(msg):
+                    yield text
+
+
+class WarmClaudeSession:
+    """데몬용 상주 SDK 세션 — claude 프로세스와 stdio MCP 서버를 job 간에 재사용.
+
+    첫 job이 connect 비용(cold start)을 지불하고, 이후 job은 `/clear`로 대화만
+    초기화한 뒤 같은 프로세스에서 실행된다(warm). 한 번에 한 job만 처리한다.
+    SDK 오류가 나면 세션을 버리고 다음 job에서 다시 connect 한다.
+    """
+
+    def __init__(self, model: str | None = None):
+        self._model = model or _DEFAULT_MODEL
+        self._client: ClaudeSDKClient | None = None
+        self._lock = anyio.Lock()
+        self.last_connect_seconds: float = 0.0
+
+    @property
+    def is_warm(self) -> bool:
+        return self._client is not None
+
+    async def run(self, prompt: str, model: str | None = None) -> str:
+        """prompt 1건 실행. 출력 수집 규칙은 ClaudeCLIExecutor.execute_async와 동일."""
+        return await _collect_report(self.stream(prompt, model))
+
+    async def stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        on_result: ResultCallback | None = None,
+    ) -> AsyncIterator[str]:
+        """prompt 1건 실행하며 TextBlock 텍스트를 도착하는 대로 yield."""
+        wanted = model or _DEFAULT_MODEL
+        async with self._lock:
+            try:
+                if self._client is None:
+                    await self._connect(wanted)
+                else:
+                    self.last_connect_seconds = 0.0
+                    async for _ in self._iter_text(_CLEAR_COMMAND):
+                        pass
+                    if wanted != self._model:
+                        await self._client.set_model(wanted)
+                        self._model = wanted
+                async for text in self._iter_text(prompt, on_result):
+                    yield text
+            except (CLIConnectionError, ProcessError, CLIJSONDecodeError):
+                await self._discard()
+                raise
+            except anyio.get_cancelled_exc_class():
+                # deadline 취소 — 응답 도중 끊긴 세션은 재사용할 수 없으므로 버린다
+                with anyio.CancelScope(shield=True):
+                    await self._discard()
+                raise
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._discard()
+
+    async def _connect(self, model: str) -> None:
+        started = time.perf_counter()
+        client = ClaudeSDKClient(
+            options=ClaudeAgentOptions(
+                model=model,
+                permission_mode=_PERMISSION_MODE,
+                cwd=Path.cwd(),
+            )
+        )
+        await client.connect()
+        self._client = client
+        self._model = model
+        self.last_connect_seconds = time.perf_counter() - started
+
+    async def _iter_text(
+        self, prompt: str, on_result: ResultCallback | None = None
+    ) -> AsyncIterator[str]:
+        await self._client.query(prompt)
+        async for msg in self._client.receive_response():
+            if on_result is not None and isinstance(msg, ResultMessage):
+                on_result(msg)
+            for text in _iter_text_blocks(msg):
+                yield text
+
+    async def _discard(self) -> None:
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            await client.disconnect()
+        except Exception as e:
+            print(f"WARNING: failed to disconnect claude SDK session: {type(e).__name__}: {e}")
+
+
+class WarmClaudeExecutor(ClaudeCLIExecutor):
+    """WarmClaudeSession 위에서 슬래시 커맨드를 실행하는 CLIExecutorPort 구현.
+
+    데몬은 use case를 워커 스레드에서 돌리므로, 동기 `execute`는 세션이 속한
+    이벤트 루프로 되돌아가(`anyio.from_thread`) 실행한다.
+    """
+
+    def __init__(
+        self,
+        session: WarmClaudeSession,
+        command: str = "daily_report",
+        model: str | None = None,
+        metrics_store: MetricsStorePort | None = None,
+        deadline_seconds: float | None = None,
+        fallback_reserve_seconds: float = 0.0,
+        context_provider: ContextProvider | None = None,
+        command_file: Path | None = None,
+        race_models: tuple[str, ...] = (),
+    ):
+        super().__init__(
+            command=command,
+            model=model,
+            metrics_store=metrics_store,
+            deadline_seconds=deadline_seconds,
+            fallback_reserve_seconds=fallback_reserve_seconds,
+            context_provider=context_provider,
+            command_file=command_file,
+            race_models=race_models,
+        )
+        self._session = session
+
+    def execute(
+        self,
+        space_key: str,
+        mention_users: str = "",
+        report_date: date | None = None,
+    ) -> str | None:
+        return anyio.from_thread.run(self.execute_async, space_key, mention_users, report_date)
+
+    async def _stream_sdk(
+        self,
+        prompt: str,
+        on_result: ResultCallback | None = None,
+        model: str | None = None,
+        system_append: str | None = None,
+    ) -> AsyncIterator[str]:
+        # 상주 세션의 system prompt는 connect 시점에 고정 — 고정 부분을 메시지 앞에 둔다
+        if system_append is not None:
+            prompt = f"{system_append}\n\n{prompt}"
+        async for text in self._session.stream(prompt, model or self._model, on_result):
+            yield text
@@ -1,19 +1,69 @@
 """Confluence REST API 어댑터"""
 
+import threading
+from datetime import datetime
+
 import requests
 from atlassian import Confluence
 
+from .confluence_id_cache import SpaceIdCache
+from .http_session import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRIES,
+    HttpPoolStats,
+    build_pooled_session,
+    session_stats,
+)
+from .page_store import PageContentStore
+from .page_tree_index import IndexedPage, PageTreeIndex
+
+# 같은 제목이 여러 건 걸려도(CQL 부분 일치) 요청한 제목이 잘리지 않을 만큼 여유 있게
+_SEARCH_MIN_LIMIT = 25
+# 부모 페이지 하위 나열 시 페이지당 결과 수 (본문 없이 id/제목/버전만)
+_INDEX_PAGE_LIMIT = 200
+
+
+def _cql_quote(value: str) -> str:
+    """CQL 문자열 리터럴로 인용 (역슬래시/큰따옴표 escape)"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
 
 class ConfluenceAdapter:
-    """atlassian-python-api + REST API v2를 사용한 Confluence 페이지 접근"""
+    """atlassian-python-api + REST API v2를 사용한 Confluence 페이지 접근
+
+    v1 클라이언트와 v2 직접 호출이 keep-alive 세션 하나(연결 풀 + 재시도)를 공유한다.
+    space id는 space_id_cache(기본: 프로세스 memo)에서 먼저 찾는다.
+    page_store가 있으면 get_page_content는 버전만 확인하고 같은 버전의 저장된 본문을 쓴다.
+    title_index가 있으면 그 space의 제목 조회는 부모 페이지 하위 색인에서 찾는다 (검색 요청 없음).
+    """
 
-    def __init__(self, url: str, user: str, token: str):
-        self.client = Confluence(url=url, username=user, password=token)
+    def __init__(
+        self,
+        url: str,
+        user: str,
+        token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        space_id_cache: SpaceIdCache | None = None,
+        page_store: PageContentStore | None = None,
+        title_index: PageTreeIndex | None = None,
+    ):
+        self._session = build_pooled_session(pool_size=pool_size, retries=retries)
+        # 클라이언트가 세션에 basic auth를 설정 → v2 호출도 같은 인증 사용
+        self.client = Confluence(url=url, username=user, password=token, session=self._session)
         # v2 API는 /wiki 경로가 필요. atlassian-python-api는 자체적으로 /wiki를 추가하지만
         # requests 직접 호출 시에는 명시적으로 포함해야 함.
         base = url.rstrip("/")
         self._v2_base_url = base if base.endswith("/wiki") else f"{base}/wiki"
-        self._auth = (user, token)
+        self._space_ids = space_id_cache or SpaceIdCache()
+        self._page_store = page_store
+        self._title_index = title_index
+        self._index_lock = threading.Lock()
+
+    def http_stats(self) -> HttpPoolStats:
+        """이 어댑터 세션의 누적 요청/연결 수 (keep-alive 재사용 확인용)"""
+        return session_stats(self._session)
 
     def _build_page_url(self, page_id: str, space_key: str, title: str) -> str:
         """v2 API URL 형식으로 페이지 URL 구성 (private helper).
@@ -25,37 +75,254 @@ class ConfluenceAdapter:
 
     def get_page_by_title(self, space_key: str, title: str) -> dict | None:
         """제목으로 페이지 조회. 반환 dict에 'url' 키 추가."""
-        page = self.client.get_page_by_title(space_key, title)
+        index = self._index_for(space_key)
+        if index is not None:
+            hit = index.lookup(title)
+            if hit is None:
+                return None
+            return {"id": hit.id, "title": title, "url": self._build_page_url(hit.id, space_key, title)}
+        page = self._find_by_title(space_key, title)
         if page is None:
             return None
         # use case가 일관된 URL 형식 사용 가능하도록 'url' 필드 추가
         page["url"] = self._build_page_url(page["id"], space_key, title)
         return page
 
+    def get_page_version(self, space_key: str, title: str) -> int | None:
+        """제목으로 페이지 버전 번호 조회 (리포트 캐시 신선도 확인용). 없으면 None."""
+        index = self._index_for(space_key)
+        if index is not None:
+            hit = index.lookup(title)
+            return None if hit is None else hit.version
+        page = self._find_by_title(space_key, title, expand="version")
+        if page is None:
+            return None
+        return page["version"]["number"]
+
+    def _find_by_title(self, space_key: str, title: str, expand: str = "") -> dict | None:
+        """v1 content 제목 조회 — 첫 결과 또는 None.
+
+        atlassian-python-api의 get_page_by_title은 메이저 버전마다 반환 형태가 달라
+        (첫 결과 dict ↔ 응답 전체) 세션으로 직접 호출한다.
+        """
+        params = {"spaceKey": space_key, "title": title, "type": "page"}
+        if expand:
+            params["expand"] = expand
+        resp = self._session.get(
+            f"{self._v2_base_url}/rest/api/content", params=params, timeout=30
+        )
+        resp.raise_for_status()
+        results = resp.json().get("results", [])
+        return results[0] if results else None
+
     def get_page_content(self, page_id: str) -> str:
-        """페이지의 storage format HTML 조회"""
-        page = self.client.get_page_by_id(page_id, expand="body.storage")
-        return page["body"]["storage"]["value"]
+        """페이지의 storage format HTML 조회.
+
+        page_store가 있으면 버전 번호만 먼저 조회(본문 없는 작은 응답)해 저장된 본문을 재사용하고,
+        없거나 버전이 바뀌었을 때만 본문을 받아 저장한다.
+        """
+        if self._page_store is None:
+            page = self.client.get_page_by_id(page_id, expand="body.storage")
+            return page["body"]["storage"]["value"]
+
+        version = self._indexed_version(page_id)
+        if version is None:
+            version = self._get_content(page_id, "version")["version"]["number"]
+        return self._stored_body(page_id, version)
+
+    def _indexed_version(self, page_id: str) -> int | None:
+        """이번 프로세스에서 갱신한 색인에 있는 페이지면 그 버전 (버전 확인 요청 생략)"""
+        index = self._title_index
+        if index is None or index.needs_refresh():
+            return None
+        return index.version_of(page_id)
+
+    def _stored_body(self, page_id: str, version: int) -> str:
+        """version의 본문 — page_store에 있으면 그대로, 없으면 받아서 저장"""
+        if self._page_store is not None:
+            cached = self._page_store.get(page_id, version)
+            if cached is not None:
+                return cached
+        page = self._get_content(page_id, "body.storage,version")
+        body = page["body"]["storage"]["value"]
+        if self._page_store is not None:
+            # 버전 확인과 본문 조회 사이에 수정됐을 수 있으므로 본문과 함께 받은 버전으로 저장
+            self._page_store.put(page_id, page["version"]["number"], body)
+        return body
+
+    def _get_content(self, page_id: str, expand: str) -> dict:
+        resp = self._session.get(
+            f"{self._v2_base_url}/rest/api/content/{page_id}",
+            params={"expand": expand},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_pages_by_titles(
+        self, space_key: str, titles: list[str], expand_body: bool = False
+    ) -> dict[str, dict]:
+        """CQL `title in (...)` 검색 1회로 여러 제목 조회. {제목: 페이지}, 없는 제목은 키 없음.
+
+        title 단건 조회 N회 + 본문 조회를 요청 1회로 줄인다. CQL 제목 매칭은
+        정확 일치가 보장되지 않으므로 응답을 요청한 제목과 다시 대조한다.
+        """
+        wanted = list(dict.fromkeys(titles))
+        if not wanted:
+            return {}
+        index = self._index_for(space_key)
+        if index is not None:
+            try:
+                return self._indexed_pages(index, space_key, wanted, expand_body)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                # 검색과 본문 조회 사이에 삭제된 페이지 — 이번 조회는 본문 포함 검색으로
+                print("WARNING: indexed Confluence page is gone — falling back to title search.")
+        found = self._search_titles(space_key, wanted, "body.storage" if expand_body else "")
+        pages: dict[str, dict] = {}
+        for title, result in found.items():
+            page = {
+                "id": result["id"],
+                "title": title,
+                "url": self._build_page_url(result["id"], space_key, title),
+            }
+            if expand_body:
+                page["content"] = result["body"]["storage"]["value"]
+            pages[title] = page
+        return pages
+
+    def _search_titles(self, space_key: str, titles: list[str], expand: str) -> dict[str, dict]:
+        """CQL 제목 검색 — {요청한 제목: 첫 검색 결과}"""
+        title_list = ", ".join(_cql_quote(t) for t in titles)
+        params = {
+            "cql": f"space = {_cql_quote(space_key)} AND type = page AND title in ({title_list})",
+            "limit": max(_SEARCH_MIN_LIMIT, len(titles)),
+        }
+        if expand:
+            params["expand"] = expand
+        resp = self._session.get(
+            f"{self._v2_base_url}/rest/api/content/search", params=params, timeout=30
+        )
+        resp.raise_for_status()
+
+        found: dict[str, dict] = {}
+        for result in resp.json().get("results", []):
+            title = result.get("title")
+            if title in titles and title not in found:
+                found[title] = result
+        return found
+
+    def _indexed_pages(
+        self, index: PageTreeIndex, space_key: str, titles: list[str], expand_body: bool
+    ) -> dict[str, dict]:
+        """버전만 받는 제목 검색으로 존재를 확정하고, 본문은 page_store에서 재사용.
+
+        색인은 마지막 갱신 이후 삭제/생성된 페이지를 모른다. create_page가 삭제된 페이지를
+        있다고 보고 생성을 건너뛰거나 새 페이지를 놓치지 않도록 hit/miss 모두 검색 결과를 따르고,
+        그 결과로 색인을 맞춘다.
+        """
+        found = self._search_titles(space_key, titles, "version")
+        pages: dict[str, dict] = {}
+        for title in titles:
+            result = found.get(title)
+            if result is None:
+                index.forget(title)
+                continue
+            confirmed = IndexedPage(result["id"], result["version"]["number"])
+            if index.lookup(title) != confirmed:
+                index.record(title, confirmed.id, confirmed.version)
+            page = {"id": confirmed.id, "title": title, "url": self._build_page_url(confirmed.id, space_key, title)}
+            if expand_body:
+                try:
+                    page["content"] = self._stored_body(confirmed.id, confirmed.version)
+                except requests.HTTPError as e:
+                    if e.response is not None and e.response.status_code == 404:
+                        index.forget(title)
+                    raise
+            pages[title] = page
+        return pages
+
+    def _index_for(self, space_key: str) -> PageTreeIndex | None:
+        """space_key의 제목 색인 (필요하면 갱신 후). 색인이 없거나 갱신 실패면 None → 검색 요청."""
+        index = self._title_index
+        if index is None or index.space_key != space_key:
+            return None
+        with self._index_lock:
+            if index.needs_refresh():
+                try:
+                    self._refresh_index(index)
+                except requests.RequestException as e:
+                    print(f"WARNING: page index refresh failed — using title search: {e}")
+                    return None
+        return index
+
+    def _refresh_index(self, index: PageTreeIndex) -> None:
+        """부모 페이지 하위를 CQL로 나열 (cursor 페이지네이션). 색인이 있으면 수정된 것만."""
+        since = index.modified_since()
+        cql = (
+            f"space = {_cql_quote(index.space_key)} AND type = page"
+            f" AND ancestor = {int(index.parent_id)}"
+        )
+        if since is not None:
+            cql += f' AND lastmodified >= "{since:%Y/%m/%d %H:%M}"'
+        url = f"{self._v2_base_url}/rest/api/content/search"
+        params: dict | None = {"cql": cql, "limit": _INDEX_PAGE_LIMIT, "expand": "version"}
+        entries = []
+        while url:
+            resp = self._session.get(url, params=params, timeout=30)
+            resp.raise_for_status()
+            data = resp.json()
+            for result in data.get("results", []):
+                version = result["version"]
+                when = version.get("when")
+                modified = datetime.fromisoformat(when.replace("Z", "+00:00")) if when else None
+                entries.append((result["title"], result["id"], version["number"], modified))
+            # next 링크에 cql/cursor/limit가 모두 들어 있다
+            next_link = data.get("_links", {}).get("next")
+            url = f"{self._v2_base_url}{next_link}" if next_link else ""
+            params = None
+        index.apply(entries, full=since is None)
 
     def get_space_id(self, space_key: str) -> str:
-        """space key로 space ID(숫자) 조회 (v2 API용)"""
-        resp = requests.get(
+        """space key로 space ID(숫자) 조회 (v2 API용). 캐시에 있으면 요청하지 않는다."""
+        cache_key = self._space_cache_key(space_key)
+        cached = self._space_ids.get(cache_key)
+        if cached is not None:
+            return cached
+        resp = self._session.get(
             f"{self._v2_base_url}/api/v2/spaces?keys={space_key}",
-            auth=self._auth,
             timeout=30,
         )
         resp.raise_for_status()
         results = resp.json().get("results", [])
         if not results:
             raise ValueError(f"Space not found: {space_key}")
-        return results[0]["id"]
+        space_id = results[0]["id"]
+        self._space_ids.put(cache_key, space_id)
+        return space_id
 
     def create_page(
         self, space_key: str, title: str, content: str, parent_id: str
     ) -> str:
-        """Live Page로 새 페이지 생성 (v2 API). 생성된 페이지 URL 반환."""
-        space_id = self.get_space_id(space_key)
+        """Live Page로 새 페이지 생성 (v2 API). 생성된 페이지 URL 반환.
+
+        캐시된 space id로 404가 나면 (space 재생성 등) 캐시를 버리고 한 번 다시 조회한다.
+        """
+        resp = self._post_page(self.get_space_id(space_key), title, content, parent_id)
+        if resp.status_code == 404:
+            print(f"WARNING: create_page got 404 — refreshing cached space id for {space_key}.")
+            self._space_ids.invalidate(self._space_cache_key(space_key))
+            resp = self._post_page(self.get_space_id(space_key), title, content, parent_id)
+        resp.raise_for_status()
+        result = resp.json()
+        page_id = result["id"]
+        index = self._title_index
+        if index is not None and index.space_key == space_key:
+            index.record(title, page_id, result.get("version", {}).get("number", 1))
+        return self._build_page_url(page_id, space_key, title)
 
+    def _post_page(self, space_id: str, title: str, content: str, parent_id: str):
         payload = {
             "spaceId": space_id,
             "title": title,
@@ -67,14 +334,11 @@ class ConfluenceAdapter:
                 "value": content,
             },
         }
-
-        resp = requests.post(
+        return self._session.post(
             f"{self._v2_base_url}/api/v2/pages",
             json=payload,
-            auth=self._auth,
             timeout=60,
         )
-        resp.raise_for_status()
-        result = resp.json()
-        page_id = result["id"]
-        return self._build_page_url(page_id, space_key, title)
+
+    def _space_cache_key(self, space_key: str) -> str:
+        return f"{self._v2_base_url}|{space_key}"
@@ -0,0 +1,69 @@
+"""Confluence 식별자 캐시 — space key → space id (v2 API용).
+
+space id는 space가 삭제/재생성되지 않는 한 바뀌지 않으므로 프로세스 memo와
+JSON 파일에 보관한다. 여러 팀/여러 주를 한 프로세스에서 처리하거나 cron이 매주
+다시 실행해도 같은 space를 두 번 조회하지 않는다. 사용처가 404를 받으면 invalidate.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+# 프로세스 전역 memo — 어댑터 인스턴스가 여러 개여도 공유 (키에 base URL 포함)
+_PROCESS_MEMO: dict[str, str] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+class SpaceIdCache:
+    """space id 캐시. path가 없으면 프로세스 memo만 사용."""
+
+    def __init__(self, path: Path | None = None):
+        self._path = Path(path) if path is not None else None
+
+    def get(self, key: str) -> str | None:
+        with _MEMO_LOCK:
+            if key in _PROCESS_MEMO:
+                return _PROCESS_MEMO[key]
+        value = self._read_disk().get(key)
+        if value is not None:
+            with _MEMO_LOCK:
+                _PROCESS_MEMO[key] = value
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        with _MEMO_LOCK:
+            _PROCESS_MEMO[key] = value
+        self._update_disk(key, value)
+
+    def invalidate(self, key: str) -> None:
+        with _MEMO_LOCK:
+            _PROCESS_MEMO.pop(key, None)
+        self._update_disk(key, None)
+
+    def _read_disk(self) -> dict[str, str]:
+        if self._path is None:
+            return {}
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _update_disk(self, key: str, value: str | None) -> None:
+        if self._path is None:
+            return
+        data = self._read_disk()
+        if value is None:
+            if data.pop(key, None) is None:
+                return
+        else:
+            data[key] = value
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError as e:
+            # 캐시 저장 실패는 다음 실행이 다시 조회하면 그만 — 페이지 생성은 계속
+            print(f"WARNING: failed to write Confluence id cache: {type(e).__name__}: {e}")
@@ -0,0 +1,126 @@
+"""Atlassian REST 호출용 pooled keep-alive HTTP 세션.
+
+atlassian-python-api 클라이언트(v1)와 어댑터의 직접 호출(v2)이 같은 세션을 쓰도록
+한 곳에서 만든다. 호스트별 연결 풀 + idempotent 요청 재시도(backoff)를 붙이고,
+요청 수 / 새로 연 연결 수를 세어 keep-alive 재사용을 확인할 수 있게 한다.
+모든 요청은 프로세스 전역 호스트 rate limiter(rate_limit)를 거치고, 429는 Retry-After를
+지켜 메서드와 상관없이 재시도한다 (429는 서버가 요청을 처리하지 않았다는 뜻이므로 POST도 안전).
+"""
+
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from .rate_limit import limiter_for, parse_retry_after
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+_BACKOFF_FACTOR = 0.5
+# 일시적 게이트웨이 오류만 재시도. GET/HEAD 등 idempotent 메서드만 (POST 페이지 생성 중복 방지)
+_RETRY_STATUSES = (502, 503, 504)
+
+
+@dataclass(frozen=True)
+class HttpPoolStats:
+    """세션 누적 통계"""
+    requests: int
+    connections: int  # 새로 연 TCP(+TLS) 연결 수
+
+    @property
+    def reused(self) -> int:
+        """기존 연결을 재사용한 요청 수"""
+        return max(0, self.requests - self.connections)
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter + 요청/새 연결 카운터 (urllib3 재시도 요청도 각각 센다)
+
+    429 재시도는 urllib3가 아니라 send()가 맡는다 — 호스트 limiter를 막아 같은 호스트로
+    가는 다른 요청(다른 스레드/어댑터)도 Retry-After 동안 기다리게 하기 위해서다.
+    """
+
+    def __init__(self, pool_size: int, retries: int):
+        self._lock = threading.Lock()
+        self._rate_limit_retries = retries
+        self._requests = 0
+        self._connections = 0
+        super().__init__(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=_BACKOFF_FACTOR,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            ),
+        )
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        limiter = limiter_for(host)
+        attempt = 0
+        while True:
+            limiter.acquire()
+            response = super().send(request, **kwargs)
+            if response.status_code != 429 or attempt >= self._rate_limit_retries:
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = limiter.on_rate_limited(retry_after, attempt)
+            print(f"WARNING: {host} rate limited (429) — retrying in {delay:.1f}s.")
+            response.close()
+            attempt += 1
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": self._counting_pool(HTTPConnectionPool),
+            "https": self._counting_pool(HTTPSConnectionPool),
+        }
+
+    def _counting_pool(self, base: type[HTTPConnectionPool]) -> type[HTTPConnectionPool]:
+        adapter = self
+
+        class CountingPool(base):
+            def _new_conn(self):
+                adapter._count(connections=1)
+                return super()._new_conn()
+
+            def _make_request(self, *args, **kwargs):
+                adapter._count(requests=1)
+                return super()._make_request(*args, **kwargs)
+
+        return CountingPool
+
+    def _count(self, requests: int = 0, connections: int = 0) -> None:
+        with self._lock:
+            self._requests += requests
+            self._connections += connections
+
+    def stats(self) -> HttpPoolStats:
+        with self._lock:
+            return HttpPoolStats(requests=self._requests, connections=self._connections)
+
+
+def build_pooled_session(
+    pool_size: int = DEFAULT_POOL_SIZE, retries: int = DEFAULT_RETRIES
+) -> requests.Session:
+    """http/https 모두에 CountingHTTPAdapter를 mount한 세션"""
+    session = requests.Session()
+    adapter = CountingHTTPAdapter(pool_size=pool_size, retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def session_stats(session: requests.Session) -> HttpPoolStats:
+    """build_pooled_session 세션의 누적 통계 (다른 세션이면 0)"""
+    adapter = session.get_adapter("https://")
+    if isinstance(adapter, CountingHTTPAdapter):
+        return adapter.stats()
+    return HttpPoolStats(requests=0, connections=0)
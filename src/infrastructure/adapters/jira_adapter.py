@@ -0,0 +1,101 @@
+"""JIRA REST API 어댑터"""
+
+import re
+
+import requests
+from atlassian import Jira
+
+from ...domain.models import JiraIssue
+from .http_session import DEFAULT_POOL_SIZE, DEFAULT_RETRIES, build_pooled_session
+
+# 리포트 작성에 쓰는 필드만 요청 (description/comment 등은 응답 크기만 키움)
+_ISSUE_FIELDS = "summary,status,fixVersions"
+# JQL 검색 1회 응답 상한 (Jira Cloud maxResults 제한)
+_SEARCH_PAGE_LIMIT = 100
+# 존재하지 않는 key가 섞이면 JQL 전체가 400 — 오류 메시지에 나온 key를 빼고 다시 검색
+_MISSING_KEY_PATTERN = re.compile(r"'([A-Z][A-Z0-9_]+-\d+)'")
+_MAX_SEARCH_ATTEMPTS = 3
+
+
+class JiraAdapter:
+    """atlassian-python-api를 사용한 JIRA 티켓 조회"""
+
+    def __init__(
+        self,
+        url: str,
+        user: str,
+        token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retries: int = DEFAULT_RETRIES,
+    ):
+        # prefetch가 티켓을 동시에 조회하므로 pool_size ≥ 동시 조회 수여야 연결이 재사용된다
+        self._session = build_pooled_session(pool_size=pool_size, retries=retries)
+        self.client = Jira(url=url, username=user, password=token, session=self._session)
+        self._url = url.rstrip("/")
+
+    def get_issue(self, key: str) -> JiraIssue | None:
+        """티켓 조회. 존재하지 않으면(404) None, 그 외 HTTP 오류는 그대로 전파."""
+        try:
+            issue = self.client.issue(key, fields=_ISSUE_FIELDS)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+        return self._to_issue(issue, key)
+
+    def get_issues(self, keys: list[str]) -> dict[str, JiraIssue]:
+        """JQL key in (...) 검색으로 여러 티켓을 한 번에 조회. 없는 key는 결과에서 빠진다.
+
+        검색은 client.jql 대신 세션으로 직접 호출한다 — 라이브러리 버전마다 인자 이름과
+        Cloud endpoint 선택이 달라 응답 형태가 바뀐다. 400이 key 문제로 해석되지 않으면
+        해당 key들은 get_issue로 하나씩 조회한다.
+        """
+        remaining = list(dict.fromkeys(keys))
+        for _ in range(_MAX_SEARCH_ATTEMPTS):
+            if not remaining:
+                return {}
+            try:
+                return self._search(remaining)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 400:
+                    raise
+                missing = set(_MISSING_KEY_PATTERN.findall(e.response.text)) & set(remaining)
+                if not missing:
+                    break
+                remaining = [k for k in remaining if k not in missing]
+        print(f"WARNING: JQL search rejected {len(remaining)} key(s), fetching one by one.")
+        issues = {}
+        for key in remaining:
+            issue = self.get_issue(key)
+            if issue is not None:
+                issues[key] = issue
+        return issues
+
+    def _search(self, keys: list[str]) -> dict[str, JiraIssue]:
+        """enhanced JQL 검색 (nextPageToken 페이지네이션). 응답 key 기준 — 이동된 티켓은 새 key로 온다."""
+        params = {
+            "jql": f"key in ({', '.join(keys)})",
+            "fields": _ISSUE_FIELDS,
+            "maxResults": min(len(keys), _SEARCH_PAGE_LIMIT),
+        }
+        issues = {}
+        while True:
+            resp = self._session.get(f"{self._url}/rest/api/2/search/jql", params=params, timeout=30)
+            resp.raise_for_status()
+            data = resp.json()
+            for raw in data.get("issues") or ():
+                issue = self._to_issue(raw, raw.get("key", ""))
+                issues[issue.key] = issue
+            token = data.get("nextPageToken")
+            if data.get("isLast") or not token:
+                return issues
+            params["nextPageToken"] = token
+
+    def _to_issue(self, issue: dict, key: str) -> JiraIssue:
+        fields = issue.get("fields") or {}
+        return JiraIssue(
+            key=issue.get("key", key),
+            summary=fields.get("summary") or "",
+            status=(fields.get("status") or {}).get("name", ""),
+            fix_versions=tuple(v["name"] for v in fields.get("fixVersions") or ()),
+        )
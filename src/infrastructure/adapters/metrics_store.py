@@ -0,0 +1,48 @@
+"""실행 메트릭 저장소 — append-only JSONL (한 줄 = RunMetrics 1건).
+
+cron/데몬 프로세스가 각자 한 줄씩 append 하므로 별도 락 없이 안전하다
+(O_APPEND 단일 write). `make perf-report`가 이 파일을 읽어 집계한다.
+"""
+
+import dataclasses
+import json
+from datetime import datetime
+from pathlib import Path
+
+from ...domain.models import RunMetrics
+
+_FIELDS = {f.name for f in dataclasses.fields(RunMetrics)}
+
+
+class JsonlMetricsStore:
+    """MetricsStorePort 구현 — JSONL 파일"""
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+
+    def append(self, metrics: RunMetrics) -> None:
+        record = dataclasses.asdict(metrics)
+        record["recorded_at"] = metrics.recorded_at.isoformat()
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(line)
+
+    def read_all(self) -> list[RunMetrics]:
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        for lineno, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                data["recorded_at"] = datetime.fromisoformat(data["recorded_at"])
+                # 이후 버전에서 추가된 필드는 무시 (구버전 reader 호환)
+                records.append(RunMetrics(**{k: v for k, v in data.items() if k in _FIELDS}))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"WARNING: skipping malformed metrics line {lineno}: {type(e).__name__}: {e}")
+        return records
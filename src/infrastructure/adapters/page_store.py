@@ -0,0 +1,69 @@
+"""Confluence 페이지 본문 on-disk 저장소 — (page id, version) 키, gzip 압축.
+
+storage format HTML은 표/매크로가 많아 수백 KB까지 커진다. 버전 번호만 가벼운 요청으로
+확인하고 같은 버전이면 저장된 본문을 쓰면, 같은 주 페이지를 다시 읽는 재실행/dry-run/
+regression 실행이 본문을 매번 다시 받지 않는다. 페이지는 수정되면 버전이 오르므로
+TTL 없이 버전 일치만으로 신선도를 판단한다.
+"""
+
+import gzip
+import os
+from pathlib import Path
+
+_ENTRY_SUFFIX = ".html.gz"
+
+
+class PageContentStore:
+    """용량 제한 LRU on-disk 저장소. 엔트리 1개 = 파일 1개 (`<page id>.v<version>.html.gz`).
+
+    LRU 순서는 파일 mtime으로 관리한다 (hit 시 갱신). 같은 페이지의 새 버전을 넣으면
+    이전 버전 파일은 지우고, 총 용량이 max_bytes를 넘으면 가장 오래 안 쓰인 것부터 제거한다.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    def get(self, page_id: str, version: int) -> str | None:
+        path = self._entry_path(page_id, version)
+        try:
+            body = gzip.decompress(path.read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, UnicodeDecodeError):
+            # 깨진 엔트리 — 지우고 miss로 처리 (다시 받아 저장)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # LRU 접근 시각 갱신
+        return body
+
+    def put(self, page_id: str, version: int, body: str) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(page_id, version)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(gzip.compress(body.encode("utf-8")))
+        os.replace(tmp, path)  # 동시 실행 중인 reader가 반쯤 쓰인 파일을 보지 않도록
+        for stale in self._directory.glob(f"{page_id}.v*{_ENTRY_SUFFIX}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        self._evict()
+
+    def _entry_path(self, page_id: str, version: int) -> Path:
+        return self._directory / f"{page_id}.v{version}{_ENTRY_SUFFIX}"
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()  # 오래 안 쓰인 순
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
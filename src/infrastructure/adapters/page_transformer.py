@@ -2,7 +2,10 @@
 
 import re
 from copy import deepcopy
+from functools import lru_cache
 from html import unescape as _html_unescape
+from html.entities import html5 as _HTML5_ENTITIES
+from typing import NamedTuple
 
 from lxml import etree
 
@@ -15,16 +18,106 @@ NS_WRAPPER_CLOSE = "</root>"
 
 # XML 표준 엔티티 (unescape하면 XML이 깨지므로 보존)
 _XML_ENTITY_NAMES = frozenset({"amp", "lt", "gt", "quot", "apos"})
+_ENTITY_PATTERN = re.compile(r"&([a-zA-Z]+);")
+# &name; → 문자 (HTML5 named entity 중 ;로 끝나는 것, XML 표준 엔티티 제외)
+_HTML_ENTITY_TABLE = {
+    name[:-1]: char
+    for name, char in _HTML5_ENTITIES.items()
+    if name.endswith(";") and name[:-1] not in _XML_ENTITY_NAMES
+}
 
 
 def _unescape_html_entities(text: str) -> str:
-    """HTML named entities를 유니코드로 변환 (XML 표준 엔티티 &amp; 등은 보존)"""
-    def _replace(match: re.Match) -> str:
-        name = match.group(1)
-        if name in _XML_ENTITY_NAMES:
-            return match.group(0)
-        return _html_unescape(match.group(0))
-    return re.sub(r"&([a-zA-Z]+);", _replace, text)
+    """HTML named entities를 유니코드로 변환 (XML 표준 엔티티 &amp; 등은 보존)
+
+    매치마다 콜백을 부르지 않고 split한 엔티티 이름을 표에서 한 번에 찾는다.
+    표에 없는 이름만 html.unescape로 넘긴다 (결과는 html.unescape와 같다).
+    """
+    parts = _ENTITY_PATTERN.split(text)
+    if len(parts) == 1:
+        return text
+    parts[1::2] = [
+        _HTML_ENTITY_TABLE[name] if name in _HTML_ENTITY_TABLE else _unknown_entity(name)
+        for name in parts[1::2]
+    ]
+    return "".join(parts)
+
+
+def _unknown_entity(name: str) -> str:
+    if name in _XML_ENTITY_NAMES:
+        return f"&{name};"
+    return _html_unescape(f"&{name};")
+
+
+def parse_storage_html(html: str) -> etree._Element:
+    """storage format HTML → lxml 트리 (ac/ri 네임스페이스 wrapper로 감싼 root)"""
+    # HTML 엔티티(&rarr;, &nbsp; 등)를 유니코드로 변환 (XML 표준 엔티티 보존)
+    html = _unescape_html_entities(html)
+    wrapped = f"{NS_WRAPPER_OPEN}{html}{NS_WRAPPER_CLOSE}"
+    return etree.fromstring(wrapped.encode("utf-8"))
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+# str.strip()이 지우는 공백 중 XML에 올 수 있는 비ASCII 문자 (XPath normalize-space는 ASCII 공백만 다룬다)
+_UNICODE_SPACES = "".join(c for c in map(chr, range(0x80, 0x3001)) if c.isspace())
+# 첫 자식 텍스트 노드(= element.text)를 strip()한 값
+_STRIPPED_TEXT = (
+    f"normalize-space(translate(node()[1][self::text()], "
+    f"'{_UNICODE_SPACES}', '{' ' * len(_UNICODE_SPACES)}'))"
+)
+
+
+def _stripped_text_in(values) -> str:
+    """element.text.strip()이 values 중 하나인지 검사하는 XPath 조건식"""
+    return " or ".join(f"{_STRIPPED_TEXT} = {_xpath_literal(v)}" for v in values) or "false()"
+
+
+# 미리 컴파일한 selector — 페이지/주와 무관
+_FIRST_TBODY = etree.XPath("(.//tbody)[1]")
+_ROWS = etree.XPath("tr")
+_CELLS = etree.XPath("td")
+# Progress 셀의 Doing/ToDo 하위 <li> (문서 순서)
+_DOING_TODO_ITEMS = etree.XPath(f"ul[1]/li[p[1][{_stripped_text_in(('Doing', 'ToDo'))}]]/ul[1]/li")
+_TODO_ITEM = etree.XPath(f"ul[1]/li[p[1][{_stripped_text_in(('ToDo',))}]][1]")
+_PROGRESS_TEMPLATE = etree.fromstring(
+    "<ul><li><p>Done</p></li><li><p>Doing</p></li><li><p>ToDo</p></li></ul>"
+)
+
+
+class CompiledTransformPlan:
+    """(old_dates, new_dates) 한 쌍의 변환 계획 — 한 번 만들어 여러 페이지에 적용.
+
+    날짜 치환표와, 이전 주 날짜가 적힌 Date 셀 <p>만 고르는 XPath를 담는다.
+    같은 주 전환을 팀마다 적용하는 batch 실행에서는 compile_transform_plan()으로 캐시된 계획을 쓴다.
+    """
+
+    def __init__(self, old_dates: list[str], new_dates: list[str]):
+        self.date_map = dict(zip(old_dates, new_dates))
+        self.date_paragraphs = etree.XPath(f"p[{_stripped_text_in(self.date_map)}]")
+
+
+@lru_cache(maxsize=32)
+def _cached_plan(old_dates: tuple[str, ...], new_dates: tuple[str, ...]) -> CompiledTransformPlan:
+    return CompiledTransformPlan(list(old_dates), list(new_dates))
+
+
+def compile_transform_plan(old_dates: list[str], new_dates: list[str]) -> CompiledTransformPlan:
+    """(old_dates, new_dates) 변환 계획 — 같은 날짜 쌍이면 같은 객체를 돌려준다"""
+    return _cached_plan(tuple(old_dates), tuple(new_dates))
+
+
+class RowCells(NamedTuple):
+    """데이터 행 1개의 편집 대상 셀 (팀원 셀 rowspan 유무에 따라 위치가 1칸 밀린다)"""
+    date: etree._Element
+    progress: etree._Element
+    notification: etree._Element
 
 
 class PageTransformer:
@@ -32,41 +125,40 @@ class PageTransformer:
 
     def transform(self, html: str, old_dates: list[str], new_dates: list[str]) -> str:
         """이전 주 HTML을 새 주 형식으로 변환"""
-        # HTML 엔티티(&rarr;, &nbsp; 등)를 유니코드로 변환 (XML 표준 엔티티 보존)
-        html = _unescape_html_entities(html)
-        wrapped = f"{NS_WRAPPER_OPEN}{html}{NS_WRAPPER_CLOSE}"
-        root = etree.fromstring(wrapped.encode("utf-8"))
-
-        table = root.find(".//tbody")
-        if table is None:
-            raise ValueError("테이블을 찾을 수 없습니다.")
-
-        rows = table.findall("tr")
-        if len(rows) < 2:
-            raise ValueError("테이블에 데이터 행이 없습니다.")
+        return self.apply(html, compile_transform_plan(old_dates, new_dates))
 
-        data_rows = rows[1:]  # 헤더 행 스킵
-        date_map = dict(zip(old_dates, new_dates))
+    def apply(self, html: str, plan: CompiledTransformPlan) -> str:
+        """컴파일된 변환 계획으로 페이지 1개 변환"""
+        root = parse_storage_html(html)
+        data_rows = self._data_rows(root)
 
-        # 팀원 블록별 처리
+        # 팀원 블록별 처리 — 행마다 셀을 한 번만 분류하고 날짜/Progress/Notifications를 한 번에 편집
         blocks = self._identify_member_blocks(data_rows)
         for block in blocks:
-            self._replace_dates(block, date_map)
-            self._transform_progress(block)
-            self._clear_notifications(block)
+            self._transform_block(block, plan)
 
         result = etree.tostring(root, encoding="unicode")
         # wrapper 제거
         result = result[len(NS_WRAPPER_OPEN) : -len(NS_WRAPPER_CLOSE)]
         return result
 
+    def _data_rows(self, root) -> list:
+        """첫 tbody의 데이터 행 (헤더 행 제외). 표가 없거나 데이터 행이 없으면 ValueError."""
+        tables = _FIRST_TBODY(root)
+        if not tables:
+            raise ValueError("테이블을 찾을 수 없습니다.")
+
+        rows = _ROWS(tables[0])
+        if len(rows) < 2:
+            raise ValueError("테이블에 데이터 행이 없습니다.")
+        return rows[1:]  # 헤더 행 스킵
+
     def _identify_member_blocks(self, rows: list) -> list[list]:
         """rowspan 값을 기반으로 팀원별 행 블록 식별"""
         blocks = []
         i = 0
         while i < len(rows):
-            cells = rows[i].findall("td")
-            rowspan = cells[0].get("rowspan")
+            rowspan = _CELLS(rows[i])[0].get("rowspan")
             if rowspan:
                 span = int(rowspan)
                 blocks.append(rows[i : i + span])
@@ -75,102 +167,59 @@ class PageTransformer:
                 i += 1
         return blocks
 
-    def _replace_dates(self, block: list, date_map: dict[str, str]) -> None:
-        """Date 컬럼의 날짜 텍스트를 치환"""
-        for row in block:
-            date_cell = self._get_date_cell(row)
-            for p in date_cell.findall("p"):
-                if p.text and p.text.strip() in date_map:
-                    p.text = date_map[p.text.strip()]
-
-    def _transform_progress(self, block: list) -> None:
-        """Progress 컬럼 변환: 금요일 이월 + 전체 초기화"""
-        # 마지막 행(금요일)에서 Doing/ToDo 항목 추출
-        friday_row = block[-1]
-        friday_progress = self._get_progress_cell(friday_row)
-        carryover_items = self._extract_doing_todo_items(friday_progress)
-
-        # 모든 행의 Progress 초기화
-        for row in block:
-            progress_cell = self._get_progress_cell(row)
-            self._reset_progress(progress_cell)
-
-        # 첫 번째 행(월요일)의 ToDo에 이월 항목 삽입
-        monday_progress = self._get_progress_cell(block[0])
-        self._insert_carryover_to_todo(monday_progress, carryover_items)
-
-    def _clear_notifications(self, block: list) -> None:
-        """Notifications 컬럼의 내용을 빈 <p>로 교체"""
-        for row in block:
-            notif_cell = self._get_notification_cell(row)
-            for child in list(notif_cell):
-                notif_cell.remove(child)
-            notif_cell.text = None
-            empty_p = etree.SubElement(notif_cell, "p")
-            empty_p.text = None
-
-    def _get_date_cell(self, row) -> etree._Element:
-        """행에서 Date 셀 반환"""
-        cells = row.findall("td")
-        return cells[1] if self._has_rowspan(cells) else cells[0]
-
-    def _get_progress_cell(self, row) -> etree._Element:
-        """행에서 Progress 셀 반환"""
-        cells = row.findall("td")
-        return cells[2] if self._has_rowspan(cells) else cells[1]
-
-    def _get_notification_cell(self, row) -> etree._Element:
-        """행에서 Notifications 셀 반환"""
-        cells = row.findall("td")
-        return cells[3] if self._has_rowspan(cells) else cells[2]
+    def _transform_block(self, block: list, plan: CompiledTransformPlan) -> None:
+        """팀원 블록 1개를 한 번 순회로 변환 (날짜 치환, Progress 초기화 + 이월, Notifications 비우기)"""
+        rows = [self._classify_row(row) for row in block]
+        # 금요일(마지막 행)의 Doing/ToDo 항목 — 초기화로 셀에서 떨어져도 참조가 남아 있어
+        # 복사 없이 월요일 ToDo로 옮긴다
+        carryover_items = self._doing_todo_items(rows[-1].progress)
+        for cells in rows:
+            self._replace_date(cells.date, plan)
+            self._reset_progress(cells.progress)
+            self._clear_notification(cells.notification)
+        self._insert_carryover_to_todo(rows[0].progress, carryover_items)
+
+    def _classify_row(self, row) -> RowCells:
+        """행의 td를 한 번만 찾아 Date/Progress/Notifications 셀로 분류"""
+        cells = _CELLS(row)
+        offset = 1 if self._has_rowspan(cells) else 0
+        return RowCells(cells[offset], cells[offset + 1], cells[offset + 2])
+
+    def _replace_date(self, date_cell, plan: CompiledTransformPlan) -> None:
+        """Date 셀에서 이전 주 날짜가 적힌 <p>(계획의 XPath가 고른 것)만 치환"""
+        for p in plan.date_paragraphs(date_cell):
+            new_date = plan.date_map.get(p.text.strip())
+            if new_date is not None:
+                p.text = new_date
+
+    def _clear_notification(self, notif_cell) -> None:
+        """Notifications 셀의 내용을 빈 <p>로 교체"""
+        del notif_cell[:]
+        notif_cell.text = None
+        empty_p = etree.SubElement(notif_cell, "p")
+        empty_p.text = None
 
     def _has_rowspan(self, cells: list) -> bool:
         """첫 번째 셀에 rowspan 속성이 있는지 확인"""
         return cells[0].get("rowspan") is not None
 
-    def _extract_doing_todo_items(self, progress_cell) -> list:
-        """Progress 셀에서 Doing/ToDo 하위 <li> 항목 추출 (deep copy)"""
-        items = []
-        ul = progress_cell.find("ul")
-        if ul is None:
-            return items
-
-        for li in ul.findall("li"):
-            p = li.find("p")
-            if p is not None and p.text:
-                label = p.text.strip()
-                if label in ("Doing", "ToDo"):
-                    sub_ul = li.find("ul")
-                    if sub_ul is not None:
-                        for sub_li in sub_ul.findall("li"):
-                            items.append(deepcopy(sub_li))
-        return items
+    def _doing_todo_items(self, progress_cell) -> list:
+        """Progress 셀의 Doing/ToDo 하위 <li> 항목 (원본 참조)"""
+        return _DOING_TODO_ITEMS(progress_cell)
 
     def _reset_progress(self, progress_cell) -> None:
         """Progress 셀을 빈 Done/Doing/ToDo 리스트로 초기화"""
-        for child in list(progress_cell):
-            progress_cell.remove(child)
+        del progress_cell[:]
         progress_cell.text = None
-
-        ul = etree.SubElement(progress_cell, "ul")
-        for label in ("Done", "Doing", "ToDo"):
-            li = etree.SubElement(ul, "li")
-            p = etree.SubElement(li, "p")
-            p.text = label
+        progress_cell.append(deepcopy(_PROGRESS_TEMPLATE))
 
     def _insert_carryover_to_todo(self, progress_cell, items: list) -> None:
         """월요일 Progress의 ToDo 하위에 이월 항목 삽입"""
         if not items:
             return
 
-        ul = progress_cell.find("ul")
-        if ul is None:
-            return
-
-        for li in ul.findall("li"):
-            p = li.find("p")
-            if p is not None and p.text and p.text.strip() == "ToDo":
-                sub_ul = etree.SubElement(li, "ul")
-                for item in items:
-                    sub_ul.append(item)
-                break
+        todo = _TODO_ITEM(progress_cell)
+        if todo:
+            sub_ul = etree.SubElement(todo[0], "ul")
+            for item in items:
+                sub_ul.append(item)
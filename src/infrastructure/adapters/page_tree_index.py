@@ -0,0 +1,152 @@
+"""부모 페이지 하위 제목 색인 — 제목 → (page id, version), JSON 파일로 실행 간 유지.
+
+주간 페이지는 모두 PARENT_PAGE_ID 아래에 있다. 부모의 하위 페이지를 한 번 나열해 두면
+create_page / prefetch / backfill의 제목 조회는 검색 요청 없이 dict 조회가 된다.
+나열과 갱신(CQL, cursor 페이지네이션)은 ConfluenceAdapter가 하고, 이 모듈은 상태와 저장만 맡는다.
+  - 프로세스마다 첫 사용 시 1회(이후 refresh_interval마다) 갱신 — 마지막으로 본 수정 시각
+    이후에 바뀐 페이지만 받는다 (incremental)
+  - 삭제된 페이지는 incremental 결과에 나타나지 않으므로 full_refresh_after가 지나면 전체를 다시 나열
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_REFRESH_INTERVAL_SECONDS = 60.0
+_FULL_REFRESH_AFTER_SECONDS = 7 * 24 * 60 * 60
+# CQL lastmodified는 분 단위 + 사용자 timezone 기준 — 하루 앞당겨 경계 누락을 막는다
+_MODIFIED_MARGIN = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class IndexedPage:
+    id: str
+    version: int
+
+
+class PageTreeIndex:
+    """space 1개, 부모 페이지 1개 아래의 제목 색인. path가 없으면 메모리에만 둔다."""
+
+    def __init__(
+        self,
+        space_key: str,
+        parent_id: str,
+        path: Path | None = None,
+        refresh_interval: float = _REFRESH_INTERVAL_SECONDS,
+        full_refresh_after: float = _FULL_REFRESH_AFTER_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.space_key = space_key
+        self.parent_id = parent_id
+        self._path = Path(path) if path is not None else None
+        self._refresh_interval = refresh_interval
+        self._full_refresh_after = full_refresh_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pages: dict[str, IndexedPage] = {}
+        self._last_modified: datetime | None = None
+        self._full_at: float | None = None
+        self._refreshed_at: float | None = None  # 메모리 전용 — 새 프로세스는 한 번은 갱신
+        self._read()
+
+    def needs_refresh(self) -> bool:
+        with self._lock:
+            return (
+                self._refreshed_at is None
+                or self._clock() - self._refreshed_at >= self._refresh_interval
+            )
+
+    def modified_since(self) -> datetime | None:
+        """incremental 갱신 하한 (UTC). None이면 전체 나열이 필요하다."""
+        with self._lock:
+            if (
+                self._full_at is None
+                or self._last_modified is None
+                or self._clock() - self._full_at >= self._full_refresh_after
+            ):
+                return None
+            return self._last_modified - _MODIFIED_MARGIN
+
+    def apply(self, pages: Iterable[tuple[str, str, int, datetime | None]], full: bool) -> None:
+        """갱신 결과 (제목, id, version, 수정 시각) 반영. full이면 기존 색인을 교체한다."""
+        with self._lock:
+            if full:
+                self._pages = {}
+                self._full_at = self._clock()
+            for title, page_id, version, modified in pages:
+                # 제목이 바뀐 페이지 — 이전 제목 항목 제거
+                for old_title in [t for t, p in self._pages.items() if p.id == page_id]:
+                    del self._pages[old_title]
+                self._pages[title] = IndexedPage(page_id, version)
+                if modified is not None and (
+                    self._last_modified is None or modified > self._last_modified
+                ):
+                    self._last_modified = modified
+            self._refreshed_at = self._clock()
+            self._write()
+
+    def lookup(self, title: str) -> IndexedPage | None:
+        with self._lock:
+            return self._pages.get(title)
+
+    def version_of(self, page_id: str) -> int | None:
+        with self._lock:
+            return next((p.version for p in self._pages.values() if p.id == page_id), None)
+
+    def record(self, title: str, page_id: str, version: int) -> None:
+        """이번 실행에서 만든 페이지 추가 (검색 색인 반영 지연과 무관하게 바로 보이도록)"""
+        with self._lock:
+            self._pages[title] = IndexedPage(page_id, version)
+            self._write()
+
+    def forget(self, title: str) -> None:
+        """삭제된 것으로 확인된 페이지 제거"""
+        with self._lock:
+            if self._pages.pop(title, None) is not None:
+                self._write()
+
+    def _read(self) -> None:
+        if self._path is None:
+            return
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            if data["space"] != self.space_key or data["parent"] != self.parent_id:
+                return
+            self._pages = {
+                title: IndexedPage(entry["id"], entry["version"])
+                for title, entry in data["pages"].items()
+            }
+            self._last_modified = (
+                datetime.fromisoformat(data["last_modified"]) if data["last_modified"] else None
+            )
+            self._full_at = data["full_at"]
+        except FileNotFoundError:
+            return
+        except (ValueError, KeyError, TypeError):
+            print(f"WARNING: ignoring unreadable page index {self._path}.")
+            self._pages, self._last_modified, self._full_at = {}, None, None
+
+    def _write(self) -> None:
+        """_lock 안에서 호출 (동시 갱신이 같은 임시 파일을 쓰지 않도록)"""
+        if self._path is None:
+            return
+        data = {
+            "space": self.space_key,
+            "parent": self.parent_id,
+            "pages": {t: {"id": p.id, "version": p.version} for t, p in self._pages.items()},
+            "last_modified": self._last_modified.isoformat() if self._last_modified else None,
+            "full_at": self._full_at,
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError as e:
+            # 저장 실패 시 다음 실행이 전체 나열 — 페이지 생성은 계속
+            print(f"WARNING: failed to write page index: {type(e).__name__}: {e}")
@@ -0,0 +1,165 @@
+"""프로세스 전역 호스트별 rate limiter — token bucket + 429 Retry-After 차단.
+
+여러 팀을 동시에 처리하면 Atlassian/Slack rate limit(429)에 걸린다. 같은 호스트로 가는
+요청은 어댑터 인스턴스와 스레드에 상관없이 하나의 limiter를 거친다.
+  - token bucket: 초당 rate, 최대 burst 만큼 연속 허용 (configure_host로 설정한 호스트만)
+  - 429: Retry-After(초 또는 HTTP-date)가 있으면 그만큼 + jitter, 없으면 지수 backoff(full jitter)
+    동안 호스트 전체를 막는다 — 한 요청이 429를 받으면 같은 호스트의 다른 요청도 기다린다
+대기한 시간은 호스트별로 누적해 throttle_stats()로 노출한다.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 30.0
+# Retry-After에 더하는 jitter 상한 — 같은 시각에 풀린 요청들이 한꺼번에 몰리지 않도록
+_RETRY_AFTER_JITTER_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class ThrottleStats:
+    """호스트 1개의 누적 통계"""
+    requests: int
+    throttled: int  # 실제로 기다린 요청 수
+    throttled_seconds: float
+    rate_limited: int  # 받은 429 수
+
+
+def parse_retry_after(value: str | None, now: Callable[[], datetime] | None = None) -> float | None:
+    """Retry-After 헤더 → 대기 초. 초 단위 정수 또는 HTTP-date. 해석 불가/없음이면 None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    current = now() if now is not None else datetime.now(timezone.utc)
+    return max(0.0, (when - current).total_seconds())
+
+
+def backoff_delay(attempt: int) -> float:
+    """Retry-After 없는 429용 지수 backoff (full jitter)"""
+    return random.uniform(0, min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+class HostRateLimiter:
+    """호스트 1개의 limiter. rate가 None이면 token bucket 없이 429 차단만 적용."""
+
+    def __init__(
+        self,
+        rate_per_second: float | None = None,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._set_rate(rate_per_second, burst)
+        self._blocked_until = 0.0
+        self._requests = 0
+        self._throttled = 0
+        self._throttled_seconds = 0.0
+        self._rate_limited = 0
+
+    def configure(self, rate_per_second: float | None, burst: int | None = None) -> None:
+        """rate/burst 변경 (버킷은 가득 찬 상태로 다시 시작, 차단 시각과 통계는 유지)"""
+        with self._lock:
+            self._set_rate(rate_per_second, burst)
+
+    def _set_rate(self, rate_per_second: float | None, burst: int | None) -> None:
+        self._rate = rate_per_second
+        self._burst = float(burst if burst is not None else max(1, int(rate_per_second or 1)))
+        self._tokens = self._burst
+        self._updated = self._clock()
+
+    def acquire(self) -> float:
+        """요청 1건 허가를 받을 때까지 대기. 대기한 초 반환."""
+        with self._lock:
+            now = self._clock()
+            wait = max(0.0, self._blocked_until - now)
+            if self._rate is not None:
+                # _updated가 미래(429 차단 종료 시각)면 그때까지는 충전하지 않는다
+                elapsed = max(0.0, now - self._updated)
+                self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+                self._updated = max(self._updated, now)
+                # 토큰을 먼저 예약(음수 허용) — 대기 순서대로 토큰이 배정된다
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, self._updated - now - self._tokens / self._rate)
+            self._requests += 1
+            if wait > 0:
+                self._throttled += 1
+                self._throttled_seconds += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_rate_limited(self, retry_after: float | None, attempt: int) -> float:
+        """429 응답 기록 + 호스트 차단. 다음 acquire가 기다릴 시간(초) 반환."""
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, _RETRY_AFTER_JITTER_SECONDS)
+        else:
+            delay = backoff_delay(attempt)
+        with self._lock:
+            self._rate_limited += 1
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+            if self._rate is not None:
+                # 차단이 풀린 뒤 burst로 몰리지 않게 — 토큰 1개에서 다시 rate로 충전
+                self._tokens = min(self._tokens, 1.0)
+                self._updated = max(self._updated, self._blocked_until)
+        return delay
+
+    def stats(self) -> ThrottleStats:
+        with self._lock:
+            return ThrottleStats(
+                requests=self._requests,
+                throttled=self._throttled,
+                throttled_seconds=self._throttled_seconds,
+                rate_limited=self._rate_limited,
+            )
+
+
+_LIMITERS: dict[str, HostRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def configure_host(host: str, rate_per_second: float | None, burst: int | None = None) -> HostRateLimiter:
+    """호스트 token bucket 설정. 이미 limiter를 잡아 둔 어댑터에도 적용되도록 제자리에서 바꾼다."""
+    limiter = limiter_for(host)
+    limiter.configure(rate_per_second, burst)
+    return limiter
+
+
+def limiter_for(host: str) -> HostRateLimiter:
+    """호스트 limiter. 설정되지 않은 호스트는 429 차단만 하는 limiter를 만든다."""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = _LIMITERS[host] = HostRateLimiter()
+        return limiter
+
+
+def throttle_stats() -> dict[str, ThrottleStats]:
+    """호스트별 누적 통계 (요청이 있었던 호스트만)"""
+    with _LIMITERS_LOCK:
+        limiters = dict(_LIMITERS)
+    stats = {host: limiter.stats() for host, limiter in limiters.items()}
+    return {host: s for host, s in stats.items() if s.requests}
+
+
+def reset_limiters() -> None:
+    """모든 호스트 limiter 제거 (테스트/데몬 재설정용)"""
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
@@ -0,0 +1,216 @@
+"""리포트 출력 캐시 — content-addressed on-disk 캐시 + CLIExecutorPort 데코레이터.
+
+같은 입력(command, space key, 날짜, 모델, 커맨드 파일 해시, Confluence 페이지 버전)으로
+다시 실행하면 agent loop를 건너뛰고 저장된 출력을 반환한다.
+Slack 전송 실패 후 재실행, 같은 날 dry-run 반복 등에서 수 분/수 달러를 아낀다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from datetime import date
+from pathlib import Path
+
+import anyio
+
+from ...application.ports import CLIExecutorPort
+from ...domain.models import StreamRestart
+from ...domain.services import ReportMarkerExtractor
+
+# (space_key, report_date) → 페이지 버전. None이면 버전 확인 불가 → 캐시 우회
+PageVersionProbe = Callable[[str, date], str | None]
+
+_ENTRY_SUFFIX = ".json"
+
+
+def build_cache_key(**parts: object) -> str:
+    """입력 값들로 content-addressed 키(sha256 hex) 생성. 키 순서 무관."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """파일 내용 sha256. 파일이 없으면 빈 문자열 (커맨드 파일 미존재 환경)."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+class ReportOutputCache:
+    """TTL + 용량 제한 LRU on-disk 캐시. 엔트리 1개 = 파일 1개 (`<key>.json`).
+
+    LRU 순서는 파일 mtime으로 관리한다 (hit 시 갱신). put 후 만료 엔트리를
+    지우고, 총 용량이 max_bytes를 넘으면 가장 오래 안 쓰인 엔트리부터 제거한다.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: float, max_bytes: int):
+        self._directory = Path(directory)
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+
+    def get(self, key: str) -> str | None:
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if self._is_expired(entry.get("created_at", 0.0)):
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # LRU 접근 시각 갱신
+        return entry["output"]
+
+    def put(self, key: str, output: str) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"created_at": time.time(), "output": output}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)  # 동시 실행 중인 reader가 반쯤 쓰인 파일을 보지 않도록
+        self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def _is_expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self._ttl_seconds
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()  # 오래 안 쓰인 순
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            if total <= self._max_bytes and not self._is_expired(mtime):
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class CachingCLIExecutor:
+    """CLIExecutorPort 데코레이터 — 캐시 hit면 내부 실행기를 호출하지 않는다.
+
+    version_probe가 주어졌는데 버전을 확인하지 못하면(None/예외) 신선도를 보장할 수
+    없으므로 캐시를 우회한다. probe가 없으면 버전은 빈 값이고 TTL만으로 만료된다.
+    """
+
+    def __init__(
+        self,
+        inner: CLIExecutorPort,
+        cache: ReportOutputCache,
+        command: str,
+        model: str,
+        command_file: Path,
+        version_probe: PageVersionProbe | None = None,
+    ):
+        self._inner = inner
+        self._cache = cache
+        self._command = command
+        self._model = model
+        self._command_file = command_file
+        self._version_probe = version_probe
+
+    def execute(
+        self,
+        space_key: str,
+        mention_users: str = "",
+        report_date: date | None = None,
+    ) -> str | None:
+        key, cached = self._lookup(space_key, mention_users, report_date)
+        if cached is not None:
+            return cached
+        output = self._inner.execute(space_key, mention_users, report_date)
+        self._put(key, output)
+        return output
+
+    async def execute_async(
+        self,
+        space_key: str,
+        mention_users: str = "",
+        report_date: date | None = None,
+    ) -> str | None:
+        # version probe(HTTP + rate limiter time.sleep)와 캐시 파일 I/O는 worker 스레드에서
+        key, cached = await anyio.to_thread.run_sync(self._lookup, space_key, mention_users, report_date)
+        if cached is not None:
+            return cached
+        output = await self._inner.execute_async(space_key, mention_users, report_date)
+        await anyio.to_thread.run_sync(self._put, key, output)
+        return output
+
+    async def stream(
+        self,
+        space_key: str,
+        mention_users: str = "",
+        report_date: date | None = None,
+    ) -> AsyncIterator[str | StreamRestart]:
+        """hit면 저장된 출력을 한 조각으로, miss면 내부 스트림을 그대로 흘리며 추출 후 저장.
+
+        StreamRestart는 그대로 전달하고 추출도 처음부터 다시 — 취소된 시도의 출력은 저장하지 않는다.
+        """
+        key, cached = await anyio.to_thread.run_sync(self._lookup, space_key, mention_users, report_date)
+        if cached is not None:
+            yield cached
+            return
+        extractor = ReportMarkerExtractor()
+        async for text in self._inner.stream(space_key, mention_users, report_date):
+            if isinstance(text, StreamRestart):
+                extractor = ReportMarkerExtractor()
+            else:
+                extractor.feed(text)
+            yield text
+        await anyio.to_thread.run_sync(self._put, key, extractor.getvalue().strip())
+
+    def _lookup(
+        self, space_key: str, mention_users: str, report_date: date | None
+    ) -> tuple[str | None, str | None]:
+        """(캐시 키, 저장된 출력). 블로킹 — async 경로는 worker 스레드에서 호출"""
+        key = self._lookup_key(space_key, mention_users, report_date)
+        return key, self._get(key)
+
+    def _lookup_key(
+        self, space_key: str, mention_users: str, report_date: date | None
+    ) -> str | None:
+        target_date = report_date or date.today()
+        page_version = ""
+        if self._version_probe is not None:
+            try:
+                page_version = self._version_probe(space_key, target_date)
+            except Exception as e:
+                print(f"WARNING: page version probe failed ({type(e).__name__}: {e}) — bypassing report cache.")
+                return None
+            if page_version is None:
+                print("WARNING: source page version unknown — bypassing report cache.")
+                return None
+        return build_cache_key(
+            command=self._command,
+            space_key=space_key,
+            mention_users=mention_users,
+            report_date=target_date.isoformat(),
+            model=self._model,
+            command_hash=hash_file(self._command_file),
+            page_version=str(page_version),
+        )
+
+    def _get(self, key: str | None) -> str | None:
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            print(f"Report cache hit ({key[:12]}) — skipping claude run.")
+        return cached
+
+    def _put(self, key: str | None, output: str | None) -> None:
+        # 실패(None)와 빈 출력은 캐시하지 않는다 — 다음 실행이 다시 시도하도록
+        if key is not None and output:
+            self._cache.put(key, output)
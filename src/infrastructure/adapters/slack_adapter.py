@@ -1,4 +1,19 @@
+import time
+from collections.abc import Callable
+
 from slack_sdk import WebClient
+from slack_sdk.http_retry import RetryHandler
+
+from ...domain.services import ReportMarkerExtractor
+from .rate_limit import HostRateLimiter, limiter_for, parse_retry_after
+
+_STREAM_PLACEHOLDER = "⏳ 리포트 생성 중..."
+_STREAM_FAILED = "❌ 리포트 생성 실패"
+# chat.update는 Tier 3 (분당 ~50회) — 진행 중 갱신은 이 간격 이상으로만
+_STREAM_UPDATE_INTERVAL_SECONDS = 3.0
+_RATE_LIMIT_RETRIES = 3
+# WebClient 기본 base_url(https://slack.com/api/)의 호스트 — rate limiter 키
+SLACK_HOST = "slack.com"
 
 
 class SlackAdapter:
@@ -8,6 +23,7 @@ class SlackAdapter:
         self._token = token
         self._channel = channel
         self._client: WebClient | None = None
+        self._limiter = limiter_for(SLACK_HOST)
 
     def send(self, message: str, thread_message: str | None = None) -> None:
         if not self._token or not self._channel:
@@ -15,14 +31,15 @@ class SlackAdapter:
             return
 
         try:
-            if self._client is None:
-                self._client = WebClient(token=self._token)
+            client = self._get_client()
 
-            response = self._client.chat_postMessage(channel=self._channel, text=message)
+            self._limiter.acquire()
+            response = client.chat_postMessage(channel=self._channel, text=message)
             print(f"Successfully sent report to Slack channel '{self._channel}'.")
 
             if thread_message:
-                self._client.chat_postMessage(
+                self._limiter.acquire()
+                client.chat_postMessage(
                     channel=self._channel,
                     text=thread_message,
                     thread_ts=response["ts"]
@@ -32,3 +49,145 @@ class SlackAdapter:
         except Exception as e:
             print(f"ERROR: An error occurred while sending report to Slack: {e}")
             raise e
+
+    def open_stream(self, message: str) -> "_SlackReportStream | _NullReportStream":
+        """제목 메시지 + 스레드 placeholder를 먼저 게시하고 스트림 핸들 반환.
+
+        리포트 마커가 보이기 시작하면 placeholder를 마커 이후 본문으로 chat_update 한다.
+        """
+        if not self._token or not self._channel:
+            print("WARNING: SLACK_TOKEN or SLACK_CHANNEL environment variables not set. Skipping Slack notification.")
+            return _NullReportStream()
+
+        try:
+            client = self._get_client()
+            self._limiter.acquire()
+            response = client.chat_postMessage(channel=self._channel, text=message)
+            self._limiter.acquire()
+            placeholder = client.chat_postMessage(
+                channel=self._channel,
+                text=_STREAM_PLACEHOLDER,
+                thread_ts=response["ts"],
+            )
+            print(f"Started streaming report to Slack channel '{self._channel}'.")
+        except Exception as e:
+            print(f"ERROR: An error occurred while sending report to Slack: {e}")
+            raise e
+        return _SlackReportStream(client, self._channel, placeholder["ts"], limiter=self._limiter)
+
+    def _get_client(self) -> WebClient:
+        """API 호출 전에는 호스트 limiter를 거치고, 429는 _RateLimitRetryHandler가 재시도한다"""
+        if self._client is None:
+            self._client = WebClient(token=self._token)
+            self._client.retry_handlers = [
+                *self._client.retry_handlers,
+                _RateLimitRetryHandler(self._limiter),
+            ]
+        return self._client
+
+
+class _RateLimitRetryHandler(RetryHandler):
+    """429 재시도 — Retry-After 동안 호스트 limiter를 막고 그 limiter에서 다시 허가를 받는다"""
+
+    def __init__(self, limiter: HostRateLimiter, max_retry_count: int = _RATE_LIMIT_RETRIES):
+        super().__init__(max_retry_count=max_retry_count)
+        self._limiter = limiter
+
+    def _can_retry(self, *, state, request, response=None, error=None) -> bool:
+        return response is not None and response.status_code == 429
+
+    def prepare_for_next_attempt(self, *, state, request, response=None, error=None) -> None:
+        # slack_sdk 응답 헤더는 {이름: [값, ...]}
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        values = headers.get("retry-after") or [None]
+        delay = self._limiter.on_rate_limited(parse_retry_after(values[0]), state.current_attempt)
+        print(f"WARNING: Slack rate limited (429) — retrying in {delay:.1f}s.")
+        state.next_attempt_requested = True
+        self._limiter.acquire()
+        state.increment_current_attempt()
+
+
+class _SlackReportStream:
+    """스레드 placeholder 메시지를 점진적으로 갱신하는 스트림 핸들"""
+
+    def __init__(
+        self,
+        client: WebClient,
+        channel: str,
+        ts: str,
+        min_interval: float = _STREAM_UPDATE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        limiter: HostRateLimiter | None = None,
+    ):
+        self._client = client
+        self._channel = channel
+        self._ts = ts
+        self._min_interval = min_interval
+        self._clock = clock
+        self._extractor = ReportMarkerExtractor()
+        self._last_update: float | None = None
+        self._limiter = limiter or limiter_for(SLACK_HOST)
+
+    def append(self, text: str) -> None:
+        self._extractor.feed(text)
+        if not self._extractor.found:
+            return  # 아직 중간 분석 단계 — placeholder 유지
+        now = self._clock()
+        if self._last_update is not None and now - self._last_update < self._min_interval:
+            return
+        self._last_update = now
+        try:
+            self._limiter.acquire()
+            self._client.chat_update(
+                channel=self._channel, ts=self._ts, text=self._extractor.getvalue().strip()
+            )
+        except Exception as e:
+            # 진행 중 갱신은 best-effort — 최종 finish에서 다시 시도
+            print(f"WARNING: Slack progressive update failed: {e}")
+
+    def restart(self) -> None:
+        found = self._extractor.found
+        self._extractor = ReportMarkerExtractor()
+        self._last_update = None
+        if not found:
+            return  # 아직 placeholder 그대로 — 되돌릴 본문 없음
+        try:
+            self._limiter.acquire()
+            self._client.chat_update(channel=self._channel, ts=self._ts, text=_STREAM_PLACEHOLDER)
+        except Exception as e:
+            print(f"WARNING: Slack progressive update failed: {e}")
+
+    def finish(self, thread_message: str) -> None:
+        try:
+            self._limiter.acquire()
+            if thread_message:
+                self._client.chat_update(channel=self._channel, ts=self._ts, text=thread_message)
+            else:
+                self._client.chat_delete(channel=self._channel, ts=self._ts)
+            print("Successfully finished streaming report thread reply.")
+        except Exception as e:
+            print(f"ERROR: An error occurred while sending report to Slack: {e}")
+            raise e
+
+    def fail(self) -> None:
+        try:
+            self._limiter.acquire()
+            self._client.chat_update(channel=self._channel, ts=self._ts, text=_STREAM_FAILED)
+        except Exception as e:
+            print(f"WARNING: Slack failure update failed: {e}")
+
+
+class _NullReportStream:
+    """Slack 미설정 시 스트림 — 아무것도 하지 않음"""
+
+    def append(self, text: str) -> None:
+        pass
+
+    def restart(self) -> None:
+        pass
+
+    def finish(self, thread_message: str) -> None:
+        pass
+
+    def fail(self) -> None:
+        pass
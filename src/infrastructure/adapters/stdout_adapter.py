@@ -15,3 +15,30 @@ class StdoutAdapter:
         if thread_message:
             print(self._SEPARATOR)
             print(thread_message)
+
+    def open_stream(self, message: str) -> "_StdoutReportStream":
+        """제목을 먼저 출력하고, 이후 텍스트 조각을 도착 즉시 출력하는 스트림 반환."""
+        print(message, flush=True)
+        return _StdoutReportStream(self._SEPARATOR)
+
+
+class _StdoutReportStream:
+    """StdoutAdapter.open_stream 핸들 — 중간 분석까지 실시간 출력, 마지막에 최종 본문."""
+
+    def __init__(self, separator: str):
+        self._separator = separator
+
+    def append(self, text: str) -> None:
+        print(text, flush=True)
+
+    def restart(self) -> None:
+        print(self._separator)
+        print("(이전 시도 출력 폐기 — fallback 모델로 다시 생성)", flush=True)
+
+    def finish(self, thread_message: str) -> None:
+        if thread_message:
+            print(self._separator)
+            print(thread_message)
+
+    def fail(self) -> None:
+        print(self._separator)
@@ -0,0 +1,159 @@
+"""스트리밍 페이지 변환 — 입력을 조각으로 파싱하며 팀원 블록 단위로 변환/직렬화.
+
+PageTransformer는 엔티티 치환 → wrapper 결합 → UTF-8 인코딩 → 전체 트리 → 전체 직렬화 순서라
+문서 사본이 여러 개 동시에 메모리에 있다. 여기서는
+  - 입력을 chunk_size씩 엔티티 치환/인코딩해 XMLPullParser에 넣고
+  - 표의 행이 끝날 때마다 팀원 블록이 완성되면 PageTransformer와 같은 _transform_block으로
+    변환해 곧바로 문자열로 직렬화한 뒤 트리에서 떼어낸다 (자리에는 처리 지시문 표식)
+  - 마지막에 남은 뼈대(표 밖 내용 + 헤더 행)를 직렬화하고 표식 자리에 블록 문자열을 끼운다
+트리에 동시에 남는 행은 변환 중인 블록 1개 + 입력 조각 1개 분량이다.
+결과는 PageTransformer와 바이트 단위로 같다.
+"""
+
+import re
+import uuid
+
+from lxml import etree
+
+from .page_transformer import (
+    NS_WRAPPER_CLOSE,
+    NS_WRAPPER_OPEN,
+    NSMAP,
+    CompiledTransformPlan,
+    PageTransformer,
+    _unescape_html_entities,
+)
+
+_CHUNK_SIZE = 64 * 1024
+_MARKER_TARGET = "streaming-rows"
+_HOLDER_CLOSE = "</root>"
+
+
+class StreamingPageTransformer(PageTransformer):
+    """PageTransformerPort 구현 — 메모리 사용이 페이지 전체가 아니라 팀원 블록 1개 크기에 비례"""
+
+    def __init__(self, chunk_size: int = _CHUNK_SIZE):
+        self._chunk_size = chunk_size
+
+    def apply(self, html: str, plan: CompiledTransformPlan) -> str:
+        """컴파일된 변환 계획으로 페이지 1개 변환"""
+        stream = _RowStream(self, plan)
+        parser = etree.XMLPullParser(events=("start", "end"))
+        for data in self._encoded_chunks(html):
+            parser.feed(data)
+            for event, el in parser.read_events():
+                stream.handle(event, el)
+        root = parser.close()
+        for event, el in parser.read_events():
+            stream.handle(event, el)
+        return stream.finish(root)
+
+    def _encoded_chunks(self, html: str):
+        """wrapper + 본문 조각 (엔티티 치환 후 UTF-8). 조각 경계에 걸친 &name;은 다음 조각으로 넘긴다."""
+        yield NS_WRAPPER_OPEN.encode("utf-8")
+        start = 0
+        while start < len(html):
+            end = min(start + self._chunk_size, len(html))
+            amp = html.rfind("&", start, end)
+            if end < len(html) and amp != -1 and html.find(";", amp, end) == -1:
+                if amp > start:
+                    end = amp
+                else:  # 조각보다 긴 &name; — 엔티티 끝까지 늘린다
+                    semi = html.find(";", amp)
+                    end = semi + 1 if semi != -1 else len(html)
+            yield _unescape_html_entities(html[start:end]).encode("utf-8")
+            start = end
+        yield NS_WRAPPER_CLOSE.encode("utf-8")
+
+
+class _RowStream:
+    """XMLPullParser 이벤트로 첫 tbody의 행을 팀원 블록 단위로 변환/직렬화.
+
+    파서가 아직 자식을 붙이고 있는 tbody에서 마지막 자식을 떼어내지 않도록, 끝난 행은 다음 행이
+    시작되거나 tbody가 끝날 때 처리한다.
+    """
+
+    def __init__(self, transformer: PageTransformer, plan: CompiledTransformPlan):
+        self._transformer = transformer
+        self._plan = plan
+        self._token = uuid.uuid4().hex
+        self._tbody: etree._Element | None = None
+        self._tbody_done = False
+        self._row_count = 0
+        self._block: list = []  # 진행 중인 팀원 블록의 행
+        self._block_span = 0
+        self._ready: list[tuple[list, bool]] = []  # (행들, 변환 여부) — 떼어낼 차례를 기다림
+        self._chunks: list[list[str]] = []  # 표식 번호 → 직렬화된 행 문자열
+        self._last_marker: etree._Element | None = None
+
+    def handle(self, event: str, el: etree._Element) -> None:
+        if self._tbody_done:
+            return
+        if self._tbody is None:
+            if event == "start" and el.tag == "tbody":
+                self._tbody = el
+            return
+        if el.tag == "tr" and el.getparent() is self._tbody:
+            if event == "start":
+                self._flush()
+            else:
+                self._end_row(el)
+        elif event == "end" and el is self._tbody:
+            # 행 수가 rowspan보다 모자란 마지막 블록도 PageTransformer처럼 있는 행만으로 변환
+            if self._block:
+                self._ready.append((self._block, True))
+                self._block = []
+            self._flush()
+            self._tbody_done = True
+
+    def finish(self, root: etree._Element) -> str:
+        if self._tbody is None:
+            raise ValueError("테이블을 찾을 수 없습니다.")
+        if self._row_count < 2:
+            raise ValueError("테이블에 데이터 행이 없습니다.")
+        result = etree.tostring(root, encoding="unicode")
+        result = result[len(NS_WRAPPER_OPEN) : -len(NS_WRAPPER_CLOSE)]
+        marker = re.compile(rf"<\?{_MARKER_TARGET} {self._token} (\d+)\?>")
+        return marker.sub(lambda m: "".join(self._chunks[int(m.group(1))]), result)
+
+    def _end_row(self, row: etree._Element) -> None:
+        self._row_count += 1
+        if self._row_count == 1:  # 헤더 행은 뼈대에 남긴다
+            return
+        if self._block:
+            self._block.append(row)
+        else:
+            rowspan = row.findall("td")[0].get("rowspan")
+            if not rowspan:
+                self._ready.append(([row], False))
+                return
+            self._block = [row]
+            self._block_span = int(rowspan)
+        if len(self._block) >= self._block_span:
+            self._ready.append((self._block, True))
+            self._block = []
+
+    def _flush(self) -> None:
+        for rows, transform in self._ready:
+            if transform:
+                self._transformer._transform_block(rows, self._plan)
+            self._detach(rows)
+        self._ready = []
+
+    def _detach(self, rows: list) -> None:
+        """행들을 직렬화해 표식 자리에 모으고 트리에서 떼어낸다"""
+        holder = etree.Element("root", nsmap=NSMAP)
+        previous = rows[0].getprevious()
+        if previous is not None and previous is self._last_marker and previous.tail is None:
+            chunk = self._chunks[-1]  # 바로 앞 표식에 이어 붙인다
+        else:
+            self._chunks.append(chunk := [])
+            marker = etree.ProcessingInstruction(
+                _MARKER_TARGET, f"{self._token} {len(self._chunks) - 1}"
+            )
+            rows[0].addprevious(marker)
+            self._last_marker = marker
+        for row in rows:
+            holder.append(row)
+        serialized = etree.tostring(holder, encoding="unicode")
+        chunk.append(serialized[serialized.index(">") + 1 : -len(_HOLDER_CLOSE)])
@@ -0,0 +1,109 @@
+"""주간 페이지 티켓 key 스캐너 — PageTransformer와 같은 lxml 파싱으로 팀원/날짜별 key 추출.
+
+key 출처:
+  - JIRA 매크로 (<ac:structured-macro ac:name="jira">의 key 파라미터)
+  - /browse/KEY 링크 (<a href>, <ri:url ri:value>)
+  - 본문 텍스트의 PROJ-1234 — "UTF-8" 같은 오탐을 막기 위해 매크로/링크로 참조된 프로젝트만
+위치는 PageTransformer와 같은 표 구조로 정한다: 헤더 다음 행부터, 첫 셀 rowspan = 팀원 블록,
+그다음 셀 = Date. 표 밖의 key는 팀원/날짜 없이 남긴다.
+"""
+
+import re
+
+from lxml import etree
+
+from ...domain.models import TicketMention
+from ...domain.services import extract_jira_keys
+from .page_transformer import AC_NS, RI_NS, parse_storage_html
+
+_KEY = r"[A-Z][A-Z0-9_]+-\d+"
+_KEY_PATTERN = re.compile(rf"^\s*({_KEY})\s*$")
+_TEXT_KEY_PATTERN = re.compile(rf"(?<![\w-])({_KEY})(?![\w-])")
+_BROWSE_PATTERN = re.compile(rf"/browse/({_KEY})(?![\w-])")
+
+_MACRO_TAG = f"{{{AC_NS}}}structured-macro"
+_PARAMETER_TAG = f"{{{AC_NS}}}parameter"
+_AC_NAME = f"{{{AC_NS}}}name"
+_RI_URL_TAG = f"{{{RI_NS}}}url"
+_RI_VALUE = f"{{{RI_NS}}}value"
+
+
+class TicketScanner:
+    """storage format HTML에서 팀원/날짜별 티켓 key 추출"""
+
+    def scan(self, storage_html: str) -> list[TicketMention]:
+        """(key, 팀원, 날짜) 등장 위치 — 문서 순서, 같은 위치의 중복 제거"""
+        try:
+            root = parse_storage_html(storage_html)
+        except etree.XMLSyntaxError:
+            # 표 구조를 알 수 없으면 정규식 추출로 key만 남긴다
+            return [TicketMention(key) for key in extract_jira_keys(storage_html)]
+
+        locations = self._row_locations(root)
+        # (key, 위치 요소, 구조적 참조 여부) — start/end 이벤트 순서가 곧 문서 순서 (tail은 end)
+        refs: list[tuple[str, etree._Element, bool]] = []
+        for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+            if event == "start":
+                refs += [(key, el, True) for key in self._structured_keys(el)]
+            # 주석/처리 지시문은 본문은 보지 않고 tail만
+            text = el.text if event == "start" else el.tail
+            if text:
+                refs += [(key, el, False) for key in _TEXT_KEY_PATTERN.findall(text)]
+
+        projects = {key.rsplit("-", 1)[0] for key, _, structured in refs if structured}
+        refs = [ref for ref in refs if ref[2] or ref[0].rsplit("-", 1)[0] in projects]
+        mentions = (TicketMention(key, *self._locate(el, locations)) for key, el, _ in refs)
+        return list(dict.fromkeys(mentions))
+
+    def _structured_keys(self, el: etree._Element) -> list[str]:
+        """JIRA 매크로 key 파라미터 / browse 링크"""
+        if el.tag == _PARAMETER_TAG:
+            parent = el.getparent()
+            if (
+                el.get(_AC_NAME) == "key"
+                and parent is not None
+                and parent.tag == _MACRO_TAG
+                and parent.get(_AC_NAME) == "jira"
+            ):
+                match = _KEY_PATTERN.match(el.text or "")
+                return [match.group(1)] if match else []
+        elif el.tag == "a":
+            return _BROWSE_PATTERN.findall(el.get("href") or "")
+        elif el.tag == _RI_URL_TAG:
+            return _BROWSE_PATTERN.findall(el.get(_RI_VALUE) or "")
+        return []
+
+    def _row_locations(self, root: etree._Element) -> dict[etree._Element, tuple[str, str]]:
+        """데이터 행 → (팀원, 날짜). 팀원 블록 밖의 행은 팀원 ""."""
+        table = root.find(".//tbody")
+        if table is None:
+            return {}
+        locations = {}
+        member, remaining = "", 0
+        for row in table.findall("tr")[1:]:  # 헤더 행 스킵
+            cells = row.findall("td")
+            if not cells:
+                continue
+            rowspan = cells[0].get("rowspan")
+            if rowspan:
+                member = self._cell_text(cells[0])
+                remaining = int(rowspan)
+                cells = cells[1:]
+            elif remaining == 0:
+                member = ""
+            remaining = max(0, remaining - 1)
+            day = self._cell_text(cells[0]) if cells else ""
+            locations[row] = (member, day)
+        return locations
+
+    def _locate(
+        self, el: etree._Element, locations: dict[etree._Element, tuple[str, str]]
+    ) -> tuple[str, str]:
+        while el is not None:
+            if el.tag == "tr" and el in locations:
+                return locations[el]
+            el = el.getparent()
+        return "", ""
+
+    def _cell_text(self, cell: etree._Element) -> str:
+        return " ".join("".join(cell.itertext()).split())
@@ -0,0 +1,221 @@
+"""XSLT 페이지 변환 — 팀원 블록 변환을 libxslt 스타일시트 한 번 적용으로 처리.
+
+PageTransformer는 행/셀마다 Python에서 트리를 고친다. 여기서는
+  - 팀원 블록 식별만 Python에서 한다 (rowspan으로 덮인 행은 rowspan이 있어도 건너뛰는 순차 규칙이라
+    XSLT로 옮기면 팀원 수만큼 깊은 재귀가 된다). 블록 행에 역할 속성(first N/middle/last N/only)을 붙이고
+  - 날짜 치환, Progress 초기화 + 금요일 Doing/ToDo 이월, Notifications 비우기는 모두 스타일시트가
+    원본을 읽어 새 결과 트리에 쓴다 (역할 속성은 복사하지 않는다)
+날짜 치환표는 XSLT 1.0 파라미터로 넘긴다. 파라미터에 노드 집합을 넘길 수 없어
+"pair-sep 이전 날짜 kv-sep 새 날짜 pair-sep ..." 문자열로 만들고, 구분자는 날짜에 없는 사용자 정의 영역 문자로 고른다.
+결과는 PageTransformer와 바이트 단위로 같다.
+"""
+
+from lxml import etree
+
+from .page_transformer import (
+    NS_WRAPPER_CLOSE,
+    NS_WRAPPER_OPEN,
+    _UNICODE_SPACES,
+    CompiledTransformPlan,
+    PageTransformer,
+    _stripped_text_in,
+    parse_storage_html,
+)
+
+# 블록 행 표시 속성 — 스타일시트가 결과에서 뺀다
+_ROW_ROLE = "data-report-xslt-row"
+# str.strip()이 지우는 문자 중 XML에 올 수 있는 것 (속성값 정규화에 걸리지 않도록 문자 참조로 넣는다)
+_STRIP_CHARS = " \t\n\r" + _UNICODE_SPACES
+_STRIP_CHARS_REF = "".join(f"&#{ord(c)};" for c in _STRIP_CHARS)
+_DOING_TODO = _stripped_text_in(("Doing", "ToDo"))
+
+_STYLESHEET = f"""\
+<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+  <xsl:param name="dates" select="''"/>
+  <xsl:param name="kv-sep" select="''"/>
+  <xsl:param name="pair-sep" select="''"/>
+  <xsl:variable name="ws" select="'{_STRIP_CHARS_REF}'"/>
+  <!-- 블록 번호 → 블록 마지막 행 (following-sibling 검색은 블록마다 표 끝까지 훑는다) -->
+  <xsl:key name="last-row" match="tr[starts-with(@{_ROW_ROLE}, 'last ')]"
+      use="substring-after(@{_ROW_ROLE}, ' ')"/>
+
+  <!-- 표까지 내려가는 경로만 노드별로 복사하고, 고치지 않는 부분은 copy-of로 통째로 복사 -->
+  <xsl:template match="@*|node()">
+    <xsl:copy><xsl:apply-templates select="@*|node()"/></xsl:copy>
+  </xsl:template>
+
+  <xsl:template match="tr">
+    <xsl:copy-of select="."/>
+  </xsl:template>
+
+  <xsl:template match="tr[@{_ROW_ROLE}]">
+    <xsl:copy>
+      <xsl:copy-of select="@*[name() != '{_ROW_ROLE}']"/>
+      <xsl:apply-templates select="node()" mode="row">
+        <xsl:with-param name="offset" select="number(boolean(td[1]/@rowspan))"/>
+      </xsl:apply-templates>
+    </xsl:copy>
+  </xsl:template>
+
+  <xsl:template match="node()" mode="row">
+    <xsl:copy-of select="."/>
+  </xsl:template>
+
+  <xsl:template match="td" mode="row">
+    <xsl:param name="offset"/>
+    <xsl:variable name="index" select="count(preceding-sibling::td) + 1 - $offset"/>
+    <xsl:choose>
+      <xsl:when test="$index = 1">
+        <xsl:copy>
+          <xsl:copy-of select="@*"/>
+          <xsl:apply-templates select="node()" mode="date"/>
+        </xsl:copy>
+      </xsl:when>
+      <xsl:when test="$index = 2">
+        <xsl:copy>
+          <xsl:copy-of select="@*"/>
+          <xsl:call-template name="progress"/>
+        </xsl:copy>
+      </xsl:when>
+      <xsl:when test="$index = 3">
+        <xsl:copy><xsl:copy-of select="@*"/><p/></xsl:copy>
+      </xsl:when>
+      <xsl:otherwise>
+        <xsl:copy-of select="."/>
+      </xsl:otherwise>
+    </xsl:choose>
+  </xsl:template>
+
+  <!-- 빈 Done/Doing/ToDo. 블록 첫 행이면 마지막 행(원본)의 Doing/ToDo 항목을 ToDo 아래로 이월 -->
+  <xsl:template name="progress">
+    <xsl:variable name="role" select="../@{_ROW_ROLE}"/>
+    <ul>
+      <li><p>Done</p></li>
+      <li><p>Doing</p></li>
+      <li>
+        <p>ToDo</p>
+        <xsl:if test="$role = 'only' or starts-with($role, 'first ')">
+          <xsl:call-template name="carryover">
+            <xsl:with-param name="last" select="../self::tr[$role = 'only']
+                                                | key('last-row', substring-after($role, ' '))"/>
+          </xsl:call-template>
+        </xsl:if>
+      </li>
+    </ul>
+  </xsl:template>
+
+  <xsl:template name="carryover">
+    <xsl:param name="last"/>
+    <xsl:variable name="offset" select="number(boolean($last/td[1]/@rowspan))"/>
+    <xsl:variable name="items"
+        select="$last/td[2 + $offset]/ul[1]/li[p[1][{_DOING_TODO}]]/ul[1]/li"/>
+    <xsl:if test="$items">
+      <ul>
+        <xsl:for-each select="$items">
+          <!-- lxml에서 옮긴 <li>는 tail 텍스트를 함께 가져간다 -->
+          <xsl:copy-of select=". | following-sibling::node()[1][self::text()]"/>
+        </xsl:for-each>
+      </ul>
+    </xsl:if>
+  </xsl:template>
+
+  <xsl:template match="node()" mode="date">
+    <xsl:copy-of select="."/>
+  </xsl:template>
+
+  <xsl:template match="p[node()[1][self::text()]]" mode="date">
+    <xsl:variable name="text" select="string(node()[1])"/>
+    <xsl:variable name="lookup" select="concat($pair-sep, $text, $kv-sep)"/>
+    <xsl:variable name="found">
+      <xsl:choose>
+        <!-- 대부분은 날짜만 적힌 텍스트 — 치환표에서 바로 찾는다 -->
+        <xsl:when test="contains($dates, $lookup)
+                        and translate($text, concat($kv-sep, $pair-sep), '') = $text">
+          <xsl:value-of
+              select="concat('1', substring-before(substring-after($dates, $lookup), $pair-sep))"/>
+        </xsl:when>
+        <xsl:when test="translate($text, $ws, '') != $text">
+          <xsl:call-template name="new-date">
+            <xsl:with-param name="text" select="$text"/>
+            <xsl:with-param name="entries" select="substring-after($dates, $pair-sep)"/>
+          </xsl:call-template>
+        </xsl:when>
+      </xsl:choose>
+    </xsl:variable>
+    <xsl:choose>
+      <xsl:when test="string($found)">
+        <xsl:copy>
+          <xsl:copy-of select="@*"/>
+          <xsl:value-of select="substring($found, 2)"/>
+          <xsl:copy-of select="node()[position() > 1]"/>
+        </xsl:copy>
+      </xsl:when>
+      <xsl:otherwise>
+        <xsl:copy-of select="."/>
+      </xsl:otherwise>
+    </xsl:choose>
+  </xsl:template>
+
+  <!-- text.strip()과 같은 이전 날짜가 있으면 '1' + 새 날짜, 없으면 빈 문자열.
+       이전 날짜는 앞뒤 공백이 없으므로 첫 등장 위치 앞뒤가 공백뿐인지로 strip() 비교를 대신한다 -->
+  <xsl:template name="new-date">
+    <xsl:param name="text"/>
+    <xsl:param name="entries"/>
+    <xsl:if test="$entries">
+      <xsl:variable name="entry" select="substring-before($entries, $pair-sep)"/>
+      <xsl:variable name="old" select="substring-before($entry, $kv-sep)"/>
+      <xsl:choose>
+        <xsl:when test="contains($text, $old)
+                        and translate(substring-before($text, $old), $ws, '') = ''
+                        and translate(substring-after($text, $old), $ws, '') = ''">
+          <xsl:value-of select="concat('1', substring-after($entry, $kv-sep))"/>
+        </xsl:when>
+        <xsl:otherwise>
+          <xsl:call-template name="new-date">
+            <xsl:with-param name="text" select="$text"/>
+            <xsl:with-param name="entries" select="substring-after($entries, $pair-sep)"/>
+          </xsl:call-template>
+        </xsl:otherwise>
+      </xsl:choose>
+    </xsl:if>
+  </xsl:template>
+</xsl:stylesheet>
+"""
+_XSLT = etree.XSLT(etree.XML(_STYLESHEET.encode("ascii", "xmlcharrefreplace")))
+
+
+def _date_params(plan: CompiledTransformPlan) -> dict[str, str]:
+    """치환표 → 스타일시트 파라미터. 앞뒤 공백이 있는 이전 날짜는 strip()한 값과 같을 수 없어 뺀다."""
+    pairs = [(old, new) for old, new in plan.date_map.items() if old == old.strip(_STRIP_CHARS)]
+    used = {c for pair in pairs for value in pair for c in value}
+    kv_sep, pair_sep = [c for c in map(chr, range(0xE000, 0xF900)) if c not in used][:2]
+    dates = pair_sep + "".join(f"{old}{kv_sep}{new}{pair_sep}" for old, new in pairs)
+    return {
+        "dates": etree.XSLT.strparam(dates),
+        "kv-sep": etree.XSLT.strparam(kv_sep),
+        "pair-sep": etree.XSLT.strparam(pair_sep),
+    }
+
+
+class XsltPageTransformer(PageTransformer):
+    """PageTransformerPort 구현 — 블록 변환을 XSLT(libxslt)로 실행"""
+
+    def apply(self, html: str, plan: CompiledTransformPlan) -> str:
+        """컴파일된 변환 계획으로 페이지 1개 변환"""
+        root = parse_storage_html(html)
+        for number, block in enumerate(self._identify_member_blocks(self._data_rows(root))):
+            self._mark_block(block, number)
+        result = _XSLT(root, **_date_params(plan))
+        serialized = etree.tostring(result.getroot(), encoding="unicode")
+        return serialized[len(NS_WRAPPER_OPEN) : -len(NS_WRAPPER_CLOSE)]
+
+    def _mark_block(self, block: list, number: int) -> None:
+        """블록 행에 역할 속성을 붙인다. 셀이 모자란 행은 PageTransformer처럼 IndexError."""
+        for row in block:
+            self._classify_row(row)
+            row.set(_ROW_ROLE, "middle")
+        if len(block) == 1:
+            block[0].set(_ROW_ROLE, "only")
+        else:
+            block[0].set(_ROW_ROLE, f"first {number}")
+            block[-1].set(_ROW_ROLE, f"last {number}")
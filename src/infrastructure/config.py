@@ -1,11 +1,13 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import date
 
 from dotenv import load_dotenv
 
 from ..domain.models import ReportConfig
 
+DEFAULT_METRICS_PATH = "logs/metrics.jsonl"
+
 
 @dataclass
 class AppConfig:
@@ -23,6 +25,32 @@ class AppConfig:
     parent_page_id: str = ""
     cli_model: str | None = None
     dry_run: bool = False
+    stream: bool = False
+    batch_reports: list[ReportConfig] = field(default_factory=list)
+    report_concurrency: int = 4
+    daemon_socket: str = ".cache/report-daemon.sock"
+    cache_dir: str = ".cache"
+    report_cache_ttl_seconds: int = 6 * 60 * 60
+    report_cache_max_mb: int = 50
+    page_store_max_mb: int = 100
+    metrics_path: str = DEFAULT_METRICS_PATH
+    deadline_daily_seconds: int | None = None  # None: deadline 없음 (opt-in)
+    deadline_weekly_seconds: int | None = None
+    fallback_reserve_seconds: int = 0  # 0: model fallback 없음 (opt-in)
+    prefetch: bool = False
+    jira_url: str = ""
+    split_prompt: bool = False
+    race_models: tuple[str, ...] = ()
+    http_pool_size: int = 10
+    http_retries: int = 3
+    atlassian_rate_per_second: int = 10
+    slack_rate_per_minute: int = 50
+    page_transformer_engine: str = "lxml"
+
+
+def _default_jira_url(confluence_url: str) -> str:
+    """Atlassian Cloud는 JIRA와 Confluence가 같은 호스트 (Confluence만 /wiki 경로)."""
+    return confluence_url.rstrip("/").removesuffix("/wiki")
 
 
 _TRUTHY_VALUES = ("1", "true")
@@ -33,6 +61,54 @@ def _parse_bool_env(key: str) -> bool:
     return os.environ.get(key, "").lower() in _TRUTHY_VALUES
 
 
+def _parse_int_env(key: str, default: int) -> int:
+    """환경변수를 양의 정수로 파싱. 미설정/형식 오류/0 이하는 default."""
+    raw = os.environ.get(key, "")
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _parse_non_negative_int_env(key: str, default: int) -> int:
+    """0이 의미 있는 정수 환경변수 파싱 (초, 재시도 횟수). 0은 그대로, 미설정/형식 오류/음수는 default."""
+    raw = os.environ.get(key, "")
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+def _parse_list_env(key: str) -> tuple[str, ...]:
+    """콤마 구분 환경변수 → 공백 제거한 값 tuple (빈 항목 제외)."""
+    return tuple(v.strip() for v in os.environ.get(key, "").split(",") if v.strip())
+
+
+def _parse_batch_reports(raw: str, base: ReportConfig) -> list[ReportConfig]:
+    """`REPORT_SPACE_KEYS` 파싱 → 팀별 ReportConfig 목록.
+
+    형식: `KEY[:PREFIX[:MENTIONS]]`를 콤마로 구분. 생략된 값은 base 설정을 따른다.
+    예: "MAI:BE:@홍길동 @김철수,OPS:OPS" → MAI(BE, 멘션 2명), OPS(OPS, base 멘션)
+    """
+    reports = []
+    for entry in raw.split(","):
+        key, _, rest = entry.strip().partition(":")
+        if not key:
+            continue
+        prefix, _, mentions = rest.partition(":")
+        reports.append(
+            replace(
+                base,
+                space_key=key.strip(),
+                team_prefix=prefix.strip() or base.team_prefix,
+                mention_users=mentions.strip() or base.mention_users,
+            )
+        )
+    return reports
+
+
 def load_config_from_env(report_date: date | None = None) -> AppConfig | None:
     """환경변수에서 설정 로드. 필수 값이 없으면 None 반환."""
     load_dotenv()
@@ -72,4 +148,30 @@ def load_config_from_env(report_date: date | None = None) -> AppConfig | None:
         parent_page_id=os.environ.get("PARENT_PAGE_ID", ""),
         cli_model=cli_model,
         dry_run=_parse_bool_env("DRY_RUN"),
+        stream=_parse_bool_env("REPORT_STREAM"),
+        batch_reports=_parse_batch_reports(
+            os.environ.get("REPORT_SPACE_KEYS", ""), report_config
+        ),
+        report_concurrency=_parse_int_env("REPORT_CONCURRENCY", 4),
+        daemon_socket=os.environ.get("REPORT_DAEMON_SOCKET", "") or ".cache/report-daemon.sock",
+        cache_dir=os.environ.get("REPORT_CACHE_DIR", "") or ".cache",
+        report_cache_ttl_seconds=_parse_int_env("REPORT_CACHE_TTL_SECONDS", 6 * 60 * 60),
+        report_cache_max_mb=_parse_int_env("REPORT_CACHE_MAX_MB", 50),
+        page_store_max_mb=_parse_int_env("CONFLUENCE_PAGE_STORE_MAX_MB", 100),
+        metrics_path=os.environ.get("REPORT_METRICS_PATH", "") or DEFAULT_METRICS_PATH,
+        # 미설정/0이면 deadline 없음 / model fallback 없음 — 켜려면 .env에 값을 넣는다
+        deadline_daily_seconds=_parse_non_negative_int_env("REPORT_DEADLINE_DAILY_SECONDS", 0) or None,
+        deadline_weekly_seconds=_parse_non_negative_int_env("REPORT_DEADLINE_WEEKLY_SECONDS", 0) or None,
+        fallback_reserve_seconds=_parse_non_negative_int_env("REPORT_FALLBACK_RESERVE_SECONDS", 0),
+        prefetch=_parse_bool_env("REPORT_PREFETCH"),
+        split_prompt=_parse_bool_env("REPORT_SPLIT_PROMPT"),
+        race_models=_parse_list_env("REPORT_RACE_MODELS"),
+        http_pool_size=_parse_int_env("ATLASSIAN_HTTP_POOL_SIZE", 10),
+        http_retries=_parse_non_negative_int_env("ATLASSIAN_HTTP_RETRIES", 3),
+        atlassian_rate_per_second=_parse_int_env("ATLASSIAN_RATE_LIMIT_PER_SECOND", 10),
+        slack_rate_per_minute=_parse_int_env("SLACK_RATE_LIMIT_PER_MINUTE", 50),
+        page_transformer_engine=os.environ.get("PAGE_TRANSFORMER_ENGINE", "").strip().lower()
+        or "lxml",
+        jira_url=os.environ.get("JIRA_URL", "")
+        or _default_jira_url(os.environ.get("CONFLUENCE_URL", "")),
     )
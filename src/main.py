@@ -1,11 +1,40 @@
 import argparse
+import dataclasses
 import sys
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from urllib.parse import urlsplit
 
-from .application.ports import CLIExecutorPort, NotificationPort
+from .application.ports import (
+    CLIExecutorPort,
+    MetricsStorePort,
+    NotificationPort,
+    PageTransformerPort,
+)
 from .application.use_cases import GenerateReportUseCase
-from .infrastructure.adapters.cli_executors import ClaudeCLIExecutor
-from .infrastructure.adapters.slack_adapter import SlackAdapter
+from .domain.models import DateRange
+from .domain.services import (
+    calculate_last_week_range,
+    calculate_this_week_range,
+    format_confluence_page_title,
+    plan_week_chain,
+)
+from .infrastructure.adapters.cli_executors import (
+    ClaudeCLIExecutor,
+    ContextProvider,
+    WarmClaudeExecutor,
+    WarmClaudeSession,
+)
+from .infrastructure.adapters.metrics_store import JsonlMetricsStore
+from .infrastructure.adapters.page_store import PageContentStore
+from .infrastructure.adapters.page_tree_index import PageTreeIndex
+from .infrastructure.adapters.rate_limit import configure_host, throttle_stats
+from .infrastructure.adapters.report_cache import (
+    CachingCLIExecutor,
+    PageVersionProbe,
+    ReportOutputCache,
+)
+from .infrastructure.adapters.slack_adapter import SLACK_HOST, SlackAdapter
 from .infrastructure.adapters.stdout_adapter import StdoutAdapter
 from .infrastructure.config import AppConfig, load_config_from_env
 
@@ -14,10 +43,29 @@ def create_cli_executor(
     cli_type: str,
     command: str = "daily_report",
     model: str | None = None,
+    session: WarmClaudeSession | None = None,
+    metrics_store: MetricsStorePort | None = None,
+    deadline_seconds: float | None = None,
+    fallback_reserve_seconds: float = 0.0,
+    context_provider: ContextProvider | None = None,
+    command_file: Path | None = None,
+    race_models: tuple[str, ...] = (),
 ) -> CLIExecutorPort:
-    """CLI 타입에 따라 적절한 실행기 생성."""
+    """CLI 타입에 따라 적절한 실행기 생성. session이 주어지면 데몬의 상주 세션을 재사용."""
     if cli_type == "claude":
-        return ClaudeCLIExecutor(command=command, model=model)
+        options = dict(
+            command=command,
+            model=model,
+            metrics_store=metrics_store,
+            deadline_seconds=deadline_seconds,
+            fallback_reserve_seconds=fallback_reserve_seconds,
+            context_provider=context_provider,
+            command_file=command_file,
+            race_models=race_models,
+        )
+        if session is not None:
+            return WarmClaudeExecutor(session, **options)
+        return ClaudeCLIExecutor(**options)
     raise ValueError(f"Unknown CLI type: {cli_type}. Supported: ['claude']")
 
 
@@ -42,9 +90,81 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Slack 전송 없이 stdout으로 리포트 출력. DRY_RUN env와 동등.",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        default=False,
+        help="상주 데몬 모드. SDK 세션/MCP 서버를 띄워둔 채 로컬 소켓으로 job 수신.",
+    )
+    parser.add_argument(
+        "--submit",
+        action="store_true",
+        default=False,
+        help="현재 모드/날짜/모델 job을 데몬에 제출. 데몬이 없으면 in-process로 실행.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="리포트 출력 캐시를 무시하고 항상 claude를 실행.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="생성 중인 출력을 실시간 전송 (stdout 즉시 출력 / Slack placeholder 갱신). REPORT_STREAM env와 동등.",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        default=False,
+        help="daily 리포트 입력(이번 주 페이지 + JIRA 티켓)을 실행 전에 조회해 프롬프트에 주입. REPORT_PREFETCH env와 동등.",
+    )
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=_parse_date,
+        default=None,
+        help="create_page: 이 날짜가 속한 주부터 --to(기본: --date/오늘) 주까지 페이지를 차례로 생성 (backfill).",
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=_parse_date,
+        default=None,
+        help="create_page: --from 범위의 마지막 날짜 (YYYY-MM-DD).",
+    )
+    parser.add_argument(
+        "--weeks-ahead",
+        type=int,
+        default=None,
+        help="create_page: 이번 주(--date 기준)부터 N주 뒤까지 페이지를 미리 생성.",
+    )
     return parser.parse_args()
 
 
+def _parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def resolve_backfill_weeks(args, report_date: date) -> list[DateRange] | None:
+    """--from/--to 또는 --weeks-ahead로 생성할 주 목록. 범위 옵션이 없으면 None (1주 생성).
+
+    --to만 지정했거나 --from과 --weeks-ahead를 함께 쓰면 ValueError.
+    """
+    if args.date_to is not None and args.date_from is None:
+        raise ValueError("--to requires --from")
+    if args.date_from is not None and args.weeks_ahead is not None:
+        raise ValueError("--from and --weeks-ahead cannot be combined")
+    if args.date_from is not None:
+        return plan_week_chain(args.date_from, args.date_to or report_date)
+    if args.weeks_ahead is not None:
+        if args.weeks_ahead < 0:
+            raise ValueError("--weeks-ahead must be 0 or more")
+        return plan_week_chain(report_date, report_date + timedelta(weeks=args.weeks_ahead))
+    return None
+
+
 def resolve_effective_settings(args, config) -> tuple[str, bool]:
     """CLI 인자와 config(ENV)에서 effective model/dry_run 결정.
 
@@ -66,25 +186,210 @@ def create_notifier(dry_run: bool, slack_token: str, slack_channel: str) -> Noti
     return SlackAdapter(token=slack_token, channel=slack_channel)
 
 
-def build_report_use_case(config: AppConfig, model: str, dry_run: bool) -> GenerateReportUseCase:
-    """report_mode(daily/weekly)에 맞는 use case 조립."""
+# chat.postMessage/chat.update 연속 호출 허용량 (그 뒤로는 분당 rate로 채워진다)
+_SLACK_RATE_BURST = 5
+
+
+def configure_rate_limits(config: AppConfig) -> None:
+    """프로세스 전역 호스트 rate limiter 설정 — Confluence/JIRA 호스트와 Slack.
+
+    같은 호스트를 쓰는 어댑터(Confluence v1/v2, JIRA, 여러 팀의 batch 실행)가 한 버킷을 나눠 쓴다.
+    """
+    atlassian_hosts = {urlsplit(url).netloc for url in (config.confluence_url, config.jira_url)}
+    for host in sorted(atlassian_hosts - {""}):
+        configure_host(host, config.atlassian_rate_per_second)
+    configure_host(SLACK_HOST, config.slack_rate_per_minute / 60, burst=_SLACK_RATE_BURST)
+
+
+def log_throttle_stats() -> None:
+    """rate limit으로 기다린 호스트별 누적 시간 출력 (기다린 적이 없으면 출력 없음)"""
+    for host, stats in sorted(throttle_stats().items()):
+        if not stats.throttled and not stats.rate_limited:
+            continue
+        print(
+            f"Rate limit: {host} throttled {stats.throttled}/{stats.requests} requests "
+            f"for {stats.throttled_seconds:.1f}s ({stats.rate_limited} x 429)"
+        )
+
+
+def create_page_version_probe(config: AppConfig) -> PageVersionProbe | None:
+    """리포트 캐시용 페이지 버전 probe. Confluence REST 설정이 없으면 None (TTL만 사용).
+
+    리포트가 읽는 주의 페이지를 본다 — daily는 이번 주, weekly는 지난주 페이지.
+    """
+    if not config.confluence_url or not config.confluence_user or not config.confluence_token:
+        return None
+    from .infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+
+    confluence = ConfluenceAdapter(
+        url=config.confluence_url,
+        user=config.confluence_user,
+        token=config.confluence_token,
+        pool_size=config.http_pool_size,
+        retries=config.http_retries,
+        title_index=create_title_index(config),
+    )
+
+    week_range = calculate_last_week_range if config.report_mode == "weekly" else calculate_this_week_range
+
+    def probe(space_key: str, report_date: date) -> str | None:
+        title = format_confluence_page_title(week_range(report_date))
+        version = confluence.get_page_version(space_key, title)
+        return None if version is None else str(version)
+
+    return probe
+
+
+def create_page_store(config: AppConfig) -> PageContentStore | None:
+    """Confluence 페이지 본문 저장소 (REPORT_CACHE_DIR/pages). 용량이 0 이하면 None (매번 본문 조회)."""
+    if config.page_store_max_mb <= 0:
+        return None
+    return PageContentStore(
+        Path(config.cache_dir) / "pages",
+        max_bytes=config.page_store_max_mb * 1024 * 1024,
+    )
+
+
+def create_title_index(config: AppConfig) -> PageTreeIndex | None:
+    """PARENT_PAGE_ID 하위 제목 색인 (REPORT_CACHE_DIR/page_index). 부모 페이지 미설정이면 None (제목 검색)."""
+    if not config.parent_page_id.isdigit():
+        return None
+    space_key = config.report.space_key
+    return PageTreeIndex(
+        space_key,
+        config.parent_page_id,
+        Path(config.cache_dir) / "page_index" / f"{space_key}-{config.parent_page_id}.json",
+    )
+
+
+def page_transformer_engines() -> dict[str, type]:
+    """PAGE_TRANSFORMER_ENGINE 값 → 변환 엔진 클래스 (첫 항목이 기본)"""
+    from .infrastructure.adapters.page_transformer import PageTransformer
+    from .infrastructure.adapters.streaming_page_transformer import StreamingPageTransformer
+    from .infrastructure.adapters.xslt_page_transformer import XsltPageTransformer
+
+    return {
+        "lxml": PageTransformer,
+        "streaming": StreamingPageTransformer,
+        "xslt": XsltPageTransformer,
+    }
+
+
+def create_page_transformer(config: AppConfig) -> PageTransformerPort:
+    """PAGE_TRANSFORMER_ENGINE에 맞는 변환 엔진. 알 수 없는 값이면 경고 후 기본(lxml)."""
+    engines = page_transformer_engines()
+    engine = engines.get(config.page_transformer_engine)
+    if engine is None:
+        print(
+            f"WARNING: unknown PAGE_TRANSFORMER_ENGINE '{config.page_transformer_engine}'"
+            f" (expected one of {', '.join(engines)}) — using lxml."
+        )
+        engine = engines["lxml"]
+    return engine()
+
+
+def create_report_context_provider(config: AppConfig) -> ContextProvider | None:
+    """daily 리포트 입력 prefetch provider. 비활성화 또는 Confluence REST 설정이 없으면 None."""
+    if not config.prefetch:
+        return None
+    if not config.confluence_url or not config.confluence_user or not config.confluence_token:
+        print("WARNING: prefetch requires CONFLUENCE_URL/USER/TOKEN — agent will query MCP instead.")
+        return None
+    from .application.report_context import ReportContextPrefetcher
+    from .infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+    from .infrastructure.adapters.jira_adapter import JiraAdapter
+    from .infrastructure.adapters.ticket_scanner import TicketScanner
+
+    prefetcher = ReportContextPrefetcher(
+        confluence=ConfluenceAdapter(
+            url=config.confluence_url,
+            user=config.confluence_user,
+            token=config.confluence_token,
+            pool_size=config.http_pool_size,
+            retries=config.http_retries,
+            page_store=create_page_store(config),
+            title_index=create_title_index(config),
+        ),
+        jira=JiraAdapter(
+            url=config.jira_url,
+            user=config.confluence_user,
+            token=config.confluence_token,
+            pool_size=config.http_pool_size,
+            retries=config.http_retries,
+        ),
+        scanner=TicketScanner(),
+    )
+    return prefetcher.fetch_prompt_block
+
+
+def build_report_use_case(
+    config: AppConfig,
+    model: str,
+    dry_run: bool,
+    session: WarmClaudeSession | None = None,
+    use_cache: bool = False,
+) -> GenerateReportUseCase:
+    """report_mode(daily/weekly)에 맞는 use case 조립.
+
+    session은 데몬 모드에서만 전달. use_cache=True면 실행기를 출력 캐시로 감싼다.
+    """
     if config.report_mode == "weekly":
         command, channel, suffix = "weekly_report", config.slack_channel_weekly, "Weekly"
+        deadline = config.deadline_weekly_seconds
+        context_provider = None  # weekly는 지난주 페이지들을 agent가 직접 수집
+        race_models: tuple[str, ...] = ()
     else:
         command, channel, suffix = "daily_report", config.slack_channel, "Daily"
+        deadline = config.deadline_daily_seconds
+        context_provider = create_report_context_provider(config)
+        # 상주 세션은 job을 하나씩 처리하므로 경주 불가 — cold start 실행에서만
+        race_models = config.race_models if session is None else ()
+    command_file = Path.cwd() / ".claude" / "commands" / f"{command}.md"
 
-    cli_executor = create_cli_executor(config.cli_type, command=command, model=model)
+    cli_executor = create_cli_executor(
+        config.cli_type,
+        command=command,
+        model=model,
+        session=session,
+        metrics_store=JsonlMetricsStore(Path(config.metrics_path)),
+        deadline_seconds=deadline,
+        fallback_reserve_seconds=config.fallback_reserve_seconds,
+        context_provider=context_provider,
+        command_file=command_file if config.split_prompt else None,
+        race_models=race_models,
+    )
+    if use_cache:
+        cache = ReportOutputCache(
+            Path(config.cache_dir) / "reports",
+            ttl_seconds=config.report_cache_ttl_seconds,
+            max_bytes=config.report_cache_max_mb * 1024 * 1024,
+        )
+        cli_executor = CachingCLIExecutor(
+            cli_executor,
+            cache,
+            command=command,
+            model=",".join(race_models) if len(race_models) > 1 else model,
+            command_file=command_file,
+            version_probe=create_page_version_probe(config),
+        )
     notifier = create_notifier(
         dry_run=dry_run, slack_token=config.slack_token, slack_channel=channel
     )
     return GenerateReportUseCase(cli_executor, notifier, title_suffix=suffix)
 
 
-def run_create_page_mode(config: AppConfig, report_date: date) -> bool:
-    """create_page 모드 실행: 주간 Confluence 페이지 생성 조립 + 실행."""
+def run_create_page_mode(
+    config: AppConfig, report_date: date, weeks: list[DateRange] | None = None
+) -> bool:
+    """create_page 모드 실행: 주간 Confluence 페이지 생성 조립 + 실행.
+
+    weeks가 주어지면 그 주들을 차례로 생성 (진행 기록: REPORT_CACHE_DIR/backfill/<space>.json).
+    """
+    from .infrastructure.adapters.async_confluence_adapter import AsyncConfluenceAdapter
+    from .infrastructure.adapters.backfill_checkpoint import JsonBackfillCheckpoint
     from .infrastructure.adapters.confluence_adapter import ConfluenceAdapter
-    from .infrastructure.adapters.page_transformer import PageTransformer
-    from .application.create_page_use_case import CreateWeeklyPageUseCase
+    from .infrastructure.adapters.confluence_id_cache import SpaceIdCache
+    from .application.create_page_use_case import AsyncCreateWeeklyPageUseCase
     from .domain.models import WeeklyPageConfig
 
     if not config.confluence_url or not config.confluence_user or not config.confluence_token:
@@ -95,8 +400,12 @@ def run_create_page_mode(config: AppConfig, report_date: date) -> bool:
         url=config.confluence_url,
         user=config.confluence_user,
         token=config.confluence_token,
+        pool_size=config.http_pool_size,
+        retries=config.http_retries,
+        space_id_cache=SpaceIdCache(Path(config.cache_dir) / "confluence_ids.json"),
+        title_index=create_title_index(config),
     )
-    transformer = PageTransformer()
+    transformer = create_page_transformer(config)
 
     # SlackAdapter 인스턴스화 (env 미설정 시 None — main.py가 primary 가드)
     notifier = (
@@ -108,8 +417,9 @@ def run_create_page_mode(config: AppConfig, report_date: date) -> bool:
         else None
     )
 
-    use_case = CreateWeeklyPageUseCase(
-        confluence=confluence,
+    # 페이지 조회와 space id 조회를 겹쳐 실행 (동시 요청 수는 연결 풀 크기로 제한)
+    use_case = AsyncCreateWeeklyPageUseCase(
+        confluence=AsyncConfluenceAdapter(confluence, max_concurrency=config.http_pool_size),
         transformer=transformer,
         notifier=notifier,
     )
@@ -118,11 +428,25 @@ def run_create_page_mode(config: AppConfig, report_date: date) -> bool:
         space_key=config.report.space_key,
         parent_page_id=config.parent_page_id,
     )
-    return use_case.execute(
-        weekly_page_config,
-        target_date=report_date,
-        notification_prefix=config.report.team_prefix,
-    )
+    if weeks is not None:
+        checkpoint = JsonBackfillCheckpoint(
+            Path(config.cache_dir) / "backfill" / f"{config.report.space_key}.json"
+        )
+        ok = use_case.execute_range(
+            weekly_page_config,
+            weeks,
+            notification_prefix=config.report.team_prefix,
+            checkpoint=checkpoint,
+        )
+    else:
+        ok = use_case.execute(
+            weekly_page_config,
+            target_date=report_date,
+            notification_prefix=config.report.team_prefix,
+        )
+    stats = confluence.http_stats()
+    print(f"Confluence HTTP: {stats.requests} requests over {stats.connections} connections ({stats.reused} reused)")
+    return ok
 
 
 def main() -> int:  # pragma: no cover
@@ -141,21 +465,77 @@ def main() -> int:  # pragma: no cover
     if config is None:
         print("Exiting due to configuration error.")
         return 1
+    if args.prefetch:
+        config = dataclasses.replace(config, prefetch=True)
+    configure_rate_limits(config)
+    try:
+        return _run(args, config)
+    finally:
+        log_throttle_stats()
+
 
+def _run(args: argparse.Namespace, config: AppConfig) -> int:  # pragma: no cover
+    """main()의 모드 분기 (설정 로드 이후)"""
     effective_model, effective_dry_run = resolve_effective_settings(args, config)
     report_date = config.report.report_date or date.today()
     print(f"Using CLI: {config.cli_type}")
     print(f"Model: {effective_model} | dry_run: {effective_dry_run}")
     print(f"Report date: {report_date.isoformat()}")
 
+    if args.serve:
+        from .daemon import ReportDaemon
+
+        ReportDaemon(config, config.daemon_socket).serve()
+        return 0
+
+    weeks = None
     if config.report_mode == "create_page":
-        if not run_create_page_mode(config, report_date):
+        try:
+            weeks = resolve_backfill_weeks(args, report_date)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            return 1
+
+    if args.submit:
+        from .daemon import DaemonJob, submit_job
+
+        # 데몬은 job을 하나씩 처리하고 출력은 데몬 로그로 간다 — 스트리밍 전달 불가
+        if args.stream:
+            print("ERROR: --stream cannot be combined with --submit (daemon runs are not streamed).")
+            return 1
+        job = DaemonJob(
+            mode=config.report_mode,
+            report_date=args.date,
+            model=effective_model,
+            dry_run=effective_dry_run,
+            use_cache=not args.no_cache,
+            prefetch=config.prefetch,
+            weeks=tuple(weeks) if weeks is not None else None,
+        )
+        result = submit_job(config.daemon_socket, job)
+        if result is not None:
+            return 0 if result["ok"] else 1
+        print("WARNING: report daemon unavailable — running in-process (cold start).")
+
+    if config.report_mode == "create_page":
+        if not run_create_page_mode(config, report_date, weeks):
             print("ERROR: Failed to create weekly page.")
             return 1
         return 0
 
-    use_case = build_report_use_case(config, effective_model, effective_dry_run)
-    if not use_case.execute(config.report):
+    use_case = build_report_use_case(
+        config, effective_model, effective_dry_run, use_cache=not args.no_cache
+    )
+    if config.batch_reports:
+        results = use_case.execute_batch(config.batch_reports, config.report_concurrency)
+        if not all(results):
+            failed = [c.space_key for c, ok in zip(config.batch_reports, results) if not ok]
+            print(f"ERROR: Failed to generate and send report for: {', '.join(failed)}")
+            return 1
+        return 0
+
+    run = use_case.execute_streaming if args.stream or config.stream else use_case.execute
+    if not run(config.report):
         print("ERROR: Failed to generate and send report.")
         return 1
     return 0
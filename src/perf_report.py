@@ -0,0 +1,226 @@
+"""실행 메트릭 집계 리포트 — `make perf-report`.
+
+JsonlMetricsStore에 쌓인 RunMetrics를 기간(주/일)·모드·모델별로 묶어
+지연(p50/p95), 비용(p50/p95/합계), 오류/deadline 초과/경주 취소 수, prompt cache 적중률을 표로 출력한다.
+지연은 끝까지 실행된 기록만 집계한다 — deadline으로 취소된 시도와 경주에서 져서 취소된 참가자의
+duration은 취소 시점까지의 시간이라 모델 지연을 낮춰 보이게 한다 (t/o, lost 열에 따로 센다).
+모델 경주(REPORT_RACE_MODELS) 기록이 있으면 모델별 승률/지연 차 표를 덧붙인다.
+프롬프트/모델 변경 전후로 daily 리포트가 느려졌거나 비싸졌는지 확인하는 용도.
+
+Usage:
+    uv run python -m src.perf_report [--by week|day|all] [--since YYYY-MM-DD] [--path logs/metrics.jsonl]
+"""
+
+import argparse
+import math
+import os
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .domain.models import RunMetrics
+from .infrastructure.adapters.metrics_store import JsonlMetricsStore
+from .infrastructure.config import DEFAULT_METRICS_PATH
+
+
+@dataclass(frozen=True)
+class PerfRow:
+    """기간·모드·모델 1그룹의 집계"""
+    period: str
+    mode: str
+    model: str
+    runs: int
+    errors: int
+    timeouts: int
+    p50_s: float | None  # 끝까지 실행된 기록 기준 (없으면 None)
+    p95_s: float | None
+    p50_cost: float | None
+    p95_cost: float | None
+    total_cost: float | None
+    avg_turns: float
+    cache_hit_ratio: float | None = None  # cache read / 전체 입력 토큰
+    lost: int = 0  # 경주에서 져서 취소된 참가자
+
+
+@dataclass(frozen=True)
+class RaceRow:
+    """모드·모델 1그룹의 경주 집계"""
+    mode: str
+    model: str
+    races: int
+    wins: int
+    invalid: int
+    failed: int
+    p50_win_s: float | None  # 우승했을 때의 지연
+    p50_behind_s: float | None  # 우승하지 못하고 완주했을 때 우승자보다 늦은 시간
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 백분위수 (표본이 적은 cron 데이터에서 보간 없이 실제 관측값 반환)."""
+    if not values:
+        raise ValueError("percentile of empty list")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def cache_hit_ratio(runs: list[RunMetrics]) -> float | None:
+    """입력 토큰 중 prompt cache에서 읽은 비율. 입력 토큰 기록이 없으면 None."""
+    cache_read = sum(r.cache_read_input_tokens for r in runs)
+    total = sum(r.input_tokens + r.cache_creation_input_tokens for r in runs) + cache_read
+    return cache_read / total if total else None
+
+
+def _period_of(recorded_at: datetime, by: str) -> str:
+    if by == "day":
+        return recorded_at.date().isoformat()
+    if by == "week":
+        year, week, _ = recorded_at.isocalendar()
+        return f"{year}-W{week:02d}"
+    return "all"
+
+
+def summarize(records: list[RunMetrics], by: str = "week") -> list[PerfRow]:
+    """(기간, 모드, 모델)별 집계. 기간 오름차순 → 모드 → 모델 순 정렬."""
+    groups: dict[tuple[str, str, str], list[RunMetrics]] = defaultdict(list)
+    for r in records:
+        groups[(_period_of(r.recorded_at, by), r.mode, r.model)].append(r)
+
+    rows = []
+    for (period, mode, model), runs in sorted(groups.items()):
+        latencies = [r.duration_ms / 1000 for r in runs if not _cancelled(r)]
+        # 비용 미보고(None) 실행은 비용 통계에서만 제외
+        costs = [r.cost_usd for r in runs if r.cost_usd is not None]
+        rows.append(PerfRow(
+            period=period,
+            mode=mode,
+            model=model,
+            runs=len(runs),
+            errors=sum(1 for r in runs if r.is_error),
+            timeouts=sum(1 for r in runs if r.timed_out),
+            p50_s=percentile(latencies, 50) if latencies else None,
+            p95_s=percentile(latencies, 95) if latencies else None,
+            p50_cost=percentile(costs, 50) if costs else None,
+            p95_cost=percentile(costs, 95) if costs else None,
+            total_cost=sum(costs) if costs else None,
+            avg_turns=sum(r.num_turns for r in runs) / len(runs),
+            cache_hit_ratio=cache_hit_ratio(runs),
+            lost=sum(1 for r in runs if r.race_outcome == "lost"),
+        ))
+    return rows
+
+
+def _cancelled(record: RunMetrics) -> bool:
+    """끝까지 실행되지 않은 기록 (deadline 취소 또는 경주 패배로 취소)"""
+    return record.timed_out or record.race_outcome == "lost"
+
+
+def summarize_races(records: list[RunMetrics]) -> list[RaceRow]:
+    """경주 참가 기록만 (모드, 모델)별로 집계. 모드 → 모델 순 정렬."""
+    groups: dict[tuple[str, str], list[RunMetrics]] = defaultdict(list)
+    for r in records:
+        if r.race_outcome is not None:
+            groups[(r.mode, r.model)].append(r)
+
+    rows = []
+    for (mode, model), runs in sorted(groups.items()):
+        wins = [r.duration_ms / 1000 for r in runs if r.race_outcome == "won"]
+        behind = [
+            r.race_delta_ms / 1000
+            for r in runs
+            if r.race_outcome != "won" and r.race_delta_ms is not None
+        ]
+        rows.append(RaceRow(
+            mode=mode,
+            model=model,
+            races=len(runs),
+            wins=len(wins),
+            invalid=sum(1 for r in runs if r.race_outcome == "invalid"),
+            failed=sum(1 for r in runs if r.race_outcome == "failed"),
+            p50_win_s=percentile(wins, 50) if wins else None,
+            p50_behind_s=percentile(behind, 50) if behind else None,
+        ))
+    return rows
+
+
+def _fmt_cost(value: float | None) -> str:
+    return f"${value:.3f}" if value is not None else "n/a"
+
+
+def _fmt_ratio(value: float | None) -> str:
+    return f"{value:.0%}" if value is not None else "n/a"
+
+
+def _fmt_seconds(value: float | None) -> str:
+    return f"{value:.1f}" if value is not None else "n/a"
+
+
+def format_table(rows: list[PerfRow]) -> str:
+    header = (
+        f"{'period':<10} {'mode':<7} {'model':<8} {'runs':>4} {'err':>3} {'t/o':>3} {'lost':>4} "
+        f"{'p50 s':>7} {'p95 s':>7} {'p50 $':>8} {'p95 $':>8} {'total $':>9} {'turns':>5} "
+        f"{'cache':>5}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r.period:<10} {r.mode:<7} {r.model:<8} {r.runs:>4} {r.errors:>3} {r.timeouts:>3} {r.lost:>4} "
+            f"{_fmt_seconds(r.p50_s):>7} {_fmt_seconds(r.p95_s):>7} {_fmt_cost(r.p50_cost):>8} "
+            f"{_fmt_cost(r.p95_cost):>8} {_fmt_cost(r.total_cost):>9} {r.avg_turns:>5.1f} "
+            f"{_fmt_ratio(r.cache_hit_ratio):>5}"
+        )
+    return "\n".join(lines)
+
+
+def format_race_table(rows: list[RaceRow]) -> str:
+    header = (
+        f"{'mode':<7} {'model':<8} {'races':>5} {'wins':>4} {'win %':>5} {'inv':>3} "
+        f"{'fail':>4} {'p50 win s':>9} {'p50 behind s':>12}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r.mode:<7} {r.model:<8} {r.races:>5} {r.wins:>4} {r.wins / r.races:>5.0%} "
+            f"{r.invalid:>3} {r.failed:>4} {_fmt_seconds(r.p50_win_s):>9} "
+            f"{_fmt_seconds(r.p50_behind_s):>12}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report run cost/latency summary")
+    parser.add_argument(
+        "--path",
+        default=os.environ.get("REPORT_METRICS_PATH") or DEFAULT_METRICS_PATH,
+        help="메트릭 JSONL 경로 (기본: REPORT_METRICS_PATH 또는 logs/metrics.jsonl)",
+    )
+    parser.add_argument("--by", choices=("week", "day", "all"), default="week", help="집계 기간 단위")
+    parser.add_argument(
+        "--since",
+        type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+        default=None,
+        help="이 날짜(YYYY-MM-DD) 이후 기록만 집계",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    records = JsonlMetricsStore(Path(args.path)).read_all()
+    if args.since is not None:
+        records = [r for r in records if r.recorded_at >= args.since]
+    if not records:
+        print(f"No run metrics recorded in {args.path}.")
+        return 0
+    print(format_table(summarize(records, by=args.by)))
+    race_rows = summarize_races(records)
+    if race_rows:
+        print()
+        print(format_race_table(race_rows))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
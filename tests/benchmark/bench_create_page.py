@@ -0,0 +1,112 @@
+"""주간 페이지 생성 HTTP 왕복 benchmark — 제목 단건 조회 2회 + 본문 조회 vs CQL 검색 1회.
+
+로컬 Confluence 대역 서버(tests/fakes)에 왕복 지연(--latency-ms)을 주고
+CreateWeeklyPageUseCase를 두 조회 방식으로 반복 실행한다.
+  legacy — 이전 주 제목 조회 → 새 주 제목 조회 → 본문 조회 (순차 3회, v1 REST 경로 그대로)
+  search — get_pages_by_titles 1회 (title in (...) + body.storage expand)
+둘 다 이어서 v2 POST로 페이지를 만든다 (space id는 캐시). 실행당 요청 수와 p50 wall time 출력.
+생성된 페이지 본문이 다르면 exit 1.
+
+Usage:
+    uv run python -m tests.benchmark.bench_create_page [--runs 20] [--latency-ms 80]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+
+from src.application.create_page_use_case import CreateWeeklyPageUseCase
+from src.domain.models import WeeklyPageConfig
+from src.domain.services import calculate_last_week_range, format_confluence_page_title
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+from src.infrastructure.adapters.page_transformer import PageTransformer
+from src.perf_report import percentile
+from tests.fakes.fake_confluence_server import FakeConfluenceServer
+
+_SPACE = "BENCH"
+_SOURCE_HTML = "<table><tbody>" + "".join(
+    f"<tr><td>{d}</td><td>MAI-{i} 작업 내용</td></tr>"
+    for i, d in enumerate(["04.06", "04.07", "04.08", "04.09", "04.10"] * 20)
+) + "</tbody></table>"
+
+
+class LegacyLookupAdapter(ConfluenceAdapter):
+    """변경 전 조회 순서 재현 — 제목별 content 조회 후 본문을 따로 가져온다"""
+
+    def get_pages_by_titles(self, space_key, titles, expand_body=False):
+        pages = {}
+        for title in titles:
+            resp = self._session.get(
+                f"{self._v2_base_url}/rest/api/content",
+                params={"spaceKey": space_key, "title": title},
+                timeout=30,
+            )
+            resp.raise_for_status()
+            results = resp.json()["results"]
+            if results:
+                page_id = results[0]["id"]
+                pages[title] = {
+                    "id": page_id,
+                    "title": title,
+                    "url": self._build_page_url(page_id, space_key, title),
+                }
+        source = pages.get(titles[0])
+        if expand_body and source is not None and titles[-1] not in pages:
+            source["content"] = self.get_page_content(source["id"])
+        return pages
+
+
+def run_path(
+    server: FakeConfluenceServer, adapter: ConfluenceAdapter, runs: int
+) -> tuple[list[float], int, list[str]]:
+    use_case = CreateWeeklyPageUseCase(confluence=adapter, transformer=PageTransformer())
+    config = WeeklyPageConfig(space_key=_SPACE, parent_page_id="1")
+    walls: list[float] = []
+    bodies: list[str] = []
+    monday = date(2026, 4, 13)
+    for i in range(runs):
+        # 실행마다 새 주 — 매번 "이전 주 있음 / 새 주 없음" 경로를 탄다
+        target = monday + timedelta(weeks=i * 2)
+        old_title = format_confluence_page_title(calculate_last_week_range(target))
+        server.add_page(_SPACE, old_title, _SOURCE_HTML)
+        before = len(server.requests)
+        started = time.perf_counter()
+        if not use_case.execute(config, target_date=target):
+            raise RuntimeError(f"create_page failed for {target}")
+        walls.append(time.perf_counter() - started)
+        bodies.append(server.pages()[-1]["body"])
+        requests_per_run = len(server.requests) - before
+    return walls, requests_per_run, bodies
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="요청당 서버 지연")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, adapter_cls in (("legacy", LegacyLookupAdapter), ("search", ConfluenceAdapter)):
+        with FakeConfluenceServer(latency=args.latency_ms / 1000) as server:
+            server.add_space(_SPACE)
+            adapter = adapter_cls(url=server.url, user="u", token="t")
+            adapter.get_space_id(_SPACE)  # space id 캐시 채우기 — 비교 대상에서 제외
+            results[name] = run_path(server, adapter, args.runs)
+
+    print(f"{'path':<7} {'req/run':>7} {'p50 wall':>9} {'p95 wall':>9}")
+    for name, (walls, reqs, _) in results.items():
+        print(
+            f"{name:<7} {reqs:>7} {percentile(walls, 50) * 1000:>7.0f}ms "
+            f"{percentile(walls, 95) * 1000:>7.0f}ms"
+        )
+    if results["legacy"][2] != results["search"][2]:
+        print("ERROR: created page bodies differ between paths.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""팀 수별 주간 페이지 생성 처리량/지연 benchmark — 로컬 Confluence 대역 서버 상대 end-to-end.
+
+팀(space)마다 지난주 페이지(--page-kb 크기)를 하나씩 만들어 두고 이번 주 페이지를 생성한다.
+  sequential — CreateWeeklyPageUseCase.execute를 팀마다 차례로 (--sequential-max 팀 수까지만)
+  batch      — AsyncCreateWeeklyPageUseCase.execute_async를 한 이벤트 루프에서 팀마다 (동시 --concurrency)
+팀별 지연은 시작부터 그 팀의 완료 알림까지 (대기 시간 포함). --server-rate로 서버 rate limit
+(초과 시 429 + Retry-After)을 주면 429 수와 호스트 limiter가 기다린 시간(요청별 대기 합)도
+함께 나온다. --client-rate는 클라이언트 token bucket으로 429를 미리 피하는 효과를 본다.
+실패한 팀이 있으면 exit 1.
+
+Usage:
+    uv run python -m tests.benchmark.bench_create_page_scale [--teams 1,10,100,500]
+        [--latency-ms 50] [--page-kb 40] [--concurrency 10] [--server-rate 0] [--client-rate 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date
+from urllib.parse import urlsplit
+
+import anyio
+
+from src.application.create_page_use_case import (
+    AsyncCreateWeeklyPageUseCase,
+    CreateWeeklyPageUseCase,
+)
+from src.domain.models import WeeklyPageConfig
+from src.domain.services import calculate_last_week_range, format_confluence_page_title
+from src.infrastructure.adapters.async_confluence_adapter import AsyncConfluenceAdapter
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+from src.infrastructure.adapters.page_transformer import PageTransformer
+from src.infrastructure.adapters.rate_limit import configure_host, reset_limiters, throttle_stats
+from src.perf_report import percentile
+from tests.fakes.fake_confluence_server import FakeConfluenceServer, week_table_body
+
+_TARGET = date(2026, 4, 13)
+_LAST_WEEK_DATES = ["04.06", "04.07", "04.08", "04.09", "04.10"]
+
+
+class _CompletionClock:
+    """NotificationPort — 팀 1개 처리가 끝날 때마다(알림 시점) 시각 기록"""
+
+    def __init__(self):
+        self.done: list[float] = []
+
+    def send(self, message: str, thread_message: str | None = None) -> None:
+        self.done.append(time.perf_counter())
+
+
+@dataclass(frozen=True)
+class ScaleResult:
+    mode: str
+    teams: int
+    wall: float
+    latencies: list[float]
+    requests: int
+    rate_limited: int
+    throttled_seconds: float
+    failed: int
+
+
+def _create_all(
+    mode: str,
+    configs: list[WeeklyPageConfig],
+    adapter: ConfluenceAdapter,
+    clock: _CompletionClock,
+    concurrency: int,
+) -> list[bool]:
+    if mode == "sequential":
+        use_case = CreateWeeklyPageUseCase(adapter, PageTransformer(), clock)
+        return [use_case.execute(config, target_date=_TARGET) for config in configs]
+    async_adapter = AsyncConfluenceAdapter(adapter, max_concurrency=concurrency)
+    transformer = PageTransformer()
+    limiter = anyio.CapacityLimiter(concurrency)
+    results = [False] * len(configs)
+
+    async def create(index: int, config: WeeklyPageConfig) -> None:
+        # 팀마다 인스턴스 — 알림 래치가 팀끼리 섞이지 않도록
+        use_case = AsyncCreateWeeklyPageUseCase(async_adapter, transformer, clock)
+        async with limiter:
+            results[index] = await use_case.execute_async(config, target_date=_TARGET)
+
+    async def create_all() -> None:
+        async with anyio.create_task_group() as tg:
+            for index, config in enumerate(configs):
+                tg.start_soon(create, index, config)
+
+    anyio.run(create_all)
+    return results
+
+
+def run_scale(mode: str, teams: int, args: argparse.Namespace) -> ScaleResult:
+    reset_limiters()
+    server_rate = args.server_rate or None
+    with FakeConfluenceServer(latency=args.latency_ms / 1000, rate_limit=server_rate) as server:
+        host = urlsplit(server.url).netloc
+        if args.client_rate:
+            configure_host(host, args.client_rate)
+        old_title = format_confluence_page_title(calculate_last_week_range(_TARGET))
+        body = week_table_body(_LAST_WEEK_DATES, args.page_kb * 1024)
+        configs = []
+        for i in range(teams):
+            space = f"T{i:04d}"
+            server.add_page(space, old_title, body)
+            configs.append(WeeklyPageConfig(space_key=space, parent_page_id="1"))
+
+        adapter = ConfluenceAdapter(
+            url=server.url, user="u", token="t", pool_size=args.concurrency
+        )
+        clock = _CompletionClock()
+        started = time.perf_counter()
+        # 팀별 "Created: ..." / 재시도 경고 출력은 표를 가리므로 버린다
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = _create_all(mode, configs, adapter, clock, args.concurrency)
+        wall = time.perf_counter() - started
+        stats = throttle_stats().get(host)
+        return ScaleResult(
+            mode=mode,
+            teams=teams,
+            wall=wall,
+            latencies=[t - started for t in clock.done],
+            requests=len(server.requests),
+            rate_limited=server.rate_limited,
+            throttled_seconds=stats.throttled_seconds if stats else 0.0,
+            failed=results.count(False),
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", default="1,10,100,500", help="쉼표 구분 팀 수 목록")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="요청당 서버 지연")
+    parser.add_argument("--page-kb", type=int, default=40, help="지난주 페이지 본문 크기")
+    parser.add_argument("--concurrency", type=int, default=10, help="batch 동시 팀 수 / 연결 풀")
+    parser.add_argument("--sequential-max", type=int, default=50, help="sequential 측정 상한 팀 수")
+    parser.add_argument("--server-rate", type=float, default=0.0, help="서버 초당 허용 요청 (0=무제한)")
+    parser.add_argument("--client-rate", type=float, default=0.0, help="클라이언트 호스트 limiter 초당 요청 (0=없음)")
+    args = parser.parse_args(argv)
+    team_counts = [int(n) for n in args.teams.split(",") if n.strip()]
+
+    results: list[ScaleResult] = []
+    for teams in team_counts:
+        for mode in ("sequential", "batch"):
+            if mode == "sequential" and teams > args.sequential_max:
+                continue
+            results.append(run_scale(mode, teams, args))
+
+    print(
+        f"{'teams':>5} {'mode':<10} {'wall':>8} {'pages/s':>8} {'p50':>8} {'p95':>8} "
+        f"{'req':>6} {'429':>5} {'throttled':>9}"
+    )
+    for r in results:
+        print(
+            f"{r.teams:>5} {r.mode:<10} {r.wall:>7.2f}s {r.teams / r.wall:>8.1f} "
+            f"{percentile(r.latencies, 50):>7.2f}s {percentile(r.latencies, 95):>7.2f}s "
+            f"{r.requests:>6} {r.rate_limited:>5} {r.throttled_seconds:>8.1f}s"
+        )
+    failed = sum(r.failed for r in results)
+    if failed:
+        print(f"ERROR: {failed} team page(s) failed.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""PageTransformer micro-benchmark — 팀원 블록 3회 순회(변경 전) vs 행별 셀 1회 분류 + 1회 순회.
+
+팀원 수별로 synthetic 주간 표(tests/fakes/synthetic_week_page.py)를 만들고 transform 전체 시간을 잰다.
+소요 시간은 repeat 중 최소값. 결과 HTML이 다르면 exit 1.
+
+Usage:
+    uv run python -m tests.benchmark.bench_page_transform [--members 10,100,500] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from copy import deepcopy
+
+from src.infrastructure.adapters.page_transformer import CompiledTransformPlan, PageTransformer
+from tests.fakes.synthetic_week_page import NEW_DATES, OLD_DATES, synthetic_week_page
+
+
+class MultiPassTransformer(PageTransformer):
+    """기준선 — 변경 전 구현. 블록마다 날짜/Progress/Notifications를 따로 순회하고, 셀 접근마다
+    td를 다시 찾고, 자식을 하나씩 remove하고, 이월 항목을 deepcopy한다."""
+
+    def _transform_block(self, block: list, plan: CompiledTransformPlan) -> None:
+        date_map = plan.date_map
+        for row in block:
+            for p in self._cell(row, 0).findall("p"):
+                if p.text and p.text.strip() in date_map:
+                    p.text = date_map[p.text.strip()]
+        carryover_items = [deepcopy(li) for li in self._doing_todo_items(self._cell(block[-1], 1))]
+        for row in block:
+            progress_cell = self._cell(row, 1)
+            for child in list(progress_cell):
+                progress_cell.remove(child)
+            self._reset_progress(progress_cell)
+        self._insert_carryover_to_todo(self._cell(block[0], 1), carryover_items)
+        for row in block:
+            notif_cell = self._cell(row, 2)
+            for child in list(notif_cell):
+                notif_cell.remove(child)
+            self._clear_notification(notif_cell)
+
+    def _cell(self, row, index: int):
+        cells = row.findall("td")
+        return cells[index + 1] if self._has_rowspan(cells) else cells[index]
+
+
+def best_time(transformer: PageTransformer, html: str, repeat: int) -> tuple[float, str]:
+    best, result = float("inf"), ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = transformer.transform(html, OLD_DATES, NEW_DATES)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", default="10,100,500", help="쉼표 구분 팀원 수 목록")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 (최소값 사용)")
+    args = parser.parse_args(argv)
+
+    print(f"{'members':>7} {'page':>9} {'multi-pass':>11} {'single-pass':>12} {'speedup':>8}")
+    mismatched = False
+    for members in (int(n) for n in args.members.split(",") if n.strip()):
+        html = synthetic_week_page(members)
+        baseline, expected = best_time(MultiPassTransformer(), html, args.repeat)
+        single, actual = best_time(PageTransformer(), html, args.repeat)
+        mismatched |= actual != expected
+        print(
+            f"{members:>7} {len(html.encode()) / 1024:>7.0f}KB {baseline * 1000:>9.1f}ms "
+            f"{single * 1000:>10.1f}ms {baseline / single:>7.2f}x"
+        )
+    if mismatched:
+        print("ERROR: single-pass output differs from multi-pass baseline.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""페이지 변환 규모별 benchmark — synthetic 주간 표 5~5,000명, 엔진별 변환/직렬화 시간과 peak RSS.
+
+팀원 수마다 tests/fakes/synthetic_week_page.py로 페이지를 만들어 임시 파일에 쓰고,
+엔진 × 팀원 수 조합마다 새 python 프로세스에서 측정한다 (peak RSS가 앞 측정과 섞이지 않도록).
+  transform  transform() 1회 wall time (repeat 중 최소)
+  serialize  그 실행에서 etree.tostring에 쓴 시간 (streaming 엔진은 블록마다 호출한 합계)
+  peak RSS   자식 프로세스 최고 RSS와, 입력을 읽은 직후 대비 증가분
+결과는 --output JSON에 기록한다 (커밋/lxml 버전 포함 — 버전 간 비교용). --baseline으로 이전 결과를
+주면 변화율을 함께 출력하고, --max-regression을 넘는 항목이 있으면 exit 1.
+엔진끼리 결과 HTML이 다르면 exit 1.
+
+Usage:
+    uv run python -m tests.benchmark.bench_page_transform_scale [--members 5,50,500,5000]
+        [--engines lxml,streaming (기본: 등록된 엔진 전부)] [--repeat 3] [--output logs/bench_page_transform.json]
+        [--baseline OLD.json] [--max-regression 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from lxml import etree
+
+from tests.fakes.synthetic_week_page import NEW_DATES, OLD_DATES, synthetic_week_page
+
+_DEFAULT_OUTPUT = "logs/bench_page_transform.json"
+# 비교에 쓰는 지표 (값이 클수록 나쁨)
+_COMPARED = ("transform_s", "serialize_s", "peak_rss_mb")
+
+
+def _max_rss_mb() -> float:
+    """프로세스 최고 RSS (Linux는 KB, macOS는 byte 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(engine: str, path: Path, repeat: int) -> dict:
+    """자식 프로세스 본체 — 엔진 1개로 페이지 1개를 repeat회 변환"""
+    from src.main import page_transformer_engines
+
+    transformer = page_transformer_engines()[engine]()
+    html = path.read_bytes().decode("utf-8")
+    rss_before = _max_rss_mb()
+
+    serialize_seconds = 0.0
+    tostring = etree.tostring
+
+    def timed_tostring(*args, **kwargs):
+        nonlocal serialize_seconds
+        started = time.perf_counter()
+        try:
+            return tostring(*args, **kwargs)
+        finally:
+            serialize_seconds += time.perf_counter() - started
+
+    etree.tostring = timed_tostring  # 두 엔진 모두 etree.tostring으로 직렬화한다
+    best: tuple[float, float] | None = None
+    result = ""
+    for _ in range(repeat):
+        serialize_seconds = 0.0
+        started = time.perf_counter()
+        result = transformer.transform(html, OLD_DATES, NEW_DATES)
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best[0]:
+            best = (elapsed, serialize_seconds)
+    etree.tostring = tostring
+    peak = _max_rss_mb()
+    return {
+        "transform_s": best[0],
+        "serialize_s": best[1],
+        "peak_rss_mb": peak,
+        "rss_over_input_mb": peak - rss_before,
+        "output_bytes": len(result.encode("utf-8")),
+        "output_sha256": hashlib.sha256(result.encode("utf-8")).hexdigest(),
+    }
+
+
+def _run_child(engine: str, path: Path, repeat: int) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", __spec__.name, "--child", engine, str(path), "--repeat", str(repeat)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _compare(results: list[dict], baseline_path: Path) -> list[str]:
+    """baseline 대비 변화율 줄 목록. 같은 (engine, members) 항목만 비교."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {(r["engine"], r["members"]): r for r in baseline["results"]}
+    lines = []
+    for r in results:
+        old = previous.get((r["engine"], r["members"]))
+        if old is None:
+            continue
+        changes = {k: r[k] / old[k] - 1 for k in _COMPARED if old.get(k)}
+        r["change_vs_baseline"] = changes
+        lines.append(
+            f"{r['members']:>6} {r['engine']:<10} "
+            + " ".join(f"{k} {v:+.0%}" for k, v in changes.items())
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", default="5,50,500,5000", help="쉼표 구분 팀원 수 목록")
+    parser.add_argument("--engines", default=None, help="쉼표 구분 PAGE_TRANSFORMER_ENGINE 값")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 (최소값 사용)")
+    parser.add_argument("--output", default=_DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=None, help="허용 악화율 (예: 0.2)")
+    parser.add_argument("--child", nargs=2, metavar=("ENGINE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], Path(args.child[1]), args.repeat)))
+        return 0
+
+    if args.engines:
+        engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    else:
+        from src.main import page_transformer_engines
+
+        engines = list(page_transformer_engines())
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for members in (int(n) for n in args.members.split(",") if n.strip()):
+            path = Path(tmp) / f"week-{members}.html"
+            path.write_text(synthetic_week_page(members), encoding="utf-8")
+            for engine in engines:
+                measured = _run_child(engine, path, args.repeat)
+                results.append(
+                    {"engine": engine, "members": members, "input_bytes": path.stat().st_size}
+                    | measured
+                )
+
+    print(
+        f"{'members':>7} {'engine':<10} {'input':>8} {'transform':>10} {'serialize':>10} "
+        f"{'peak RSS':>9} {'+RSS':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['members']:>7} {r['engine']:<10} {r['input_bytes'] / 2**20:>6.1f}MB "
+            f"{r['transform_s'] * 1000:>8.1f}ms {r['serialize_s'] * 1000:>8.1f}ms "
+            f"{r['peak_rss_mb']:>7.0f}MB {r['rss_over_input_mb']:>6.0f}MB"
+        )
+
+    exit_code = 0
+    digests = {}
+    for r in results:
+        digests.setdefault(r["members"], set()).add(r["output_sha256"])
+    mismatched = sorted(m for m, d in digests.items() if len(d) > 1)
+    if mismatched:
+        print(f"ERROR: engines disagree on output for members={mismatched}.")
+        exit_code = 1
+
+    if args.baseline:
+        print(f"\nvs {args.baseline}:")
+        for line in _compare(results, Path(args.baseline)):
+            print(line)
+        if args.max_regression is not None:
+            worst = max(
+                (v for r in results for v in r.get("change_vs_baseline", {}).values()), default=0.0
+            )
+            if worst > args.max_regression:
+                print(f"ERROR: regression {worst:+.0%} exceeds {args.max_regression:+.0%}.")
+                exit_code = 1
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "lxml": ".".join(map(str, etree.LXML_VERSION)),
+        "libxml2": ".".join(map(str, etree.LIBXML_VERSION)),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
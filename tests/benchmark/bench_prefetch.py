@@ -0,0 +1,89 @@
+"""daily 리포트 prefetch 비교 benchmark — agent MCP 조회 vs Python 사전 조회 주입.
+
+실제 claude + Confluence/JIRA를 호출한다 (.env의 CONFLUENCE_URL/USER/TOKEN, claude 인증 필요).
+같은 날짜로 두 경로를 번갈아 N회씩 실행하고, 실행별 RunMetrics를 임시 JSONL에 모아
+p50 wall time / turn 수 / 토큰 / 비용을 비교한다. prefetch 경로의 wall time에는
+Confluence/JIRA 조회 시간이 포함된다. 출력 캐시는 사용하지 않는다.
+
+Usage:
+    uv run python -m tests.benchmark.bench_prefetch [--runs 3] [--date YYYY-MM-DD] [--model sonnet]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from src.infrastructure.adapters.cli_executors import ClaudeCLIExecutor
+from src.infrastructure.adapters.metrics_store import JsonlMetricsStore
+from src.infrastructure.config import load_config_from_env
+from src.main import create_report_context_provider
+from src.perf_report import percentile
+
+
+def run_once(executor: ClaudeCLIExecutor, space_key: str, report_date: date) -> tuple[float, bool]:
+    started = time.perf_counter()
+    output = executor.execute(space_key, report_date=report_date)
+    return time.perf_counter() - started, bool(output)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="경로별 실행 횟수")
+    parser.add_argument(
+        "--date", type=lambda s: datetime.strptime(s, "%Y-%m-%d").date(), default=date.today()
+    )
+    parser.add_argument("--model", default="sonnet")
+    args = parser.parse_args(argv)
+
+    config = load_config_from_env(report_date=args.date)
+    if config is None:
+        return 1
+    provider = create_report_context_provider(dataclasses.replace(config, prefetch=True))
+    if provider is None:
+        print("ERROR: prefetch benchmark needs CONFLUENCE_URL/USER/TOKEN.")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = {name: JsonlMetricsStore(Path(tmp) / f"{name}.jsonl") for name in ("mcp", "prefetch")}
+        executors = {
+            "mcp": ClaudeCLIExecutor(model=args.model, metrics_store=stores["mcp"]),
+            "prefetch": ClaudeCLIExecutor(
+                model=args.model, metrics_store=stores["prefetch"], context_provider=provider
+            ),
+        }
+        walls: dict[str, list[float]] = {name: [] for name in executors}
+        failures = 0
+        for i in range(args.runs):
+            # 번갈아 실행 — 시간대별 API 지연 편차가 한쪽에 몰리지 않도록
+            for name, executor in executors.items():
+                wall, ok = run_once(executor, config.report.space_key, args.date)
+                failures += not ok
+                walls[name].append(wall)
+                print(f"run {i + 1}/{args.runs} {name:<8} wall={wall:6.1f}s ok={ok}")
+
+        print()
+        print(f"{'path':<8} {'p50 wall':>9} {'p50 turns':>9} {'p50 in+out':>11} {'p50 cache_read':>14} {'p50 $':>8}")
+        for name, store in stores.items():
+            records = store.read_all()
+            if not records:
+                print(f"{name:<8} (no result messages recorded)")
+                continue
+            costs = [r.cost_usd for r in records if r.cost_usd is not None]
+            print(
+                f"{name:<8} {percentile(walls[name], 50):>8.1f}s "
+                f"{percentile([r.num_turns for r in records], 50):>9} "
+                f"{percentile([r.input_tokens + r.output_tokens for r in records], 50):>11} "
+                f"{percentile([r.cache_read_input_tokens for r in records], 50):>14} "
+                f"{'$%.3f' % percentile(costs, 50) if costs else 'n/a':>8}"
+            )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
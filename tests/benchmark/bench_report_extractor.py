@@ -0,0 +1,147 @@
+"""리포트 추출 micro-benchmark — 블록 전부 보관 + join + 마커별 str.find vs ReportMarkerExtractor.
+
+수 MB짜리 synthetic agent transcript(중간 분석 블록 다수 + 마지막 리포트)를 블록 단위로
+생성하며 두 시나리오를 측정한다.
+  final       — 스트림이 끝난 뒤 리포트 1회 추출 (execute 경로)
+  progressive — 블록이 올 때마다 마커 여부 확인 (Slack 스트리밍 갱신 경로)
+소요 시간은 repeat 중 최소값, 메모리는 tracemalloc peak. 결과가 다르면 exit 1.
+
+Usage:
+    uv run python -m tests.benchmark.bench_report_extractor [--mb 1,4,16] [--progressive-kb 64,256,1024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+from src.domain.services import ReportMarkerExtractor, extract_report_content, find_report_start
+
+_ANALYSIS_BLOCK = (
+    "MCP 도구 결과를 분석합니다. 티켓 MAI-1234의 상태는 진행 중이며 담당자는 홍길동입니다. "
+    "다음 단계로 Confluence 페이지의 회의록 섹션을 확인합니다. "
+) * 8
+_REPORT = (
+    "*\U0001f4ca 일정 요약*\n"
+    + "\n".join(f"- MAI-{i} 작업 {i} 진행 중" for i in range(40))
+)
+
+
+def synthetic_transcript(total_bytes: int) -> Callable[[], Iterator[str]]:
+    """total_bytes 크기의 중간 분석 블록들 + 마지막 리포트 블록을 만드는 generator factory.
+
+    블록은 SDK 메시지처럼 도착 시점에 새로 할당된다 (보관 여부가 peak 메모리에 드러나도록).
+    """
+    count = max(1, total_bytes // len(_ANALYSIS_BLOCK.encode("utf-8")))
+
+    def blocks() -> Iterator[str]:
+        for i in range(count):
+            yield f"[{i}] {_ANALYSIS_BLOCK}"
+        yield _REPORT
+
+    return blocks
+
+
+def final_baseline(blocks: Iterator[str]) -> str:
+    parts = list(blocks)
+    return extract_report_content("\n".join(parts).strip())
+
+
+def final_streaming(blocks: Iterator[str]) -> str:
+    extractor = ReportMarkerExtractor()
+    for block in blocks:
+        extractor.feed(block)
+    return extract_report_content(extractor.getvalue())
+
+
+def progressive_baseline(blocks: Iterator[str]) -> str:
+    parts: list[str] = []
+    latest = ""
+    for block in blocks:
+        parts.append(block)
+        output = "\n".join(parts).strip()
+        idx = find_report_start(output)
+        if idx != -1:
+            latest = output[idx:]
+    return latest
+
+
+def progressive_streaming(blocks: Iterator[str]) -> str:
+    extractor = ReportMarkerExtractor()
+    latest = ""
+    for block in blocks:
+        extractor.feed(block)
+        if extractor.found:
+            latest = extractor.getvalue().strip()
+    return latest
+
+
+def measure(
+    fn: Callable[[Iterator[str]], str], blocks: Callable[[], Iterator[str]], repeat: int
+) -> tuple[str, float, int]:
+    """(결과, 최소 소요 초, peak 바이트)."""
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(blocks())
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(blocks())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def run_scenario(
+    name: str,
+    sizes_kb: list[float],
+    baseline: Callable[[Iterator[str]], str],
+    streaming: Callable[[Iterator[str]], str],
+    repeat: int,
+) -> bool:
+    print(f"\n[{name}]")
+    print(f"{'size':>8} | {'baseline ms':>11} {'peak KiB':>9} | {'extractor ms':>12} {'peak KiB':>9}")
+    for kb in sizes_kb:
+        blocks = synthetic_transcript(int(kb * 1024))
+        expected, base_s, base_peak = measure(baseline, blocks, repeat)
+        actual, stream_s, stream_peak = measure(streaming, blocks, repeat)
+        if expected != actual:
+            print(f"ERROR: extractor output differs from baseline ({name}, {kb:g}KB)")
+            return False
+        print(
+            f"{kb:>6g}KB | {base_s * 1000:>11.1f} {base_peak / 1024:>9.0f} | "
+            f"{stream_s * 1000:>12.1f} {stream_peak / 1024:>9.0f}"
+        )
+    return True
+
+
+def _parse_sizes(raw: str, scale: float) -> list[float]:
+    return [float(x) * scale for x in raw.split(",")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", default="1,4,16", help="final 시나리오 transcript 크기 (MB, 쉼표 구분)")
+    parser.add_argument(
+        "--progressive-kb", default="64,256,1024",
+        help="progressive 시나리오 크기 (KB) — baseline이 O(n^2)이라 작게",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ok = run_scenario(
+        "final", _parse_sizes(args.mb, 1024), final_baseline, final_streaming, args.repeat
+    ) and run_scenario(
+        "progressive", _parse_sizes(args.progressive_kb, 1), progressive_baseline,
+        progressive_streaming, args.repeat,
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
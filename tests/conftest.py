@@ -5,6 +5,14 @@ from datetime import date
 import pytest
 
 from src.domain.models import DateRange, ReportConfig, WeeklyPageConfig
+from src.infrastructure.adapters.rate_limit import reset_limiters
+
+
+@pytest.fixture(autouse=True)
+def _isolate_rate_limiters():
+    """호스트 rate limiter는 프로세스 전역 — 테스트 간 설정/차단 상태가 새지 않도록 매번 비운다"""
+    yield
+    reset_limiters()
 
 
 @pytest.fixture
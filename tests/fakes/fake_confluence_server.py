@@ -0,0 +1,300 @@
+"""로컬 Confluence 대역 서버 — 어댑터 테스트/benchmark용.
+
+ConfluenceAdapter가 쓰는 REST 경로만 흉내 낸다 (`{url}/wiki` 하위):
+    GET  rest/api/content?spaceKey=&title=        제목 단건 조회 (v1)
+    GET  rest/api/content/{id}?expand=             본문/버전 조회 (v1)
+    GET  rest/api/content/search?cql=&cursor=     CQL 검색 (space / title in (...) / ancestor / lastmodified만
+                                                  해석, limit 초과 시 _links.next에 cursor)
+    GET  api/v2/spaces?keys=                      space id 조회
+    POST api/v2/pages                             페이지 생성
+
+HTTP/1.1 keep-alive, 요청마다 latency초 지연(원격 왕복 흉내), 요청 로그를 남긴다.
+장애 주입:
+    fail_statuses   다음 요청들을 이 상태 코드로 응답 (429면 Retry-After: retry_after 헤더 포함)
+    rate_limit      초당 허용 요청 수 — 넘으면 429 + Retry-After (Atlassian Cloud rate limit 흉내)
+페이지 크기는 week_table_body()로 원하는 바이트 수의 주간 표 본문을 만들어 add_page에 넘긴다.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+_CQL_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_CQL_SPACE = re.compile(r'space\s*=\s*("(?:[^"\\]|\\.)*")')
+_CQL_TITLES = re.compile(r"title\s+in\s*\((.*)\)")
+_CQL_ANCESTOR = re.compile(r"ancestor\s*=\s*(\d+)")
+_CQL_MODIFIED = re.compile(r'lastmodified\s*>=\s*"(\d{4}/\d{2}/\d{2} \d{2}:\d{2})"')
+
+
+def _cql_unquote(literal: str) -> str:
+    return re.sub(r"\\(.)", r"\1", literal)
+
+
+def week_table_body(dates: list[str], size_bytes: int) -> str:
+    """dates(MM.DD)를 돌아가며 쓰는 주간 표 storage HTML — 대략 size_bytes 크기 (최소 1행)"""
+    rows: list[str] = []
+    size = len("<table><tbody></tbody></table>")
+    while not rows or size < size_bytes:
+        i = len(rows)
+        row = f"<tr><td>{dates[i % len(dates)]}</td><td>MAI-{i} 작업 내용 {'x' * 40}</td></tr>"
+        rows.append(row)
+        size += len(row.encode())
+    return "<table><tbody>" + "".join(rows) + "</tbody></table>"
+
+
+class FakeConfluenceServer:
+    """with 블록 안에서만 떠 있는 Confluence 대역. url은 어댑터에 그대로 넘긴다."""
+
+    def __init__(self, latency: float = 0.0, rate_limit: float | None = None):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = "1"  # fail_statuses로 주입한 429의 Retry-After
+        self.requests: list[tuple[str, str]] = []  # (method, path) — query 제외
+        self.fail_statuses: list[int] = []  # 다음 요청들을 이 상태 코드로 실패시킴 (앞에서부터 소모)
+        self.rate_limited = 0  # 보낸 429 수
+        self._tokens = rate_limit or 0.0
+        self._refilled = time.monotonic()
+        self._pages: dict[str, dict] = {}
+        self._spaces: dict[str, str] = {}
+        self._next_id = 1000
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "server not started"
+        return f"http://127.0.0.1:{self._server.server_address[1]}/wiki"
+
+    def add_space(self, space_key: str, space_id: str | None = None) -> str:
+        with self._lock:
+            space_id = space_id or str(self._allocate_id())
+            self._spaces[space_key] = space_id
+            return space_id
+
+    def add_page(
+        self,
+        space_key: str,
+        title: str,
+        body: str,
+        parent_id: str | None = None,
+        modified: datetime | None = None,
+    ) -> str:
+        if space_key not in self._spaces:
+            self.add_space(space_key)
+        with self._lock:
+            page_id = str(self._allocate_id())
+            self._pages[page_id] = {
+                "id": page_id, "space": space_key, "title": title, "body": body, "version": 1,
+                "parent_id": parent_id, "modified": modified or datetime.now(timezone.utc),
+            }
+            return page_id
+
+    def update_page(self, page_id: str, body: str | None = None, title: str | None = None) -> None:
+        """본문/제목 교체 + 버전 증가 (Confluence 편집과 동일)"""
+        with self._lock:
+            page = self._pages[page_id]
+            if body is not None:
+                page["body"] = body
+            if title is not None:
+                page["title"] = title
+            page["version"] += 1
+            page["modified"] = datetime.now(timezone.utc)
+
+    def delete_page(self, page_id: str) -> None:
+        with self._lock:
+            del self._pages[page_id]
+
+    def pages(self) -> list[dict]:
+        with self._lock:
+            return [dict(p) for p in self._pages.values()]
+
+    def start(self) -> FakeConfluenceServer:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> FakeConfluenceServer:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---------- 라우팅 ----------
+
+    def _allocate_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def _throttle(self) -> float | None:
+        """rate_limit 초과면 Retry-After 초, 아니면 None. _lock 안에서 호출."""
+        if self.rate_limit is None:
+            return None
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate_limit
+
+    def _space_key_of(self, space_id: str) -> str | None:
+        return next((k for k, v in self._spaces.items() if v == space_id), None)
+
+    def _content_json(self, page: dict, expand: str) -> dict:
+        result = {"id": page["id"], "type": "page", "title": page["title"]}
+        if "body.storage" in expand:
+            result["body"] = {"storage": {"value": page["body"], "representation": "storage"}}
+        if "version" in expand:
+            result["version"] = {
+                "number": page["version"],
+                "when": page["modified"].isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            }
+        return result
+
+    def _get(self, path: str, query: dict[str, list[str]]) -> tuple[int, dict]:
+        expand = query.get("expand", [""])[0]
+        with self._lock:
+            pages = list(self._pages.values())
+            if path == "/wiki/rest/api/content":
+                space, title = query.get("spaceKey", [""])[0], query.get("title", [""])[0]
+                found = [p for p in pages if p["space"] == space and p["title"] == title]
+                return 200, {"results": [self._content_json(p, expand) for p in found]}
+            if path == "/wiki/rest/api/content/search":
+                return 200, self._search(pages, query, expand)
+            if path.startswith("/wiki/rest/api/content/"):
+                page = self._pages.get(path.rsplit("/", 1)[1])
+                if page is None:
+                    return 404, {"message": "No content found"}
+                return 200, self._content_json(page, expand)
+            if path == "/wiki/api/v2/spaces":
+                key = query.get("keys", [""])[0]
+                space_id = self._spaces.get(key)
+                return 200, {"results": [{"id": space_id, "key": key}] if space_id else []}
+        return 404, {"message": f"unknown path {path}"}
+
+    def _search(self, pages: list[dict], query: dict[str, list[str]], expand: str) -> dict:
+        cql = query.get("cql", [""])[0]
+        space = _CQL_SPACE.search(cql)
+        titles = _CQL_TITLES.search(cql)
+        ancestor = _CQL_ANCESTOR.search(cql)
+        modified = _CQL_MODIFIED.search(cql)
+        since = (
+            datetime.strptime(modified.group(1), "%Y/%m/%d %H:%M").replace(tzinfo=timezone.utc)
+            if modified else None
+        )
+        found = [
+            p for p in pages
+            if (space is None or p["space"] == _cql_unquote(space.group(1)[1:-1]))
+            and (titles is None or p["title"] in {
+                _cql_unquote(t) for t in _CQL_STRING.findall(titles.group(1))
+            })
+            and (ancestor is None or self._has_ancestor(p, ancestor.group(1)))
+            and (since is None or p["modified"] >= since)
+        ]
+        limit = int(query.get("limit", ["25"])[0])
+        start = int(query.get("cursor", ["0"])[0])
+        data = {
+            "results": [self._content_json(p, expand) for p in found[start:start + limit]],
+            "_links": {"base": "/wiki"},
+        }
+        if start + limit < len(found):
+            params = {"cql": cql, "limit": limit, "cursor": start + limit}
+            if expand:
+                params["expand"] = expand
+            data["_links"]["next"] = f"/rest/api/content/search?{urlencode(params)}"
+        return data
+
+    def _has_ancestor(self, page: dict, ancestor_id: str) -> bool:
+        parent = page.get("parent_id")
+        while parent is not None:
+            if parent == ancestor_id:
+                return True
+            parent = self._pages.get(parent, {}).get("parent_id")
+        return False
+
+    def _post(self, path: str, payload: dict) -> tuple[int, dict]:
+        if path != "/wiki/api/v2/pages":
+            return 404, {"message": f"unknown path {path}"}
+        with self._lock:
+            space_key = self._space_key_of(payload.get("spaceId", ""))
+            if space_key is None:
+                return 404, {"message": "space not found"}
+            page_id = str(self._allocate_id())
+            self._pages[page_id] = {
+                "id": page_id,
+                "space": space_key,
+                "title": payload["title"],
+                "body": payload["body"]["value"],
+                "version": 1,
+                "parent_id": payload.get("parentId"),
+                "modified": datetime.now(timezone.utc),
+            }
+            return 200, {"id": page_id, "title": payload["title"], "version": {"number": 1}}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if not self._rejected(parsed.path):
+                    self._respond(*fake._get(parsed.path, parse_qs(parsed.query)))
+
+            def do_POST(self):
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not self._rejected(parsed.path):
+                    self._respond(*fake._post(parsed.path, payload))
+
+            def _rejected(self, path: str) -> bool:
+                """요청 기록 + 주입한 실패/429 응답. 거절했으면 True (요청은 처리하지 않음)"""
+                retry_after = None
+                with fake._lock:
+                    fake.requests.append((self.command, path))
+                    if fake.fail_statuses:
+                        status = fake.fail_statuses.pop(0)
+                        retry_after = fake.retry_after if status == 429 else None
+                    else:
+                        wait = fake._throttle()
+                        if wait is None:
+                            return False
+                        status, retry_after = 429, str(math.ceil(wait))
+                    if status == 429:
+                        fake.rate_limited += 1
+                self._respond(status, {"message": "injected failure"}, retry_after)
+                return True
+
+            def _respond(self, status: int, data: dict, retry_after: str | None = None) -> None:
+                if fake.latency:
+                    time.sleep(fake.latency)
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                if retry_after is not None:
+                    self.send_header("Retry-After", retry_after)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,142 @@
+"""synthetic 주간 표 생성기 — PageTransformer 테스트/benchmark용 Confluence storage format HTML.
+
+실제 주간 페이지 구조를 따른다:
+  - 헤더 행 + 팀원 블록 (첫 셀 rowspan = 근무일 수, 일부 팀원은 3~4일)
+  - Progress: Done/Doing/ToDo 중첩 리스트, 항목 아래 하위 리스트가 한 단계 더 있기도 함
+  - JIRA/status 매크로(ac:structured-macro), 사용자 멘션(ac:link + ri:user), 이모티콘, browse 링크
+  - HTML named entity (&nbsp; &rarr; &middot; &hellip;)와 XML 엔티티 (&amp; &lt;)
+같은 (members, seed)면 같은 HTML을 만든다.
+"""
+
+from __future__ import annotations
+
+import random
+
+OLD_DATES = ["04.06", "04.07", "04.08", "04.09", "04.10"]
+NEW_DATES = ["04.13", "04.14", "04.15", "04.16", "04.17"]
+
+_HEADER = (
+    "<tr>"
+    + "".join(
+        f'<th><p><strong>{name}</strong></p></th>'
+        for name in ("Name", "Date", "Progress", "Notifications")
+    )
+    + "</tr>"
+)
+_TASKS = (
+    "로그인 API 응답 캐시",
+    "결제 실패 재시도 정책",
+    "배치 스케줄러 이관",
+    "알림 템플릿 정리",
+    "검색 색인 재구축",
+    "권한 모델 리팩터링",
+)
+_SUFFIXES = (
+    "&rarr; 리뷰 대기",
+    "&nbsp;(QA 확인 중)",
+    "&middot; 배포 준비",
+    "진행 중&hellip;",
+    "A &amp; B 비교 &lt;초안&gt;",
+)
+
+
+def _jira(key: str) -> str:
+    return (
+        '<ac:structured-macro ac:name="jira" ac:schema-version="1" ac:macro-id="m-' + key + '">'
+        '<ac:parameter ac:name="server">System JIRA</ac:parameter>'
+        f'<ac:parameter ac:name="key">{key}</ac:parameter>'
+        "</ac:structured-macro>"
+    )
+
+
+def _status(title: str, colour: str) -> str:
+    return (
+        '<ac:structured-macro ac:name="status" ac:schema-version="1">'
+        f'<ac:parameter ac:name="colour">{colour}</ac:parameter>'
+        f'<ac:parameter ac:name="title">{title}</ac:parameter>'
+        "</ac:structured-macro>"
+    )
+
+
+def _mention(account: int) -> str:
+    return f'<ac:link><ri:user ri:account-id="5f{account:08x}" /></ac:link>'
+
+
+class _Generator:
+    def __init__(self, seed: int):
+        self._rng = random.Random(seed)
+        self._next_key = 1
+
+    def _key(self) -> str:
+        key = f"MAI-{self._next_key}"
+        self._next_key += 1
+        return key
+
+    def _item(self, depth: int = 0) -> str:
+        rng = self._rng
+        key = self._key()
+        kind = rng.randrange(4)
+        if kind == 0:
+            ref = _jira(key)
+        elif kind == 1:
+            ref = f'<a href="https://example.atlassian.net/browse/{key}">{key}</a>'
+        else:
+            ref = key
+        text = f"{ref} {rng.choice(_TASKS)} {rng.choice(_SUFFIXES)}"
+        if rng.random() < 0.2:
+            text += f" {_status('BLOCKED', 'Red')}"
+        if rng.random() < 0.15:
+            text += ' <ac:emoticon ac:name="tick" />'
+        nested = ""
+        if depth == 0 and rng.random() < 0.25:
+            nested = "<ul>" + "".join(self._item(depth + 1) for _ in range(rng.randint(1, 2))) + "</ul>"
+        return f"<li><p>{text}</p>{nested}</li>"
+
+    def _progress(self, items_per_label: int) -> str:
+        parts = []
+        for label in ("Done", "Doing", "ToDo"):
+            count = self._rng.randint(0, items_per_label)
+            sub = "<ul>" + "".join(self._item() for _ in range(count)) + "</ul>" if count else ""
+            parts.append(f"<li><p>{label}</p>{sub}</li>")
+        return f"<ul>{''.join(parts)}</ul>"
+
+    def _notifications(self, member: int) -> str:
+        rng = self._rng
+        if rng.random() < 0.5:
+            return "<p />"
+        return (
+            f"<p>{_mention(member * 7 + 1)} 배포 일정 공유&nbsp;&rarr; {rng.choice(_TASKS)}</p>"
+            f"<p><strong>주의</strong>: {rng.choice(_SUFFIXES)}</p>"
+        )
+
+    def page(self, members: int, dates: list[str], items_per_label: int) -> str:
+        rows = [_HEADER]
+        for member in range(members):
+            # 대부분 5일, 일부는 3~4일 근무 (rowspan이 팀원마다 다르다)
+            days = dates if self._rng.random() < 0.85 else dates[: self._rng.randint(3, 4)]
+            for d, day in enumerate(days):
+                member_cell = (
+                    f'<td rowspan="{len(days)}"><p>{_mention(member)}</p></td>' if d == 0 else ""
+                )
+                rows.append(
+                    f"<tr>{member_cell}<td><p>{day}</p></td>"
+                    f"<td>{self._progress(items_per_label)}</td>"
+                    f"<td>{self._notifications(member)}</td></tr>"
+                )
+        return (
+            "<p>이번 주 공지&nbsp;&middot; 배포 동결은 목요일부터</p>"
+            '<table data-layout="default" ac:local-id="week-table">'
+            "<colgroup><col /><col /><col /><col /></colgroup>"
+            f"<tbody>{''.join(rows)}</tbody></table>"
+            "<p />"
+        )
+
+
+def synthetic_week_page(
+    members: int,
+    dates: list[str] | None = None,
+    items_per_label: int = 3,
+    seed: int = 0,
+) -> str:
+    """팀원 members명의 주간 표 storage HTML (dates 기본 OLD_DATES)"""
+    return _Generator(seed).page(members, list(dates or OLD_DATES), items_per_label)
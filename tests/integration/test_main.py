@@ -2,11 +2,12 @@
 
 import sys
 from datetime import date
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
 from src.infrastructure.adapters.cli_executors import ClaudeCLIExecutor
+from src.infrastructure.adapters.report_cache import CachingCLIExecutor
 from src.main import create_cli_executor, main, parse_args
 
 
@@ -83,7 +84,10 @@ class TestMain:
         main()
 
         # Then: GenerateReportUseCase가 daily 구성으로 조립된다
-        executor_arg, notifier_arg = mock_use_case_class.call_args.args
+        cached_executor, notifier_arg = mock_use_case_class.call_args.args
+        # 기본 실행은 리포트 출력 캐시(CachingCLIExecutor)로 감싸진다
+        assert isinstance(cached_executor, CachingCLIExecutor)
+        executor_arg = cached_executor._inner
         assert isinstance(executor_arg, ClaudeCLIExecutor)
         assert executor_arg._command == "daily_report"
         assert executor_arg._model == "sonnet"
@@ -242,17 +246,21 @@ class TestMainCreatePageMode:
 
         with patch("src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter") as mock_confluence_cls, \
              patch("src.infrastructure.adapters.page_transformer.PageTransformer") as mock_transformer_cls, \
-             patch("src.application.create_page_use_case.CreateWeeklyPageUseCase") as mock_use_case_cls:
+             patch("src.application.create_page_use_case.AsyncCreateWeeklyPageUseCase") as mock_use_case_cls:
             mock_use_case_cls.return_value = mock_use_case
 
             # When: main을 호출하면
             main()
 
-            # Then: ConfluenceAdapter, PageTransformer, CreateWeeklyPageUseCase가 생성되고 실행된다
+            # Then: ConfluenceAdapter, PageTransformer, AsyncCreateWeeklyPageUseCase가 생성되고 실행된다
             mock_confluence_cls.assert_called_once_with(
                 url="https://example.atlassian.net",
                 user="user@example.com",
                 token="token123",
+                pool_size=10,
+                retries=3,
+                space_id_cache=ANY,
+                title_index=ANY,
             )
             mock_transformer_cls.assert_called_once()
             mock_use_case.execute.assert_called_once()
@@ -282,7 +290,7 @@ class TestMainCreatePageMode:
 
         with patch("src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter"), \
              patch("src.infrastructure.adapters.page_transformer.PageTransformer"), \
-             patch("src.application.create_page_use_case.CreateWeeklyPageUseCase") as mock_use_case_cls:
+             patch("src.application.create_page_use_case.AsyncCreateWeeklyPageUseCase") as mock_use_case_cls:
             mock_use_case_cls.return_value = mock_use_case
 
             # When: main을 호출하면
@@ -382,13 +390,70 @@ class TestMainExitCode:
         mock_use_case.execute.return_value = False
         with patch("src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter"), \
              patch("src.infrastructure.adapters.page_transformer.PageTransformer"), \
-             patch("src.application.create_page_use_case.CreateWeeklyPageUseCase") as m:
+             patch("src.application.create_page_use_case.AsyncCreateWeeklyPageUseCase") as m:
             m.return_value = mock_use_case
 
             # When/Then: 1을 반환한다
             assert main() == 1
 
 
+class TestMainSubmit:
+    """--submit — 다른 플래그도 데몬 job에 실어 보내거나 거부"""
+
+    @pytest.fixture
+    def create_page_config(self):
+        from src.domain.models import ReportConfig
+        from src.infrastructure.config import AppConfig
+
+        return AppConfig(
+            report=ReportConfig(
+                space_key="MAI", team_name="", team_prefix="", mention_users="",
+                report_date=date(2026, 4, 6),
+            ),
+            slack_token="", slack_channel="", cli_type="claude", report_mode="create_page",
+        )
+
+    # ---------- [Happy] ----------
+    @patch("sys.argv", ["src.main", "--submit", "--date", "2026-04-06", "--weeks-ahead", "1", "--prefetch"])
+    @patch("src.main.load_config_from_env")
+    def test_should_submit_page_range_and_prefetch(self, mock_load_config, create_page_config):
+        # Given: create_page 범위 + prefetch를 데몬에 제출
+        mock_load_config.return_value = create_page_config
+        with patch("src.daemon.submit_job", return_value={"ok": True}) as submit_job:
+            # When
+            assert main() == 0
+        # Then: 1주가 아니라 요청한 2주
+        job = submit_job.call_args.args[1]
+        assert [w.start for w in job.weeks] == [date(2026, 4, 6), date(2026, 4, 13)]
+        assert job.prefetch is True
+
+    # ---------- [Error] ----------
+    @patch("sys.argv", ["src.main", "--submit", "--stream"])
+    @patch("src.main.load_config_from_env")
+    def test_should_refuse_stream_with_submit(self, mock_load_config, sample_report_config, capsys):
+        # Given: 데몬 실행은 스트리밍 불가
+        from src.infrastructure.config import AppConfig
+
+        mock_load_config.return_value = AppConfig(
+            report=sample_report_config, slack_token="t", slack_channel="c", cli_type="claude"
+        )
+        with patch("src.daemon.submit_job") as submit_job:
+            # When/Then: 조용히 무시하지 않고 실패
+            assert main() == 1
+        submit_job.assert_not_called()
+        assert "--stream cannot be combined with --submit" in capsys.readouterr().out
+
+    @patch("sys.argv", ["src.main", "--submit", "--to", "2026-04-20"])
+    @patch("src.main.load_config_from_env")
+    def test_should_reject_invalid_range_before_submitting(self, mock_load_config, create_page_config):
+        # Given: --from 없는 --to
+        mock_load_config.return_value = create_page_config
+        with patch("src.daemon.submit_job") as submit_job:
+            # When/Then
+            assert main() == 1
+        submit_job.assert_not_called()
+
+
 class TestParseArgs:
     """CLI 인자 파싱 테스트"""
 
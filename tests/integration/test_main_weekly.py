@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.infrastructure.adapters.cli_executors import ClaudeCLIExecutor
+from src.infrastructure.adapters.report_cache import CachingCLIExecutor
 from src.infrastructure.config import AppConfig
 from src.main import main
 
@@ -97,7 +98,9 @@ class TestMainWeeklyMode:
         main()
 
         # Then: use case가 weekly_report 커맨드로 생성된 executor를 받는다
-        executor_arg = mock_use_case_class.call_args.args[0]
+        cached_executor = mock_use_case_class.call_args.args[0]
+        assert isinstance(cached_executor, CachingCLIExecutor)
+        executor_arg = cached_executor._inner
         assert isinstance(executor_arg, ClaudeCLIExecutor)
         assert executor_arg._command == "weekly_report"
 
@@ -174,7 +177,9 @@ class TestMainWeeklyMode:
 
         # Then: title_suffix="Daily" + daily_report executor(model default sonnet)로 조립된다
         assert mock_use_case_class.call_args.kwargs == {"title_suffix": "Daily"}
-        executor_arg = mock_use_case_class.call_args.args[0]
+        cached_executor = mock_use_case_class.call_args.args[0]
+        assert isinstance(cached_executor, CachingCLIExecutor)
+        executor_arg = cached_executor._inner
         assert isinstance(executor_arg, ClaudeCLIExecutor)
         assert executor_arg._command == "daily_report"
         assert executor_arg._model == "sonnet"
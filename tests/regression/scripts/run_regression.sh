@@ -40,8 +40,11 @@ run_model() {
 
     echo "▶ [${model}] run ${i}/${count} → ${out_file}"
 
+    # NO_CACHE=1: 같은 모델 반복 실행이 리포트 출력 캐시 hit로 대체되지 않도록
+    # REPORT_FALLBACK_RESERVE_SECONDS=0: deadline에 걸린 실행이 더 빠른 모델로 다시 돌아
+    #   다른 모델 출력이 이 모델 샘플로 기록되지 않도록 (시간 초과는 실패로 남긴다)
     # shellcheck disable=SC2086
-    if DRY_RUN=1 make run MODEL="$model" $DATE_ARG > "$out_file" 2>&1; then
+    if DRY_RUN=1 REPORT_FALLBACK_RESERVE_SECONDS=0 make run MODEL="$model" NO_CACHE=1 $DATE_ARG > "$out_file" 2>&1; then
       echo "  ✅ ok ($(wc -l < "$out_file" | tr -d ' ') lines)"
     else
       echo "  ❌ failed (see $out_file)"
@@ -54,6 +57,8 @@ run_model() {
       echo "started_at=$started_at"
       echo "ended_at=$(date -u +%FT%TZ)"
       echo "date_arg=${DATE:-}"
+      echo "split_prompt=${REPORT_SPLIT_PROMPT:-0}"
+      echo "model_fallback=0"
     } > "${out_file%.txt}.meta"
   done
 }
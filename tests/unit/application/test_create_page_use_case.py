@@ -1,16 +1,19 @@
 """CreateWeeklyPageUseCase 테스트"""
 
 from datetime import date
-from datetime import date as _date
 from unittest.mock import MagicMock
 from unittest.mock import MagicMock as _MagicMock
 
+import anyio
 import pytest
 
-from src.application.create_page_use_case import STATUS_LABELS, CreateWeeklyPageUseCase
-from src.application.create_page_use_case import CreateWeeklyPageUseCase as _UseCase
+from src.application.create_page_use_case import (
+    STATUS_LABELS,
+    AsyncCreateWeeklyPageUseCase,
+    CreateWeeklyPageUseCase,
+)
 from src.domain.models import CreatePageStatus, WeeklyPageConfig
-from src.domain.models import CreatePageStatus as _Status, DateRange as _DateRange
+from src.domain.models import DateRange as _DateRange
 
 
 @pytest.fixture
@@ -42,11 +45,12 @@ class TestCreateWeeklyPageUseCase:
         self, use_case, mock_confluence, mock_transformer, config
     ):
         # Given: 이전 주 페이지가 존재하고 새 주 페이지는 없는 상황
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123", "title": "2026.04.06 ~ 04.10"},  # 이전 주 존재
-            None,  # 새 주 미존재
-        ]
-        mock_confluence.get_page_content.return_value = "<table>old html</table>"
+        mock_confluence.get_pages_by_titles.return_value = {
+            # 이전 주만 존재 (새 주 미존재)
+            "2026.04.06 ~ 04.10": {
+                "id": "123", "title": "2026.04.06 ~ 04.10", "content": "<table>old html</table>"
+            },
+        }
         mock_transformer.transform.return_value = "<table>new html</table>"
         mock_confluence.create_page.return_value = "https://test.atlassian.net/wiki/pages/456"
 
@@ -55,18 +59,21 @@ class TestCreateWeeklyPageUseCase:
 
         # Then: 페이지가 생성된다
         assert result is True
-        mock_confluence.get_page_content.assert_called_once_with("123")
-        mock_transformer.transform.assert_called_once()
+        mock_confluence.get_pages_by_titles.assert_called_once_with(
+            "MAI", ["2026.04.06 ~ 04.10", "2026.04.13 ~ 04.17"], expand_body=True
+        )
+        mock_confluence.get_page_content.assert_not_called()
+        assert mock_transformer.transform.call_args[0][0] == "<table>old html</table>"
         mock_confluence.create_page.assert_called_once()
 
     def test_should_skip_when_page_already_exists(
         self, use_case, mock_confluence, config
     ):
         # Given: 새 주 페이지가 이미 존재하는 상황
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123"},  # 이전 주 존재
-            {"id": "456", "url": "https://fake.url/456"},  # 새 주도 존재 (url 키 필요)
-        ]
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.06 ~ 04.10": {"id": "123", "content": "<table>old</table>"},  # 이전 주 존재
+            "2026.04.13 ~ 04.17": {"id": "456", "url": "https://fake.url/456"},  # 새 주도 존재
+        }
 
         # When: 유스케이스를 실행하면
         result = use_case.execute(config, target_date=date(2026, 4, 13))
@@ -79,7 +86,7 @@ class TestCreateWeeklyPageUseCase:
         self, use_case, mock_confluence, config
     ):
         # Given: 이전 주 페이지가 없는 상황
-        mock_confluence.get_page_by_title.return_value = None
+        mock_confluence.get_pages_by_titles.return_value = {}
 
         # When: 유스케이스를 실행하면
         result = use_case.execute(config, target_date=date(2026, 4, 13))
@@ -92,11 +99,9 @@ class TestCreateWeeklyPageUseCase:
         self, use_case, mock_confluence, mock_transformer, config
     ):
         # Given: 2026-04-13 (월요일) 기준
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123"},  # 이전 주 존재
-            None,  # 새 주 미존재
-        ]
-        mock_confluence.get_page_content.return_value = "<table>html</table>"
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.06 ~ 04.10": {"id": "123", "content": "<table>html</table>"},  # 이전 주만 존재
+        }
         mock_transformer.transform.return_value = "<table>new</table>"
         mock_confluence.create_page.return_value = "url"
 
@@ -114,11 +119,9 @@ class TestCreateWeeklyPageUseCase:
         self, use_case, mock_confluence, mock_transformer, config
     ):
         # Given: 정상 실행 상황
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123"},
-            None,
-        ]
-        mock_confluence.get_page_content.return_value = "<table>html</table>"
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.06 ~ 04.10": {"id": "123", "content": "<table>html</table>"},
+        }
         mock_transformer.transform.return_value = "<table>new</table>"
         mock_confluence.create_page.return_value = "url"
 
@@ -170,88 +173,94 @@ def use_case_with_notifier(mock_confluence, mock_transformer, mock_notifier):
     )
 
 
-class TestBuildTitle:
-    """_build_title 헬퍼 — Slack 알림 제목 생성"""
+class TestNotificationTitle:
+    """execute 알림 제목 — [prefix][yy.mm.dd ~ mm.dd_WeeklyPage] 상태 라벨"""
 
-    def test_should_build_title_with_prefix(self, use_case_with_notifier):
-        # Given: 2026-04-27(월) ~ 2026-05-01(금) 주간
-        this_week = _DateRange(start=_date(2026, 4, 27), end=_date(2026, 5, 1))
+    _SOURCE = {"2026.04.20 ~ 04.24": {"id": "123", "content": "<table>old</table>"}}
 
-        # When: prefix='BE', status=CREATED로 제목 생성
-        title = use_case_with_notifier._build_title(
-            "BE", this_week, _Status.CREATED
-        )
+    def test_should_build_title_with_prefix(
+        self, use_case_with_notifier, mock_confluence, mock_notifier, config
+    ):
+        # Given: 2026-04-27(월) ~ 2026-05-01(금) 주간 생성
+        mock_confluence.get_pages_by_titles.return_value = dict(self._SOURCE)
+        mock_confluence.create_page.return_value = "https://wiki/url"
+
+        # When: prefix='BE'
+        use_case_with_notifier.execute(config, target_date=date(2026, 4, 27), notification_prefix="BE")
 
         # Then: spec §5 형식
-        assert title == "[BE][26.04.27 ~ 05.01_WeeklyPage] ✅ 생성 완료"
+        assert mock_notifier.send.call_args[0][0] == "[BE][26.04.27 ~ 05.01_WeeklyPage] ✅ 생성 완료"
 
-    def test_should_build_title_without_prefix_when_empty(self, use_case_with_notifier):
-        # Given: prefix 빈 문자열
-        this_week = _DateRange(start=_date(2026, 4, 27), end=_date(2026, 5, 1))
+    def test_should_build_title_without_prefix_when_empty(
+        self, use_case_with_notifier, mock_confluence, mock_notifier, config
+    ):
+        # Given: 새 주 페이지가 이미 존재
+        mock_confluence.get_pages_by_titles.return_value = {
+            **self._SOURCE, "2026.04.27 ~ 05.01": {"id": "456", "url": "https://wiki/new"},
+        }
 
-        # When
-        title = use_case_with_notifier._build_title(
-            "", this_week, _Status.ALREADY_EXISTS
-        )
+        # When: prefix 빈 문자열
+        use_case_with_notifier.execute(config, target_date=date(2026, 4, 27))
 
         # Then: [BE] 부분 생략
-        assert title == "[26.04.27 ~ 05.01_WeeklyPage] ℹ️ 이미 존재"
+        assert mock_notifier.send.call_args[0][0] == "[26.04.27 ~ 05.01_WeeklyPage] ℹ️ 이미 존재"
 
-    def test_should_use_failed_label(self, use_case_with_notifier):
-        # Given
-        this_week = _DateRange(start=_date(2026, 4, 27), end=_date(2026, 5, 1))
+    def test_should_use_failed_label(self, use_case_with_notifier, mock_confluence, mock_notifier, config):
+        # Given: 이전 주 페이지 없음
+        mock_confluence.get_pages_by_titles.return_value = {}
 
         # When
-        title = use_case_with_notifier._build_title("BE", this_week, _Status.FAILED)
+        use_case_with_notifier.execute(config, target_date=date(2026, 4, 27), notification_prefix="BE")
 
         # Then
-        assert title == "[BE][26.04.27 ~ 05.01_WeeklyPage] ❌ 생성 실패"
+        assert mock_notifier.send.call_args[0][0] == "[BE][26.04.27 ~ 05.01_WeeklyPage] ❌ 생성 실패"
 
 
-class TestNotify:
-    """_notify — 알림 전송 + 격리"""
+class TestNotificationIsolation:
+    """알림은 부수효과 — notifier 유무/실패가 execute 결과를 바꾸지 않음"""
 
-    def test_should_skip_when_notifier_is_none(self, mock_confluence, mock_transformer):
-        # Given: notifier 없는 use case (default)
-        use_case = _UseCase(confluence=mock_confluence, transformer=mock_transformer)
-        this_week = _DateRange(start=_date(2026, 4, 27), end=_date(2026, 5, 1))
-
-        # When: _notify 호출
-        # Then: 예외 발생 없이 조용히 return
-        use_case._notify(_Status.CREATED, "BE", this_week, "url")
-        # 추가 검증: _already_notified가 False 유지
-        assert use_case._already_notified is False
-
-    def test_should_send_notification_when_notifier_set(
-        self, use_case_with_notifier, mock_notifier
+    def test_should_swallow_notifier_exception(
+        self, use_case_with_notifier, mock_confluence, mock_notifier, config, capsys
     ):
-        # Given: notifier 주입된 use case
-        this_week = _DateRange(start=_date(2026, 4, 27), end=_date(2026, 5, 1))
+        # Given: 생성은 성공, notifier.send가 예외 발생
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.20 ~ 04.24": {"id": "123", "content": "<table>old</table>"},
+        }
+        mock_confluence.create_page.return_value = "https://wiki/url"
+        mock_notifier.send.side_effect = RuntimeError("Slack down")
 
-        # When: _notify 호출
-        use_case_with_notifier._notify(_Status.CREATED, "BE", this_week, "https://...")
+        # When: 예외 전파 안 됨
+        result = use_case_with_notifier.execute(
+            config, target_date=date(2026, 4, 27), notification_prefix="BE"
+        )
 
-        # Then: notifier.send 호출됨, _already_notified=True 설정
-        mock_notifier.send.assert_called_once()
-        call_args = mock_notifier.send.call_args
-        assert call_args[0][0] == "[BE][26.04.27 ~ 05.01_WeeklyPage] ✅ 생성 완료"
-        assert call_args[0][1] == "https://..."
-        assert use_case_with_notifier._already_notified is True
+        # Then: 생성 결과 그대로 + 경고만
+        assert result is True
+        assert "WARNING: Slack notification failed (status=created)" in capsys.readouterr().out
 
-    def test_should_swallow_notifier_exception(
-        self, use_case_with_notifier, mock_notifier
+    def test_should_notify_again_on_next_run(
+        self, use_case_with_notifier, mock_confluence, mock_notifier, config
     ):
-        # Given: notifier.send가 예외 발생
-        mock_notifier.send.side_effect = RuntimeError("Slack down")
-        this_week = _DateRange(start=_date(2026, 4, 27), end=_date(2026, 5, 1))
+        # Given: 첫 실행은 알림까지 성공, 두 번째 실행은 조회 예외
+        mock_confluence.get_pages_by_titles.side_effect = [
+            {"2026.04.20 ~ 04.24": {"id": "123", "content": "<table>old</table>"}},
+            RuntimeError("Network timeout"),
+        ]
+        mock_confluence.create_page.return_value = "https://wiki/url"
 
-        # When: _notify 호출 — 예외 전파 안 됨
-        use_case_with_notifier._notify(
-            _Status.FAILED, "BE", this_week, "error body"
+        # When
+        use_case_with_notifier.execute(config, target_date=date(2026, 4, 27), notification_prefix="BE")
+        result = use_case_with_notifier.execute(
+            config, target_date=date(2026, 4, 27), notification_prefix="BE"
         )
 
-        # Then: _already_notified는 False 유지 (실패한 알림은 latch 트리거 안 함)
-        assert use_case_with_notifier._already_notified is False
+        # Then: 중복 알림 방지 래치는 실행마다 초기화 — 두 번째 실패도 알린다
+        assert result is False
+        titles = [c.args[0] for c in mock_notifier.send.call_args_list]
+        assert titles == [
+            "[BE][26.04.27 ~ 05.01_WeeklyPage] ✅ 생성 완료",
+            "[BE][26.04.27 ~ 05.01_WeeklyPage] ❌ 생성 실패",
+        ]
 
 
 class TestExecuteNotificationIntegration:
@@ -261,11 +270,11 @@ class TestExecuteNotificationIntegration:
         self, use_case_with_notifier, mock_confluence, mock_transformer, mock_notifier, config
     ):
         # Given: 정상 생성 경로
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123", "title": "2026.04.20 ~ 04.24"},
-            None,
-        ]
-        mock_confluence.get_page_content.return_value = "<table>old</table>"
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.20 ~ 04.24": {
+                "id": "123", "title": "2026.04.20 ~ 04.24", "content": "<table>old</table>"
+            },
+        }
         mock_transformer.transform.return_value = "<table>new</table>"
         mock_confluence.create_page.return_value = "https://wiki/spaces/MAI/pages/456/title"
 
@@ -284,11 +293,11 @@ class TestExecuteNotificationIntegration:
     def test_should_send_already_exists_notification_with_url_from_dict(
         self, use_case_with_notifier, mock_confluence, mock_notifier, config
     ):
-        # Given: 새 주 페이지가 이미 존재 — get_page_by_title이 'url' 키 포함
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123", "url": "https://wiki/spaces/MAI/pages/123/old"},
-            {"id": "456", "url": "https://wiki/spaces/MAI/pages/456/new"},
-        ]
+        # Given: 새 주 페이지가 이미 존재 — get_pages_by_titles 결과가 'url' 키 포함
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.20 ~ 04.24": {"id": "123", "url": "https://wiki/spaces/MAI/pages/123/old"},
+            "2026.04.27 ~ 05.01": {"id": "456", "url": "https://wiki/spaces/MAI/pages/456/new"},
+        }
 
         # When
         result = use_case_with_notifier.execute(
@@ -306,7 +315,7 @@ class TestExecuteNotificationIntegration:
         self, use_case_with_notifier, mock_confluence, mock_notifier, config
     ):
         # Given: 이전 주 페이지 없음
-        mock_confluence.get_page_by_title.return_value = None
+        mock_confluence.get_pages_by_titles.return_value = {}
 
         # When
         result = use_case_with_notifier.execute(
@@ -324,7 +333,7 @@ class TestExecuteNotificationIntegration:
         self, use_case_with_notifier, mock_confluence, mock_notifier, config
     ):
         # Given: confluence 호출이 예외 발생
-        mock_confluence.get_page_by_title.side_effect = RuntimeError("Network timeout")
+        mock_confluence.get_pages_by_titles.side_effect = RuntimeError("Network timeout")
 
         # When
         result = use_case_with_notifier.execute(
@@ -339,38 +348,6 @@ class TestExecuteNotificationIntegration:
         assert "Unexpected error" in call_args[0][1]
         assert "Network timeout" in call_args[0][1]
 
-    def test_should_not_double_notify_when_post_success_code_raises(
-        self, use_case_with_notifier, mock_confluence, mock_transformer, mock_notifier, config, monkeypatch
-    ):
-        # Given: 정상 생성 후 추가 코드가 raise하는 시나리오
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123"},
-            None,
-        ]
-        mock_confluence.get_page_content.return_value = "<table>old</table>"
-        mock_transformer.transform.return_value = "<table>new</table>"
-        mock_confluence.create_page.return_value = "https://wiki/url"
-
-        # _notify를 monkeypatch하여 CREATED 후에 raise
-        original_notify = use_case_with_notifier._notify
-
-        def notify_then_raise(status, prefix, week, body):
-            original_notify(status, prefix, week, body)
-            if status == _Status.CREATED:
-                raise RuntimeError("Simulated post-success failure")
-
-        monkeypatch.setattr(use_case_with_notifier, "_notify", notify_then_raise)
-
-        # When
-        result = use_case_with_notifier.execute(
-            config, target_date=date(2026, 4, 27), notification_prefix="BE"
-        )
-
-        # Then: outer except는 _already_notified=True를 보고 추가 알림 발송 안 함
-        # → notifier.send 호출은 정확히 1회 (성공 알림만)
-        assert result is False  # outer except가 False 반환
-        assert mock_notifier.send.call_count == 1  # CREATED만, FAILED 추가 발송 안 됨
-
     def test_should_skip_notification_when_pre_try_fails(
         self, use_case_with_notifier, mock_notifier, config, monkeypatch
     ):
@@ -399,11 +376,9 @@ class TestExecuteWithoutNotifier:
         self, use_case, mock_confluence, mock_transformer, config
     ):
         # Given: notifier 없음 (use_case 픽스처 사용)
-        mock_confluence.get_page_by_title.side_effect = [
-            {"id": "123"},
-            None,
-        ]
-        mock_confluence.get_page_content.return_value = "<table>old</table>"
+        mock_confluence.get_pages_by_titles.return_value = {
+            "2026.04.20 ~ 04.24": {"id": "123", "content": "<table>old</table>"},
+        }
         mock_transformer.transform.return_value = "<table>new</table>"
         mock_confluence.create_page.return_value = "url"
 
@@ -413,3 +388,299 @@ class TestExecuteWithoutNotifier:
         # Then: 페이지 생성 정상, 어떤 알림도 시도되지 않음
         assert result is True
         mock_confluence.create_page.assert_called_once()
+
+
+class _FakeAsyncConfluence:
+    """AsyncConfluencePort fake — 호출마다 delay초 대기, 동시 진행 수 최대치를 기록"""
+
+    def __init__(self, pages: dict[str, dict], delay: float = 0.0, space_error: Exception | None = None):
+        self.pages = pages
+        self.delay = delay
+        self.space_error = space_error
+        self.active = 0
+        self.max_active = 0
+        self.created: list[dict] = []
+
+    async def _call(self):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await anyio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+    async def get_pages_by_titles(self, space_key, titles, expand_body=False):
+        await self._call()
+        return {t: self.pages[t] for t in titles if t in self.pages}
+
+    async def get_page_content(self, page_id):
+        raise AssertionError("body is expanded in get_pages_by_titles")
+
+    async def get_space_id(self, space_key):
+        await self._call()
+        if self.space_error is not None:
+            raise self.space_error
+        return "77"
+
+    async def create_page(self, space_key, title, content, parent_id):
+        await self._call()
+        self.created.append({"space_key": space_key, "title": title, "content": content})
+        return f"https://wiki/{space_key}/{title}"
+
+
+class TestAsyncCreateWeeklyPageUseCase:
+    """AsyncConfluencePort 사용 — 독립 조회 동시 실행"""
+
+    _OLD = "2026.04.06 ~ 04.10"
+
+    # ---------- [Happy] ----------
+    def test_should_overlap_page_lookup_and_space_id_lookup(self, mock_transformer, config):
+        # Given: 조회마다 지연이 있는 async Confluence
+        confluence = _FakeAsyncConfluence({self._OLD: {"id": "1", "content": "<p>old</p>"}}, delay=0.05)
+        mock_transformer.transform.return_value = "<p>new</p>"
+        use_case = AsyncCreateWeeklyPageUseCase(confluence=confluence, transformer=mock_transformer)
+
+        # When
+        result = use_case.execute(config, target_date=date(2026, 4, 13))
+
+        # Then: 페이지 조회와 space id 조회가 겹쳐 실행되고 페이지가 생성된다
+        assert result is True
+        assert confluence.max_active == 2
+        assert confluence.created == [
+            {"space_key": "MAI", "title": "2026.04.13 ~ 04.17", "content": "<p>new</p>"}
+        ]
+        mock_transformer.transform.assert_called_once()
+        assert mock_transformer.transform.call_args[0][0] == "<p>old</p>"
+
+    # ---------- [Boundary] ----------
+    def test_should_skip_when_new_page_exists(self, mock_transformer, config):
+        confluence = _FakeAsyncConfluence({
+            self._OLD: {"id": "1", "content": "<p/>"},
+            "2026.04.13 ~ 04.17": {"id": "2", "url": "https://wiki/2"},
+        })
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, mock_transformer)
+
+        assert use_case.execute(config, target_date=date(2026, 4, 13)) is True
+        assert confluence.created == []
+
+    def test_should_still_create_page_when_space_id_prefetch_fails(self, mock_transformer, config, capsys):
+        # Given: space id 미리 조회만 실패 (create_page가 다시 조회하므로 치명적이지 않음)
+        confluence = _FakeAsyncConfluence(
+            {self._OLD: {"id": "1", "content": "<p/>"}}, space_error=ConnectionError("reset")
+        )
+        mock_transformer.transform.return_value = "<p/>"
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, mock_transformer)
+
+        assert use_case.execute(config, target_date=date(2026, 4, 13)) is True
+        assert "WARNING: space id prefetch failed for MAI" in capsys.readouterr().out
+
+    # ---------- [Error] ----------
+    def test_should_report_original_exception_from_task_group(self, mock_transformer, config):
+        # Given: 페이지 조회가 예외 — task group이 감싸도 원래 예외로 알림
+        confluence = _FakeAsyncConfluence({})
+        notifier = MagicMock()
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("Network timeout")
+
+        confluence.get_pages_by_titles = boom
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, mock_transformer, notifier)
+
+        # When
+        result = use_case.execute(config, target_date=date(2026, 4, 13), notification_prefix="BE")
+
+        # Then
+        assert result is False
+        assert "Unexpected error: RuntimeError: Network timeout" in notifier.send.call_args[0][1]
+
+
+class _MemoryCheckpoint:
+    """BackfillCheckpointPort fake"""
+
+    def __init__(self, created=(), last=None):
+        self.created = {t: f"url/{t}" for t in created}
+        self.last = last
+        self.cleared = False
+
+    def created_titles(self):
+        return set(self.created)
+
+    def last_created(self):
+        return self.last
+
+    def record(self, title, url, content):
+        self.created[title] = url
+        self.last = (title, content)
+
+    def clear(self):
+        self.cleared = True
+
+
+def _weeks(*mondays: date) -> list[_DateRange]:
+    from datetime import timedelta
+
+    return [_DateRange(m, m + timedelta(days=4)) for m in mondays]
+
+
+class TestExecuteRange:
+    """여러 주 연속 생성 — 앞 주 결과가 다음 주 원본, checkpoint로 재개"""
+
+    _SOURCE = "2026.04.06 ~ 04.10"
+    _WEEKS = _weeks(date(2026, 4, 13), date(2026, 4, 20), date(2026, 4, 27))
+
+    @pytest.fixture
+    def chain_transformer(self):
+        transformer = MagicMock()
+        # 변환 결과에 새 주 첫날을 덧붙여 원본 체인을 추적
+        transformer.transform.side_effect = lambda html, old, new: f"{html}>{new[0]}"
+        return transformer
+
+    # ---------- [Happy] ----------
+    def test_should_chain_each_week_from_previous_created_page(self, chain_transformer, config):
+        # Given: 원본 주만 존재
+        confluence = _FakeAsyncConfluence({self._SOURCE: {"id": "1", "content": "src"}})
+        notifier = MagicMock()
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer, notifier)
+        checkpoint = _MemoryCheckpoint()
+
+        # When
+        result = use_case.execute_range(config, self._WEEKS, "BE", checkpoint=checkpoint)
+
+        # Then: 순서대로 생성, 각 주는 앞 주 결과에서 변환
+        assert result is True
+        assert [(c["title"], c["content"]) for c in confluence.created] == [
+            ("2026.04.13 ~ 04.17", "src>04.13"),
+            ("2026.04.20 ~ 04.24", "src>04.13>04.20"),
+            ("2026.04.27 ~ 05.01", "src>04.13>04.20>04.27"),
+        ]
+        assert checkpoint.cleared is True
+        assert notifier.send.call_count == 1
+        assert "[BE][26.04.27 ~ 05.01_WeeklyPage] ✅ 생성 완료" == notifier.send.call_args[0][0]
+
+    def test_should_overlap_next_transform_with_page_creation(self, config):
+        # Given: 생성 POST 0.1s, 변환 0.1s
+        import time
+
+        confluence = _FakeAsyncConfluence({self._SOURCE: {"id": "1", "content": "src"}}, delay=0.1)
+        transformer = MagicMock()
+        transformer.transform.side_effect = lambda html, old, new: time.sleep(0.1) or html
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, transformer)
+
+        # When
+        started = time.perf_counter()
+        assert use_case.execute_range(config, self._WEEKS) is True
+        elapsed = time.perf_counter() - started
+
+        # Then: 조회 0.1 + 변환 3회 + 생성 3회 순차(0.7s)보다 짧다 (변환/생성 겹침)
+        assert elapsed < 0.65
+
+    def test_should_resume_from_checkpoint_without_recreating(self, chain_transformer, config):
+        # Given: 이전 실행이 첫 주를 만들고 중단 — 검색 색인에는 아직 없음
+        confluence = _FakeAsyncConfluence({self._SOURCE: {"id": "1", "content": "src"}})
+        checkpoint = _MemoryCheckpoint(
+            created=["2026.04.13 ~ 04.17"], last=("2026.04.13 ~ 04.17", "src>04.13")
+        )
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer)
+
+        # When
+        assert use_case.execute_range(config, self._WEEKS, checkpoint=checkpoint) is True
+
+        # Then: 남은 두 주만, checkpoint 본문을 원본으로 생성
+        assert [c["content"] for c in confluence.created] == [
+            "src>04.13>04.20", "src>04.13>04.20>04.27"
+        ]
+
+    # ---------- [Boundary] ----------
+    def test_should_use_existing_middle_week_as_next_source(self, chain_transformer, config):
+        confluence = _FakeAsyncConfluence({
+            self._SOURCE: {"id": "1", "content": "src"},
+            "2026.04.20 ~ 04.24": {"id": "2", "content": "edited"},
+        })
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer)
+
+        assert use_case.execute_range(config, self._WEEKS) is True
+        assert [c["content"] for c in confluence.created] == ["src>04.13", "edited>04.27"]
+
+    def test_should_start_from_existing_first_week_when_source_missing(self, chain_transformer, config):
+        # Given: 범위 앞 주는 없지만 범위 첫 주는 이미 있음
+        confluence = _FakeAsyncConfluence({"2026.04.13 ~ 04.17": {"id": "2", "content": "first"}})
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer)
+
+        # When
+        assert use_case.execute_range(config, self._WEEKS) is True
+
+        # Then: 이미 있는 첫 주를 원본으로 나머지 주 생성
+        assert [c["content"] for c in confluence.created] == ["first>04.20", "first>04.20>04.27"]
+
+    def test_should_recreate_checkpointed_week_that_is_not_visible(self, chain_transformer, config, capsys):
+        # Given: checkpoint에는 첫 두 주가 있지만 첫 주는 보이지 않음 (삭제) — 마지막 기록은 둘째 주
+        confluence = _FakeAsyncConfluence({self._SOURCE: {"id": "1", "content": "src"}})
+        lookups = []
+        original_lookup = confluence.get_pages_by_titles
+
+        async def record_lookup(space_key, titles, expand_body=False):
+            lookups.append(list(titles))
+            return await original_lookup(space_key, titles, expand_body)
+
+        confluence.get_pages_by_titles = record_lookup
+        checkpoint = _MemoryCheckpoint(
+            created=["2026.04.13 ~ 04.17", "2026.04.20 ~ 04.24"],
+            last=("2026.04.20 ~ 04.24", "src>04.13>04.20"),
+        )
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer)
+
+        # When
+        assert use_case.execute_range(config, self._WEEKS, checkpoint=checkpoint) is True
+
+        # Then: 보이지 않는 주는 한 번 더 조회한 뒤 완료로 치지 않고 다시 만든다
+        assert lookups[-1] == ["2026.04.13 ~ 04.17"]
+        assert [c["title"] for c in confluence.created] == ["2026.04.13 ~ 04.17", "2026.04.27 ~ 05.01"]
+        assert "WARNING: checkpointed page not found: 2026.04.13 ~ 04.17" in capsys.readouterr().out
+
+    def test_should_notify_already_exists_when_nothing_to_create(self, chain_transformer, config):
+        confluence = _FakeAsyncConfluence({
+            self._SOURCE: {"id": "1", "content": "src"},
+            "2026.04.13 ~ 04.17": {"id": "2", "content": "a"},
+        })
+        notifier = MagicMock()
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer, notifier)
+
+        assert use_case.execute_range(config, self._WEEKS[:1]) is True
+        assert "ℹ️ 이미 존재" in notifier.send.call_args[0][0]
+
+    def test_should_succeed_without_requests_for_empty_range(self, chain_transformer, config):
+        confluence = _FakeAsyncConfluence({})
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer)
+        assert use_case.execute_range(config, []) is True
+        assert confluence.max_active == 0
+
+    # ---------- [Error] ----------
+    def test_should_fail_when_first_source_missing(self, chain_transformer, config):
+        notifier = MagicMock()
+        use_case = AsyncCreateWeeklyPageUseCase(_FakeAsyncConfluence({}), chain_transformer, notifier)
+
+        assert use_case.execute_range(config, self._WEEKS) is False
+        assert "이전 주 페이지를 찾을 수 없습니다: 2026.04.06 ~ 04.10" in notifier.send.call_args[0][1]
+
+    def test_should_keep_checkpoint_when_creation_fails_midway(self, chain_transformer, config):
+        # Given: 두 번째 생성에서 실패
+        confluence = _FakeAsyncConfluence({self._SOURCE: {"id": "1", "content": "src"}})
+        original_create = confluence.create_page
+
+        async def create_twice(space_key, title, content, parent_id):
+            if confluence.created:
+                raise RuntimeError("429 Too Many Requests")
+            return await original_create(space_key, title, content, parent_id)
+
+        confluence.create_page = create_twice
+        checkpoint = _MemoryCheckpoint()
+        use_case = AsyncCreateWeeklyPageUseCase(confluence, chain_transformer)
+
+        # When
+        result = use_case.execute_range(config, self._WEEKS, checkpoint=checkpoint)
+
+        # Then: 실패, 첫 주 기록은 남아 재실행이 이어서 진행
+        assert result is False
+        assert checkpoint.created_titles() == {"2026.04.13 ~ 04.17"}
+        assert checkpoint.last == ("2026.04.13 ~ 04.17", "src>04.13")
+        assert checkpoint.cleared is False
@@ -0,0 +1,165 @@
+"""ReportContextPrefetcher 테스트 — Confluence/JIRA 포트는 fake.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import threading
+import time
+from datetime import date
+
+import anyio
+
+from src.application import report_context
+from src.application.report_context import ReportContextPrefetcher
+from src.domain.models import JiraIssue, TicketMention
+
+_PAGE_BODY = (
+    '<ac:parameter ac:name="key">MAI-1</ac:parameter>'
+    '<ac:parameter ac:name="key">MAI-2</ac:parameter>'
+    '<a href="/browse/MAI-3">MAI-3</a>'
+)
+
+
+class _FakeConfluence:
+    def __init__(self, page: dict | None, body: str = _PAGE_BODY):
+        self.page = page
+        self.body = body
+        self.titles: list[tuple[str, str]] = []
+
+    def get_page_by_title(self, space_key, title):
+        self.titles.append((space_key, title))
+        return self.page
+
+    def get_page_content(self, page_id):
+        return self.body
+
+
+class _FakeJira:
+    """get_issues 호출(묶음)마다 delay만큼 블로킹. 동시 실행 수 최대치와 묶음을 기록."""
+
+    def __init__(self, missing=(), failing=(), delay: float = 0.0):
+        self.missing = set(missing)
+        self.failing = set(failing)
+        self.delay = delay
+        self.batches: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_issues(self, keys):
+        with self._lock:
+            self.batches.append(list(keys))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.failing & set(keys):
+                raise ConnectionError("jira down")
+            return {
+                key: JiraIssue(key, f"summary {key}", "Done")
+                for key in keys
+                if key not in self.missing
+            }
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class _FakeScanner:
+    def __init__(self, mentions):
+        self.mentions = mentions
+
+    def scan(self, storage_html):
+        return self.mentions
+
+
+_PAGE = {"id": "42", "title": "2026.01.26 ~ 01.30", "url": "https://x/wiki/spaces/MAI/pages/42/t"}
+
+
+class TestReportContextPrefetcher:
+    # ---------- [Happy] ----------
+    def test_should_fetch_this_week_page_and_referenced_issues(self):
+        # Given
+        confluence = _FakeConfluence(_PAGE)
+        prefetcher = ReportContextPrefetcher(confluence, _FakeJira())
+        # When
+        context = anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        # Then: 이번 주 제목으로 조회, 티켓은 페이지 등장 순서
+        assert confluence.titles == [("MAI", "2026.01.26 ~ 01.30")]
+        assert context.page_url == _PAGE["url"]
+        assert context.page_body == _PAGE_BODY
+        assert [i.key for i in context.issues] == ["MAI-1", "MAI-2", "MAI-3"]
+        assert context.missing_issue_keys == ()
+
+    def test_should_fetch_all_referenced_issues_in_one_bulk_call(self):
+        jira = _FakeJira()
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(_PAGE), jira)
+        anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        assert jira.batches == [["MAI-1", "MAI-2", "MAI-3"]]
+
+    def test_should_keep_scanned_member_and_day_locations(self):
+        # Given: 스캐너가 팀원/날짜별 위치를 돌려줌 (같은 티켓이 여러 날에 등장)
+        mentions = [
+            TicketMention("MAI-1", "홍길동", "01.26"),
+            TicketMention("MAI-1", "홍길동", "01.27"),
+            TicketMention("MAI-2", "김철수", "01.26"),
+        ]
+        jira = _FakeJira()
+        prefetcher = ReportContextPrefetcher(
+            _FakeConfluence(_PAGE), jira, scanner=_FakeScanner(mentions)
+        )
+        # When
+        context = anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        # Then: 티켓은 한 번씩만 조회, 위치는 그대로 전달
+        assert jira.batches == [["MAI-1", "MAI-2"]]
+        assert context.mentions == tuple(mentions)
+
+    def test_should_fetch_batches_concurrently_up_to_limit(self, monkeypatch):
+        # Given: 티켓 3건을 1건씩 묶음, 동시 2묶음 제한
+        monkeypatch.setattr(report_context, "_ISSUE_BATCH_SIZE", 1)
+        jira = _FakeJira(delay=0.05)
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(_PAGE), jira, max_concurrency=2)
+        # When
+        anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        # Then
+        assert jira.max_active == 2
+
+    def test_should_render_prompt_block(self):
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(_PAGE), _FakeJira())
+        block = anyio.run(prefetcher.fetch_prompt_block, "MAI", date(2026, 1, 28))
+        assert block.startswith("<prefetched_context>")
+        assert "- MAI-3 | status: Done" in block
+
+    # ---------- [Boundary] ----------
+    def test_should_return_none_when_page_not_found(self, capsys):
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(None), _FakeJira())
+        assert anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28)) is None
+        assert anyio.run(prefetcher.fetch_prompt_block, "MAI", date(2026, 1, 28)) is None
+        assert "WARNING: prefetch could not find Confluence page" in capsys.readouterr().out
+
+    def test_should_return_page_without_issues_when_none_referenced(self):
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(_PAGE, body="<p>no tickets</p>"), _FakeJira())
+        context = anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        assert context.issues == ()
+        assert context.missing_issue_keys == ()
+
+    def test_should_split_large_key_sets_into_batches(self, monkeypatch):
+        monkeypatch.setattr(report_context, "_ISSUE_BATCH_SIZE", 2)
+        jira = _FakeJira()
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(_PAGE), jira)
+        context = anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        assert sorted(jira.batches) == [["MAI-1", "MAI-2"], ["MAI-3"]]
+        assert [i.key for i in context.issues] == ["MAI-1", "MAI-2", "MAI-3"]
+
+    # ---------- [Error] ----------
+    def test_should_mark_missing_and_failed_issues_without_aborting(self, capsys, monkeypatch):
+        # Given: MAI-2 미존재, MAI-3 묶음 조회 오류 (1건씩 묶음)
+        monkeypatch.setattr(report_context, "_ISSUE_BATCH_SIZE", 1)
+        jira = _FakeJira(missing={"MAI-2"}, failing={"MAI-3"})
+        prefetcher = ReportContextPrefetcher(_FakeConfluence(_PAGE), jira)
+        # When
+        context = anyio.run(prefetcher.fetch, "MAI", date(2026, 1, 28))
+        # Then: 나머지는 그대로, 실패분은 agent가 MCP로 보완하도록 남긴다
+        assert [i.key for i in context.issues] == ["MAI-1"]
+        assert context.missing_issue_keys == ("MAI-2", "MAI-3")
+        assert "WARNING: prefetch failed for 1 issue(s) (MAI-3..): ConnectionError" in capsys.readouterr().out
@@ -1,10 +1,14 @@
 """GenerateReportUseCase 단위 테스트 (daily/weekly 공용)"""
 
+import threading
+import time
 from datetime import date
 from unittest.mock import Mock
 
+import anyio
+
 from src.application.use_cases import GenerateReportUseCase
-from src.domain.models import ReportConfig
+from src.domain.models import ReportConfig, StreamRestart
 
 
 def make_config(**overrides) -> ReportConfig:
@@ -77,3 +81,206 @@ class TestGenerateReportUseCase:
         # Then: False 반환, 알림 미전송
         assert result is False
         notifier.send.assert_not_called()
+
+
+class _FakeAsyncExecutor:
+    """execute_async만 구현한 fake — space_key별 지연/출력/예외 지정, 동시 실행 수 기록."""
+
+    def __init__(self, delays: dict[str, float], failures: dict[str, BaseException] | None = None):
+        self._delays = delays
+        self._failures = failures or {}
+        self.running = 0
+        self.max_running = 0
+
+    async def execute_async(self, space_key, mention_users="", report_date=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await anyio.sleep(self._delays.get(space_key, 0))
+            if space_key in self._failures:
+                raise self._failures[space_key]
+            return None if space_key == "NONE" else f"\U0001f4ca 일정 요약\n{space_key} 본문"
+        finally:
+            self.running -= 1
+
+
+class TestGenerateReportUseCaseBatch:
+    """execute_batch — 단일 이벤트 루프 multi-team fan-out."""
+
+    # ---------- [Happy] ----------
+    def test_should_run_jobs_concurrently_and_send_in_config_order(self):
+        # Given: 첫 job이 가장 느림
+        executor = _FakeAsyncExecutor({"A": 0.05, "B": 0.0, "C": 0.01})
+        notifier = Mock()
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        configs = [make_config(space_key=k, team_prefix=k) for k in ("A", "B", "C")]
+        # When
+        results = use_case.execute_batch(configs, max_concurrency=3)
+        # Then: 동시 실행 + 전송 순서는 입력 순서
+        assert results == [True, True, True]
+        assert executor.max_running == 3
+        sent_titles = [c.args[0] for c in notifier.send.call_args_list]
+        assert sent_titles == ["[A][26.01.27_Daily]", "[B][26.01.27_Daily]", "[C][26.01.27_Daily]"]
+
+    def test_should_keep_running_jobs_while_notifier_blocks(self):
+        # Given: A 전송이 rate limiter 대기처럼 스레드를 블록 (time.sleep), 그동안 B가 실행 중
+        executor = _FakeAsyncExecutor({"A": 0.0, "B": 0.05})
+        running_after_send = []
+
+        def blocking_send(*args):
+            time.sleep(0.3)
+            running_after_send.append(executor.running)
+
+        notifier = Mock()
+        notifier.send.side_effect = blocking_send
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        configs = [make_config(space_key=k, team_prefix=k) for k in ("A", "B")]
+        # When
+        results = use_case.execute_batch(configs, max_concurrency=2)
+        # Then: A 전송이 끝나기 전에 B가 끝났다 (이벤트 루프가 막히지 않음), 순서 유지
+        assert results == [True, True]
+        assert running_after_send[0] == 0
+        assert [c.args[0] for c in notifier.send.call_args_list] == [
+            "[A][26.01.27_Daily]", "[B][26.01.27_Daily]",
+        ]
+
+    # ---------- [Boundary] ----------
+    def test_should_respect_max_concurrency(self):
+        # Given: 4 jobs, 동시 실행 한도 2
+        executor = _FakeAsyncExecutor({k: 0.01 for k in "ABCD"})
+        use_case = GenerateReportUseCase(executor, Mock(), title_suffix="Daily")
+        # When
+        use_case.execute_batch([make_config(space_key=k) for k in "ABCD"], max_concurrency=2)
+        # Then
+        assert executor.max_running == 2
+
+    def test_should_return_empty_list_for_no_configs(self):
+        # Given/When
+        use_case = GenerateReportUseCase(Mock(), Mock(), title_suffix="Daily")
+        # Then
+        assert use_case.execute_batch([]) == []
+
+    # ---------- [Error] ----------
+    def test_should_isolate_executor_failure_per_job(self):
+        # Given: B는 예외, NONE은 None 반환
+        executor = _FakeAsyncExecutor({}, failures={"B": RuntimeError("boom")})
+        notifier = Mock()
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        configs = [make_config(space_key=k) for k in ("A", "B", "NONE", "C")]
+        # When
+        results = use_case.execute_batch(configs)
+        # Then: 실패 job만 False, 나머지는 전송
+        assert results == [True, False, False, True]
+        assert notifier.send.call_count == 2
+
+    def test_should_isolate_notifier_failure_per_job(self):
+        # Given: 첫 전송만 Slack 예외
+        executor = _FakeAsyncExecutor({})
+        notifier = Mock()
+        notifier.send.side_effect = [Exception("slack down"), None]
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        # When
+        results = use_case.execute_batch([make_config(space_key="A"), make_config(space_key="B")])
+        # Then
+        assert results == [False, True]
+
+
+class _FakeStreamingExecutor:
+    """stream만 구현한 fake — chunks를 순서대로 yield 후 error가 있으면 raise."""
+
+    def __init__(self, chunks: list[str], error: BaseException | None = None):
+        self._chunks = chunks
+        self._error = error
+
+    async def stream(self, space_key, mention_users="", report_date=None):
+        for chunk in self._chunks:
+            await anyio.sleep(0)
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+
+class TestGenerateReportUseCaseStreaming:
+    """execute_streaming — executor 출력을 notifier 스트림으로 실시간 전달."""
+
+    # ---------- [Happy] ----------
+    def test_should_append_each_chunk_and_finish_with_extracted_content(self):
+        # Given: 분석 텍스트 뒤에 마커가 오는 스트림
+        executor = _FakeStreamingExecutor(["분석 중...", "\U0001f4ca 일정 요약", "- 작업1"])
+        notifier = Mock()
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        # When
+        result = use_case.execute_streaming(make_config())
+        # Then: 제목으로 스트림 오픈 → 조각별 append → 마커 이후 본문으로 finish
+        assert result is True
+        notifier.open_stream.assert_called_once_with("[BE][26.01.27_Daily]")
+        stream = notifier.open_stream.return_value
+        assert [c.args[0] for c in stream.append.call_args_list] == [
+            "분석 중...", "\U0001f4ca 일정 요약", "- 작업1",
+        ]
+        stream.finish.assert_called_once_with("\U0001f4ca 일정 요약\n- 작업1")
+        stream.fail.assert_not_called()
+        notifier.send.assert_not_called()
+
+    def test_should_restart_stream_and_drop_cancelled_attempt_output(self):
+        # Given: 취소된 시도의 부분 리포트 뒤 fallback 재시작 — 새 시도는 마커 없이 완료
+        executor = _FakeStreamingExecutor([
+            "\U0001f4ca 일정 요약 (opus 부분)",
+            StreamRestart(attempt=1, model="sonnet"),
+            "sonnet 본문",
+        ])
+        notifier = Mock()
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        # When
+        result = use_case.execute_streaming(make_config())
+        # Then: 스트림에 재시작을 알리고, 최종 본문에는 fallback 시도 출력만
+        assert result is True
+        stream = notifier.open_stream.return_value
+        stream.restart.assert_called_once_with()
+        assert [c.args[0] for c in stream.append.call_args_list] == [
+            "\U0001f4ca 일정 요약 (opus 부분)", "sonnet 본문",
+        ]
+        stream.finish.assert_called_once_with("sonnet 본문")
+
+    def test_should_call_stream_off_event_loop_thread(self):
+        # Given: 호출 스레드를 기록하는 stream (Slack 호출은 rate limiter에서 time.sleep 할 수 있음)
+        executor = _FakeStreamingExecutor(["\U0001f4ca 일정 요약", "- 작업1"])
+        notifier = Mock()
+        stream = notifier.open_stream.return_value
+        threads = []
+        stream.append.side_effect = lambda text: threads.append(threading.get_ident())
+        stream.finish.side_effect = lambda text: threads.append(threading.get_ident())
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        # When
+        use_case.execute_streaming(make_config())
+        # Then: 이벤트 루프(메인) 스레드에서 블록하지 않는다
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+    def test_should_fall_back_to_execute_when_notifier_cannot_stream(self, capsys):
+        # Given: send만 있는 notifier
+        executor = Mock()
+        executor.execute.return_value = "\U0001f4ca 일정 요약\n- 작업1"
+        notifier = Mock(spec=["send"])
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        # When
+        result = use_case.execute_streaming(make_config())
+        # Then: 완성된 리포트를 한 번에 전송
+        assert result is True
+        notifier.send.assert_called_once_with("[BE][26.01.27_Daily]", "\U0001f4ca 일정 요약\n- 작업1")
+        executor.stream.assert_not_called()
+        assert "WARNING: notifier does not support streaming" in capsys.readouterr().out
+
+    # ---------- [Error] ----------
+    def test_should_fail_stream_and_return_false_when_executor_raises(self):
+        # Given: 중간에 예외가 나는 스트림
+        executor = _FakeStreamingExecutor(["분석 중..."], error=RuntimeError("boom"))
+        notifier = Mock()
+        use_case = GenerateReportUseCase(executor, notifier, title_suffix="Daily")
+        # When
+        result = use_case.execute_streaming(make_config())
+        # Then: fail()로 placeholder 정리, finish 미호출
+        assert result is False
+        stream = notifier.open_stream.return_value
+        stream.fail.assert_called_once_with()
+        stream.finish.assert_not_called()
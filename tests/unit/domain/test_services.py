@@ -1,16 +1,25 @@
 """Domain 서비스 테스트"""
 
+import random
 from datetime import date
 
 import pytest
 
-from src.domain.models import DateRange
+from src.domain.models import DateRange, JiraIssue, ReportContext, TicketMention
 from src.domain.services import (
+    _REPORT_MARKER_PATTERN,
+    _REPORT_MARKERS,
     calculate_last_week_range,
     calculate_this_week_range,
     convert_markdown_links_to_slack,
+    extract_jira_keys,
     extract_report_content,
+    find_report_violations,
+    format_report_context,
+    ReportMarkerExtractor,
+    find_report_start,
     format_confluence_page_title,
+    plan_week_chain,
 )
 
 
@@ -157,6 +166,31 @@ class TestFormatConfluencePageTitle:
         assert result == expected
 
 
+class TestPlanWeekChain:
+    """backfill 대상 주 목록"""
+
+    def test_should_list_weeks_between_dates_inclusive(self):
+        # Given: 수요일 ~ 다음다음 주 월요일
+        weeks = plan_week_chain(date(2026, 4, 15), date(2026, 4, 27))
+
+        # Then: 각 날짜가 속한 주까지 월~금 범위 3개
+        assert [format_confluence_page_title(w) for w in weeks] == [
+            "2026.04.13 ~ 04.17", "2026.04.20 ~ 04.24", "2026.04.27 ~ 05.01"
+        ]
+
+    def test_should_return_single_week_for_same_week(self):
+        assert plan_week_chain(date(2026, 4, 13), date(2026, 4, 19)) == [
+            DateRange(date(2026, 4, 13), date(2026, 4, 17))
+        ]
+
+    def test_should_cross_year_boundary(self):
+        weeks = plan_week_chain(date(2025, 12, 22), date(2026, 1, 5))
+        assert [w.start for w in weeks] == [date(2025, 12, 22), date(2025, 12, 29), date(2026, 1, 5)]
+
+    def test_should_return_empty_when_end_before_start(self):
+        assert plan_week_chain(date(2026, 4, 20), date(2026, 4, 13)) == []
+
+
 class TestConvertMarkdownLinksToSlack:
     """마크다운 링크 → Slack 링크 변환 테스트"""
 
@@ -274,3 +308,198 @@ class TestExtractReportContent:
     def test_should_strip_surrounding_whitespace(self):
         # [Boundary] Given: 앞뒤 공백
         assert extract_report_content("  본문  ") == "본문"
+
+
+class TestFindReportStart:
+    """리포트 마커 위치 탐색 (스트리밍 중 placeholder 갱신 판단용)"""
+
+    def test_should_return_marker_index(self):
+        # [Happy] Given: 분석 텍스트 뒤 마커
+        output = "분석...\n\U0001f4ca 일정 요약"
+        # When/Then
+        assert find_report_start(output) == output.index("\U0001f4ca")
+
+    def test_should_return_minus_one_when_no_marker(self):
+        # [Boundary] Given: 마커 없는 중간 출력
+        assert find_report_start("MCP 호출 중...") == -1
+
+
+def _extract_streaming(blocks: list[str]) -> str:
+    extractor = ReportMarkerExtractor()
+    for block in blocks:
+        extractor.feed(block)
+    return extractor.getvalue()
+
+
+class TestReportMarkerExtractor:
+    """스트리밍 추출기 — 마지막 마커 이후만 보관, 블록 경계 마커 인식"""
+
+    def test_should_drop_analysis_before_marker(self):
+        # [Happy] Given: 중간 분석 블록들 뒤 마커 블록
+        blocks = ["분석 1", "분석 2", "*\U0001f4ca 일정 요약*", "- 항목1"]
+        # When/Then: extract_report_content와 같은 결과
+        assert _extract_streaming(blocks) == "*\U0001f4ca 일정 요약*\n- 항목1"
+        assert _extract_streaming(blocks) == extract_report_content("\n".join(blocks))
+
+    def test_should_keep_from_last_marker(self):
+        # [Happy] Given: 초안 리포트 후 최종 리포트가 다시 나오는 transcript
+        blocks = ["\U0001f4ca 일정 요약 초안", "수정 중...", "\U0001f4ca 일정 요약 최종"]
+        # When/Then
+        assert _extract_streaming(blocks) == "\U0001f4ca 일정 요약 최종"
+
+    @pytest.mark.parametrize("split", range(1, len("*:bar_chart: 일정 요약*")))
+    def test_should_detect_marker_split_across_blocks(self, split):
+        # [Boundary] Given: 마커가 블록 두 개에 걸쳐 나뉨 (separator 없이 이어지는 delta)
+        marker = "*:bar_chart: 일정 요약*"
+        extractor = ReportMarkerExtractor(separator="")
+        # When
+        for block in ["분석...\n" + marker[:split], marker[split:] + " 본문"]:
+            extractor.feed(block)
+        # Then
+        assert extractor.found is True
+        assert extractor.getvalue() == marker + " 본문"
+
+    @pytest.mark.parametrize("marker", _REPORT_MARKERS)
+    @pytest.mark.parametrize("separator", ["\n", ""])
+    def test_should_keep_marker_that_ends_a_block_when_next_block_follows(self, marker, separator):
+        # [Boundary] Given: 블록이 마커로 끝나고 다음 블록이 이어짐 (마커가 carry 안에 통째로 남음)
+        blocks = ["분석...\n" + marker, "*[개발]*\n───", "- 항목"]
+        extractor = ReportMarkerExtractor(separator=separator)
+        # When
+        for block in blocks:
+            extractor.feed(block)
+        # Then: joined 텍스트의 마지막 마커부터 (앞의 "*" 등이 잘리지 않음)
+        joined = separator.join(blocks)
+        assert extractor.getvalue() == joined[joined.rindex(marker):]
+
+    def test_should_match_last_marker_rule_on_random_blocks(self):
+        # [Boundary] Given: 마커/마커 조각이 무작위로 섞인 블록들 — 기준: joined 텍스트의 마지막 마커.
+        # 마커끼리 "*"를 공유해 겹치지 않도록 마커 앞에는 공백을 둔다
+        rng = random.Random(0)
+        pieces = [" " + m for m in _REPORT_MARKERS] + ["요약", " ", "x", "\n", ":bar_chart:", "일정", "\U0001f4ca"]
+        for _ in range(2000):
+            blocks = [
+                "".join(rng.choice(pieces) for _ in range(rng.randint(0, 4)))
+                for _ in range(rng.randint(1, 5))
+            ]
+            separator = rng.choice(["\n", ""])
+            extractor = ReportMarkerExtractor(separator=separator)
+            for block in blocks:
+                extractor.feed(block)
+            joined = separator.join(blocks)
+            last = None
+            for last in _REPORT_MARKER_PATTERN.finditer(joined):
+                pass
+            # Then
+            assert extractor.getvalue() == (joined[last.start():] if last else joined), blocks
+
+    def test_should_keep_whole_text_when_no_marker(self):
+        # [Boundary] Given: 마커 없는 출력 — fallback용 전체 보관
+        extractor = ReportMarkerExtractor()
+        for block in ["a", "b"]:
+            extractor.feed(block)
+        # Then
+        assert extractor.found is False
+        assert extractor.getvalue() == "a\nb"
+
+    def test_should_return_empty_string_before_any_block(self):
+        # [Boundary]
+        assert ReportMarkerExtractor().getvalue() == ""
+
+
+class TestExtractJiraKeys:
+    """Confluence storage HTML에서 JIRA 티켓 key 추출"""
+
+    # ---------- [Happy] ----------
+    def test_should_extract_keys_from_jira_macro_and_browse_links(self):
+        # Given: JIRA 매크로 + /browse 링크
+        html = (
+            '<ac:structured-macro ac:name="jira">'
+            '<ac:parameter ac:name="key">MAI-101</ac:parameter></ac:structured-macro>'
+            '<a href="https://x.atlassian.net/browse/OPS-7">OPS-7</a>'
+        )
+        # When/Then
+        assert extract_jira_keys(html) == ["MAI-101", "OPS-7"]
+
+    # ---------- [Boundary] ----------
+    def test_should_dedupe_keys_preserving_first_appearance(self):
+        html = (
+            '<ac:parameter ac:name="key">MAI-2</ac:parameter>'
+            '<a href="/browse/MAI-1">x</a>'
+            '<ac:parameter ac:name="key"> MAI-2 </ac:parameter>'
+        )
+        assert extract_jira_keys(html) == ["MAI-2", "MAI-1"]
+
+    def test_should_ignore_plain_text_and_other_macro_params(self):
+        html = '<p>MAI-3 언급</p><ac:parameter ac:name="columns">key,summary</ac:parameter>'
+        assert extract_jira_keys(html) == []
+
+
+class TestFormatReportContext:
+    """사전 조회 컨텍스트 → 프롬프트 블록"""
+
+    # ---------- [Happy] ----------
+    def test_should_render_page_and_issue_lines(self):
+        # Given
+        context = ReportContext(
+            page_title="2026.01.26 ~ 01.30",
+            page_url="https://x/wiki/spaces/MAI/pages/1/t",
+            page_body="<table>body</table>",
+            issues=(JiraIssue("MAI-1", "로그인 개선", "In Progress", ("1.2.0",)),),
+        )
+        # When
+        block = format_report_context(context)
+        # Then
+        assert block.startswith("<prefetched_context>")
+        assert block.endswith("</prefetched_context>")
+        assert "## Confluence page: 2026.01.26 ~ 01.30" in block
+        assert "<table>body</table>" in block
+        assert "- MAI-1 | status: In Progress | fixVersions: 1.2.0 | summary: 로그인 개선" in block
+        assert "조회하지 못한 티켓" not in block
+
+    # ---------- [Boundary] ----------
+    def test_should_list_missing_keys_and_placeholder_for_empty_fix_versions(self):
+        context = ReportContext(
+            page_title="t", page_url="u", page_body="",
+            issues=(JiraIssue("MAI-1", "s", "Done"),),
+            missing_issue_keys=("MAI-9", "OPS-2"),
+        )
+        block = format_report_context(context)
+        assert "조회하지 못한 티켓만 MCP로 확인하라: MAI-9, OPS-2" in block
+        assert "fixVersions: - |" in block
+
+    def test_should_group_ticket_mentions_by_member_and_day(self):
+        context = ReportContext(
+            page_title="t", page_url="u", page_body="",
+            mentions=(
+                TicketMention("MAI-1", "@홍길동", "01.26"),
+                TicketMention("MAI-2", "@홍길동", "01.26"),
+                TicketMention("MAI-1", "@김철수", "01.27"),
+            ),
+        )
+        block = format_report_context(context)
+        assert "- @홍길동 | 01.26: MAI-1, MAI-2\n- @김철수 | 01.27: MAI-1" in block
+
+
+class TestFindReportViolations:
+    """daily 리포트 구조 검사 (rubric D1/D2)"""
+
+    _VALID = "*\U0001f4ca 일정 요약*\n\n*[제품A]*\n- MAI-1 진행 중 ([링크](https://x))\n───"
+
+    # ---------- [Happy] ----------
+    def test_should_accept_slack_formatted_report(self):
+        assert find_report_violations(self._VALID) == []
+
+    # ---------- [Boundary] ----------
+    @pytest.mark.parametrize(
+        "report,violation",
+        [
+            ("*[제품A]*\n───", "missing report marker"),
+            (_VALID + "\n| 이름 | 상태 |", "markdown table"),
+            (_VALID + "\n## 제품A", "markdown heading"),
+            ("\U0001f4ca 일정 요약\n───", "missing *[category]* header"),
+            ("\U0001f4ca 일정 요약\n*[제품A]*", "missing divider"),
+        ],
+    )
+    def test_should_report_each_violation(self, report, violation):
+        assert violation in find_report_violations(report)
@@ -0,0 +1,92 @@
+"""AsyncConfluenceAdapter 테스트 — 로컬 Confluence 대역 서버 상대로 동시 요청 제한 확인.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import time
+
+import anyio
+import pytest
+import requests
+
+from src.infrastructure.adapters.async_confluence_adapter import AsyncConfluenceAdapter
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+from tests.fakes.fake_confluence_server import FakeConfluenceServer
+
+_TITLE = "2026.04.06 ~ 04.10"
+
+
+@pytest.fixture
+def server():
+    with FakeConfluenceServer(latency=0.05) as fake:
+        fake.add_page("MAI", _TITLE, "<p>old</p>")
+        yield fake
+
+
+def _adapter(server: FakeConfluenceServer, max_concurrency: int) -> AsyncConfluenceAdapter:
+    sync = ConfluenceAdapter(url=server.url, user="u", token="t", pool_size=max_concurrency)
+    return AsyncConfluenceAdapter(sync, max_concurrency=max_concurrency)
+
+
+async def _lookup_many(adapter: AsyncConfluenceAdapter, count: int) -> list[dict]:
+    results: list[dict] = []
+
+    async def lookup() -> None:
+        results.append(await adapter.get_pages_by_titles("MAI", [_TITLE], expand_body=True))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(lookup)
+    return results
+
+
+class TestAsyncConfluenceAdapter:
+    # ---------- [Happy] ----------
+    def test_should_run_requests_concurrently_up_to_limit(self, server):
+        # Given: 동시 4개까지 허용
+        adapter = _adapter(server, max_concurrency=4)
+
+        # When: 요청 8개 (각 50ms)
+        started = time.perf_counter()
+        results = anyio.run(_lookup_many, adapter, 8)
+        elapsed = time.perf_counter() - started
+
+        # Then: 4개씩 2묶음 — 순차(400ms)보다 빠르고, 연결은 동시 수만큼만 연다
+        assert [r[_TITLE]["content"] for r in results] == ["<p>old</p>"] * 8
+        assert elapsed < 0.35
+        assert adapter.http_stats().connections <= 4
+
+    def test_should_create_page_with_cached_space_id(self, server):
+        adapter = _adapter(server, max_concurrency=2)
+
+        async def create() -> str:
+            await adapter.get_space_id("MAI")
+            return await adapter.create_page("MAI", "new", "<p/>", "1")
+
+        url = anyio.run(create)
+
+        assert url.endswith("/spaces/MAI/pages/" + server.pages()[-1]["id"] + "/new")
+        assert [r for r in server.requests if "spaces" in r[1]] == [("GET", "/wiki/api/v2/spaces")]
+
+    # ---------- [Boundary] ----------
+    def test_should_serialize_requests_with_limit_one(self, server):
+        adapter = _adapter(server, max_concurrency=1)
+
+        started = time.perf_counter()
+        anyio.run(_lookup_many, adapter, 3)
+
+        assert time.perf_counter() - started >= 0.15
+        assert adapter.http_stats().connections == 1
+
+    def test_should_work_across_separate_event_loops(self, server):
+        # Given: 같은 어댑터로 anyio.run 두 번 (limiter는 루프별로 새로 만든다)
+        adapter = _adapter(server, max_concurrency=2)
+        assert len(anyio.run(_lookup_many, adapter, 2)) == 2
+        assert len(anyio.run(_lookup_many, adapter, 2)) == 2
+
+    # ---------- [Error] ----------
+    def test_should_propagate_http_errors(self, server):
+        adapter = _adapter(server, max_concurrency=2)
+        server.fail_statuses = [500]
+        with pytest.raises(requests.HTTPError):
+            anyio.run(adapter.get_pages_by_titles, "MAI", [_TITLE])
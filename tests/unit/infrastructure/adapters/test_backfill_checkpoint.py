@@ -0,0 +1,44 @@
+"""backfill 진행 기록(JSON) 테스트.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+from src.infrastructure.adapters.backfill_checkpoint import JsonBackfillCheckpoint
+
+
+class TestJsonBackfillCheckpoint:
+    # ---------- [Happy] ----------
+    def test_should_persist_progress_across_instances(self, tmp_path):
+        # Given: 두 주 생성 기록
+        path = tmp_path / "backfill" / "MAI.json"
+        checkpoint = JsonBackfillCheckpoint(path)
+        checkpoint.record("2026.04.13 ~ 04.17", "url/1", "<p>1</p>")
+        checkpoint.record("2026.04.20 ~ 04.24", "url/2", "<p>2</p>")
+
+        # When: 재실행이 새로 읽으면
+        resumed = JsonBackfillCheckpoint(path)
+
+        # Then: 생성한 제목 전부 + 마지막 본문
+        assert resumed.created_titles() == {"2026.04.13 ~ 04.17", "2026.04.20 ~ 04.24"}
+        assert resumed.last_created() == ("2026.04.20 ~ 04.24", "<p>2</p>")
+
+    # ---------- [Boundary] ----------
+    def test_should_start_empty_without_file(self, tmp_path):
+        checkpoint = JsonBackfillCheckpoint(tmp_path / "none.json")
+        assert checkpoint.created_titles() == set()
+        assert checkpoint.last_created() is None
+
+    def test_should_remove_file_on_clear(self, tmp_path):
+        path = tmp_path / "MAI.json"
+        checkpoint = JsonBackfillCheckpoint(path)
+        checkpoint.record("t", "u", "c")
+        checkpoint.clear()
+        assert not path.exists()
+        assert checkpoint.created_titles() == set()
+
+    # ---------- [Error] ----------
+    def test_should_ignore_corrupt_file(self, tmp_path, capsys):
+        path = tmp_path / "MAI.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert JsonBackfillCheckpoint(path).created_titles() == set()
+        assert "WARNING: ignoring unreadable backfill checkpoint" in capsys.readouterr().out
@@ -1,9 +1,11 @@
 """CLI 실행기 테스트 — Claude는 claude-agent-sdk mock."""
 
+import inspect
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
 from claude_agent_sdk import (
     AssistantMessage,
@@ -16,7 +18,12 @@ from claude_agent_sdk import (
     ToolUseBlock,
 )
 
-from src.infrastructure.adapters.cli_executors import ClaudeCLIExecutor
+from src.domain.models import StreamRestart
+from src.infrastructure.adapters.cli_executors import (
+    ClaudeCLIExecutor,
+    WarmClaudeExecutor,
+    WarmClaudeSession,
+)
 
 
 # ----------------------------- 헬퍼 -----------------------------
@@ -29,6 +36,20 @@ def _assistant(*texts: str) -> AssistantMessage:
     )
 
 
+def _result(**overrides) -> ResultMessage:
+    """실행 종료 ResultMessage 생성 (기본: 성공, 비용/토큰 포함)."""
+    fields = dict(
+        subtype="success", duration_ms=93_000, duration_api_ms=61_000, is_error=False,
+        num_turns=7, session_id="s-1", total_cost_usd=0.42,
+        usage={
+            "input_tokens": 1200, "output_tokens": 800,
+            "cache_creation_input_tokens": 300, "cache_read_input_tokens": 9000,
+        },
+    )
+    fields.update(overrides)
+    return ResultMessage(**fields)
+
+
 def _make_fake_query(messages, captured: dict | None = None):
     """SDK query를 흉내내는 async generator factory.
 
@@ -292,3 +313,710 @@ class TestClaudeCLIExecutor:
             # Then: RuntimeError 전파
             with pytest.raises(RuntimeError, match="boom"):
                 ClaudeCLIExecutor().execute("MAI")
+
+
+class TestClaudeCLIExecutorAsync:
+    """execute_async — 호출자 이벤트 루프 안에서 실행 (batch fan-out용)."""
+
+    def test_should_return_output_inside_running_event_loop(self):
+        # Given/When: 이미 실행 중인 루프에서 execute_async await
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("async ok")]),
+        ):
+            result = anyio.run(ClaudeCLIExecutor().execute_async, "MAI")
+        # Then
+        assert result == "async ok"
+
+    def test_should_return_none_on_sdk_error(self):
+        # Given: SDK 예외
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_raising_query(ProcessError("subprocess died")),
+        ):
+            result = anyio.run(ClaudeCLIExecutor().execute_async, "MAI")
+        # Then
+        assert result is None
+
+    def test_should_stream_text_blocks_as_they_arrive(self):
+        # Given: 메시지 2개에 걸친 text block 3개
+        async def collect():
+            return [t async for t in ClaudeCLIExecutor().stream("MAI")]
+
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("분석", "\U0001f4ca 일정 요약"), _assistant("- 작업1")]),
+        ):
+            # When
+            chunks = anyio.run(collect)
+        # Then: 조각 단위로 순서대로 yield
+        assert chunks == ["분석", "\U0001f4ca 일정 요약", "- 작업1"]
+
+    def test_should_drop_intermediate_analysis_before_report_marker(self):
+        # Given: 마커 앞의 중간 분석 블록
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("분석 1", "분석 2"), _assistant("\U0001f4ca 일정 요약", "- 작업1")]),
+        ):
+            # When
+            result = anyio.run(ClaudeCLIExecutor().execute_async, "MAI")
+        # Then: 마지막 마커부터만 반환
+        assert result == "\U0001f4ca 일정 요약\n- 작업1"
+
+
+class TestClaudeCLIExecutorMetrics:
+    """ResultMessage → RunMetrics 기록."""
+
+    # ---------- [Happy] ----------
+    def test_should_record_cost_tokens_and_latency_from_result_message(self):
+        # Given: 출력 + ResultMessage, 메트릭 저장소
+        store = MagicMock()
+        executor = ClaudeCLIExecutor(command="weekly_report", model="opus", metrics_store=store)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("본문"), _result()]),
+        ):
+            # When
+            result = executor.execute("MAI")
+        # Then: 출력은 그대로, 메트릭 1건 기록
+        assert result == "본문"
+        metrics = store.append.call_args.args[0]
+        assert (metrics.mode, metrics.model, metrics.space_key) == ("weekly", "opus", "MAI")
+        assert (metrics.duration_ms, metrics.duration_api_ms, metrics.num_turns) == (93_000, 61_000, 7)
+        assert metrics.cost_usd == 0.42
+        assert (metrics.input_tokens, metrics.output_tokens) == (1200, 800)
+        assert (metrics.cache_creation_input_tokens, metrics.cache_read_input_tokens) == (300, 9000)
+
+    # ---------- [Boundary] ----------
+    def test_should_default_missing_usage_and_cost(self):
+        # Given: usage/비용 미보고
+        store = MagicMock()
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_result(usage=None, total_cost_usd=None)]),
+        ):
+            ClaudeCLIExecutor(metrics_store=store).execute("MAI")
+        # Then
+        metrics = store.append.call_args.args[0]
+        assert metrics.cost_usd is None
+        assert metrics.input_tokens == 0
+        assert metrics.mode == "daily"
+        assert metrics.model == "sonnet"
+
+    # ---------- [Error] ----------
+    def test_should_keep_output_when_metrics_store_fails(self, capsys):
+        # Given: 저장소 append 예외
+        store = MagicMock()
+        store.append.side_effect = OSError("disk full")
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("본문"), _result()]),
+        ):
+            result = ClaudeCLIExecutor(metrics_store=store).execute("MAI")
+        # Then: 리포트는 정상, 경고만 출력
+        assert result == "본문"
+        assert "WARNING: failed to record run metrics" in capsys.readouterr().out
+
+
+def _make_model_query(hanging_models: set[str], closed: list[str] | None = None):
+    """모델별로 동작하는 fake query — hanging_models는 응답 없이 대기(취소될 때까지)."""
+
+    async def fake(**kwargs):
+        model = kwargs["options"].model
+        try:
+            if model in hanging_models:
+                await anyio.sleep(30)
+            yield _assistant(f"\U0001f4ca 일정 요약 by {model}")
+            yield _result()
+        finally:
+            if closed is not None:
+                closed.append(model)
+
+    return fake
+
+
+class TestClaudeCLIExecutorDeadline:
+    """deadline 초과 시 취소 + 더 빠른 모델로 fallback."""
+
+    # ---------- [Happy] ----------
+    def test_should_fall_back_to_faster_model_when_attempt_exceeds_budget(self, capsys):
+        # Given: opus는 멈춤, reserve 0.3s × fallback 2개 → opus 예산 0.1s
+        store = MagicMock()
+        closed: list[str] = []
+        executor = ClaudeCLIExecutor(
+            model="opus", metrics_store=store, deadline_seconds=0.7, fallback_reserve_seconds=0.3
+        )
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_model_query({"opus"}, closed),
+        ):
+            # When
+            result = executor.execute("MAI")
+        # Then: sonnet 결과, opus 시도는 취소(generator 정리)되고 timed_out으로 기록
+        assert result == "\U0001f4ca 일정 요약 by sonnet"
+        assert closed == ["opus", "sonnet"]
+        recorded = [c.args[0] for c in store.append.call_args_list]
+        assert [(m.model, m.timed_out) for m in recorded] == [("opus", True), ("sonnet", False)]
+        out = capsys.readouterr().out
+        assert "Attempt 1/3 model=opus: timed out" in out
+        assert "Attempt 2/3 model=sonnet: completed" in out
+
+    def test_should_run_single_attempt_without_timeout_when_fast(self, capsys):
+        # Given: 예산 안에 끝나는 실행
+        executor = ClaudeCLIExecutor(model="sonnet", deadline_seconds=5, fallback_reserve_seconds=1)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query", new=_make_model_query(set())
+        ):
+            result = executor.execute("MAI")
+        # Then
+        assert result == "\U0001f4ca 일정 요약 by sonnet"
+        assert "Attempt 1/2 model=sonnet: completed" in capsys.readouterr().out
+
+    def test_should_signal_restart_when_stream_falls_back(self):
+        # Given: opus는 마커 있는 부분 출력 후 멈춤, sonnet은 마커 없이 완료
+        async def fake(**kwargs):
+            model = kwargs["options"].model
+            if model == "opus":
+                yield _assistant("\U0001f4ca 일정 요약 (opus 부분)")
+                await anyio.sleep(30)
+            yield _assistant("sonnet 본문")
+            yield _result()
+
+        executor = ClaudeCLIExecutor(model="opus", deadline_seconds=0.7, fallback_reserve_seconds=0.3)
+
+        async def collect():
+            return [t async for t in executor.stream("MAI")]
+
+        with patch("src.infrastructure.adapters.cli_executors.query", new=fake):
+            # When
+            chunks = anyio.run(collect)
+        # Then: sonnet 시도 전에 재시작 신호 — 소비자가 opus 부분 출력을 버릴 수 있다
+        assert chunks == [
+            "\U0001f4ca 일정 요약 (opus 부분)",
+            StreamRestart(attempt=1, model="sonnet"),
+            "sonnet 본문",
+        ]
+
+    # ---------- [Boundary] ----------
+    def test_should_not_fall_back_for_model_outside_chain(self):
+        # Given: 체인에 없는 전체 모델 ID는 fallback 없이 deadline만 적용
+        executor = ClaudeCLIExecutor(
+            model="claude-opus-4-1", deadline_seconds=0.1, fallback_reserve_seconds=0.05
+        )
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_model_query({"claude-opus-4-1"}),
+        ):
+            # When/Then
+            assert executor.execute("MAI") is None
+
+    def test_should_not_fall_back_when_reserve_is_zero(self, capsys):
+        # Given: reserve 0 — deadline만 적용 (회귀 실행처럼 모델을 바꾸면 안 되는 경우)
+        store = MagicMock()
+        executor = ClaudeCLIExecutor(
+            model="opus", metrics_store=store, deadline_seconds=0.1, fallback_reserve_seconds=0
+        )
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query", new=_make_model_query({"opus"})
+        ):
+            # When
+            result = executor.execute("MAI")
+        # Then: 더 빠른 모델로 다시 돌리지 않고 실패
+        assert result is None
+        assert [c.args[0].model for c in store.append.call_args_list] == ["opus"]
+        assert "Attempt 1/1 model=opus: timed out" in capsys.readouterr().out
+
+    def test_should_skip_attempt_whose_budget_is_already_spent(self, capsys):
+        # Given: reserve가 deadline보다 커서 opus/sonnet 예산이 0 이하
+        executor = ClaudeCLIExecutor(model="opus", deadline_seconds=1, fallback_reserve_seconds=1)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query", new=_make_model_query(set())
+        ):
+            result = executor.execute("MAI")
+        # Then: haiku만 실행
+        assert result == "\U0001f4ca 일정 요약 by haiku"
+        assert "Attempt 1/3 model=opus: skipped" in capsys.readouterr().out
+
+    # ---------- [Error] ----------
+    def test_should_return_none_when_every_attempt_times_out(self, capsys):
+        # Given: 모든 모델 멈춤
+        executor = ClaudeCLIExecutor(model="sonnet", deadline_seconds=0.2, fallback_reserve_seconds=0.1)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_model_query({"sonnet", "haiku"}),
+        ):
+            result = executor.execute("MAI")
+        # Then
+        assert result is None
+        assert "ERROR: claude run exceeded its deadline" in capsys.readouterr().out
+
+    def test_should_raise_timeout_from_stream_when_deadline_exhausted(self):
+        # Given: 스트리밍 경로는 호출자(use case)가 실패 처리하도록 예외 전파
+        executor = ClaudeCLIExecutor(model="haiku", deadline_seconds=0.1)
+
+        async def collect():
+            return [t async for t in executor.stream("MAI")]
+
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_model_query({"haiku"}),
+        ):
+            with pytest.raises(TimeoutError):
+                anyio.run(collect)
+
+
+
+class TestClaudeCLIExecutorContextProvider:
+    """context_provider — 사전 조회한 리포트 입력을 프롬프트에 주입."""
+
+    # ---------- [Happy] ----------
+    def test_should_append_prefetched_context_after_command_line(self):
+        # Given: provider가 컨텍스트 블록 반환
+        calls = []
+
+        async def provider(space_key, report_date):
+            calls.append((space_key, report_date))
+            return "<prefetched_context>...</prefetched_context>"
+
+        captured: dict = {}
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok")], captured=captured),
+        ):
+            # When
+            ClaudeCLIExecutor(context_provider=provider).execute("MAI", report_date=date(2026, 1, 27))
+        # Then: 슬래시 커맨드 줄 뒤에 컨텍스트, provider는 space/날짜로 호출
+        assert captured["prompt"] == (
+            "/daily_report MAI --date 2026-01-27\n\n<prefetched_context>...</prefetched_context>"
+        )
+        assert calls == [("MAI", date(2026, 1, 27))]
+
+    # ---------- [Boundary] ----------
+    def test_should_keep_plain_prompt_when_provider_returns_none(self):
+        # Given: 페이지 미존재 등으로 provider가 None
+        async def provider(space_key, report_date):
+            return None
+
+        captured: dict = {}
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok")], captured=captured),
+        ):
+            ClaudeCLIExecutor(context_provider=provider).execute("MAI")
+        # Then
+        assert captured["prompt"] == "/daily_report MAI"
+
+    # ---------- [Error] ----------
+    def test_should_run_without_context_when_provider_fails(self, capsys):
+        # Given: prefetch 중 네트워크 오류
+        async def provider(space_key, report_date):
+            raise ConnectionError("confluence down")
+
+        captured: dict = {}
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok")], captured=captured),
+        ):
+            result = ClaudeCLIExecutor(context_provider=provider).execute("MAI")
+        # Then: 기존 MCP 조회 경로로 실행 계속
+        assert result == "ok"
+        assert captured["prompt"] == "/daily_report MAI"
+        assert "WARNING: context prefetch failed (ConnectionError" in capsys.readouterr().out
+
+
+
+_COMMAND_FILE = """---
+description: daily report
+---
+# Daily report
+인자: $ARGUMENTS
+형식 규칙: 표 금지
+"""
+
+
+class TestClaudeCLIExecutorSplitPrompt:
+    """command_file — 고정 커맨드 본문은 system prompt, 가변 인자는 사용자 메시지."""
+
+    # ---------- [Happy] ----------
+    def test_should_move_command_body_to_system_prompt_append(self, tmp_path):
+        # Given: frontmatter 포함 커맨드 파일
+        command_file = tmp_path / "daily_report.md"
+        command_file.write_text(_COMMAND_FILE, encoding="utf-8")
+        captured: dict = {}
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok")], captured=captured),
+        ):
+            # When
+            ClaudeCLIExecutor(command_file=command_file).execute(
+                "MAI", "@hong", date(2026, 1, 27)
+            )
+        # Then: system prompt = preset + 커맨드 본문(frontmatter 제외, $ARGUMENTS 치환)
+        system_prompt = captured["options"].system_prompt
+        assert system_prompt["preset"] == "claude_code"
+        assert system_prompt["exclude_dynamic_sections"] is True
+        assert system_prompt["append"] == (
+            '<report_command name="daily_report">\n# Daily report\n'
+            "인자: (사용자 메시지의 <arguments> 값)\n형식 규칙: 표 금지\n</report_command>"
+        )
+        # 사용자 메시지에는 가변 인자만
+        assert captured["prompt"].endswith(
+            '<arguments>MAI "@hong" --date 2026-01-27</arguments>'
+        )
+        assert "daily report" not in captured["prompt"]
+
+    def test_should_run_on_sdk_that_forwards_exclude_dynamic_sections(self):
+        # Given: 설치된 SDK (pyproject 최소 버전 이상)
+        from claude_agent_sdk.types import SystemPromptPreset
+        from claude_agent_sdk._internal.query import Query
+
+        # Then: preset 키를 선언하고 initialize 요청으로 넘긴다 — 아니면 고정 prompt 캐시가 깨진다
+        assert "exclude_dynamic_sections" in SystemPromptPreset.__annotations__
+        assert "exclude_dynamic_sections" in inspect.signature(Query.__init__).parameters
+
+    def test_should_keep_system_prompt_identical_across_dates(self, tmp_path):
+        # Given: 같은 커맨드 파일로 다른 날짜 2회 실행
+        command_file = tmp_path / "daily_report.md"
+        command_file.write_text(_COMMAND_FILE, encoding="utf-8")
+        executor = ClaudeCLIExecutor(command_file=command_file)
+        captured = [{}, {}]
+        for i, day in enumerate((27, 28)):
+            with patch(
+                "src.infrastructure.adapters.cli_executors.query",
+                new=_make_fake_query([_assistant("ok")], captured=captured[i]),
+            ):
+                executor.execute("MAI", report_date=date(2026, 1, day))
+        # Then: cache prefix(system prompt)는 동일, 사용자 메시지만 다름
+        assert captured[0]["options"].system_prompt == captured[1]["options"].system_prompt
+        assert captured[0]["prompt"] != captured[1]["prompt"]
+
+    # ---------- [Boundary] ----------
+    def test_should_fall_back_to_slash_command_when_file_missing(self, tmp_path):
+        captured: dict = {}
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok")], captured=captured),
+        ):
+            ClaudeCLIExecutor(command_file=tmp_path / "missing.md").execute("MAI")
+        assert captured["prompt"] == "/daily_report MAI"
+        assert captured["options"].system_prompt is None
+
+    def test_should_log_cache_read_and_write_tokens(self, capsys):
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok"), _result()]),
+        ):
+            ClaudeCLIExecutor().execute("MAI")
+        assert "cache(read/write)=9000/300" in capsys.readouterr().out
+
+
+
+_VALID_REPORT = "*\U0001f4ca 일정 요약*\n*[제품A]*\n- MAI-1 진행 중\n───"
+_TABLE_REPORT = "*\U0001f4ca 일정 요약*\n| 이름 | 상태 |\n|---|---|"
+
+
+def _make_race_query(script: dict, closed: list[str] | None = None):
+    """모델별 (지연 초, 출력) — 출력이 예외면 raise. 취소/종료 시 closed에 기록."""
+
+    async def fake(**kwargs):
+        model = kwargs["options"].model
+        delay, output = script[model]
+        try:
+            await anyio.sleep(delay)
+            if isinstance(output, BaseException):
+                raise output
+            yield _assistant(output)
+            yield _result()
+        finally:
+            if closed is not None:
+                closed.append(model)
+
+    return fake
+
+
+class TestClaudeCLIExecutorRace:
+    """race_models — 여러 모델 동시 실행, 구조 검사를 먼저 통과한 출력 채택."""
+
+    def _outcomes(self, store) -> dict:
+        return {
+            call.args[0].model: (call.args[0].race_outcome, call.args[0].race_delta_ms)
+            for call in store.append.call_args_list
+        }
+
+    # ---------- [Happy] ----------
+    def test_should_take_first_valid_output_and_cancel_the_rest(self, capsys):
+        # Given: haiku가 먼저 유효한 리포트, sonnet은 느림
+        store = MagicMock()
+        closed: list[str] = []
+        executor = ClaudeCLIExecutor(race_models=("haiku", "sonnet"), metrics_store=store)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({"haiku": (0, _VALID_REPORT), "sonnet": (30, _VALID_REPORT)}, closed),
+        ):
+            # When
+            result = executor.execute("MAI")
+        # Then: haiku 출력 채택, sonnet은 취소(서브프로세스 정리)
+        assert result == _VALID_REPORT
+        assert sorted(closed) == ["haiku", "sonnet"]
+        outcomes = self._outcomes(store)
+        assert outcomes["haiku"] == ("won", 0)
+        assert outcomes["sonnet"] == ("lost", None)
+        assert "Race winner model=haiku" in capsys.readouterr().out
+
+    def test_should_skip_invalid_output_and_wait_for_valid_one(self):
+        # Given: haiku는 빠르지만 마크다운 표 사용(D1 위반)
+        store = MagicMock()
+        executor = ClaudeCLIExecutor(race_models=("haiku", "sonnet"), metrics_store=store)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({"haiku": (0, _TABLE_REPORT), "sonnet": (0.05, _VALID_REPORT)}),
+        ):
+            result = executor.execute("MAI")
+        # Then: sonnet 채택, haiku는 invalid로 기록 (우승자보다 앞서 완료 → 음수 delta)
+        assert result == _VALID_REPORT
+        outcomes = self._outcomes(store)
+        assert outcomes["sonnet"] == ("won", 0)
+        assert outcomes["haiku"][0] == "invalid"
+        assert outcomes["haiku"][1] < 0
+
+    def test_should_stream_winner_output_as_single_chunk(self):
+        executor = ClaudeCLIExecutor(race_models=("haiku", "sonnet"))
+
+        async def collect():
+            return [t async for t in executor.stream("MAI")]
+
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({"haiku": (0, _VALID_REPORT), "sonnet": (30, _VALID_REPORT)}),
+        ):
+            assert anyio.run(collect) == [_VALID_REPORT]
+
+    # ---------- [Boundary] ----------
+    def test_should_fall_back_to_first_listed_model_when_none_valid(self, capsys):
+        # Given: 둘 다 표 사용
+        executor = ClaudeCLIExecutor(race_models=("sonnet", "haiku"))
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({
+                "sonnet": (0.05, _TABLE_REPORT + " sonnet"), "haiku": (0, _TABLE_REPORT + " haiku"),
+            }),
+        ):
+            result = executor.execute("MAI")
+        # Then: race_models 순서상 먼저인 sonnet
+        assert result.endswith("sonnet")
+        assert "WARNING: no raced output passed validation — using model=sonnet" in capsys.readouterr().out
+
+    def test_should_not_race_with_single_model(self):
+        captured: dict = {}
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_fake_query([_assistant("ok")], captured=captured),
+        ):
+            result = ClaudeCLIExecutor(race_models=("haiku",)).execute("MAI")
+        assert result == "ok"
+        assert captured["options"].model == "sonnet"
+
+    # ---------- [Error] ----------
+    def test_should_record_failed_model_and_use_other(self):
+        store = MagicMock()
+        executor = ClaudeCLIExecutor(race_models=("haiku", "sonnet"), metrics_store=store)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({"haiku": (0, ProcessError("died")), "sonnet": (0.05, _VALID_REPORT)}),
+        ):
+            result = executor.execute("MAI")
+        assert result == _VALID_REPORT
+        assert self._outcomes(store)["haiku"][0] == "failed"
+
+    def test_should_return_none_when_race_exceeds_deadline(self, capsys):
+        executor = ClaudeCLIExecutor(race_models=("haiku", "sonnet"), deadline_seconds=0.1)
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({"haiku": (30, _VALID_REPORT), "sonnet": (30, _VALID_REPORT)}),
+        ):
+            result = executor.execute("MAI")
+        assert result is None
+        assert "ERROR: every raced model failed or was cancelled" in capsys.readouterr().out
+
+    def test_should_record_all_timeout_race_as_timed_out_not_lost(self):
+        # Given: 우승자 없이 모든 참가자가 경주 deadline으로 취소
+        store = MagicMock()
+        executor = ClaudeCLIExecutor(
+            race_models=("haiku", "sonnet"), deadline_seconds=0.1, metrics_store=store
+        )
+        with patch(
+            "src.infrastructure.adapters.cli_executors.query",
+            new=_make_race_query({"haiku": (30, _VALID_REPORT), "sonnet": (30, _VALID_REPORT)}),
+        ):
+            # When
+            executor.execute("MAI")
+        # Then: "lost"(우승자에게 취소됨)가 아니라 timed_out 실패로 기록
+        recorded = [c.args[0] for c in store.append.call_args_list]
+        assert [(m.model, m.race_outcome, m.timed_out) for m in recorded] == [
+            ("haiku", "failed", True), ("sonnet", "failed", True),
+        ]
+
+
+class _FakeSDKClient:
+    """ClaudeSDKClient 대역 — query/receive_response 호출 기록."""
+
+    instances: list["_FakeSDKClient"] = []
+
+    def __init__(self, options=None):
+        self.options = options
+        self.prompts: list[str] = []
+        self.models: list[str] = []
+        self.connected = False
+        self.fail_next = False
+        self.hang_next = False
+        _FakeSDKClient.instances.append(self)
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def set_model(self, model):
+        self.models.append(model)
+
+    async def query(self, prompt):
+        if self.fail_next:
+            raise ProcessError("subprocess died")
+        self.prompts.append(prompt)
+
+    async def receive_response(self):
+        if self.hang_next:
+            await anyio.sleep(30)
+        yield _assistant(f"reply to {self.prompts[-1]}")
+        yield _result()
+
+
+class TestWarmClaudeSession:
+    """WarmClaudeSession — 데몬용 상주 SDK 세션 재사용."""
+
+    @pytest.fixture(autouse=True)
+    def _fake_client(self):
+        _FakeSDKClient.instances.clear()
+        with patch(
+            "src.infrastructure.adapters.cli_executors.ClaudeSDKClient", new=_FakeSDKClient
+        ):
+            yield
+
+    # ---------- [Happy] ----------
+    def test_should_connect_once_and_clear_between_jobs(self):
+        # Given
+        session = WarmClaudeSession()
+
+        async def scenario():
+            first = await session.run("/daily_report MAI")
+            warm_after_first = session.is_warm
+            second = await session.run("/daily_report OPS")
+            return first, warm_after_first, second
+
+        # When
+        first, warm_after_first, second = anyio.run(scenario)
+        # Then: 프로세스 1개 재사용, 두 번째 job 전에 /clear
+        assert len(_FakeSDKClient.instances) == 1
+        assert warm_after_first is True
+        assert _FakeSDKClient.instances[0].prompts == [
+            "/daily_report MAI", "/clear", "/daily_report OPS",
+        ]
+        assert first == "reply to /daily_report MAI"
+        assert second == "reply to /daily_report OPS"
+
+    def test_should_run_warm_executor_prompt_through_session(self):
+        # Given: WarmClaudeExecutor가 세션을 공유
+        session = WarmClaudeSession()
+        executor = WarmClaudeExecutor(session, command="weekly_report")
+        # When
+        result = anyio.run(executor.execute_async, "MAI")
+        # Then
+        assert result == "reply to /weekly_report MAI"
+
+    def test_should_stream_warm_executor_output_through_session(self):
+        # Given
+        executor = WarmClaudeExecutor(WarmClaudeSession(), command="daily_report")
+
+        async def collect():
+            return [t async for t in executor.stream("MAI")]
+
+        # When/Then
+        assert anyio.run(collect) == ["reply to /daily_report MAI"]
+
+    def test_should_prefix_stable_command_body_on_warm_session(self, tmp_path):
+        # Given: 상주 세션은 system prompt가 connect 시 고정 → 고정 본문을 메시지 앞에
+        command_file = tmp_path / "daily_report.md"
+        command_file.write_text(_COMMAND_FILE, encoding="utf-8")
+        executor = WarmClaudeExecutor(WarmClaudeSession(), command_file=command_file)
+        # When
+        anyio.run(executor.execute_async, "MAI")
+        # Then
+        prompt = _FakeSDKClient.instances[0].prompts[0]
+        assert prompt.startswith('<report_command name="daily_report">\n# Daily report')
+        assert prompt.endswith("<arguments>MAI</arguments>")
+
+    def test_should_record_metrics_for_job_but_not_for_clear(self):
+        # Given: 두 job 사이에 /clear가 끼는 warm 실행
+        store = MagicMock()
+        executor = WarmClaudeExecutor(WarmClaudeSession(), metrics_store=store)
+
+        async def scenario():
+            await executor.execute_async("MAI")
+            await executor.execute_async("OPS")
+
+        # When
+        anyio.run(scenario)
+        # Then: job당 1건, /clear 응답은 기록하지 않음
+        assert [c.args[0].space_key for c in store.append.call_args_list] == ["MAI", "OPS"]
+
+    # ---------- [Boundary] ----------
+    def test_should_switch_model_on_warm_session(self):
+        # Given: sonnet으로 연결된 세션
+        session = WarmClaudeSession()
+
+        async def scenario():
+            await session.run("a")
+            await session.run("b", model="haiku")
+
+        # When
+        anyio.run(scenario)
+        # Then: 재연결 없이 set_model
+        assert _FakeSDKClient.instances[0].options.model == "sonnet"
+        assert _FakeSDKClient.instances[0].models == ["haiku"]
+
+    # ---------- [Error] ----------
+    def test_should_discard_session_after_sdk_error(self):
+        # Given: 연결된 세션에서 SDK 프로세스 오류
+        session = WarmClaudeSession()
+
+        async def scenario():
+            await session.run("a")
+            _FakeSDKClient.instances[0].fail_next = True
+            with pytest.raises(ProcessError):
+                await session.run("b")
+            return session.is_warm
+
+        # When
+        warm = anyio.run(scenario)
+        # Then: 다음 job은 cold로 재연결
+        assert warm is False
+        assert _FakeSDKClient.instances[0].connected is False
+
+    def test_should_discard_session_when_deadline_cancels_job(self):
+        # Given: 연결된 세션에서 응답이 멈춘 job + deadline
+        session = WarmClaudeSession()
+        executor = WarmClaudeExecutor(session, model="haiku", deadline_seconds=0.1)
+
+        async def scenario():
+            await session.run("warmup")
+            _FakeSDKClient.instances[0].hang_next = True
+            result = await executor.execute_async("MAI")
+            return result, session.is_warm
+
+        # When
+        result, warm = anyio.run(scenario)
+        # Then: 실패 반환 + 끊긴 세션은 폐기 (다음 job은 cold)
+        assert result is None
+        assert warm is False
+        assert _FakeSDKClient.instances[0].connected is False
@@ -0,0 +1,170 @@
+"""ConfluenceAdapter 테스트 — 로컬 Confluence 대역 서버(tests/fakes) 상대로 실제 HTTP 호출.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import pytest
+import requests
+
+from src.infrastructure.adapters import rate_limit
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter, _cql_quote
+from src.infrastructure.adapters.confluence_id_cache import SpaceIdCache
+from tests.fakes.fake_confluence_server import FakeConfluenceServer
+
+OLD_TITLE = "2026.04.06 ~ 04.10"
+NEW_TITLE = "2026.04.13 ~ 04.17"
+
+
+@pytest.fixture
+def server():
+    with FakeConfluenceServer() as fake:
+        yield fake
+
+
+@pytest.fixture
+def adapter(server, tmp_path):
+    return ConfluenceAdapter(
+        url=server.url,
+        user="u",
+        token="t",
+        space_id_cache=SpaceIdCache(tmp_path / "ids.json"),
+    )
+
+
+class TestGetPagesByTitles:
+    # ---------- [Happy] ----------
+    def test_should_resolve_titles_and_body_in_one_request(self, server, adapter):
+        # Given: 이전 주 페이지만 존재
+        page_id = server.add_page("MAI", OLD_TITLE, "<table>old</table>")
+
+        # When
+        pages = adapter.get_pages_by_titles("MAI", [OLD_TITLE, NEW_TITLE], expand_body=True)
+
+        # Then: 요청 1회로 이전 주 페이지 + 본문, 없는 새 주는 키 없음
+        assert pages == {
+            OLD_TITLE: {
+                "id": page_id,
+                "title": OLD_TITLE,
+                "url": f"{server.url}/spaces/MAI/pages/{page_id}/{OLD_TITLE}",
+                "content": "<table>old</table>",
+            }
+        }
+        assert server.requests == [("GET", "/wiki/rest/api/content/search")]
+
+    def test_should_omit_content_when_body_not_expanded(self, server, adapter):
+        server.add_page("MAI", OLD_TITLE, "<p/>")
+        server.add_page("MAI", NEW_TITLE, "<p/>")
+
+        pages = adapter.get_pages_by_titles("MAI", [OLD_TITLE, NEW_TITLE])
+
+        assert set(pages) == {OLD_TITLE, NEW_TITLE}
+        assert "content" not in pages[OLD_TITLE]
+
+    # ---------- [Boundary] ----------
+    def test_should_not_request_when_no_titles(self, server, adapter):
+        assert adapter.get_pages_by_titles("MAI", []) == {}
+        assert server.requests == []
+
+    def test_should_ignore_pages_in_other_spaces(self, server, adapter):
+        server.add_page("OTHER", OLD_TITLE, "<p/>")
+        assert adapter.get_pages_by_titles("MAI", [OLD_TITLE]) == {}
+
+    def test_should_match_titles_containing_quotes(self, server, adapter):
+        # Given: CQL 리터럴 escape가 필요한 제목
+        title = 'Weekly "draft" \\ notes'
+        server.add_page("MAI", title, "<p/>")
+
+        pages = adapter.get_pages_by_titles("MAI", [title])
+
+        assert list(pages) == [title]
+
+    def test_should_quote_cql_literals(self):
+        assert _cql_quote('a "b" \\c') == '"a \\"b\\" \\\\c"'
+
+    # ---------- [Error] ----------
+    def test_should_raise_on_http_error(self, server, adapter):
+        server.fail_statuses = [500]
+        with pytest.raises(requests.HTTPError):
+            adapter.get_pages_by_titles("MAI", [OLD_TITLE])
+
+
+class TestCreatePage:
+    # ---------- [Happy] ----------
+    def test_should_create_page_and_return_url(self, server, adapter):
+        server.add_space("MAI", "77")
+
+        url = adapter.create_page("MAI", NEW_TITLE, "<table>new</table>", parent_id="1")
+
+        created = next(p for p in server.pages() if p["title"] == NEW_TITLE)
+        assert created["body"] == "<table>new</table>"
+        assert url == f"{server.url}/spaces/MAI/pages/{created['id']}/{NEW_TITLE}"
+
+
+class TestV1Lookups:
+    """atlassian-python-api 클라이언트 경유 조회 — 대역 서버의 v1 경로"""
+
+    # ---------- [Happy] ----------
+    def test_should_get_page_by_title_with_url(self, server, adapter):
+        page_id = server.add_page("MAI", OLD_TITLE, "<p>old</p>")
+
+        page = adapter.get_page_by_title("MAI", OLD_TITLE)
+
+        assert page["id"] == page_id
+        assert page["url"] == f"{server.url}/spaces/MAI/pages/{page_id}/{OLD_TITLE}"
+
+    def test_should_get_page_version(self, server, adapter):
+        page_id = server.add_page("MAI", OLD_TITLE, "<p>v1</p>")
+        server.update_page(page_id, "<p>v2</p>")
+
+        assert adapter.get_page_version("MAI", OLD_TITLE) == 2
+
+    def test_should_get_page_content_by_id(self, server, adapter):
+        page_id = server.add_page("MAI", OLD_TITLE, "<p>body</p>")
+
+        assert adapter.get_page_content(page_id) == "<p>body</p>"
+
+    # ---------- [Boundary] ----------
+    def test_should_return_none_for_missing_title(self, server, adapter):
+        server.add_space("MAI")
+
+        assert adapter.get_page_by_title("MAI", NEW_TITLE) is None
+        assert adapter.get_page_version("MAI", NEW_TITLE) is None
+
+
+class TestRateLimited:
+    """429 + Retry-After — 어댑터는 호스트 limiter가 기다린 뒤 재시도해 성공한다"""
+
+    @pytest.fixture(autouse=True)
+    def _no_jitter(self, monkeypatch):
+        monkeypatch.setattr(rate_limit, "_RETRY_AFTER_JITTER_SECONDS", 0.0)
+
+    # ---------- [Happy] ----------
+    def test_should_retry_search_after_injected_429(self, server, adapter):
+        server.add_page("MAI", OLD_TITLE, "<p>old</p>")
+        server.fail_statuses = [429]
+        server.retry_after = "0"
+
+        pages = adapter.get_pages_by_titles("MAI", [OLD_TITLE])
+
+        assert list(pages) == [OLD_TITLE]
+        assert server.rate_limited == 1
+
+    def test_should_create_page_once_after_429(self, server, adapter):
+        # Given: 첫 POST가 429 — 서버는 처리하지 않았다
+        server.add_space("MAI", "77")
+        adapter.get_space_id("MAI")
+        server.fail_statuses = [429]
+        server.retry_after = "0"
+
+        adapter.create_page("MAI", NEW_TITLE, "<p>new</p>", parent_id="1")
+
+        # Then: 재시도 1회로 페이지는 정확히 1개
+        assert [p["title"] for p in server.pages()] == [NEW_TITLE]
+
+    # ---------- [Error] ----------
+    def test_should_raise_when_server_keeps_rate_limiting(self, server, adapter):
+        server.fail_statuses = [429] * 4
+        server.retry_after = "0"
+
+        with pytest.raises(requests.HTTPError):
+            adapter.get_pages_by_titles("MAI", [OLD_TITLE])
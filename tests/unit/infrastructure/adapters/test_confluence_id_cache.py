@@ -0,0 +1,97 @@
+"""SpaceIdCache + ConfluenceAdapter space id 재사용 테스트.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+from src.infrastructure.adapters.confluence_id_cache import SpaceIdCache
+
+
+def _response(status: int, payload: dict | None = None) -> MagicMock:
+    resp = MagicMock(status_code=status)
+    resp.json.return_value = payload or {}
+    return resp
+
+
+@pytest.fixture
+def base_url():
+    # 프로세스 memo는 전역이므로 테스트마다 다른 호스트로 격리
+    return f"https://{uuid.uuid4().hex}.atlassian.net"
+
+
+def _adapter(base_url: str, cache: SpaceIdCache) -> ConfluenceAdapter:
+    adapter = ConfluenceAdapter(url=base_url, user="u", token="t", space_id_cache=cache)
+    adapter._session = MagicMock()
+    return adapter
+
+
+class TestSpaceIdCache:
+    # ---------- [Happy] ----------
+    def test_should_persist_ids_across_processes(self, tmp_path, base_url):
+        # Given
+        path = tmp_path / "ids.json"
+        SpaceIdCache(path).put(f"{base_url}|MAI", "98765")
+        # When: 새 프로세스 흉내 — memo에 없고 디스크에만 있는 키
+        other_key = f"{base_url}|OPS"
+        SpaceIdCache(path).put(other_key, "111")
+        # Then
+        assert SpaceIdCache(path)._read_disk() == {f"{base_url}|MAI": "98765", other_key: "111"}
+
+    def test_should_share_memo_between_instances_without_disk(self, base_url):
+        SpaceIdCache().put(f"{base_url}|MAI", "1")
+        assert SpaceIdCache().get(f"{base_url}|MAI") == "1"
+
+    # ---------- [Boundary] ----------
+    def test_should_drop_entry_on_invalidate(self, tmp_path, base_url):
+        cache = SpaceIdCache(tmp_path / "ids.json")
+        cache.put(f"{base_url}|MAI", "1")
+        cache.invalidate(f"{base_url}|MAI")
+        assert cache.get(f"{base_url}|MAI") is None
+
+    def test_should_ignore_corrupt_cache_file(self, tmp_path, base_url):
+        path = tmp_path / "ids.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert SpaceIdCache(path).get(f"{base_url}|MAI") is None
+
+
+class TestConfluenceAdapterSpaceId:
+    # ---------- [Happy] ----------
+    def test_should_look_up_space_once_for_repeated_page_creation(self, tmp_path, base_url):
+        # Given
+        adapter = _adapter(base_url, SpaceIdCache(tmp_path / "ids.json"))
+        adapter._session.get.return_value = _response(200, {"results": [{"id": "42"}]})
+        adapter._session.post.return_value = _response(200, {"id": "7"})
+        # When: 두 주 연속 생성
+        adapter.create_page("MAI", "w1", "<p/>", "1")
+        adapter.create_page("MAI", "w2", "<p/>", "1")
+        # Then: /spaces 조회 1회, 두 POST 모두 같은 space id
+        assert adapter._session.get.call_count == 1
+        assert [c.kwargs["json"]["spaceId"] for c in adapter._session.post.call_args_list] == ["42", "42"]
+
+    def test_should_use_disk_cache_without_request(self, tmp_path, base_url):
+        path = tmp_path / "ids.json"
+        path.write_text(f'{{"{base_url}/wiki|MAI": "42"}}', encoding="utf-8")
+        adapter = _adapter(base_url, SpaceIdCache(path))
+        assert adapter.get_space_id("MAI") == "42"
+        adapter._session.get.assert_not_called()
+
+    # ---------- [Error] ----------
+    def test_should_refresh_stale_space_id_after_404(self, tmp_path, base_url, capsys):
+        # Given: 캐시된 id가 낡음 (space 재생성)
+        cache = SpaceIdCache(tmp_path / "ids.json")
+        cache.put(f"{base_url}/wiki|MAI", "old")
+        adapter = _adapter(base_url, cache)
+        adapter._session.get.return_value = _response(200, {"results": [{"id": "new"}]})
+        adapter._session.post.side_effect = [_response(404), _response(200, {"id": "7"})]
+        # When
+        url = adapter.create_page("MAI", "w1", "<p/>", "1")
+        # Then: 재조회한 id로 한 번 더 POST, 캐시 갱신
+        assert url.endswith("/pages/7/w1")
+        assert adapter._session.post.call_args.kwargs["json"]["spaceId"] == "new"
+        assert cache.get(f"{base_url}/wiki|MAI") == "new"
+        assert "refreshing cached space id" in capsys.readouterr().out
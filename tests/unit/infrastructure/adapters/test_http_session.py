@@ -0,0 +1,136 @@
+"""pooled HTTP 세션 테스트 — 로컬 keep-alive HTTP 서버로 연결 재사용 측정.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.infrastructure.adapters import rate_limit
+from src.infrastructure.adapters.http_session import (
+    HttpPoolStats,
+    build_pooled_session,
+    session_stats,
+)
+from src.infrastructure.adapters.rate_limit import limiter_for
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    statuses: list[int] = []
+    retry_after: str | None = None  # 429 응답에 붙일 Retry-After
+    bodies: list[bytes] = []
+
+    def do_GET(self):
+        status = _Handler.statuses.pop(0) if _Handler.statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        if status == 429 and _Handler.retry_after is not None:
+            self.send_header("Retry-After", _Handler.retry_after)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        _Handler.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_RETRY_AFTER_JITTER_SECONDS", 0.0)
+    _Handler.statuses = []
+    _Handler.retry_after = None
+    _Handler.bodies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledSession:
+    # ---------- [Happy] ----------
+    def test_should_reuse_one_connection_for_sequential_requests(self, server_url):
+        # Given
+        session = build_pooled_session()
+        # When: 같은 호스트에 5회 요청
+        for _ in range(5):
+            session.get(f"{server_url}/rest/api/content", timeout=5).raise_for_status()
+        # Then: 연결 1개를 keep-alive로 재사용
+        assert session_stats(session) == HttpPoolStats(requests=5, connections=1)
+        assert session_stats(session).reused == 4
+
+    def test_should_retry_transient_gateway_errors_on_get(self, server_url):
+        # Given: 첫 응답 503
+        _Handler.statuses = [503]
+        session = build_pooled_session(retries=2)
+        # When
+        resp = session.get(f"{server_url}/x", timeout=5)
+        # Then: 재시도 후 성공, 재시도 요청도 집계
+        assert resp.status_code == 200
+        assert session_stats(session).requests == 2
+
+    def test_should_retry_429_after_retry_after_and_block_host(self, server_url):
+        # Given: 첫 응답 429 + Retry-After 0.2초
+        _Handler.statuses = [429]
+        _Handler.retry_after = "0.2"
+        session = build_pooled_session(retries=2)
+        # When
+        resp = session.get(f"{server_url}/x", timeout=5)
+        # Then: 호스트 limiter가 Retry-After만큼 막은 뒤 재시도해 성공
+        assert resp.status_code == 200
+        stats = limiter_for(server_url.removeprefix("http://")).stats()
+        assert stats.rate_limited == 1
+        assert stats.throttled == 1
+        assert stats.throttled_seconds > 0.15
+
+    def test_should_retry_429_for_post_with_same_body(self, server_url):
+        # Given: 페이지 생성 POST가 429 — 서버가 처리하지 않았으므로 재전송해도 중복 없음
+        _Handler.statuses = [429]
+        _Handler.retry_after = "0"
+        session = build_pooled_session(retries=1)
+        # When
+        resp = session.post(f"{server_url}/api/v2/pages", json={"title": "t"}, timeout=5)
+        # Then
+        assert resp.status_code == 200
+        assert _Handler.bodies == [b'{"title": "t"}'] * 2
+
+    def test_should_share_host_block_across_sessions(self, server_url):
+        # Given: 다른 어댑터의 요청이 429를 받아 호스트가 0.2초 막힌 상태
+        limiter = limiter_for(server_url.removeprefix("http://"))
+        limiter.on_rate_limited(0.2, attempt=0)
+        # When: 새 세션이 같은 호스트로 요청
+        build_pooled_session().get(f"{server_url}/y", timeout=5)
+        # Then: 그 요청도 차단이 풀릴 때까지 기다린다
+        assert limiter.stats().throttled == 1
+
+    # ---------- [Boundary] ----------
+    def test_should_report_zero_stats_for_plain_session(self):
+        assert session_stats(requests.Session()) == HttpPoolStats(requests=0, connections=0)
+
+    # ---------- [Error] ----------
+    def test_should_return_last_error_status_when_retries_exhausted(self, server_url):
+        _Handler.statuses = [503, 503]
+        session = build_pooled_session(retries=1)
+        resp = session.get(f"{server_url}/x", timeout=5)
+        assert resp.status_code == 503
+
+    def test_should_return_429_when_rate_limit_retries_exhausted(self, server_url, monkeypatch):
+        # Given: Retry-After 없는 429 연속 — 지수 backoff(jitter) 후 재시도
+        monkeypatch.setattr(rate_limit, "_BACKOFF_BASE_SECONDS", 0.01)
+        _Handler.statuses = [429, 429]
+        session = build_pooled_session(retries=1)
+        # When
+        resp = session.get(f"{server_url}/x", timeout=5)
+        # Then: 재시도 1회 후 마지막 429를 그대로 반환 (raise_for_status는 호출자 몫)
+        assert resp.status_code == 429
+        assert limiter_for(server_url.removeprefix("http://")).stats().rate_limited == 1
@@ -0,0 +1,133 @@
+"""JiraAdapter 테스트 — atlassian Jira 클라이언트는 mock.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from src.domain.models import JiraIssue
+from src.infrastructure.adapters.jira_adapter import JiraAdapter
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status}", response=response)
+
+
+@pytest.fixture
+def adapter():
+    adapter = JiraAdapter(url="https://x.atlassian.net", user="u", token="t")
+    adapter.client = MagicMock()
+    return adapter
+
+
+class TestJiraAdapter:
+    # ---------- [Happy] ----------
+    def test_should_map_issue_fields(self, adapter):
+        # Given
+        adapter.client.issue.return_value = {
+            "key": "MAI-1",
+            "fields": {
+                "summary": "로그인 개선",
+                "status": {"name": "In Progress"},
+                "fixVersions": [{"name": "1.2.0"}, {"name": "1.3.0"}],
+            },
+        }
+        # When
+        issue = adapter.get_issue("MAI-1")
+        # Then: 필요한 필드만 요청
+        assert issue == JiraIssue("MAI-1", "로그인 개선", "In Progress", ("1.2.0", "1.3.0"))
+        adapter.client.issue.assert_called_once_with("MAI-1", fields="summary,status,fixVersions")
+
+    # ---------- [Boundary] ----------
+    def test_should_default_missing_fields(self, adapter):
+        adapter.client.issue.return_value = {"key": "MAI-1", "fields": {"fixVersions": None}}
+        assert adapter.get_issue("MAI-1") == JiraIssue("MAI-1", "", "", ())
+
+    def test_should_return_none_when_issue_not_found(self, adapter):
+        adapter.client.issue.side_effect = _http_error(404)
+        assert adapter.get_issue("MAI-404") is None
+
+    # ---------- [Error] ----------
+    def test_should_propagate_other_http_errors(self, adapter):
+        adapter.client.issue.side_effect = _http_error(500)
+        with pytest.raises(requests.HTTPError):
+            adapter.get_issue("MAI-1")
+
+
+def _response(status: int, payload: dict | None = None, text: str = "") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = (json.dumps(payload) if payload is not None else text).encode("utf-8")
+    return response
+
+
+def _raw_issue(key: str) -> dict:
+    return {"key": key, "fields": {"summary": f"s {key}", "status": {"name": "Done"}}}
+
+
+class TestJiraAdapterGetIssues:
+    @pytest.fixture
+    def session(self, adapter):
+        adapter._session = MagicMock()
+        return adapter._session
+
+    # ---------- [Happy] ----------
+    def test_should_fetch_all_keys_with_one_jql_search(self, adapter, session):
+        # Given
+        session.get.return_value = _response(200, {"issues": [_raw_issue("MAI-1"), _raw_issue("OPS-7")], "isLast": True})
+        # When
+        issues = adapter.get_issues(["MAI-1", "OPS-7", "MAI-1"])
+        # Then: 중복 제거된 key로 요청 1회
+        assert issues == {
+            "MAI-1": JiraIssue("MAI-1", "s MAI-1", "Done"),
+            "OPS-7": JiraIssue("OPS-7", "s OPS-7", "Done"),
+        }
+        url = session.get.call_args.args[0]
+        params = session.get.call_args.kwargs["params"]
+        assert url == "https://x.atlassian.net/rest/api/2/search/jql"
+        assert params["jql"] == "key in (MAI-1, OPS-7)"
+        assert params["fields"] == "summary,status,fixVersions"
+
+    def test_should_follow_next_page_token(self, adapter, session):
+        session.get.side_effect = [
+            _response(200, {"issues": [_raw_issue("MAI-1")], "nextPageToken": "p2", "isLast": False}),
+            _response(200, {"issues": [_raw_issue("MAI-2")], "isLast": True}),
+        ]
+        assert set(adapter.get_issues(["MAI-1", "MAI-2"])) == {"MAI-1", "MAI-2"}
+        assert session.get.call_args.kwargs["params"]["nextPageToken"] == "p2"
+
+    # ---------- [Boundary] ----------
+    def test_should_not_request_without_keys(self, adapter, session):
+        assert adapter.get_issues([]) == {}
+        session.get.assert_not_called()
+
+    def test_should_retry_without_keys_named_in_400(self, adapter, session):
+        # Given: 삭제된 티켓이 섞이면 JQL 전체가 400
+        error = {"errorMessages": ["An issue with key 'MAI-404' does not exist for field 'key'."]}
+        session.get.side_effect = [
+            _response(400, error),
+            _response(200, {"issues": [_raw_issue("MAI-1")], "isLast": True}),
+        ]
+        # When
+        issues = adapter.get_issues(["MAI-1", "MAI-404"])
+        # Then
+        assert list(issues) == ["MAI-1"]
+        assert session.get.call_args.kwargs["params"]["jql"] == "key in (MAI-1)"
+
+    # ---------- [Error] ----------
+    def test_should_fall_back_to_single_lookups_on_unexplained_400(self, adapter, session, capsys):
+        session.get.return_value = _response(400, {"errorMessages": ["bad query"]})
+        adapter.client.issue.side_effect = [_raw_issue("MAI-1"), _http_error(404)]
+        assert list(adapter.get_issues(["MAI-1", "MAI-2"])) == ["MAI-1"]
+        assert "WARNING: JQL search rejected 2 key(s)" in capsys.readouterr().out
+
+    def test_should_propagate_server_errors(self, adapter, session):
+        session.get.return_value = _response(503, text="unavailable")
+        with pytest.raises(requests.HTTPError):
+            adapter.get_issues(["MAI-1"])
@@ -0,0 +1,70 @@
+"""JsonlMetricsStore 테스트 — append-only JSONL 메트릭 저장소.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+from datetime import datetime
+
+from src.domain.models import RunMetrics
+from src.infrastructure.adapters.metrics_store import JsonlMetricsStore
+
+
+def make_metrics(**overrides) -> RunMetrics:
+    defaults = dict(
+        recorded_at=datetime(2026, 4, 6, 12, 0, 5), mode="daily", model="sonnet",
+        space_key="MAI", duration_ms=90_000, duration_api_ms=60_000, num_turns=6,
+        cost_usd=0.31, input_tokens=100, output_tokens=50,
+    )
+    defaults.update(overrides)
+    return RunMetrics(**defaults)
+
+
+class TestJsonlMetricsStore:
+    # ---------- [Happy] ----------
+    def test_should_round_trip_appended_metrics(self, tmp_path):
+        # Given
+        store = JsonlMetricsStore(tmp_path / "logs" / "metrics.jsonl")
+        first, second = make_metrics(), make_metrics(mode="weekly", cost_usd=None)
+        # When
+        store.append(first)
+        store.append(second)
+        # Then: 기록 순서대로 복원 (디렉토리 자동 생성)
+        assert store.read_all() == [first, second]
+
+    def test_should_append_one_json_line_per_run(self, tmp_path):
+        # Given
+        path = tmp_path / "metrics.jsonl"
+        store = JsonlMetricsStore(path)
+        # When
+        store.append(make_metrics())
+        store.append(make_metrics())
+        # Then
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+    # ---------- [Boundary] ----------
+    def test_should_return_empty_list_when_file_missing(self, tmp_path):
+        assert JsonlMetricsStore(tmp_path / "none.jsonl").read_all() == []
+
+    def test_should_ignore_unknown_fields_from_newer_writers(self, tmp_path):
+        # Given: 알 수 없는 필드가 추가된 라인
+        path = tmp_path / "metrics.jsonl"
+        JsonlMetricsStore(path).append(make_metrics())
+        line = path.read_text(encoding="utf-8").rstrip("\n")
+        path.write_text(line[:-1] + ', "future_field": 1}\n', encoding="utf-8")
+        # When/Then
+        assert JsonlMetricsStore(path).read_all() == [make_metrics()]
+
+    # ---------- [Error] ----------
+    def test_should_skip_malformed_lines(self, tmp_path, capsys):
+        # Given: 중간에 깨진 라인 (동시 기록 중 잘린 경우 등)
+        path = tmp_path / "metrics.jsonl"
+        store = JsonlMetricsStore(path)
+        store.append(make_metrics())
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"mode": "daily"\n')
+        store.append(make_metrics(space_key="OPS"))
+        # When
+        records = store.read_all()
+        # Then
+        assert [r.space_key for r in records] == ["MAI", "OPS"]
+        assert "WARNING: skipping malformed metrics line 2" in capsys.readouterr().out
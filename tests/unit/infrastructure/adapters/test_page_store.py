@@ -0,0 +1,110 @@
+"""Confluence 페이지 본문 저장소 테스트 — PageContentStore(버전 키/압축/LRU) + 어댑터 버전 확인.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import os
+import secrets
+
+import pytest
+
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+from src.infrastructure.adapters.page_store import PageContentStore
+from tests.fakes.fake_confluence_server import FakeConfluenceServer
+
+_BODY = "<table>" + "<tr><td>04.13</td><td>MAI-1 작업</td></tr>" * 500 + "</table>"
+
+
+@pytest.fixture
+def store(tmp_path) -> PageContentStore:
+    return PageContentStore(tmp_path / "pages", max_bytes=1024 * 1024)
+
+
+class TestPageContentStore:
+    # ---------- [Happy] ----------
+    def test_should_return_stored_body_for_same_version(self, store):
+        store.put("123", 4, _BODY)
+        assert store.get("123", 4) == _BODY
+
+    def test_should_compress_bodies_on_disk(self, store, tmp_path):
+        store.put("123", 4, _BODY)
+        stored = (tmp_path / "pages" / "123.v4.html.gz").stat().st_size
+        assert stored < len(_BODY.encode("utf-8")) / 10
+
+    # ---------- [Boundary] ----------
+    def test_should_miss_for_other_version(self, store):
+        store.put("123", 4, _BODY)
+        assert store.get("123", 5) is None
+
+    def test_should_drop_older_versions_of_same_page(self, store, tmp_path):
+        store.put("123", 4, "old")
+        store.put("12", 1, "other page")
+        store.put("123", 5, "new")
+        assert sorted(p.name for p in (tmp_path / "pages").iterdir()) == [
+            "12.v1.html.gz", "123.v5.html.gz"
+        ]
+
+    def test_should_evict_least_recently_used_when_over_capacity(self, tmp_path):
+        # Given: 압축해도 ~5KB인 본문 2개 분량만 허용
+        bodies = {key: secrets.token_hex(5000) for key in ("1", "2", "3")}
+        store = PageContentStore(tmp_path / "pages", max_bytes=15_000)
+        store.put("1", 1, bodies["1"])
+        store.put("2", 1, bodies["2"])
+        os.utime(tmp_path / "pages" / "1.v1.html.gz", (1, 1))
+        os.utime(tmp_path / "pages" / "2.v1.html.gz", (2, 2))
+        store.get("1", 1)  # 1을 최근 사용으로
+
+        # When
+        store.put("3", 1, bodies["3"])
+
+        # Then: 가장 오래 안 쓰인 2가 제거
+        assert store.get("2", 1) is None
+        assert store.get("1", 1) == bodies["1"]
+        assert store.get("3", 1) == bodies["3"]
+
+    # ---------- [Error] ----------
+    def test_should_treat_corrupt_entry_as_miss(self, store, tmp_path):
+        store.put("123", 4, _BODY)
+        (tmp_path / "pages" / "123.v4.html.gz").write_bytes(b"not gzip")
+        assert store.get("123", 4) is None
+        assert not (tmp_path / "pages" / "123.v4.html.gz").exists()
+
+
+class TestConfluenceAdapterPageStore:
+    @pytest.fixture
+    def server(self):
+        with FakeConfluenceServer() as fake:
+            yield fake
+
+    def _adapter(self, server, store):
+        return ConfluenceAdapter(url=server.url, user="u", token="t", page_store=store)
+
+    # ---------- [Happy] ----------
+    def test_should_reuse_body_when_version_unchanged(self, server, store):
+        # Given: 본문을 한 번 받아 둔 상태
+        page_id = server.add_page("MAI", "week", _BODY)
+        assert self._adapter(server, store).get_page_content(page_id) == _BODY
+        server.requests.clear()
+
+        # When: 새 어댑터(다음 실행)로 다시 조회
+        body = self._adapter(server, store).get_page_content(page_id)
+
+        # Then: 버전 확인 1회만, 본문은 저장소에서
+        assert body == _BODY
+        assert server.requests == [("GET", f"/wiki/rest/api/content/{page_id}")]
+
+    def test_should_refetch_body_after_page_edit(self, server, store):
+        page_id = server.add_page("MAI", "week", "<p>v1</p>")
+        adapter = self._adapter(server, store)
+        adapter.get_page_content(page_id)
+
+        server.update_page(page_id, "<p>v2</p>")
+
+        assert adapter.get_page_content(page_id) == "<p>v2</p>"
+        assert store.get(page_id, 2) == "<p>v2</p>"
+
+    # ---------- [Boundary] ----------
+    def test_should_fetch_body_directly_without_store(self, server):
+        page_id = server.add_page("MAI", "week", _BODY)
+        adapter = ConfluenceAdapter(url=server.url, user="u", token="t")
+        assert adapter.get_page_content(page_id) == _BODY
@@ -1,13 +1,17 @@
 """PageTransformer 테스트"""
 
+from html import unescape
+
 import pytest
 from lxml import etree
 
 from src.infrastructure.adapters.page_transformer import (
     NS_WRAPPER_CLOSE,
     NS_WRAPPER_OPEN,
+    CompiledTransformPlan,
     PageTransformer,
     _unescape_html_entities,
+    compile_transform_plan,
 )
 
 # 최소 테이블 HTML 픽스처 (1명, 2일 — 월/금 구조)
@@ -194,6 +198,46 @@ class TestPageTransformerDynamicRowspan:
         assert "Ongoing work" in progress_text
 
 
+class TestPageTransformerRowCells:
+    """행별 셀 분류 (1회) — rowspan 셀 유무에 따라 1칸 밀림"""
+
+    def test_should_classify_cells_after_member_cell(self):
+        # Given: 팀원 셀(rowspan)이 있는 첫 행
+        row = etree.fromstring(
+            '<tr><td rowspan="2"><p>@U</p></td><td><p>04.06</p></td>'
+            '<td><p>P</p></td><td><p>N</p></td></tr>'
+        )
+        # When
+        cells = PageTransformer()._classify_row(row)
+        # Then
+        assert [c.findtext("p") for c in cells] == ["04.06", "P", "N"]
+
+    def test_should_classify_cells_of_continuation_row(self):
+        row = etree.fromstring('<tr><td><p>04.07</p></td><td><p>P</p></td><td><p>N</p></td></tr>')
+        assert PageTransformer()._classify_row(row).date.findtext("p") == "04.07"
+
+    def test_should_carry_over_within_each_member_block(self):
+        # Given: 2명 — 각자 금요일 Doing 항목이 자기 월요일로만 이월돼야 한다
+        second_member = (
+            '<tr><td rowspan="2"><p>@Second</p></td><td><p>04.06</p></td>'
+            '<td><ul><li><p>Done</p></li></ul></td><td><p>n</p></td></tr>'
+            '<tr><td><p>04.10</p></td>'
+            '<td><ul><li><p>Doing</p><ul><li><p>Task Z</p></li></ul></li>'
+            '<li><p>ToDo</p></li></ul></td><td><p>n</p></td></tr>'
+        )
+        html = MINIMAL_TABLE_HTML.replace("</tbody>", f"{second_member}</tbody>")
+        # When
+        result = PageTransformer().transform(html, ["04.06", "04.10"], ["04.13", "04.17"])
+        root = etree.fromstring(f"{NS_WRAPPER_OPEN}{result}{NS_WRAPPER_CLOSE}".encode())
+        mondays = [row for row in root.iter("tr") if row.find("td[@rowspan]") is not None]
+        # Then
+        todo = [
+            [li.findtext("p") for li in monday.findall("td")[2].findall("ul/li[3]/ul/li")]
+            for monday in mondays
+        ]
+        assert todo == [["Task D", "Task E"], ["Task Z"]]
+
+
 class TestPageTransformerEdgeCases:
     """에지 케이스 및 오류 처리 테스트"""
 
@@ -330,24 +374,31 @@ class TestPageTransformerEdgeCases:
         # Then: 기존 날짜 텍스트가 그대로 유지된다
         assert "99.99" in result
 
-    def test_should_skip_extract_when_li_p_has_no_text(self):
-        # Given: Doing/ToDo li의 <p>에 텍스트가 없는 경우 (line 123 False 브랜치)
-        from lxml import etree as _etree
-
-        transformer = PageTransformer()
-        # <p> 텍스트가 None인 li 포함
-        progress_cell = _etree.fromstring(
+    def test_should_skip_carryover_when_li_p_has_no_text(self):
+        # Given: 금요일 Progress에 라벨 텍스트가 없는 li와 Doing 항목이 함께 있는 HTML
+        html = (
+            '<table><tbody>'
+            '<tr><th><p>Name</p></th><th><p>Date</p></th>'
+            '<th><p>Progress</p></th><th><p>Notifications</p></th></tr>'
+            '<tr><td rowspan="1"><p>@User</p></td>'
+            '<td><p>04.10</p></td>'
             '<td><ul>'
-            '<li><p></p></li>'
+            '<li><p></p><ul><li><p>Unlabeled</p></li></ul></li>'
             '<li><p>Doing</p><ul><li><p>Task X</p></li></ul></li>'
             '</ul></td>'
+            '<td><p></p></td></tr>'
+            '</tbody></table>'
         )
+        transformer = PageTransformer()
 
-        # When: _extract_doing_todo_items를 호출하면
-        items = transformer._extract_doing_todo_items(progress_cell)
+        # When: 변환하면
+        result = transformer.transform(html, old_dates=["04.10"], new_dates=["04.17"])
 
-        # Then: 텍스트 없는 li는 건너뛰고 Doing 항목만 추출된다
-        assert len(items) == 1
+        # Then: 텍스트 없는 li의 하위 항목은 건너뛰고 Doing 항목만 월요일 ToDo로 이월된다
+        root = etree.fromstring(f"{NS_WRAPPER_OPEN}{result}{NS_WRAPPER_CLOSE}".encode())
+        todo = next(li for li in root.iter("li") if li.findtext("p") == "ToDo")
+        assert [li.findtext("p") for li in todo.find("ul")] == ["Task X"]
+        assert "Unlabeled" not in result
 
     def test_should_skip_insert_when_no_todo_label_in_ul(self):
         # Given: ul에 "ToDo" 라벨이 없는 progress_cell (line 153 False 브랜치)
@@ -445,6 +496,84 @@ class TestPageTransformerNamespace:
         assert "TICKET-999" in result
 
 
+class TestCompiledTransformPlan:
+    """(old_dates, new_dates)별 변환 계획 — 여러 페이지에 재사용"""
+
+    def test_should_apply_one_plan_to_many_pages_like_transform(self):
+        # Given: 같은 주 전환을 적용할 두 팀 페이지
+        plan = CompiledTransformPlan(["04.06", "04.10"], ["04.13", "04.17"])
+        pages = [MINIMAL_TABLE_HTML, MINIMAL_TABLE_HTML.replace("@TestUser", "@Other")]
+        transformer = PageTransformer()
+
+        # When: 계획 하나로 두 페이지를 변환하면
+        results = [transformer.apply(html, plan) for html in pages]
+
+        # Then: 페이지마다 transform()과 같은 결과
+        assert results == [
+            transformer.transform(html, ["04.06", "04.10"], ["04.13", "04.17"]) for html in pages
+        ]
+
+    def test_should_cache_plan_per_date_pair(self):
+        # Given / When: 같은 날짜 쌍과 다른 날짜 쌍
+        first = compile_transform_plan(["04.06"], ["04.13"])
+        second = compile_transform_plan(["04.06"], ["04.13"])
+        other = compile_transform_plan(["04.06"], ["04.20"])
+
+        # Then: 같은 쌍은 같은 계획 객체를 재사용
+        assert first is second
+        assert other is not first
+        assert other.date_map == {"04.06": "04.20"}
+
+    def test_should_match_labels_and_dates_with_unicode_whitespace_like_strip(self):
+        # Given: 라벨/날짜 앞뒤에 nbsp·줄바꿈 (str.strip()은 지우고 XPath normalize-space는 못 지우는 문자 포함)
+        html = (
+            MINIMAL_TABLE_HTML.replace("<p>04.10</p>", "<p>\n04.10&nbsp;</p>")
+            .replace("<p>Doing</p><ul><li><p>Task D", "<p>&nbsp;Doing\u3000</p><ul><li><p>Task D")
+        )
+
+        # When
+        result = PageTransformer().transform(html, ["04.06", "04.10"], ["04.13", "04.17"])
+
+        # Then: 날짜가 치환되고 Doing 항목도 이월된다
+        assert "<p>04.17</p>" in result
+        assert "Task D" in result
+
+    def test_should_not_match_label_after_leading_child_element(self):
+        # Given: 라벨 텍스트가 첫 자식 element 뒤에 있는 경우 (p.text는 None)
+        html = MINIMAL_TABLE_HTML.replace(
+            "<p>Doing</p><ul><li><p>Task D", "<p><strong>!</strong>Doing</p><ul><li><p>Task D"
+        )
+
+        # When
+        result = PageTransformer().transform(html, ["04.06"], ["04.13"])
+
+        # Then: 이월 대상이 아니다 (p.text 기준 판정과 동일)
+        assert "Task D" not in result
+        assert "Task E" in result
+
+    def test_should_quote_dates_containing_quotes_in_xpath(self):
+        # Given: 따옴표가 섞인 날짜 문자열
+        html = MINIMAL_TABLE_HTML.replace("<p>04.06</p>", "<p>it's \"04\"</p>")
+
+        # When
+        plan = CompiledTransformPlan(["it's \"04\""], ["04.13"])
+        result = PageTransformer().apply(html, plan)
+
+        # Then
+        assert "<p>04.13</p>" in result
+
+    def test_should_leave_dates_when_plan_has_no_dates(self):
+        # Given / When: 날짜 쌍이 비어 있는 계획
+        result = PageTransformer().apply(MINIMAL_TABLE_HTML, CompiledTransformPlan([], []))
+
+        # Then: 날짜는 그대로
+        assert "<p>04.06</p>" in result
+
+    def test_should_raise_when_applying_plan_to_page_without_table(self):
+        with pytest.raises(ValueError, match="테이블을 찾을 수 없습니다"):
+            PageTransformer().apply("<p>no table</p>", compile_transform_plan(["04.06"], ["04.13"]))
+
+
 class TestUnescapeHtmlEntities:
     """HTML 엔티티 변환 — XML 표준 엔티티는 보존, 그 외는 unicode 변환"""
 
@@ -477,3 +606,9 @@ class TestUnescapeHtmlEntities:
 
         # Then: XML은 보존, 일반은 변환
         assert result == "&amp; and → and &lt;"
+
+    @pytest.mark.parametrize("text", ["&AMP;", "&notit;", "&unknownname;", "&NotNestedLessLess;", "a&b; &;"])
+    def test_should_match_html_unescape_for_unusual_names(self, text):
+        # Given: 대문자 별칭, ;없는 옛 엔티티 접두어, 표에 없는 이름
+        # When / Then: 표 기반 변환도 html.unescape와 같은 결과
+        assert _unescape_html_entities(text) == unescape(text)
@@ -0,0 +1,203 @@
+"""부모 페이지 하위 제목 색인 테스트 — 색인 자체 + 로컬 Confluence 대역 서버 상대 어댑터 연동.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.infrastructure.adapters.confluence_adapter import ConfluenceAdapter
+from src.infrastructure.adapters.page_store import PageContentStore
+from src.infrastructure.adapters.page_tree_index import IndexedPage, PageTreeIndex
+from tests.fakes.fake_confluence_server import FakeConfluenceServer
+
+OLD_TITLE = "2026.04.06 ~ 04.10"
+NEW_TITLE = "2026.04.13 ~ 04.17"
+_MODIFIED = datetime(2026, 4, 10, 9, 0, tzinfo=timezone.utc)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPageTreeIndex:
+    # ---------- [Happy] ----------
+    def test_should_persist_entries_between_instances(self, tmp_path):
+        # Given
+        path = tmp_path / "index.json"
+        PageTreeIndex("MAI", "1", path).apply([(OLD_TITLE, "10", 3, _MODIFIED)], full=True)
+        # When: 다음 실행
+        index = PageTreeIndex("MAI", "1", path)
+        # Then: 저장된 항목 + incremental 하한(하루 여유)
+        assert index.lookup(OLD_TITLE) == IndexedPage("10", 3)
+        assert index.modified_since() == _MODIFIED - timedelta(days=1)
+
+    def test_should_refresh_once_per_process_then_per_interval(self):
+        clock = _FakeClock()
+        index = PageTreeIndex("MAI", "1", refresh_interval=60, clock=clock)
+        assert index.needs_refresh()
+        index.apply([], full=True)
+        assert not index.needs_refresh()
+        clock.now += 60
+        assert index.needs_refresh()
+
+    def test_should_move_entry_when_page_renamed(self):
+        index = PageTreeIndex("MAI", "1")
+        index.apply([(OLD_TITLE, "10", 1, _MODIFIED)], full=True)
+        index.apply([(NEW_TITLE, "10", 2, _MODIFIED)], full=False)
+        assert index.lookup(OLD_TITLE) is None
+        assert index.lookup(NEW_TITLE) == IndexedPage("10", 2)
+
+    # ---------- [Boundary] ----------
+    def test_should_require_full_listing_after_full_refresh_age(self):
+        clock = _FakeClock()
+        index = PageTreeIndex("MAI", "1", full_refresh_after=100, clock=clock)
+        index.apply([(OLD_TITLE, "10", 1, _MODIFIED)], full=True)
+        clock.now += 100
+        assert index.modified_since() is None
+
+    def test_should_ignore_file_for_other_parent(self, tmp_path):
+        path = tmp_path / "index.json"
+        PageTreeIndex("MAI", "1", path).apply([(OLD_TITLE, "10", 1, _MODIFIED)], full=True)
+        assert PageTreeIndex("MAI", "2", path).lookup(OLD_TITLE) is None
+
+    # ---------- [Error] ----------
+    def test_should_start_empty_on_corrupt_file(self, tmp_path, capsys):
+        path = tmp_path / "index.json"
+        path.write_text("{not json", encoding="utf-8")
+        index = PageTreeIndex("MAI", "1", path)
+        assert index.modified_since() is None
+        assert "WARNING" in capsys.readouterr().out
+
+
+class TestConfluenceAdapterTitleIndex:
+    @pytest.fixture
+    def server(self):
+        with FakeConfluenceServer() as fake:
+            fake.add_space("MAI", "77")
+            yield fake
+
+    @pytest.fixture
+    def parent(self, server):
+        return server.add_page("MAI", "Weekly", "<p>parent</p>")
+
+    def _adapter(self, server, index, store=None):
+        return ConfluenceAdapter(
+            url=server.url, user="u", token="t", title_index=index, page_store=store
+        )
+
+    # ---------- [Happy] ----------
+    def test_should_list_parent_once_then_resolve_titles_locally(self, server, parent):
+        # Given
+        server.add_page("MAI", OLD_TITLE, "<p>old</p>", parent_id=parent)
+        adapter = self._adapter(server, PageTreeIndex("MAI", parent))
+        # When: 여러 번 제목 조회
+        first = adapter.get_pages_by_titles("MAI", [OLD_TITLE, NEW_TITLE])
+        adapter.get_page_by_title("MAI", OLD_TITLE)
+        adapter.get_page_version("MAI", NEW_TITLE)
+        # Then: 나열 1회 + 다건 조회의 존재 확인 검색 1회, 단건 조회는 요청 없음
+        assert list(first) == [OLD_TITLE]
+        assert server.requests == [("GET", "/wiki/rest/api/content/search")] * 2
+
+    def test_should_follow_cursor_pages(self, server, parent, monkeypatch):
+        monkeypatch.setattr("src.infrastructure.adapters.confluence_adapter._INDEX_PAGE_LIMIT", 2)
+        for i in range(5):
+            server.add_page("MAI", f"week {i}", "<p/>", parent_id=parent)
+        index = PageTreeIndex("MAI", parent)
+        self._adapter(server, index).get_page_by_title("MAI", "week 0")
+        assert all(index.lookup(f"week {i}") for i in range(5))
+        assert len(server.requests) == 3
+
+    def test_should_refresh_incrementally_on_next_run(self, server, parent, tmp_path):
+        # Given: 지난 실행이 색인을 저장
+        path = tmp_path / "index.json"
+        page_id = server.add_page("MAI", OLD_TITLE, "<p>v1</p>", parent_id=parent)
+        self._adapter(server, PageTreeIndex("MAI", parent, path)).get_page_by_title("MAI", OLD_TITLE)
+        server.update_page(page_id, "<p>v2</p>")
+        server.requests.clear()
+        # When: 다음 실행
+        version = self._adapter(server, PageTreeIndex("MAI", parent, path)).get_page_version(
+            "MAI", OLD_TITLE
+        )
+        # Then: 수정된 페이지만 다시 받아 버전 반영
+        assert version == 2
+        assert len(server.requests) == 1
+
+    def test_should_skip_version_probe_for_indexed_page_body(self, server, parent, tmp_path):
+        # Given: 본문 저장소에 이미 있는 페이지
+        page_id = server.add_page("MAI", OLD_TITLE, "<p>old</p>", parent_id=parent)
+        store = PageContentStore(tmp_path / "pages", max_bytes=1_000_000)
+        store.put(page_id, 1, "<p>old</p>")
+        adapter = self._adapter(server, PageTreeIndex("MAI", parent), store)
+        # When: prefetch 경로 (제목 → 본문)
+        page = adapter.get_page_by_title("MAI", OLD_TITLE)
+        body = adapter.get_page_content(page["id"])
+        # Then: 색인 나열 외 요청 없음
+        assert body == "<p>old</p>"
+        assert len(server.requests) == 1
+
+    def test_should_record_created_page_without_refresh(self, server, parent):
+        index = PageTreeIndex("MAI", parent)
+        adapter = self._adapter(server, index)
+        adapter.get_page_by_title("MAI", OLD_TITLE)
+        adapter.create_page("MAI", NEW_TITLE, "<p>new</p>", parent_id=parent)
+        assert adapter.get_page_by_title("MAI", NEW_TITLE) is not None
+        assert server.requests.count(("GET", "/wiki/rest/api/content/search")) == 1
+
+    # ---------- [Boundary] ----------
+    def test_should_search_other_spaces_over_network(self, server, parent):
+        server.add_page("OPS", OLD_TITLE, "<p>ops</p>")
+        adapter = self._adapter(server, PageTreeIndex("MAI", parent))
+        assert list(adapter.get_pages_by_titles("OPS", [OLD_TITLE])) == [OLD_TITLE]
+
+    def test_should_find_page_created_after_index_refresh(self, server, parent):
+        # Given: 색인 갱신 이후 다른 곳에서 만든 페이지 (색인 miss)
+        index = PageTreeIndex("MAI", parent)
+        adapter = self._adapter(server, index)
+        adapter.get_page_by_title("MAI", OLD_TITLE)
+        page_id = server.add_page("MAI", NEW_TITLE, "<p>new</p>", parent_id=parent)
+        # When
+        pages = adapter.get_pages_by_titles("MAI", [NEW_TITLE])
+        # Then: miss를 그대로 믿지 않고 검색 결과를 따르며 색인에도 반영
+        assert pages[NEW_TITLE]["id"] == page_id
+        assert index.lookup(NEW_TITLE) == IndexedPage(page_id, 1)
+
+    # ---------- [Error] ----------
+    def test_should_not_report_deleted_indexed_page_as_existing(self, server, parent):
+        # Given: 색인에 남아 있지만 삭제된 이번 주 페이지
+        index = PageTreeIndex("MAI", parent)
+        stale = server.add_page("MAI", NEW_TITLE, "<p>gone</p>", parent_id=parent)
+        adapter = self._adapter(server, index)
+        adapter.get_page_by_title("MAI", NEW_TITLE)
+        server.delete_page(stale)
+        # When: create_page의 존재 확인 (본문 없이)
+        pages = adapter.get_pages_by_titles("MAI", [OLD_TITLE, NEW_TITLE])
+        # Then: 없는 페이지로 판정 → create_page가 다시 만든다, 색인 항목도 제거
+        assert NEW_TITLE not in pages
+        assert index.lookup(NEW_TITLE) is None
+
+    def test_should_use_replacement_page_when_indexed_page_deleted(self, server, parent):
+        # Given: 색인 후 삭제된 이전 주 페이지와 같은 제목의 새 페이지
+        index = PageTreeIndex("MAI", parent)
+        stale = server.add_page("MAI", OLD_TITLE, "<p>gone</p>", parent_id=parent)
+        adapter = self._adapter(server, index)
+        adapter.get_page_by_title("MAI", OLD_TITLE)
+        server.delete_page(stale)
+        replacement = server.add_page("MAI", OLD_TITLE, "<p>again</p>", parent_id=parent)
+        # When
+        pages = adapter.get_pages_by_titles("MAI", [OLD_TITLE], expand_body=True)
+        # Then: 검색 결과 사용 + 색인 항목 교체
+        assert pages[OLD_TITLE]["content"] == "<p>again</p>"
+        assert index.lookup(OLD_TITLE) == IndexedPage(replacement, 1)
+
+    def test_should_fall_back_to_search_when_refresh_fails(self, server, parent, capsys):
+        server.add_page("MAI", OLD_TITLE, "<p>old</p>", parent_id=parent)
+        adapter = self._adapter(server, PageTreeIndex("MAI", parent))
+        server.fail_statuses = [500]
+        assert list(adapter.get_pages_by_titles("MAI", [OLD_TITLE])) == [OLD_TITLE]
+        assert "page index refresh failed" in capsys.readouterr().out
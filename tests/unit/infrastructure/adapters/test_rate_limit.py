@@ -0,0 +1,135 @@
+"""호스트 rate limiter 테스트 — 가짜 시계/sleep으로 token bucket과 429 차단 검증.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.infrastructure.adapters import rate_limit
+from src.infrastructure.adapters.rate_limit import (
+    HostRateLimiter,
+    ThrottleStats,
+    configure_host,
+    limiter_for,
+    parse_retry_after,
+    throttle_stats,
+)
+
+
+class _FakeTime:
+    """sleep하면 시계가 그만큼 흐르는 가짜 시간"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time():
+    return _FakeTime()
+
+
+@pytest.fixture(autouse=True)
+def _no_jitter(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_RETRY_AFTER_JITTER_SECONDS", 0.0)
+
+
+class TestHostRateLimiter:
+    # ---------- [Happy] ----------
+    def test_should_pass_burst_then_pace_at_rate(self, fake_time):
+        # Given: 초당 2회, burst 2
+        limiter = HostRateLimiter(2, burst=2, clock=fake_time.clock, sleep=fake_time.sleep)
+        # When: 연속 4회 요청
+        waits = [limiter.acquire() for _ in range(4)]
+        # Then: burst 2회는 바로, 이후는 0.5초 간격
+        assert waits == [0.0, 0.0, 0.5, 0.5]
+        assert limiter.stats() == ThrottleStats(
+            requests=4, throttled=2, throttled_seconds=1.0, rate_limited=0
+        )
+
+    def test_should_refill_tokens_over_time(self, fake_time):
+        limiter = HostRateLimiter(1, burst=1, clock=fake_time.clock, sleep=fake_time.sleep)
+        limiter.acquire()
+        fake_time.now += 1.0  # 1초 뒤 토큰 1개 충전
+        assert limiter.acquire() == 0.0
+
+    def test_should_block_host_for_retry_after(self, fake_time):
+        # Given: bucket 없는 limiter가 Retry-After 5초를 받음
+        limiter = HostRateLimiter(clock=fake_time.clock, sleep=fake_time.sleep)
+        delay = limiter.on_rate_limited(5.0, attempt=0)
+        # When
+        waited = limiter.acquire()
+        # Then
+        assert delay == waited == 5.0
+        assert limiter.stats().rate_limited == 1
+
+    def test_should_reconfigure_in_place_for_adapters_holding_limiter(self, fake_time):
+        # Given: 어댑터가 설정 전에 limiter를 잡아 둠
+        held = limiter_for("example.atlassian.net")
+        # When
+        configured = configure_host("example.atlassian.net", 1, burst=1)
+        # Then: 같은 객체 — 설정이 바로 적용된다
+        assert configured is held
+        held.acquire()
+        assert held.stats().requests == 1
+
+    def test_should_report_stats_only_for_used_hosts(self):
+        limiter_for("idle.example")
+        limiter_for("busy.example").acquire()
+        assert set(throttle_stats()) == {"busy.example"}
+
+    # ---------- [Boundary] ----------
+    def test_should_not_wait_without_bucket(self, fake_time):
+        limiter = HostRateLimiter(clock=fake_time.clock, sleep=fake_time.sleep)
+        assert [limiter.acquire() for _ in range(50)] == [0.0] * 50
+        assert fake_time.sleeps == []
+
+    def test_should_not_release_burst_right_after_rate_limit(self, fake_time):
+        # Given: 토큰이 남아 있어도 429를 받으면
+        limiter = HostRateLimiter(10, burst=10, clock=fake_time.clock, sleep=fake_time.sleep)
+        limiter.on_rate_limited(1.0, attempt=0)
+        # When: 차단이 풀린 직후 2회 요청
+        limiter.acquire()
+        second = limiter.acquire()
+        # Then: burst가 아니라 rate 간격으로 나간다
+        assert second == pytest.approx(0.1)
+
+    def test_should_use_exponential_backoff_without_retry_after(self, fake_time, monkeypatch):
+        # Given: jitter 상한을 그대로 반환하도록 고정
+        monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: high)
+        limiter = HostRateLimiter(clock=fake_time.clock, sleep=fake_time.sleep)
+        # When/Then: 0.5, 1, 2 ... 상한 30초
+        assert [limiter.on_rate_limited(None, attempt=n) for n in (0, 1, 2, 10)] == [
+            0.5, 1.0, 2.0, 30.0,
+        ]
+
+
+class TestParseRetryAfter:
+    # ---------- [Happy] ----------
+    def test_should_parse_seconds(self):
+        assert parse_retry_after("30") == 30.0
+
+    def test_should_parse_http_date(self):
+        now = datetime(2026, 3, 2, 9, 0, 0, tzinfo=timezone.utc)
+        header = "Mon, 02 Mar 2026 09:00:12 GMT"
+        assert parse_retry_after(header, now=lambda: now) == 12.0
+
+    # ---------- [Boundary] ----------
+    def test_should_clamp_past_date_to_zero(self):
+        now = datetime(2026, 3, 2, 9, 0, 0, tzinfo=timezone.utc)
+        past = (now - timedelta(minutes=1)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        assert parse_retry_after(past, now=lambda: now) == 0.0
+
+    # ---------- [Error] ----------
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_should_return_none_for_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
@@ -0,0 +1,249 @@
+"""리포트 출력 캐시 테스트 — ReportOutputCache(TTL/LRU) + CachingCLIExecutor.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import os
+import threading
+import time
+from datetime import date
+from unittest.mock import AsyncMock, Mock
+
+import anyio
+import pytest
+
+from src.domain.models import StreamRestart
+from src.infrastructure.adapters.report_cache import (
+    CachingCLIExecutor,
+    ReportOutputCache,
+    build_cache_key,
+)
+
+
+@pytest.fixture
+def cache(tmp_path) -> ReportOutputCache:
+    return ReportOutputCache(tmp_path / "reports", ttl_seconds=3600, max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def command_file(tmp_path):
+    path = tmp_path / "daily_report.md"
+    path.write_text("prompt v1", encoding="utf-8")
+    return path
+
+
+def make_executor(cache, command_file, inner=None, probe=None) -> CachingCLIExecutor:
+    return CachingCLIExecutor(
+        inner or Mock(execute=Mock(return_value="리포트")),
+        cache,
+        command="daily_report",
+        model="sonnet",
+        command_file=command_file,
+        version_probe=probe,
+    )
+
+
+class TestBuildCacheKey:
+    def test_should_be_stable_regardless_of_argument_order(self):
+        # Given/When/Then
+        assert build_cache_key(a=1, b="x") == build_cache_key(b="x", a=1)
+
+    def test_should_change_when_any_part_changes(self):
+        # Given/When/Then
+        assert build_cache_key(a=1, v="3") != build_cache_key(a=1, v="4")
+
+
+class TestReportOutputCache:
+    # ---------- [Happy] ----------
+    def test_should_return_stored_output(self, cache):
+        # Given
+        cache.put("k1", "본문")
+        # When/Then
+        assert cache.get("k1") == "본문"
+
+    # ---------- [Boundary] ----------
+    def test_should_return_none_for_missing_key(self, cache):
+        assert cache.get("missing") is None
+
+    def test_should_expire_entry_after_ttl(self, tmp_path):
+        # Given: TTL 0초
+        cache = ReportOutputCache(tmp_path, ttl_seconds=0, max_bytes=1024)
+        cache.put("k1", "본문")
+        time.sleep(0.01)
+        # When/Then: 만료 + 파일 삭제
+        assert cache.get("k1") is None
+        assert not (tmp_path / "k1.json").exists()
+
+    def test_should_evict_least_recently_used_when_over_size(self, tmp_path):
+        # Given: 엔트리 2개 정도만 들어가는 용량
+        cache = ReportOutputCache(tmp_path, ttl_seconds=3600, max_bytes=250)
+        cache.put("old", "a" * 60)
+        cache.put("recent", "b" * 60)
+        past = time.time() - 100
+        os.utime(tmp_path / "old.json", (past, past))
+        os.utime(tmp_path / "recent.json", (past + 50, past + 50))
+        cache.get("old")  # old를 최근 사용으로 갱신
+        # When: 새 엔트리로 용량 초과
+        cache.put("new", "c" * 60)
+        # Then: 가장 오래 안 쓰인 recent가 제거
+        assert cache.get("recent") is None
+        assert cache.get("old") == "a" * 60
+        assert cache.get("new") == "c" * 60
+
+    # ---------- [Error] ----------
+    def test_should_treat_corrupted_entry_as_miss(self, cache, tmp_path):
+        # Given: 깨진 JSON
+        (tmp_path / "reports").mkdir(parents=True)
+        (tmp_path / "reports" / "bad.json").write_text("{not json", encoding="utf-8")
+        # When/Then
+        assert cache.get("bad") is None
+
+
+class TestCachingCLIExecutor:
+    # ---------- [Happy] ----------
+    def test_should_skip_inner_executor_on_second_run(self, cache, command_file):
+        # Given
+        inner = Mock(execute=Mock(return_value="리포트"))
+        executor = make_executor(cache, command_file, inner=inner)
+        # When
+        first = executor.execute("MAI", "@홍길동", date(2026, 4, 6))
+        second = executor.execute("MAI", "@홍길동", date(2026, 4, 6))
+        # Then: 두 번째는 캐시 hit
+        assert first == second == "리포트"
+        inner.execute.assert_called_once()
+
+    def test_should_share_cache_between_sync_and_async_paths(self, cache, command_file):
+        # Given: sync로 채운 캐시
+        inner = Mock(execute=Mock(return_value="리포트"), execute_async=AsyncMock())
+        executor = make_executor(cache, command_file, inner=inner)
+        executor.execute("MAI", "", date(2026, 4, 6))
+        # When
+        result = anyio.run(executor.execute_async, "MAI", "", date(2026, 4, 6))
+        # Then
+        assert result == "리포트"
+        inner.execute_async.assert_not_called()
+
+    def test_should_probe_and_store_off_event_loop_thread(self, cache, command_file, monkeypatch):
+        # Given: probe는 HTTP + rate limiter time.sleep, 캐시 put은 파일 I/O — 호출 스레드 기록
+        threads = []
+
+        def probe(space_key, target_date):
+            threads.append(threading.get_ident())
+            return "7"
+
+        original_put = cache.put
+        monkeypatch.setattr(
+            cache, "put", lambda *args: (threads.append(threading.get_ident()), original_put(*args))
+        )
+        inner = Mock(execute_async=AsyncMock(return_value="리포트"))
+        executor = make_executor(cache, command_file, inner=inner, probe=probe)
+        # When: async 경로와 스트림 경로 (스트림은 hit)
+        anyio.run(executor.execute_async, "MAI", "", date(2026, 4, 6))
+        chunks = anyio.run(_collect, executor, "MAI", "", date(2026, 4, 6))
+        # Then: 이벤트 루프(메인) 스레드에서 블록하지 않는다
+        assert chunks == ["리포트"]
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+    # ---------- [Boundary] ----------
+    def test_should_miss_when_command_file_changes(self, cache, command_file):
+        # Given
+        inner = Mock(execute=Mock(return_value="리포트"))
+        executor = make_executor(cache, command_file, inner=inner)
+        executor.execute("MAI", "", date(2026, 4, 6))
+        # When: 프롬프트 수정
+        command_file.write_text("prompt v2", encoding="utf-8")
+        executor.execute("MAI", "", date(2026, 4, 6))
+        # Then
+        assert inner.execute.call_count == 2
+
+    def test_should_miss_when_page_version_changes(self, cache, command_file):
+        # Given: 페이지 버전 3 → 4
+        versions = iter(["3", "4"])
+        inner = Mock(execute=Mock(return_value="리포트"))
+        executor = make_executor(cache, command_file, inner=inner, probe=lambda k, d: next(versions))
+        # When
+        executor.execute("MAI", "", date(2026, 4, 6))
+        executor.execute("MAI", "", date(2026, 4, 6))
+        # Then
+        assert inner.execute.call_count == 2
+
+    def test_should_not_cache_failed_or_empty_output(self, cache, command_file):
+        # Given: 실패(None) 후 빈 출력
+        inner = Mock(execute=Mock(side_effect=[None, "", "리포트"]))
+        executor = make_executor(cache, command_file, inner=inner)
+        # When
+        results = [executor.execute("MAI", "", date(2026, 4, 6)) for _ in range(3)]
+        # Then: 매번 다시 실행
+        assert results == [None, "", "리포트"]
+        assert inner.execute.call_count == 3
+
+    # ---------- [Error] ----------
+    @pytest.mark.parametrize("probe_result", [None, RuntimeError("network")])
+    def test_should_bypass_cache_when_page_version_unknown(self, cache, command_file, probe_result):
+        # Given: 버전 확인 실패 (페이지 없음/네트워크 오류)
+        def probe(space_key, report_date):
+            if isinstance(probe_result, Exception):
+                raise probe_result
+            return probe_result
+
+        inner = Mock(execute=Mock(return_value="리포트"))
+        executor = make_executor(cache, command_file, inner=inner, probe=probe)
+        # When
+        executor.execute("MAI", "", date(2026, 4, 6))
+        executor.execute("MAI", "", date(2026, 4, 6))
+        # Then: 신선도 보장 불가 → 매번 실행
+        assert inner.execute.call_count == 2
+
+
+class _FakeStreamingInner:
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.calls = 0
+
+    async def stream(self, space_key, mention_users="", report_date=None):
+        self.calls += 1
+        for chunk in self._chunks:
+            yield chunk
+
+
+async def _collect(executor, *args):
+    return [text async for text in executor.stream(*args)]
+
+
+class TestCachingCLIExecutorStream:
+    # ---------- [Happy] ----------
+    def test_should_pass_through_chunks_and_store_extracted_output(self, cache, command_file):
+        # Given
+        inner = _FakeStreamingInner(["분석", "\U0001f4ca 일정 요약"])
+        executor = make_executor(cache, command_file, inner=inner)
+        # When
+        chunks = anyio.run(_collect, executor, "MAI", "", date(2026, 4, 6))
+        # Then: 조각은 그대로, 캐시에는 execute와 같은 형태(마커 이후)로 저장
+        assert chunks == ["분석", "\U0001f4ca 일정 요약"]
+        inner.execute = Mock()
+        assert executor.execute("MAI", "", date(2026, 4, 6)) == "\U0001f4ca 일정 요약"
+        inner.execute.assert_not_called()
+
+    def test_should_store_only_fallback_attempt_output_after_restart(self, cache, command_file):
+        # Given: 취소된 시도의 부분 출력(마커 포함) 뒤 재시작, fallback 시도는 마커 없이 완료
+        restart = StreamRestart(attempt=1, model="sonnet")
+        inner = _FakeStreamingInner(["\U0001f4ca 일정 요약 (opus 부분)", restart, "sonnet 본문"])
+        executor = make_executor(cache, command_file, inner=inner)
+        # When
+        chunks = anyio.run(_collect, executor, "MAI", "", date(2026, 4, 6))
+        # Then: 재시작 신호는 그대로 전달, 캐시에는 fallback 시도의 출력만
+        assert chunks == ["\U0001f4ca 일정 요약 (opus 부분)", restart, "sonnet 본문"]
+        inner.execute = Mock()
+        assert executor.execute("MAI", "", date(2026, 4, 6)) == "sonnet 본문"
+
+    def test_should_yield_cached_output_as_single_chunk_on_hit(self, cache, command_file):
+        # Given: 이미 채워진 캐시
+        inner = _FakeStreamingInner(["리포트"])
+        executor = make_executor(cache, command_file, inner=inner)
+        anyio.run(_collect, executor, "MAI", "", date(2026, 4, 6))
+        # When
+        chunks = anyio.run(_collect, executor, "MAI", "", date(2026, 4, 6))
+        # Then
+        assert chunks == ["리포트"]
+        assert inner.calls == 1
@@ -82,3 +82,41 @@ class TestStdoutAdapter:
         assert "한글 메시지" in captured.out
         assert "🔄" in captured.out
         assert "홍길동" in captured.out
+
+
+class TestStdoutReportStream:
+    """open_stream — 생성 중인 출력을 즉시 stdout에 흘리는 스트림 핸들."""
+
+    # ---------- [Happy] ----------
+    def test_should_print_title_and_chunks_as_they_arrive(self, capsys):
+        # Given
+        stream = StdoutAdapter().open_stream("Title")
+        # When: 조각 append
+        stream.append("chunk-1")
+        first = capsys.readouterr().out
+        stream.append("chunk-2")
+        second = capsys.readouterr().out
+        # Then: 각 조각이 append 시점에 출력
+        assert "Title" in first and "chunk-1" in first
+        assert "chunk-2" in second
+
+    def test_should_print_separator_and_final_content_on_finish(self, capsys):
+        # Given
+        stream = StdoutAdapter().open_stream("Title")
+        capsys.readouterr()
+        # When
+        stream.finish("Final body")
+        # Then
+        out = capsys.readouterr().out
+        assert "─" in out
+        assert "Final body" in out
+
+    # ---------- [Boundary] ----------
+    def test_should_print_only_separator_on_fail(self, capsys):
+        # Given
+        stream = StdoutAdapter().open_stream("Title")
+        capsys.readouterr()
+        # When
+        stream.fail()
+        # Then
+        assert capsys.readouterr().out.strip().startswith("─")
@@ -0,0 +1,152 @@
+"""StreamingPageTransformer 테스트 — PageTransformer와 바이트 단위로 같은 결과 + 블록 단위 메모리.
+
+test_page_transformer.py의 테스트 클래스를 그대로 상속해 다시 돌리되, 그 모듈의 PageTransformer를
+두 엔진을 모두 실행해 비교하는 변환기로 바꿔 끼운다 (작은 chunk로 조각 경계도 함께 검증).
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import pytest
+
+from src.infrastructure.adapters.page_transformer import PageTransformer
+from src.infrastructure.adapters.streaming_page_transformer import StreamingPageTransformer
+from tests.fakes.synthetic_week_page import NEW_DATES, OLD_DATES, synthetic_week_page
+from tests.unit.infrastructure.adapters import test_page_transformer as base
+
+_CHUNK_SIZES = (7, 64 * 1024)
+
+
+class _BothEngines(PageTransformer):
+    """PageTransformer 결과를 돌려주되 스트리밍 엔진도 같은 결과(또는 같은 예외)를 내는지 확인"""
+
+    def apply(self, html, plan):
+        try:
+            expected = PageTransformer().apply(html, plan)
+        except Exception as e:
+            for chunk_size in _CHUNK_SIZES:
+                with pytest.raises(type(e)):
+                    StreamingPageTransformer(chunk_size).apply(html, plan)
+            raise
+        for chunk_size in _CHUNK_SIZES:
+            actual = StreamingPageTransformer(chunk_size).apply(html, plan)
+            assert actual == expected
+        return expected
+
+
+@pytest.fixture(autouse=True)
+def _differential(monkeypatch):
+    monkeypatch.setattr(base, "PageTransformer", _BothEngines)
+
+
+# ---------- [Happy] / [Boundary] / [Error] — 기존 PageTransformer 케이스 전부 ----------
+class TestStreamingDates(base.TestPageTransformerDates):
+    pass
+
+
+class TestStreamingNotifications(base.TestPageTransformerNotifications):
+    pass
+
+
+class TestStreamingProgress(base.TestPageTransformerProgress):
+    pass
+
+
+class TestStreamingDynamicRowspan(base.TestPageTransformerDynamicRowspan):
+    pass
+
+
+class TestStreamingRowCells(base.TestPageTransformerRowCells):
+    pass
+
+
+class TestStreamingEdgeCases(base.TestPageTransformerEdgeCases):
+    pass
+
+
+class TestStreamingNamespace(base.TestPageTransformerNamespace):
+    pass
+
+
+class TestStreamingCompiledTransformPlan(base.TestCompiledTransformPlan):
+    pass
+
+
+class _BlockSpy(StreamingPageTransformer):
+    """블록을 변환할 때마다 tbody에 남아 있는 행 수를 기록"""
+
+    def __init__(self, chunk_size):
+        super().__init__(chunk_size)
+        self.rows_in_tree: list[int] = []
+
+    def _transform_block(self, block, plan):
+        self.rows_in_tree.append(len(block[0].getparent().findall("tr")))
+        super()._transform_block(block, plan)
+
+
+def _member_rows(name: str) -> str:
+    return (
+        f'<tr><td rowspan="2"><p>{name}</p></td><td><p>04.06</p></td>'
+        '<td><ul><li><p>Doing</p><ul><li><p>work&nbsp;&rarr; next</p></li></ul></li>'
+        '<li><p>ToDo</p></li></ul></td><td><p>note</p></td></tr>\n'
+        '<tr><td><p>04.10</p></td><td><ul><li><p>Done</p></li></ul></td><td><p>n</p></td></tr>\n'
+    )
+
+
+_MANY_MEMBERS_HTML = (
+    '<p>intro &amp; notes</p><table><tbody>'
+    '<tr><th><p>Name</p></th><th><p>Date</p></th><th><p>Progress</p></th><th><p>N</p></th></tr>\n'
+    + "".join(_member_rows(f"@user{i}") for i in range(50))
+    + '</tbody></table><p>outro</p>'
+)
+
+
+class TestStreamingPageTransformer:
+    # ---------- [Happy] ----------
+    def test_should_match_lxml_engine_on_many_member_page(self):
+        args = (["04.06", "04.10"], ["04.13", "04.17"])
+        expected = PageTransformer().transform(_MANY_MEMBERS_HTML, *args)
+        assert StreamingPageTransformer(chunk_size=100).transform(_MANY_MEMBERS_HTML, *args) == expected
+
+    def test_should_keep_only_one_block_of_rows_in_tree(self):
+        # Given: 팀원 50명(블록당 2행)
+        spy = _BlockSpy(chunk_size=256)
+        # When
+        spy.transform(_MANY_MEMBERS_HTML, ["04.06"], ["04.13"])
+        # Then: 팀원 수와 무관하게 헤더 + 그 블록 + 조각 1개(256B ≈ 2행) 분량만 트리에 남아 있다
+        assert len(spy.rows_in_tree) == 50
+        assert max(spy.rows_in_tree) <= 6
+
+    def test_should_match_lxml_engine_on_synthetic_week_page(self):
+        # Given: 매크로/멘션/중첩 리스트/엔티티가 섞인 synthetic 주간 표 (benchmark와 같은 생성기)
+        html = synthetic_week_page(20)
+        # When / Then
+        expected = PageTransformer().transform(html, OLD_DATES, NEW_DATES)
+        assert StreamingPageTransformer(chunk_size=1000).transform(html, OLD_DATES, NEW_DATES) == expected
+
+    # ---------- [Boundary] ----------
+    @pytest.mark.parametrize("chunk_size", range(1, 12))
+    def test_should_not_split_entities_across_chunks(self, chunk_size):
+        html = base.MINIMAL_TABLE_HTML.replace("Alert!", "A&nbsp;&rarr;&amp;B")
+        args = (["04.06"], ["04.13"])
+        expected = PageTransformer().transform(html, *args)
+        assert StreamingPageTransformer(chunk_size).transform(html, *args) == expected
+
+    def test_should_leave_rows_outside_member_blocks_unchanged(self):
+        # Given: 헤더 다음에 rowspan 없는 행, 그 뒤에 팀원 블록
+        html = base.MINIMAL_TABLE_HTML.replace(
+            "<tr><td rowspan", '<tr><td><p>04.06</p></td><td><p>x</p></td><td><p>y</p></td></tr><tr><td rowspan', 1
+        )
+        args = (["04.06"], ["04.13"])
+        # When
+        result = StreamingPageTransformer(5).transform(html, *args)
+        # Then: 블록 밖 행은 그대로 (날짜도 바꾸지 않음)
+        assert result == PageTransformer().transform(html, *args)
+        assert "<td><p>04.06</p></td><td><p>x</p></td>" in result
+
+    # ---------- [Error] ----------
+    def test_should_raise_syntax_error_like_lxml_engine(self):
+        from lxml import etree
+
+        with pytest.raises(etree.XMLSyntaxError):
+            StreamingPageTransformer().transform("<table><tbody><tr></tbody>", [], [])
+
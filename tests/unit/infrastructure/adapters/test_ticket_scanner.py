@@ -0,0 +1,86 @@
+"""TicketScanner 테스트 — 주간 페이지 표에서 팀원/날짜별 티켓 key 추출.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+from src.domain.models import TicketMention
+from src.infrastructure.adapters.ticket_scanner import TicketScanner
+
+_HEADER = (
+    '<tr><th><p>Name</p></th><th><p>Date</p></th>'
+    '<th><p>Progress</p></th><th><p>Notifications</p></th></tr>'
+)
+
+
+def _jira_macro(key: str) -> str:
+    return (
+        '<ac:structured-macro ac:name="jira" ac:schema-version="1">'
+        '<ac:parameter ac:name="server">System JIRA</ac:parameter>'
+        f'<ac:parameter ac:name="key">{key}</ac:parameter>'
+        '</ac:structured-macro>'
+    )
+
+
+def _table(rows: str) -> str:
+    return f'<table><tbody>{_HEADER}{rows}</tbody></table>'
+
+
+WEEK_HTML = _table(
+    '<tr><td rowspan="2"><p>@홍길동</p></td>'
+    '<td><p>04.06</p></td>'
+    f'<td><ul><li><p>Doing</p><ul><li><p>{_jira_macro("MAI-1")} 로그인 개선</p></li></ul></li></ul></td>'
+    '<td><p></p></td></tr>'
+    '<tr><td><p>04.07</p></td>'
+    '<td><ul><li><p><a href="https://x.atlassian.net/browse/MAI-2">MAI-2</a> 리뷰, MAI-1 계속</p></li></ul></td>'
+    '<td><p>배포 대기 OPS-7</p></td></tr>'
+    '<tr><td rowspan="1"><p>@김철수</p></td>'
+    '<td><p>04.06</p></td>'
+    f'<td><p>{_jira_macro("OPS-7")}</p></td>'
+    '<td><p></p></td></tr>'
+)
+
+
+class TestTicketScanner:
+    # ---------- [Happy] ----------
+    def test_should_locate_keys_by_member_and_day(self):
+        # When
+        mentions = TicketScanner().scan(WEEK_HTML)
+        # Then: 매크로/링크/텍스트 key 모두, 문서 순서
+        assert mentions == [
+            TicketMention("MAI-1", "@홍길동", "04.06"),
+            TicketMention("MAI-2", "@홍길동", "04.07"),
+            TicketMention("MAI-1", "@홍길동", "04.07"),
+            TicketMention("OPS-7", "@홍길동", "04.07"),
+            TicketMention("OPS-7", "@김철수", "04.06"),
+        ]
+
+    def test_should_read_entity_escaped_page(self):
+        html = WEEK_HTML.replace("리뷰", "리뷰&nbsp;&rarr;")
+        assert TicketMention("MAI-2", "@홍길동", "04.07") in TicketScanner().scan(html)
+
+    # ---------- [Boundary] ----------
+    def test_should_ignore_text_keys_of_unreferenced_projects(self):
+        # Given: 매크로/링크로 참조된 프로젝트는 MAI뿐
+        html = _table(
+            '<tr><td rowspan="1"><p>@홍길동</p></td><td><p>04.06</p></td>'
+            f'<td><p>{_jira_macro("MAI-1")} UTF-8 인코딩, ISO-8601 포맷, MAI-3</p></td>'
+            '<td><p></p></td></tr>'
+        )
+        # When/Then
+        assert [m.key for m in TicketScanner().scan(html)] == ["MAI-1", "MAI-3"]
+
+    def test_should_keep_keys_outside_table_without_location(self):
+        html = f'<p>{_jira_macro("MAI-9")}</p>{WEEK_HTML}'
+        assert TicketScanner().scan(html)[0] == TicketMention("MAI-9")
+
+    def test_should_ignore_other_macro_parameters(self):
+        html = (
+            '<ac:structured-macro ac:name="status">'
+            '<ac:parameter ac:name="key">MAI-1</ac:parameter></ac:structured-macro>'
+        )
+        assert TicketScanner().scan(html) == []
+
+    # ---------- [Error] ----------
+    def test_should_fall_back_to_regex_for_malformed_html(self):
+        html = f'<p>{_jira_macro("MAI-1")}<br></p>'  # 닫히지 않은 <br>
+        assert TicketScanner().scan(html) == [TicketMention("MAI-1")]
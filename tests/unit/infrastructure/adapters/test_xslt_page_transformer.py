@@ -0,0 +1,160 @@
+"""XsltPageTransformer 테스트 — PageTransformer와 바이트 단위로 같은 결과.
+
+test_page_transformer.py의 테스트 클래스를 그대로 상속해 다시 돌리되, 그 모듈의 PageTransformer를
+두 엔진을 모두 실행해 비교하는 변환기로 바꿔 끼운다.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import pytest
+
+from src.infrastructure.adapters.page_transformer import CompiledTransformPlan, PageTransformer
+from src.infrastructure.adapters.xslt_page_transformer import XsltPageTransformer
+from tests.fakes.synthetic_week_page import NEW_DATES, OLD_DATES, synthetic_week_page
+from tests.unit.infrastructure.adapters import test_page_transformer as base
+
+
+class _BothEngines(PageTransformer):
+    """PageTransformer 결과를 돌려주되 XSLT 엔진도 같은 결과(또는 같은 예외)를 내는지 확인"""
+
+    def apply(self, html, plan):
+        try:
+            expected = PageTransformer().apply(html, plan)
+        except Exception as e:
+            with pytest.raises(type(e)):
+                XsltPageTransformer().apply(html, plan)
+            raise
+        assert XsltPageTransformer().apply(html, plan) == expected
+        return expected
+
+
+@pytest.fixture(autouse=True)
+def _differential(monkeypatch):
+    monkeypatch.setattr(base, "PageTransformer", _BothEngines)
+
+
+def _assert_same(html, old_dates=("04.06", "04.10"), new_dates=("04.13", "04.17")):
+    expected = PageTransformer().transform(html, list(old_dates), list(new_dates))
+    assert XsltPageTransformer().transform(html, list(old_dates), list(new_dates)) == expected
+    return expected
+
+
+# ---------- [Happy] / [Boundary] / [Error] — 기존 PageTransformer 케이스 전부 ----------
+class TestXsltDates(base.TestPageTransformerDates):
+    pass
+
+
+class TestXsltNotifications(base.TestPageTransformerNotifications):
+    pass
+
+
+class TestXsltProgress(base.TestPageTransformerProgress):
+    pass
+
+
+class TestXsltDynamicRowspan(base.TestPageTransformerDynamicRowspan):
+    pass
+
+
+class TestXsltRowCells(base.TestPageTransformerRowCells):
+    pass
+
+
+class TestXsltEdgeCases(base.TestPageTransformerEdgeCases):
+    pass
+
+
+class TestXsltNamespace(base.TestPageTransformerNamespace):
+    pass
+
+
+class TestXsltCompiledTransformPlan(base.TestCompiledTransformPlan):
+    pass
+
+
+class TestXsltPageTransformer:
+    # ---------- [Happy] ----------
+    def test_should_match_lxml_engine_on_synthetic_week_page(self):
+        # Given: 매크로/멘션/중첩 리스트/엔티티가 섞인 synthetic 주간 표
+        html = synthetic_week_page(30)
+        # When / Then
+        expected = PageTransformer().transform(html, OLD_DATES, NEW_DATES)
+        assert XsltPageTransformer().transform(html, OLD_DATES, NEW_DATES) == expected
+
+    def test_should_not_leave_row_role_attribute_in_output(self):
+        # Given: 속성이 있는 블록 행
+        html = base.MINIMAL_TABLE_HTML.replace("<tr><td rowspan", '<tr class="a" data-x="1"><td rowspan')
+        # When
+        result = _assert_same(html)
+        # Then: 원래 속성만 순서대로 남는다
+        assert '<tr class="a" data-x="1">' in result
+        assert "data-report-xslt-row" not in result
+
+    # ---------- [Boundary] ----------
+    def test_should_skip_rowspan_of_rows_covered_by_member_cell(self):
+        # Given: 팀원 블록 안쪽 행의 날짜 셀에 rowspan="1" (Confluence가 셀 병합 후 남기는 형태)
+        html = base.MINIMAL_TABLE_HTML.replace(
+            "<tr><td><p>04.10</p></td>", '<tr><td rowspan="1"><p>04.10</p></td>'
+        ).replace("<td><p>Alert!</p></td></tr>", "<td><p>Alert!</p></td><td><p>extra</p></td></tr>")
+        # When / Then: 새 블록으로 보지 않고 셀 위치만 1칸 민다 (PageTransformer와 같음)
+        _assert_same(html)
+
+    def test_should_carry_over_item_tails_and_keep_whitespace_between_rows(self):
+        # Given: 행 사이 줄바꿈, 이월 항목 뒤 tail 텍스트
+        html = (
+            base.MINIMAL_TABLE_HTML.replace("</tr>", "</tr>\n")
+            .replace("<li><p>Task D</p></li>", "<li><p>Task D</p></li>\n  tail D\n<li><p>Task D2</p></li>")
+        )
+        # When
+        result = _assert_same(html)
+        # Then
+        assert "tail D" in result
+
+    def test_should_transform_only_first_table(self):
+        # Given: 같은 표가 두 번
+        html = base.MINIMAL_TABLE_HTML + base.MINIMAL_TABLE_HTML
+        # When
+        result = _assert_same(html)
+        # Then: 두 번째 표의 날짜는 그대로
+        assert result.count("04.06") == 1
+
+    @pytest.mark.parametrize(
+        "text",
+        ["04.06", " 04.06\n", "\xa004.06\u3000", "04. 06", "x 04.06", "04.06\ue000", "\ue00004.06"],
+    )
+    def test_should_match_dates_like_strip(self, text):
+        # Given: 앞뒤 공백(비ASCII 포함), 내부 공백, 다른 글자, 구분자 후보 문자가 섞인 날짜 텍스트
+        html = base.MINIMAL_TABLE_HTML.replace("<p>04.06</p>", f"<p>{text}<strong>!</strong></p>")
+        # When / Then
+        _assert_same(html)
+
+    def test_should_pick_separators_absent_from_dates(self):
+        # Given: 구분자 후보(사용자 정의 영역 첫 글자)가 들어간 날짜
+        html = base.MINIMAL_TABLE_HTML.replace("<p>04.06</p>", "<p>\ue00004.06</p>")
+        plan = CompiledTransformPlan(["\ue00004.06", " 04.10 "], ["\ue001", "04.17"])
+        # When / Then
+        assert XsltPageTransformer().apply(html, plan) == PageTransformer().apply(html, plan)
+
+    def test_should_handle_more_members_than_xslt_recursion_depth(self):
+        # Given: libxslt 기본 재귀 한도(3000)보다 많은 팀원 블록
+        html = (
+            "<table><tbody><tr><th><p>N</p></th></tr>"
+            + "".join(
+                f'<tr><td rowspan="1"><p>@u{i}</p></td><td><p>04.06</p></td>'
+                "<td><ul><li><p>Doing</p><ul><li><p>w</p></li></ul></li></ul></td><td><p>n</p></td></tr>"
+                for i in range(3200)
+            )
+            + "</tbody></table>"
+        )
+        # When / Then
+        _assert_same(html)
+
+    # ---------- [Error] ----------
+    def test_should_raise_index_error_for_block_row_missing_cells(self):
+        # Given: 블록 행에 Notifications 셀이 없음
+        html = base.MINIMAL_TABLE_HTML.replace("<td><p>Alert!</p></td>", "")
+        # When / Then: PageTransformer와 같은 예외
+        with pytest.raises(IndexError):
+            PageTransformer().transform(html, ["04.06"], ["04.13"])
+        with pytest.raises(IndexError):
+            XsltPageTransformer().transform(html, ["04.06"], ["04.13"])
@@ -361,3 +361,216 @@ class TestCliModelAndDryRun:
         # Then: dry_run is False (안전 기본)
         assert config is not None
         assert config.dry_run is False
+
+    def test_should_load_report_stream_flag(self, monkeypatch):
+        # Given: REPORT_STREAM=1
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_STREAM", "1")
+
+        # When/Then
+        assert load_config_from_env().stream is True
+
+    def test_should_default_metrics_path_to_logs(self, monkeypatch):
+        # Given: REPORT_METRICS_PATH 미설정
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.delenv("REPORT_METRICS_PATH", raising=False)
+
+        # When/Then
+        assert load_config_from_env().metrics_path == "logs/metrics.jsonl"
+
+    def test_should_load_per_mode_deadlines_and_fallback_reserve(self, monkeypatch):
+        # Given: 모드별 deadline + reserve
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_DEADLINE_DAILY_SECONDS", "300")
+        monkeypatch.setenv("REPORT_DEADLINE_WEEKLY_SECONDS", "1200")
+        monkeypatch.setenv("REPORT_FALLBACK_RESERVE_SECONDS", "90")
+
+        # When
+        config = load_config_from_env()
+
+        # Then
+        assert (config.deadline_daily_seconds, config.deadline_weekly_seconds) == (300, 1200)
+        assert config.fallback_reserve_seconds == 90
+
+    def test_should_disable_deadline_and_fallback_when_zero(self, monkeypatch):
+        # Given: deadline/reserve 0
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_DEADLINE_DAILY_SECONDS", "0")
+        monkeypatch.setenv("REPORT_DEADLINE_WEEKLY_SECONDS", "0")
+        monkeypatch.setenv("REPORT_FALLBACK_RESERVE_SECONDS", "0")
+
+        # When
+        config = load_config_from_env()
+
+        # Then: 기본값으로 바꾸지 않고 비활성화
+        assert (config.deadline_daily_seconds, config.deadline_weekly_seconds) == (None, None)
+        assert config.fallback_reserve_seconds == 0
+
+    def test_should_leave_deadline_and_fallback_off_by_default(self, monkeypatch):
+        # Given: 미설정 / 음수 / 형식 오류
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.delenv("REPORT_DEADLINE_WEEKLY_SECONDS", raising=False)
+        monkeypatch.setenv("REPORT_DEADLINE_DAILY_SECONDS", "-1")
+        monkeypatch.setenv("REPORT_FALLBACK_RESERVE_SECONDS", "abc")
+
+        # When
+        config = load_config_from_env()
+
+        # Then: 설정 없이는 취소/모델 전환 없음 (opt-in)
+        assert (config.deadline_daily_seconds, config.deadline_weekly_seconds) == (None, None)
+        assert config.fallback_reserve_seconds == 0
+
+    def test_should_load_prefetch_flag_and_derive_jira_url_from_confluence(self, monkeypatch):
+        # Given: REPORT_PREFETCH=1, JIRA_URL 미설정
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_PREFETCH", "true")
+        monkeypatch.setenv("CONFLUENCE_URL", "https://x.atlassian.net/wiki/")
+        monkeypatch.delenv("JIRA_URL", raising=False)
+
+        # When
+        config = load_config_from_env()
+
+        # Then: Cloud는 같은 호스트 — /wiki만 제거
+        assert config.prefetch is True
+        assert config.jira_url == "https://x.atlassian.net"
+
+    def test_should_load_split_prompt_flag(self, monkeypatch):
+        # Given: REPORT_SPLIT_PROMPT=1
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_SPLIT_PROMPT", "1")
+
+        # When/Then
+        assert load_config_from_env().split_prompt is True
+
+    def test_should_load_race_models_list(self, monkeypatch):
+        # Given: 공백/빈 항목 포함 목록
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_RACE_MODELS", " haiku, sonnet ,")
+
+        # When/Then
+        assert load_config_from_env().race_models == ("haiku", "sonnet")
+
+    def test_should_load_atlassian_http_pool_settings(self, monkeypatch):
+        # Given
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("ATLASSIAN_HTTP_POOL_SIZE", "32")
+        monkeypatch.setenv("ATLASSIAN_HTTP_RETRIES", "5")
+
+        # When
+        config = load_config_from_env()
+
+        # Then
+        assert (config.http_pool_size, config.http_retries) == (32, 5)
+
+    def test_should_keep_zero_http_retries(self, monkeypatch):
+        # Given: 재시도 끄기 (0은 "미설정"이 아님)
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("ATLASSIAN_HTTP_RETRIES", "0")
+
+        # When/Then
+        assert load_config_from_env().http_retries == 0
+
+    def test_should_default_http_retries_for_negative_or_invalid(self, monkeypatch):
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        for raw in ("-1", "many"):
+            monkeypatch.setenv("ATLASSIAN_HTTP_RETRIES", raw)
+            assert load_config_from_env().http_retries == 3
+
+    def test_should_load_rate_limits(self, monkeypatch):
+        # Given
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_PER_SECOND", "4")
+        monkeypatch.setenv("SLACK_RATE_LIMIT_PER_MINUTE", "20")
+
+        # When
+        config = load_config_from_env()
+
+        # Then
+        assert (config.atlassian_rate_per_second, config.slack_rate_per_minute) == (4, 20)
+
+    def test_should_default_rate_limits(self, monkeypatch):
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        config = load_config_from_env()
+        assert (config.atlassian_rate_per_second, config.slack_rate_per_minute) == (10, 50)
+
+    def test_should_load_page_transformer_engine(self, monkeypatch):
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("PAGE_TRANSFORMER_ENGINE", " Streaming ")
+        assert load_config_from_env().page_transformer_engine == "streaming"
+
+    def test_should_default_page_transformer_engine(self, monkeypatch):
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.delenv("PAGE_TRANSFORMER_ENGINE", raising=False)
+        assert load_config_from_env().page_transformer_engine == "lxml"
+
+    def test_should_load_page_store_size(self, monkeypatch):
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("CONFLUENCE_PAGE_STORE_MAX_MB", "8")
+        assert load_config_from_env().page_store_max_mb == 8
+
+    def test_should_prefer_explicit_jira_url(self, monkeypatch):
+        # Given
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("CONFLUENCE_URL", "https://x.atlassian.net/wiki")
+        monkeypatch.setenv("JIRA_URL", "https://jira.example.com")
+
+        # When/Then
+        assert load_config_from_env().jira_url == "https://jira.example.com"
+
+
+class TestBatchReportsConfig:
+    """REPORT_SPACE_KEYS / REPORT_CONCURRENCY — multi-team fan-out 설정."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate_env_and_dotenv(self, monkeypatch):
+        monkeypatch.setattr("src.infrastructure.config.load_dotenv", lambda: None)
+        monkeypatch.setenv("CONFLUENCE_SPACE_KEY", "MAI")
+        monkeypatch.setenv("REPORT_TEAM_PREFIX", "BE")
+        monkeypatch.setenv("REPORT_MENTION_USERS", "@base")
+        monkeypatch.delenv("REPORT_SPACE_KEYS", raising=False)
+        monkeypatch.delenv("REPORT_CONCURRENCY", raising=False)
+
+    # ---------- [Happy] ----------
+    def test_should_parse_space_keys_with_prefix_and_mentions(self, monkeypatch):
+        # Given: 팀별 prefix/멘션 지정
+        monkeypatch.setenv("REPORT_SPACE_KEYS", "MAI:BE:@홍길동 @김철수,OPS:OPS")
+        # When
+        config = load_config_from_env(report_date=date(2026, 4, 6))
+        # Then: 생략된 멘션은 base 값, report_date 공유
+        assert [r.space_key for r in config.batch_reports] == ["MAI", "OPS"]
+        assert config.batch_reports[0].mention_users == "@홍길동 @김철수"
+        assert config.batch_reports[1].team_prefix == "OPS"
+        assert config.batch_reports[1].mention_users == "@base"
+        assert config.batch_reports[1].report_date == date(2026, 4, 6)
+
+    def test_should_load_report_concurrency(self, monkeypatch):
+        # Given
+        monkeypatch.setenv("REPORT_CONCURRENCY", "8")
+        # When/Then
+        assert load_config_from_env().report_concurrency == 8
+
+    # ---------- [Boundary] ----------
+    def test_should_default_to_single_report_mode_when_unset(self):
+        # Given/When: REPORT_SPACE_KEYS 미설정
+        config = load_config_from_env()
+        # Then: batch 비활성 + 기본 동시성 4
+        assert config.batch_reports == []
+        assert config.report_concurrency == 4
+
+    def test_should_fall_back_to_base_prefix_and_skip_empty_entries(self, monkeypatch):
+        # Given: prefix 생략 + 빈 항목
+        monkeypatch.setenv("REPORT_SPACE_KEYS", "OPS, ,QA")
+        # When
+        config = load_config_from_env()
+        # Then
+        assert [(r.space_key, r.team_prefix) for r in config.batch_reports] == [
+            ("OPS", "BE"), ("QA", "BE"),
+        ]
+
+    # ---------- [Error] ----------
+    @pytest.mark.parametrize("value", ["abc", "0", "-2"])
+    def test_should_use_default_concurrency_for_invalid_value(self, monkeypatch, value):
+        # Given: 정수가 아니거나 양수가 아닌 값
+        monkeypatch.setenv("REPORT_CONCURRENCY", value)
+        # When/Then
+        assert load_config_from_env().report_concurrency == 4
@@ -0,0 +1,222 @@
+"""daemon.py 단위 테스트 — job 직렬화, cold/warm 지연 기록, 소켓 왕복.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+import socket
+import tempfile
+import threading
+from datetime import date
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from src.daemon import DaemonJob, ReportDaemon, submit_job
+from src.domain.models import DateRange, ReportConfig
+from src.infrastructure.config import AppConfig
+
+
+class _FakeSession:
+    """WarmClaudeSession 대역 — 첫 job 이후 warm."""
+
+    def __init__(self):
+        self.is_warm = False
+        self.last_connect_seconds = 2.5
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def app_config() -> AppConfig:
+    return AppConfig(
+        report=ReportConfig(space_key="MAI", team_name="", team_prefix="BE", mention_users=""),
+        slack_token="",
+        slack_channel="",
+        cli_type="claude",
+    )
+
+
+@pytest.fixture
+def short_socket():
+    # unix socket 경로 길이 제한(~104자) 회피용 짧은 경로
+    with tempfile.TemporaryDirectory(prefix="rd") as d:
+        yield f"{d}/d.sock"
+
+
+class TestDaemonJob:
+    # ---------- [Happy] ----------
+    def test_should_round_trip_json(self):
+        # Given
+        job = DaemonJob(mode="weekly", report_date=date(2026, 4, 6), model="haiku", dry_run=True)
+        # When/Then
+        assert DaemonJob.from_json(job.to_json()) == job
+
+    def test_should_round_trip_page_range_and_prefetch(self):
+        # Given: create_page 범위 + prefetch
+        weeks = (
+            DateRange(date(2026, 4, 6), date(2026, 4, 10)),
+            DateRange(date(2026, 4, 13), date(2026, 4, 17)),
+        )
+        job = DaemonJob(mode="create_page", weeks=weeks, prefetch=True)
+        # When/Then
+        assert DaemonJob.from_json(job.to_json()) == job
+
+    # ---------- [Boundary] ----------
+    def test_should_default_optional_fields(self):
+        # Given/When: mode만 있는 요청
+        job = DaemonJob.from_json('{"mode": "daily"}')
+        # Then
+        assert job == DaemonJob(mode="daily")
+
+
+class TestReportDaemonExecuteJob:
+    # ---------- [Happy] ----------
+    def test_should_create_requested_page_range(self, app_config, short_socket):
+        # Given: --submit --weeks-ahead로 들어온 범위
+        weeks = (DateRange(date(2026, 4, 13), date(2026, 4, 17)),)
+        daemon = ReportDaemon(app_config, short_socket, session=_FakeSession())
+        with patch("src.main.run_create_page_mode", return_value=True) as run_create_page_mode:
+            # When
+            ok = daemon._execute_job(DaemonJob(mode="create_page", report_date=date(2026, 4, 6), weeks=weeks))
+        # Then: 1주가 아닌 범위 생성
+        assert ok is True
+        assert run_create_page_mode.call_args.args[1:] == (date(2026, 4, 6), list(weeks))
+
+    def test_should_enable_prefetch_for_job(self, app_config, short_socket):
+        # Given: prefetch 요청
+        daemon = ReportDaemon(app_config, short_socket, session=_FakeSession())
+        with patch("src.main.build_report_use_case") as build:
+            build.return_value.execute.return_value = True
+            # When
+            daemon._execute_job(DaemonJob(mode="daily", prefetch=True))
+        # Then
+        assert build.call_args.args[0].prefetch is True
+
+
+class TestReportDaemonRunJob:
+    # ---------- [Happy] ----------
+    def test_should_report_cold_then_warm_latency(self, app_config, short_socket):
+        # Given: 첫 job 실행 후 세션이 warm 상태가 됨
+        session = _FakeSession()
+        daemon = ReportDaemon(app_config, short_socket, session=session)
+
+        def fake_execute(job):
+            session.is_warm = True
+            return True
+
+        with patch.object(daemon, "_execute_job", side_effect=fake_execute):
+            # When
+            first = anyio.run(daemon.run_job, DaemonJob(mode="daily"))
+            second = anyio.run(daemon.run_job, DaemonJob(mode="weekly"))
+        # Then: 첫 job만 cold + connect 비용
+        assert (first["warm"], first["connect_s"]) == (False, 2.5)
+        assert (second["warm"], second["connect_s"]) == (True, 0.0)
+        assert first["ok"] and second["ok"]
+
+    # ---------- [Boundary] ----------
+    def test_should_not_report_session_temperature_for_create_page(self, app_config, short_socket):
+        # Given: create_page는 SDK를 쓰지 않음
+        daemon = ReportDaemon(app_config, short_socket, session=_FakeSession())
+        with patch.object(daemon, "_execute_job", return_value=True):
+            # When
+            result = anyio.run(daemon.run_job, DaemonJob(mode="create_page"))
+        # Then
+        assert result["warm"] is None
+        assert result["connect_s"] == 0.0
+
+    # ---------- [Error] ----------
+    def test_should_return_not_ok_when_job_raises(self, app_config, short_socket):
+        # Given: job 내부 예외
+        daemon = ReportDaemon(app_config, short_socket, session=_FakeSession())
+        with patch.object(daemon, "_execute_job", side_effect=RuntimeError("boom")):
+            # When
+            result = anyio.run(daemon.run_job, DaemonJob(mode="daily"))
+        # Then: 데몬은 살아있고 실패만 보고
+        assert result["ok"] is False
+
+
+class TestSocketRoundTrip:
+    # ---------- [Happy] ----------
+    def test_should_submit_job_over_unix_socket(self, app_config, short_socket):
+        # Given: 데몬이 소켓에서 대기
+        session = _FakeSession()
+        daemon = ReportDaemon(app_config, short_socket, session=session)
+        received: list[DaemonJob] = []
+
+        def fake_execute(job):
+            received.append(job)
+            return True
+
+        async def scenario():
+            async with anyio.create_task_group() as tg:
+                await tg.start(daemon.serve_async)
+                # When: 동기 클라이언트로 제출 (워커 스레드)
+                result = await anyio.to_thread.run_sync(
+                    submit_job, short_socket, DaemonJob(mode="daily", model="haiku")
+                )
+                tg.cancel_scope.cancel()
+            return result
+
+        with patch.object(daemon, "_execute_job", side_effect=fake_execute):
+            result = anyio.run(scenario)
+        # Then: job 전달 + 결과 반환 + 종료 시 세션 정리
+        assert result["ok"] is True
+        assert received == [DaemonJob(mode="daily", model="haiku")]
+        assert session.closed is True
+
+    # ---------- [Error] ----------
+    def test_should_return_none_when_daemon_not_running(self, short_socket):
+        # Given: 소켓 파일 없음
+        # When/Then: 호출자가 in-process로 fallback 할 수 있도록 None
+        assert submit_job(short_socket, DaemonJob(mode="daily")) is None
+
+    @pytest.mark.parametrize("reply", [b"not json\n", b"\xff\xfe\n", b"[1, 2]\n", b"null\n"])
+    def test_should_report_failure_when_daemon_reply_is_invalid(self, short_socket, reply, capsys):
+        # Given: 데몬이 깨진 응답을 보냄 (job은 이미 제출됨)
+        with _OneShotServer(short_socket, reply):
+            # When
+            result = submit_job(short_socket, DaemonJob(mode="daily"))
+        # Then: 예외 없이 실패 결과 — in-process 재실행(None) 아님
+        assert result == {"ok": False, "error": "invalid response"}
+        assert "ERROR: report daemon returned an invalid result" in capsys.readouterr().out
+
+    def test_should_report_failure_when_daemon_does_not_answer_in_time(self, short_socket, capsys):
+        # Given: 요청을 받고 응답하지 않는 데몬
+        with _OneShotServer(short_socket, reply=None):
+            # When
+            result = submit_job(short_socket, DaemonJob(mode="daily"), timeout=0.2)
+        # Then
+        assert result == {"ok": False, "error": "timeout"}
+        assert "ERROR: report daemon did not return a result within" in capsys.readouterr().out
+
+
+class _OneShotServer:
+    """요청 한 줄을 받아 reply를 보내는 소켓 서버 (reply가 None이면 응답 없이 연결만 유지)."""
+
+    def __init__(self, path: str, reply: bytes | None):
+        self._reply = reply
+        self._done = threading.Event()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(path)
+        self._sock.listen(1)
+        self._thread = threading.Thread(target=self._serve)
+
+    def _serve(self):
+        conn, _ = self._sock.accept()
+        with conn:
+            conn.recv(4096)
+            if self._reply is not None:
+                conn.sendall(self._reply)
+            self._done.wait(5)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._done.set()
+        self._thread.join()
+        self._sock.close()
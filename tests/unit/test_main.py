@@ -3,25 +3,45 @@
 카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
 """
 
+import argparse
 import dataclasses
 import sys
 from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from src.application.use_cases import GenerateReportUseCase
-from src.domain.models import ReportConfig
-from src.infrastructure.adapters.cli_executors import ClaudeCLIExecutor
+from src.domain.models import DateRange, ReportConfig
+from src.infrastructure.adapters.cli_executors import (
+    ClaudeCLIExecutor,
+    WarmClaudeExecutor,
+    WarmClaudeSession,
+)
+from src.infrastructure.adapters.metrics_store import JsonlMetricsStore
+from src.infrastructure.adapters.page_transformer import PageTransformer
+from src.infrastructure.adapters.rate_limit import limiter_for
+from src.infrastructure.adapters.report_cache import CachingCLIExecutor
 from src.infrastructure.adapters.slack_adapter import SlackAdapter
 from src.infrastructure.adapters.stdout_adapter import StdoutAdapter
+from src.infrastructure.adapters.streaming_page_transformer import StreamingPageTransformer
+from src.infrastructure.adapters.xslt_page_transformer import XsltPageTransformer
 from src.infrastructure.config import AppConfig
 from src.main import (
     build_report_use_case,
+    configure_rate_limits,
     create_cli_executor,
     create_notifier,
+    create_page_store,
+    create_page_transformer,
+    create_page_version_probe,
+    create_report_context_provider,
+    create_title_index,
+    log_throttle_stats,
     parse_args,
+    resolve_backfill_weeks,
     resolve_effective_settings,
     run_create_page_mode,
 )
@@ -84,6 +104,51 @@ class TestParseArgs:
         # Then
         assert args.dry_run is True
 
+    def test_should_parse_serve_and_submit_flags(self):
+        # Given: 데몬 관련 플래그
+        with patch.object(sys, "argv", ["main.py", "--serve", "--submit"]):
+            # When
+            args = parse_args()
+        # Then
+        assert args.serve is True
+        assert args.submit is True
+
+    def test_should_parse_no_cache_flag(self):
+        # Given: --no-cache
+        with patch.object(sys, "argv", ["main.py", "--no-cache"]):
+            # When
+            args = parse_args()
+        # Then
+        assert args.no_cache is True
+
+    def test_should_parse_stream_flag(self):
+        # Given: --stream
+        with patch.object(sys, "argv", ["main.py", "--stream"]):
+            # When
+            args = parse_args()
+        # Then
+        assert args.stream is True
+
+    def test_should_parse_prefetch_flag(self):
+        # Given: --prefetch
+        with patch.object(sys, "argv", ["main.py", "--prefetch"]):
+            # When
+            args = parse_args()
+        # Then
+        assert args.prefetch is True
+
+    def test_should_parse_backfill_range_flags(self):
+        with patch.object(sys, "argv", ["main.py", "--from", "2026-03-02", "--to", "2026-04-13"]):
+            args = parse_args()
+        assert (args.date_from, args.date_to, args.weeks_ahead) == (
+            date(2026, 3, 2), date(2026, 4, 13), None
+        )
+
+    def test_should_parse_weeks_ahead_flag(self):
+        with patch.object(sys, "argv", ["main.py", "--weeks-ahead", "4"]):
+            args = parse_args()
+        assert args.weeks_ahead == 4
+
     # ---------- [Boundary] ----------
     def test_should_default_model_to_none_when_flag_missing(self):
         # Given: no --model
@@ -234,6 +299,14 @@ class TestCreateCliExecutor:
         # Then
         assert isinstance(executor, ClaudeCLIExecutor)
 
+    def test_should_return_warm_executor_when_session_given(self):
+        # Given/When: 데몬의 상주 세션 전달
+        session = WarmClaudeSession()
+        executor = create_cli_executor("claude", command="daily_report", session=session)
+        # Then
+        assert isinstance(executor, WarmClaudeExecutor)
+        assert executor._session is session
+
     def test_should_pass_command_and_model_to_claude_executor(self):
         # Given/When: 명시적 command + model 전달
         executor = create_cli_executor("claude", command="weekly_report", model="haiku")
@@ -276,7 +349,83 @@ class TestBuildReportUseCase:
         # Then: Weekly 접미사
         assert use_case._title_suffix == "Weekly"
 
+    def test_should_wrap_executor_with_output_cache_when_enabled(self, daily_config, tmp_path):
+        # [Happy] Given: 캐시 사용 + Confluence REST 미설정 (버전 probe 없음 → TTL만)
+        config = dataclasses.replace(daily_config, cache_dir=str(tmp_path))
+        # When
+        use_case = build_report_use_case(config, model="sonnet", dry_run=True, use_cache=True)
+        # Then
+        assert isinstance(use_case._cli_executor, CachingCLIExecutor)
+        assert isinstance(use_case._cli_executor._inner, ClaudeCLIExecutor)
+        assert use_case._cli_executor._version_probe is None
+
     # ---------- [Boundary] ----------
+    def test_should_not_wrap_executor_by_default(self, daily_config):
+        # [Boundary] Given/When: use_cache 미지정
+        use_case = build_report_use_case(daily_config, model="sonnet", dry_run=True)
+        # Then
+        assert isinstance(use_case._cli_executor, ClaudeCLIExecutor)
+
+    def test_should_attach_metrics_store_at_configured_path(self, daily_config):
+        # [Happy] Given: daily_config (metrics_path 기본값)
+        use_case = build_report_use_case(daily_config, model="sonnet", dry_run=True)
+        # Then: 실행기에 JSONL 메트릭 저장소 주입
+        store = use_case._cli_executor._metrics_store
+        assert isinstance(store, JsonlMetricsStore)
+        assert store._path == Path("logs/metrics.jsonl")
+
+    def test_should_apply_mode_deadline_to_executor(self, daily_config):
+        # [Happy] Given: weekly 모드
+        config = dataclasses.replace(
+            daily_config, report_mode="weekly", deadline_weekly_seconds=1200, fallback_reserve_seconds=90
+        )
+        # When
+        executor = build_report_use_case(config, model="opus", dry_run=True)._cli_executor
+        # Then: weekly deadline + reserve 주입
+        assert executor._deadline_seconds == 1200
+        assert executor._fallback_reserve_seconds == 90
+
+    def test_should_inject_prefetch_provider_for_daily_only(self, daily_config):
+        # [Happy] Given: prefetch 활성화 + Confluence 자격 증명
+        config = dataclasses.replace(
+            daily_config, prefetch=True, confluence_url="https://x.atlassian.net/wiki",
+            confluence_user="u", confluence_token="t", jira_url="https://x.atlassian.net",
+        )
+        # When
+        daily = build_report_use_case(config, model="sonnet", dry_run=True)._cli_executor
+        weekly = build_report_use_case(
+            dataclasses.replace(config, report_mode="weekly"), model="sonnet", dry_run=True
+        )._cli_executor
+        # Then: daily만 사전 조회 컨텍스트 사용
+        assert daily._context_provider is not None
+        assert weekly._context_provider is None
+
+    def test_should_pass_command_file_only_when_split_prompt_enabled(self, daily_config):
+        # [Happy] Given: split_prompt on/off
+        split = dataclasses.replace(daily_config, split_prompt=True)
+        # When
+        on = build_report_use_case(split, model="sonnet", dry_run=True)._cli_executor
+        off = build_report_use_case(daily_config, model="sonnet", dry_run=True)._cli_executor
+        # Then: 커맨드 파일 경로는 모드별 .claude/commands/<command>.md
+        assert on._command_file == Path.cwd() / ".claude" / "commands" / "daily_report.md"
+        assert off._command_file is None
+
+    def test_should_race_models_for_cold_daily_runs_only(self, daily_config):
+        # [Happy] Given: REPORT_RACE_MODELS=haiku,sonnet
+        config = dataclasses.replace(daily_config, race_models=("haiku", "sonnet"))
+        # When
+        daily = build_report_use_case(config, model="sonnet", dry_run=True)._cli_executor
+        weekly = build_report_use_case(
+            dataclasses.replace(config, report_mode="weekly"), model="sonnet", dry_run=True
+        )._cli_executor
+        warm = build_report_use_case(
+            config, model="sonnet", dry_run=True, session=WarmClaudeSession()
+        )._cli_executor
+        # Then: 상주 세션(job 1개씩)과 weekly는 경주하지 않음
+        assert daily._race_models == ("haiku", "sonnet")
+        assert weekly._race_models == ()
+        assert warm._race_models == ()
+
     def test_should_use_stdout_adapter_when_dry_run(self, daily_config):
         # [Boundary] Given: dry_run=True
         use_case = build_report_use_case(daily_config, model="sonnet", dry_run=True)
@@ -290,6 +439,186 @@ class TestBuildReportUseCase:
             build_report_use_case(daily_config_unknown_cli, model="sonnet", dry_run=False)
 
 
+class TestCreateReportContextProvider:
+    """REPORT_PREFETCH → daily 리포트 입력 prefetch provider."""
+
+    # ---------- [Happy] ----------
+    def test_should_build_provider_when_enabled_with_credentials(self, daily_config):
+        config = dataclasses.replace(
+            daily_config, prefetch=True, confluence_url="https://x.atlassian.net/wiki",
+            confluence_user="u", confluence_token="t", jira_url="https://x.atlassian.net",
+        )
+        assert callable(create_report_context_provider(config))
+
+    # ---------- [Boundary] ----------
+    def test_should_return_none_when_prefetch_disabled(self, daily_config):
+        assert create_report_context_provider(daily_config) is None
+
+    def test_should_return_none_without_confluence_credentials(self, daily_config, capsys):
+        config = dataclasses.replace(daily_config, prefetch=True)
+        assert create_report_context_provider(config) is None
+        assert "WARNING: prefetch requires CONFLUENCE_URL/USER/TOKEN" in capsys.readouterr().out
+
+
+class TestCreatePageVersionProbe:
+    """리포트 캐시 키의 페이지 버전 — 리포트가 읽는 주의 페이지"""
+
+    # ---------- [Happy] ----------
+    @pytest.mark.parametrize(
+        "mode,expected_title",
+        [("daily", "2026.01.26 ~ 01.30"), ("weekly", "2026.01.19 ~ 01.23")],
+    )
+    def test_should_probe_page_the_report_reads(self, daily_config, mode, expected_title):
+        # Given: daily는 이번 주, weekly는 지난주 페이지를 읽는다
+        config = dataclasses.replace(
+            daily_config, report_mode=mode, confluence_url="https://x.atlassian.net/wiki",
+            confluence_user="u", confluence_token="t",
+        )
+        with patch(
+            "src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter.get_page_version",
+            return_value=7,
+        ) as get_page_version:
+            # When
+            version = create_page_version_probe(config)("MAI", date(2026, 1, 27))
+        # Then
+        assert version == "7"
+        get_page_version.assert_called_once_with("MAI", expected_title)
+
+    # ---------- [Boundary] ----------
+    def test_should_return_none_without_confluence_credentials(self, daily_config):
+        assert create_page_version_probe(daily_config) is None
+
+
+class TestCreateTitleIndex:
+    """PARENT_PAGE_ID 하위 제목 색인 — REPORT_CACHE_DIR/page_index"""
+
+    # ---------- [Happy] ----------
+    def test_should_index_parent_page_under_cache_dir(self, daily_config, tmp_path):
+        config = dataclasses.replace(daily_config, cache_dir=str(tmp_path), parent_page_id="123")
+        index = create_title_index(config)
+        index.record("week", "9", 1)
+        assert (index.space_key, index.parent_id) == ("MAI", "123")
+        assert (tmp_path / "page_index" / "MAI-123.json").exists()
+
+    # ---------- [Boundary] ----------
+    @pytest.mark.parametrize("parent", ["", "not-a-number"])
+    def test_should_skip_index_without_numeric_parent(self, daily_config, parent):
+        assert create_title_index(dataclasses.replace(daily_config, parent_page_id=parent)) is None
+
+
+class TestCreatePageTransformer:
+    """PAGE_TRANSFORMER_ENGINE → 변환 엔진"""
+
+    # ---------- [Happy] ----------
+    def test_should_default_to_lxml_engine(self, daily_config):
+        assert type(create_page_transformer(daily_config)) is PageTransformer
+
+    def test_should_select_streaming_engine(self, daily_config):
+        config = dataclasses.replace(daily_config, page_transformer_engine="streaming")
+        assert isinstance(create_page_transformer(config), StreamingPageTransformer)
+
+    def test_should_select_xslt_engine(self, daily_config):
+        config = dataclasses.replace(daily_config, page_transformer_engine="xslt")
+        assert isinstance(create_page_transformer(config), XsltPageTransformer)
+
+    # ---------- [Error] ----------
+    def test_should_warn_and_use_lxml_for_unknown_engine(self, daily_config, capsys):
+        config = dataclasses.replace(daily_config, page_transformer_engine="fast")
+        assert type(create_page_transformer(config)) is PageTransformer
+        assert "WARNING: unknown PAGE_TRANSFORMER_ENGINE 'fast'" in capsys.readouterr().out
+
+
+class TestCreatePageStore:
+    """Confluence 페이지 본문 저장소 — REPORT_CACHE_DIR/pages"""
+
+    # ---------- [Happy] ----------
+    def test_should_store_pages_under_cache_dir(self, daily_config, tmp_path):
+        config = dataclasses.replace(daily_config, cache_dir=str(tmp_path), page_store_max_mb=1)
+        store = create_page_store(config)
+        store.put("1", 2, "<p/>")
+        assert (tmp_path / "pages" / "1.v2.html.gz").exists()
+
+    # ---------- [Boundary] ----------
+    def test_should_disable_store_when_size_is_zero(self, daily_config):
+        assert create_page_store(dataclasses.replace(daily_config, page_store_max_mb=0)) is None
+
+
+class TestConfigureRateLimits:
+    """프로세스 전역 호스트 limiter — Atlassian 호스트들 + Slack"""
+
+    # ---------- [Happy] ----------
+    def test_should_share_one_bucket_for_confluence_and_jira_host(self, daily_config):
+        # Given: JIRA와 Confluence가 같은 Atlassian 호스트, 초당 2회
+        config = dataclasses.replace(
+            daily_config,
+            confluence_url="https://x.atlassian.net/wiki",
+            jira_url="https://x.atlassian.net",
+            atlassian_rate_per_second=2,
+        )
+        # When
+        configure_rate_limits(config)
+        limiter = limiter_for("x.atlassian.net")
+        # Then: 호스트 1개만 설정, burst = rate
+        assert (limiter._rate, limiter._burst) == (2, 2.0)
+        assert [limiter.acquire() for _ in range(2)] == [0.0, 0.0]
+
+    def test_should_configure_slack_rate_per_minute(self, daily_config):
+        configure_rate_limits(dataclasses.replace(daily_config, slack_rate_per_minute=30))
+        assert limiter_for("slack.com")._rate == 0.5
+
+    def test_should_log_only_throttled_hosts(self, capsys):
+        # Given: 429를 받은 호스트 1개 + 한 번도 기다리지 않은 호스트 1개
+        limiter = limiter_for("x.atlassian.net")
+        limiter.on_rate_limited(0.0, attempt=0)
+        limiter.acquire()
+        limiter_for("slack.com").acquire()
+        # When
+        log_throttle_stats()
+        # Then
+        out = capsys.readouterr().out
+        assert "Rate limit: x.atlassian.net" in out and "(1 x 429)" in out
+        assert "slack.com" not in out
+
+    # ---------- [Boundary] ----------
+    def test_should_skip_atlassian_hosts_without_urls(self, daily_config):
+        configure_rate_limits(daily_config)
+        assert limiter_for("")._rate is None
+
+
+class TestResolveBackfillWeeks:
+    """--from/--to/--weeks-ahead → create_page 대상 주 목록"""
+
+    @staticmethod
+    def _args(date_from=None, date_to=None, weeks_ahead=None):
+        return argparse.Namespace(date_from=date_from, date_to=date_to, weeks_ahead=weeks_ahead)
+
+    # ---------- [Happy] ----------
+    def test_should_plan_range_up_to_report_date_by_default(self):
+        weeks = resolve_backfill_weeks(self._args(date_from=date(2026, 3, 30)), date(2026, 4, 15))
+        assert [w.start for w in weeks] == [date(2026, 3, 30), date(2026, 4, 6), date(2026, 4, 13)]
+
+    def test_should_plan_this_week_plus_weeks_ahead(self):
+        weeks = resolve_backfill_weeks(self._args(weeks_ahead=2), date(2026, 4, 15))
+        assert [w.start for w in weeks] == [date(2026, 4, 13), date(2026, 4, 20), date(2026, 4, 27)]
+
+    # ---------- [Boundary] ----------
+    def test_should_return_none_without_range_flags(self):
+        assert resolve_backfill_weeks(self._args(), date(2026, 4, 15)) is None
+
+    # ---------- [Error] ----------
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"date_to": date(2026, 4, 13)},
+            {"date_from": date(2026, 4, 6), "weeks_ahead": 1},
+            {"weeks_ahead": -1},
+        ],
+    )
+    def test_should_reject_invalid_combinations(self, kwargs):
+        with pytest.raises(ValueError):
+            resolve_backfill_weeks(self._args(**kwargs), date(2026, 4, 15))
+
+
 class TestRunCreatePageMode:
     """create_page 모드 함수 — SlackAdapter truthy arm 커버 (plan Task 4).
 
@@ -312,7 +641,7 @@ class TestRunCreatePageMode:
         with (
             patch("src.main.SlackAdapter") as mock_slack,
             patch("src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter"),
-            patch("src.application.create_page_use_case.CreateWeeklyPageUseCase") as mock_uc,
+            patch("src.application.create_page_use_case.AsyncCreateWeeklyPageUseCase") as mock_uc,
         ):
             mock_uc.return_value.execute.return_value = True
             # When
@@ -321,6 +650,32 @@ class TestRunCreatePageMode:
         assert result is True
         mock_slack.assert_called_once_with(token="test-token", channel="C-page")
 
+    def test_should_run_range_with_checkpoint_under_cache_dir(self, daily_config, tmp_path):
+        # [Happy] Given: backfill 대상 주 목록
+        config = dataclasses.replace(
+            daily_config,
+            report_mode="create_page",
+            confluence_url="https://x.atlassian.net",
+            confluence_user="u",
+            confluence_token="t",
+            parent_page_id="123",
+            cache_dir=str(tmp_path),
+        )
+        weeks = [DateRange(date(2026, 6, 8), date(2026, 6, 12))]
+        with (
+            patch("src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter"),
+            patch("src.application.create_page_use_case.AsyncCreateWeeklyPageUseCase") as mock_uc,
+        ):
+            mock_uc.return_value.execute_range.return_value = True
+            # When
+            result = run_create_page_mode(config, date(2026, 6, 8), weeks)
+        # Then: 단일 execute 대신 execute_range, checkpoint는 space key별 파일
+        assert result is True
+        mock_uc.return_value.execute.assert_not_called()
+        call = mock_uc.return_value.execute_range.call_args
+        assert call.args[1] == weeks
+        assert call.kwargs["checkpoint"]._path == tmp_path / "backfill" / "MAI.json"
+
     # ---------- [Boundary] ----------
     def test_should_return_false_when_confluence_env_missing(self, daily_config, capsys):
         # [Boundary] Given: create_page 모드인데 Confluence ENV 미설정 (빈 문자열)
@@ -346,7 +701,7 @@ class TestRunCreatePageMode:
         with (
             patch("src.main.SlackAdapter") as mock_slack,
             patch("src.infrastructure.adapters.confluence_adapter.ConfluenceAdapter"),
-            patch("src.application.create_page_use_case.CreateWeeklyPageUseCase") as mock_uc,
+            patch("src.application.create_page_use_case.AsyncCreateWeeklyPageUseCase") as mock_uc,
         ):
             mock_uc.return_value.execute.return_value = False
             # When
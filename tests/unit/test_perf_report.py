@@ -0,0 +1,184 @@
+"""perf_report.py 단위 테스트 — 기간·모드·모델별 지연/비용 집계.
+
+카테고리: [Happy] / [Boundary] / [Error] — CLAUDE.md Test Coverage Categories.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.models import RunMetrics
+from src.infrastructure.adapters.metrics_store import JsonlMetricsStore
+from src.perf_report import main, percentile, summarize, summarize_races
+
+
+def make_metrics(day: int, duration_s: float, cost: float | None = 0.3, **overrides) -> RunMetrics:
+    defaults = dict(
+        recorded_at=datetime(2026, 4, day, 12, 0), mode="daily", model="sonnet",
+        space_key="MAI", duration_ms=int(duration_s * 1000), duration_api_ms=0,
+        num_turns=6, cost_usd=cost,
+    )
+    defaults.update(overrides)
+    return RunMetrics(**defaults)
+
+
+class TestPercentile:
+    # ---------- [Happy] ----------
+    @pytest.mark.parametrize("pct, expected", [(50, 5), (95, 10), (100, 10), (10, 1)])
+    def test_should_return_nearest_rank_value(self, pct, expected):
+        assert percentile(list(range(10, 0, -1)), pct) == expected
+
+    # ---------- [Error] ----------
+    def test_should_reject_empty_values(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+
+class TestSummarize:
+    # ---------- [Happy] ----------
+    def test_should_group_by_iso_week_mode_and_model(self):
+        # Given: 2026-04-06(월)~04-07 daily/sonnet 2건, weekly/opus 1건, 다음 주 daily 1건
+        records = [
+            make_metrics(6, 90, 0.30),
+            make_metrics(7, 120, 0.50),
+            make_metrics(6, 300, 1.20, mode="weekly", model="opus"),
+            make_metrics(13, 60, 0.20),
+        ]
+        # When
+        rows = summarize(records, by="week")
+        # Then
+        assert [(r.period, r.mode, r.model, r.runs) for r in rows] == [
+            ("2026-W15", "daily", "sonnet", 2),
+            ("2026-W15", "weekly", "opus", 1),
+            ("2026-W16", "daily", "sonnet", 1),
+        ]
+        daily = rows[0]
+        assert (daily.p50_s, daily.p95_s) == (90.0, 120.0)
+        assert daily.total_cost == pytest.approx(0.80)
+
+    # ---------- [Boundary] ----------
+    def test_should_exclude_unreported_cost_from_cost_stats_only(self):
+        # Given: 비용 미보고 실행 포함
+        rows = summarize([make_metrics(6, 90, None), make_metrics(6, 100, 0.4)], by="all")
+        # Then: 지연은 2건, 비용은 1건 기준
+        assert rows[0].runs == 2
+        assert rows[0].p95_s == 100.0
+        assert rows[0].total_cost == pytest.approx(0.4)
+
+    def test_should_count_timed_out_attempts(self):
+        # Given: deadline으로 취소된 시도 (비용 미보고, is_error)
+        rows = summarize([
+            make_metrics(6, 420, None, model="opus", is_error=True, timed_out=True),
+            make_metrics(6, 500, 0.9, model="opus"),
+        ], by="all")
+        # Then
+        assert (rows[0].errors, rows[0].timeouts) == (1, 1)
+
+    def test_should_exclude_cancelled_runs_from_latency_and_count_them(self):
+        # Given: 끝까지 실행된 2건 + deadline 취소 1건 + 경주 패배로 취소된 1건 (취소 시점까지의 짧은 duration)
+        rows = summarize([
+            make_metrics(6, 100),
+            make_metrics(6, 200),
+            make_metrics(6, 30, None, is_error=True, timed_out=True),
+            make_metrics(6, 10, None, race_outcome="lost"),
+        ], by="all")
+        # Then: 지연은 완주 2건 기준, 취소는 따로 센다
+        assert rows[0].runs == 4
+        assert (rows[0].p50_s, rows[0].p95_s) == (100.0, 200.0)
+        assert (rows[0].timeouts, rows[0].lost) == (1, 1)
+
+    def test_should_report_none_latency_when_every_run_was_cancelled(self):
+        rows = summarize([make_metrics(6, 10, None, race_outcome="lost")], by="all")
+        assert (rows[0].p50_s, rows[0].p95_s, rows[0].lost) == (None, None, 1)
+
+    def test_should_report_none_cost_when_no_run_reported_cost(self):
+        rows = summarize([make_metrics(6, 90, None)], by="day")
+        assert rows[0].period == "2026-04-06"
+        assert rows[0].p50_cost is None
+
+
+    def test_should_report_prompt_cache_hit_ratio(self):
+        # Given: 입력 1000 중 cache read 600, cache write 200
+        rows = summarize([
+            make_metrics(6, 90, 0.3, input_tokens=100, cache_read_input_tokens=600, cache_creation_input_tokens=200),
+            make_metrics(6, 90, 0.3, input_tokens=100),
+        ], by="all")
+        # Then
+        assert rows[0].cache_hit_ratio == pytest.approx(0.6)
+
+    def test_should_report_none_cache_ratio_without_input_tokens(self):
+        rows = summarize([make_metrics(6, 90, 0.3, input_tokens=0)], by="all")
+        assert rows[0].cache_hit_ratio is None
+
+
+class TestSummarizeRaces:
+    # ---------- [Happy] ----------
+    def test_should_compute_win_rate_and_latency_behind_winner(self):
+        # Given: 경주 3회 — haiku 2승, sonnet 1승 (완주 후 패배 delta 기록)
+        records = [
+            make_metrics(6, 40, race_outcome="won", race_delta_ms=0, model="haiku"),
+            make_metrics(6, 40, race_outcome="lost", model="sonnet"),
+            make_metrics(7, 50, race_outcome="won", race_delta_ms=0, model="haiku"),
+            make_metrics(7, 60, race_outcome="lost", race_delta_ms=10_000, model="sonnet"),
+            make_metrics(8, 20, race_outcome="invalid", race_delta_ms=-30_000, model="haiku"),
+            make_metrics(8, 50, race_outcome="won", race_delta_ms=0, model="sonnet"),
+            make_metrics(8, 90),  # 경주 아닌 실행은 제외
+        ]
+        # When
+        rows = {r.model: r for r in summarize_races(records)}
+        # Then
+        assert (rows["haiku"].races, rows["haiku"].wins, rows["haiku"].invalid) == (3, 2, 1)
+        assert rows["haiku"].p50_win_s == 40.0
+        assert rows["haiku"].p50_behind_s == -30.0
+        assert (rows["sonnet"].races, rows["sonnet"].wins) == (3, 1)
+        assert rows["sonnet"].p50_behind_s == 10.0
+
+    # ---------- [Boundary] ----------
+    def test_should_return_nothing_without_race_records(self):
+        assert summarize_races([make_metrics(6, 90)]) == []
+
+
+class TestMain:
+    # ---------- [Happy] ----------
+    def test_should_print_table_from_metrics_file(self, tmp_path, capsys):
+        # Given
+        path = tmp_path / "metrics.jsonl"
+        store = JsonlMetricsStore(path)
+        store.append(make_metrics(6, 90))
+        store.append(make_metrics(7, 150, is_error=True))
+        # When
+        exit_code = main(["--path", str(path), "--by", "all"])
+        # Then
+        out = capsys.readouterr().out
+        assert exit_code == 0
+        assert "p95 s" in out
+        assert "daily" in out and "sonnet" in out
+        assert "win %" not in out
+
+    def test_should_print_race_table_when_races_recorded(self, tmp_path, capsys):
+        # Given
+        path = tmp_path / "metrics.jsonl"
+        store = JsonlMetricsStore(path)
+        store.append(make_metrics(6, 40, model="haiku", race_outcome="won", race_delta_ms=0))
+        store.append(make_metrics(6, 40, race_outcome="lost"))
+        # When
+        main(["--path", str(path)])
+        # Then: 패배만 있는 sonnet 행은 지연 n/a
+        out = capsys.readouterr().out
+        assert "win %" in out
+        assert "lost" in out and "n/a" in out
+
+    # ---------- [Boundary] ----------
+    def test_should_filter_records_before_since(self, tmp_path, capsys):
+        # Given
+        path = tmp_path / "metrics.jsonl"
+        store = JsonlMetricsStore(path)
+        store.append(make_metrics(6, 90))
+        # When
+        main(["--path", str(path), "--since", "2026-04-07"])
+        # Then
+        assert "No run metrics" in capsys.readouterr().out
+
+    def test_should_handle_missing_metrics_file(self, tmp_path, capsys):
+        assert main(["--path", str(tmp_path / "none.jsonl")]) == 0
+        assert "No run metrics" in capsys.readouterr().out